@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark docx_format_range: per-run tool calls vs. the direct bulk path.
+
+Builds a section of PARAGRAPHS paragraphs with RUNS runs each between two
+markers and formats it both ways: the per-run path is what docx_format_range
+did before (register every run and call docx_set_font, which renders a full
+Markdown response with document context per run), the bulk path is the
+current tool. Checks that the resulting formatting is identical and prints
+the timings and the size of the discarded per-run responses.
+
+Usage:
+    python scripts/bench_format_range.py [--paragraphs 40] [--runs 8]
+"""
+
+import argparse
+import time
+
+from docx.shared import Pt
+
+from docx_mcp_server.server import session_manager
+from docx_mcp_server.core.global_state import global_state
+from docx_mcp_server.tools.composite_tools import docx_format_range
+from docx_mcp_server.tools.run_tools import docx_set_font
+
+
+def open_session(paragraphs: int, runs: int):
+    session_id = session_manager.create_session()
+    global_state.active_session_id = session_id
+    session = session_manager.get_session(session_id)
+    doc = session.document
+    doc.add_paragraph("Chapter 1")
+    for i in range(paragraphs):
+        p = doc.add_paragraph()
+        for j in range(runs):
+            p.add_run(f"p{i} r{j} ")
+    doc.add_paragraph("Chapter 2")
+    return session
+
+
+def close_session():
+    session_manager.close_session(global_state.active_session_id)
+    global_state.clear()
+
+
+def format_per_run(session, **font):
+    rendered = 0
+    for para in session.document.paragraphs:
+        for run in para.runs:
+            run_id = session._get_element_id(run, auto_register=True)
+            rendered += len(docx_set_font(run_id, **font))
+    return rendered
+
+
+def snapshot(session):
+    return [(r.bold, r.font.size) for p in session.document.paragraphs for r in p.runs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--paragraphs", type=int, default=40)
+    parser.add_argument("--runs", type=int, default=8)
+    args = parser.parse_args()
+    font = dict(bold=True, size=14)
+
+    session = open_session(args.paragraphs, args.runs)
+    start = time.perf_counter()
+    rendered = format_per_run(session, **font)
+    slow_time = time.perf_counter() - start
+    slow_result = snapshot(session)
+    close_session()
+
+    session = open_session(args.paragraphs, args.runs)
+    start = time.perf_counter()
+    response = docx_format_range("Chapter 1", "Chapter 2", **font)
+    fast_time = time.perf_counter() - start
+    fast_result = snapshot(session)
+    close_session()
+
+    if slow_result != fast_result or (True, Pt(14)) not in fast_result:
+        raise SystemExit("Mismatch between per-run and bulk formatting")
+
+    run_count = args.paragraphs * args.runs
+    print(f"section:         {args.paragraphs} paragraphs x {args.runs} runs")
+    print(f"per-run calls:   {slow_time * 1000:8.1f} ms  ({rendered / 1024:.0f} KiB of responses)")
+    print(f"bulk path:       {fast_time * 1000:8.1f} ms  ({len(response)} bytes)")
+    print(f"per-run cost:    {(slow_time - fast_time) / run_count * 1e6:8.1f} us removed")
+    print(f"speedup:         {slow_time / fast_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
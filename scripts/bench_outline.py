@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark outline queries: full structure scans vs. the incremental outline.
+
+Builds a document of CHAPTERS chapters with SECTIONS sections of PARAGRAPHS
+paragraphs each, then alternates edits (a paragraph inserted into a random
+section) with an outline question ("where does section c.s start and end").
+The scan path answers it the way clients did before, from
+docx_get_structure_summary; the outline path uses docx_get_outline, whose
+index is updated in place by the insert. Prints the time per question.
+
+Usage:
+    python scripts/bench_outline.py [--chapters 20] [--sections 10] [--paragraphs 10] [--queries 50]
+"""
+
+import argparse
+import random
+import time
+
+from docx_mcp_server.server import session_manager
+from docx_mcp_server.core.global_state import global_state
+from docx_mcp_server.tools.composite_tools import docx_get_structure_summary
+from docx_mcp_server.tools.content_tools import docx_get_outline
+from docx_mcp_server.tools.paragraph_tools import docx_insert_paragraph
+
+
+def open_session(chapters: int, sections: int, paragraphs: int):
+    session_id = session_manager.create_session()
+    global_state.active_session_id = session_id
+    session = session_manager.get_session(session_id)
+    doc = session.document
+    for c in range(1, chapters + 1):
+        doc.add_paragraph(f"Chapter {c}", style="Heading 1")
+        for s in range(1, sections + 1):
+            doc.add_paragraph(f"Section {c}.{s}", style="Heading 2")
+            for p in range(paragraphs):
+                doc.add_paragraph(f"Paragraph {c}.{s}.{p}")
+    return session
+
+
+def close_session():
+    session_manager.close_session(global_state.active_session_id)
+    global_state.clear()
+
+
+def run(args, ask):
+    session = open_session(args.chapters, args.sections, args.paragraphs)
+    rng = random.Random(7)
+    anchors = [session.register_object(p, "para") for p in session.document.paragraphs[::7]]
+    elapsed = 0.0
+    for _ in range(args.queries):
+        docx_insert_paragraph("inserted", position=f"after:{rng.choice(anchors)}")
+        number = f"{rng.randint(1, args.chapters)}.{rng.randint(1, args.sections)}"
+        start = time.perf_counter()
+        ask(number)
+        elapsed += time.perf_counter() - start
+    close_session()
+    return elapsed / args.queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chapters", type=int, default=20)
+    parser.add_argument("--sections", type=int, default=10)
+    parser.add_argument("--paragraphs", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    def scan(number):
+        docx_get_structure_summary(max_headings=10_000, max_tables=0, max_paragraphs=0)
+
+    def outline(number):
+        docx_get_outline(section=number)
+
+    scan_time = run(args, scan)
+    outline_time = run(args, outline)
+    blocks = args.chapters * args.sections * (args.paragraphs + 1) + args.chapters
+    print(f"document:        {blocks} blocks, {args.chapters * (args.sections + 1)} headings")
+    print(f"structure scan:  {scan_time * 1000:8.2f} ms per question")
+    print(f"outline index:   {outline_time * 1000:8.2f} ms per question")
+    print(f"speedup:         {scan_time / outline_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark table filling: per-cell python-docx access vs. the grid-cached
+fill engine (docx_mcp_server.core.table_fill).
+
+Creates a table with a formatted header row, fills it with ROWS x COLS
+values both ways (the per-cell path is what docx_fill_table did before the
+engine was introduced), checks that the cell texts are identical and
+prints the timings.
+
+Usage:
+    python scripts/bench_table_fill.py [--rows 2000] [--cols 8]
+"""
+
+import argparse
+import time
+
+from docx import Document
+
+from docx_mcp_server.core.format_painter import FormatPainter
+from docx_mcp_server.core.table_fill import fill_table
+
+
+def build_table(cols: int):
+    doc = Document()
+    table = doc.add_table(rows=1, cols=cols)
+    for cell in table.rows[0].cells:
+        run = cell.paragraphs[0].add_run("header")
+        run.bold = True
+    return table
+
+
+def make_data(rows: int, cols: int):
+    return [[f"r{r}c{c}" for c in range(cols)] for r in range(rows)]
+
+
+def fill_per_cell(table, rows_data):
+    painter = FormatPainter()
+    for row_idx, row_data in enumerate(rows_data):
+        if row_idx >= len(table.rows):
+            table.add_row()
+        row = table.rows[row_idx]
+        for col_idx, value in enumerate(row_data):
+            if col_idx < len(row.cells):
+                paragraph = row.cells[col_idx].paragraphs[0]
+                source = next((r for r in paragraph.runs if r.text), None)
+                if source is None and paragraph.runs:
+                    source = paragraph.runs[0]
+                for run in list(paragraph.runs):
+                    run._element.getparent().remove(run._element)
+                new_run = paragraph.add_run(str(value))
+                if source:
+                    painter.copy_format(source, new_run)
+                else:
+                    painter.copy_format(paragraph, new_run)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--cols", type=int, default=8)
+    args = parser.parse_args()
+
+    data = make_data(args.rows, args.cols)
+
+    slow_table = build_table(args.cols)
+    slow_time = timed(fill_per_cell, slow_table, data)
+
+    fast_table = build_table(args.cols)
+    fast_time = timed(fill_table, fast_table, data)
+
+    def texts(table):
+        return [[cell.text for cell in row.cells] for row in table.rows]
+
+    if texts(slow_table) != texts(fast_table):
+        raise SystemExit("Mismatch between per-cell and engine fill")
+
+    print(f"table:           {args.rows} x {args.cols}")
+    print(f"per-cell:        {slow_time * 1000:8.1f} ms")
+    print(f"fill engine:     {fast_time * 1000:8.1f} ms")
+    print(f"speedup:         {slow_time / fast_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
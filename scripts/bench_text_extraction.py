@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark text extraction: python-docx wrappers vs. the lxml fast path
+(docx_mcp_server.core.text_extractor).
+
+Builds a synthetic document with N body blocks (paragraphs with several
+runs, interleaved with tables), extracts all text both ways, checks that
+the results are identical and prints the timings.
+
+Usage:
+    python scripts/bench_text_extraction.py [--blocks 10000] [--repeat 3]
+"""
+
+import argparse
+import time
+
+from docx import Document
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+from docx_mcp_server.core import text_extractor
+
+
+def build_document(blocks: int):
+    doc = Document()
+    for i in range(blocks):
+        if i % 50 == 49:
+            table = doc.add_table(rows=6, cols=4)
+            for r, row in enumerate(table.rows):
+                for c, cell in enumerate(row.cells):
+                    cell.text = f"r{r}c{c} value {i}"
+            table.cell(1, 0).merge(table.cell(2, 0))
+            table.cell(3, 1).merge(table.cell(3, 2))
+        else:
+            p = doc.add_paragraph(f"Paragraph {i}: ")
+            p.add_run("bold part").bold = True
+            p.add_run("\tafter tab, ")
+            p.add_run("italic tail.").italic = True
+    return doc
+
+
+def extract_with_wrappers(doc):
+    out = []
+    for child in doc.element.body.iterchildren():
+        tag = child.tag.split('}')[-1]
+        if tag == 'p':
+            out.append(Paragraph(child, doc).text)
+        elif tag == 'tbl':
+            table = Table(child, doc)
+            out.append([[cell.text for cell in row.cells] for row in table.rows])
+    return out
+
+
+def extract_fast(doc):
+    out = []
+    for kind, element in text_extractor.iter_blocks(doc.element.body):
+        if kind == "paragraph":
+            out.append(text_extractor.paragraph_text(element))
+        else:
+            out.append(text_extractor.table_rows(element))
+    return out
+
+
+def best_of(func, doc, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(doc)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blocks", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    doc = build_document(args.blocks)
+    wrapped_time, wrapped = best_of(extract_with_wrappers, doc, args.repeat)
+    fast_time, fast = best_of(extract_fast, doc, args.repeat)
+
+    if wrapped != fast:
+        raise SystemExit("Mismatch between wrapper and fast-path extraction")
+
+    print(f"blocks:          {args.blocks}")
+    print(f"python-docx:     {wrapped_time * 1000:8.1f} ms")
+    print(f"lxml fast path:  {fast_time * 1000:8.1f} ms")
+    print(f"speedup:         {wrapped_time / fast_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Per-table index of registered cell IDs and their grid positions.
+
+``RegistryCleaner`` used to scan the whole object registry and re-walk the
+table for every registered cell to find the IDs a row or column deletion
+invalidates. ``CellIndex`` keeps, per table, each registered ``cell_`` ID
+with the grid position of its ``w:tc`` (the top-left of a merged region).
+Structural edits are handled in two steps:
+
+1. ``plan_*`` (before the edit) computes which IDs go away and where the
+   remaining cells of the same table move to;
+2. ``apply`` (after the edit succeeded) commits the plan.
+
+Both only touch the indexed cells of the edited table.
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from docx.oxml.ns import qn
+
+from docx_mcp_server.core import text_extractor
+
+_TC = qn("w:tc")
+
+
+@dataclass
+class CellRemap:
+    """Effect of one structural edit on the indexed cells of a table."""
+    table_key: int
+    removed: List[str] = field(default_factory=list)
+    moved: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+
+
+def _table_of(tc) -> Optional[Any]:
+    tr = tc.getparent()
+    return tr.getparent() if tr is not None else None
+
+
+def _tc_covering(tr, col: int) -> Optional[Any]:
+    """The ``w:tc`` of ``tr`` covering grid column ``col`` (None past the row end)."""
+    offset = text_extractor.grid_before(tr)
+    for tc in tr.iterchildren(_TC):
+        span = text_extractor.grid_span(tc)
+        if offset <= col < offset + span:
+            return tc
+        offset += span
+    return None
+
+
+class CellIndex:
+    """Registered cell IDs grouped by table, with their ``(row, col)``."""
+
+    def __init__(self):
+        # id(w:tbl) -> {cell_id: [tc, row, col]}
+        self._cells: Dict[int, Dict[str, List[Any]]] = {}
+        # id(w:tbl) -> w:tbl, keeps the element (and so its id) alive
+        self._tables: Dict[int, Any] = {}
+        self._table_of_id: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._table_of_id)
+
+    def add(self, cell_id: str, tc, row: int, col: int):
+        """Index ``cell_id`` as the cell ``tc`` at grid position ``(row, col)``."""
+        tbl = _table_of(tc)
+        if tbl is None:
+            return
+        self.discard(cell_id)
+        key = id(tbl)
+        self._tables[key] = tbl
+        self._cells.setdefault(key, {})[cell_id] = [tc, row, col]
+        self._table_of_id[cell_id] = key
+
+    def discard(self, cell_id: str):
+        key = self._table_of_id.pop(cell_id, None)
+        if key is None:
+            return
+        cells = self._cells.get(key)
+        if cells is not None:
+            cells.pop(cell_id, None)
+            if not cells:
+                del self._cells[key]
+                del self._tables[key]
+
+    def position(self, cell_id: str) -> Optional[Tuple[int, int]]:
+        key = self._table_of_id.get(cell_id)
+        if key is None:
+            return None
+        _, row, col = self._cells[key][cell_id]
+        return row, col
+
+    def table_cells(self, tbl) -> Dict[str, Tuple[int, int]]:
+        """``{cell_id: (row, col)}`` for the indexed cells of ``tbl``."""
+        return {cid: (row, col) for cid, (_, row, col) in self._cells.get(id(tbl), {}).items()}
+
+    def plan_delete_row(self, tbl, index: int) -> CellRemap:
+        """Cells whose ``w:tc`` sits in row ``index`` go; rows below move up."""
+        remap = CellRemap(id(tbl))
+        for cell_id, (_, row, col) in self._cells.get(id(tbl), {}).items():
+            if row == index:
+                remap.removed.append(cell_id)
+            elif row > index:
+                remap.moved[cell_id] = (row - 1, col)
+        return remap
+
+    def plan_delete_col(self, tbl, index: int) -> CellRemap:
+        """Cells spanning column ``index`` go; cells to the right move left.
+
+        The shift in each row is the span of the cell removed from that row,
+        so positions stay exact next to horizontally merged cells.
+        """
+        remap = CellRemap(id(tbl))
+        shifts: Dict[int, int] = {}
+        for cell_id, (tc, row, col) in self._cells.get(id(tbl), {}).items():
+            span = text_extractor.grid_span(tc)
+            if col <= index < col + span:
+                remap.removed.append(cell_id)
+            elif col > index:
+                if row not in shifts:
+                    removed_tc = _tc_covering(tc.getparent(), index)
+                    shifts[row] = text_extractor.grid_span(removed_tc) if removed_tc is not None else 0
+                remap.moved[cell_id] = (row, col - shifts[row])
+        return remap
+
+    def plan_insert_row(self, tbl, index: int) -> CellRemap:
+        """Rows at or below ``index`` move down by one."""
+        remap = CellRemap(id(tbl))
+        for cell_id, (_, row, col) in self._cells.get(id(tbl), {}).items():
+            if row >= index:
+                remap.moved[cell_id] = (row + 1, col)
+        return remap
+
+    def plan_insert_col(self, tbl, index: int) -> CellRemap:
+        """Cells at or right of column ``index`` move right by one."""
+        remap = CellRemap(id(tbl))
+        for cell_id, (_, row, col) in self._cells.get(id(tbl), {}).items():
+            if col >= index:
+                remap.moved[cell_id] = (row, col + 1)
+        return remap
+
+    def plan_delete_cols(self, tbl, indexes: List[int]) -> CellRemap:
+        """Several columns go at once (see ``ElementManipulator.delete_cols``).
+
+        Cells whose columns are all deleted go; narrowed and later cells
+        move left by the number of deleted columns before them.
+        """
+        remap = CellRemap(id(tbl))
+        deleted = sorted(set(indexes))
+        for cell_id, (tc, row, col) in self._cells.get(id(tbl), {}).items():
+            span = text_extractor.grid_span(tc)
+            if all(c in deleted for c in range(col, col + span)):
+                remap.removed.append(cell_id)
+                continue
+            shift = bisect_left(deleted, col)
+            if shift:
+                remap.moved[cell_id] = (row, col - shift)
+        return remap
+
+    def plan_insert_cols(self, tbl, indexes: List[int]) -> CellRemap:
+        """Several columns are inserted before the given current positions."""
+        remap = CellRemap(id(tbl))
+        points = sorted(indexes)
+        for cell_id, (_, row, col) in self._cells.get(id(tbl), {}).items():
+            shift = bisect_right(points, col)
+            if shift:
+                remap.moved[cell_id] = (row, col + shift)
+        return remap
+
+    def plan_row_mapping(self, tbl, mapping: Dict[int, Optional[int]]) -> CellRemap:
+        """Rows move to ``mapping[row]``, or go when it is None (sort/filter).
+
+        Rows missing from ``mapping`` keep their index.
+        """
+        remap = CellRemap(id(tbl))
+        for cell_id, (_, row, col) in self._cells.get(id(tbl), {}).items():
+            if row not in mapping:
+                continue
+            new_row = mapping[row]
+            if new_row is None:
+                remap.removed.append(cell_id)
+            elif new_row != row:
+                remap.moved[cell_id] = (new_row, col)
+        return remap
+
+    def apply(self, remap: CellRemap):
+        """Commit a plan computed before the structural edit."""
+        for cell_id in remap.removed:
+            self.discard(cell_id)
+        cells = self._cells.get(remap.table_key, {})
+        for cell_id, (row, col) in remap.moved.items():
+            entry = cells.get(cell_id)
+            if entry is not None:
+                entry[1], entry[2] = row, col
@@ -0,0 +1,324 @@
+"""Formats compiled to property XML and applied by cloning.
+
+``FormatPainter`` and ``TemplateManager`` originally copied formatting one
+python-docx descriptor at a time: each property is an XPath lookup plus an
+element creation on the target, and anything without a descriptor (table
+and cell borders, shading, East Asian fonts, ...) was lost.
+
+``CompiledFormat`` captures the property element Word itself stores
+(``w:rPr``, ``w:pPr``, ``w:tblPr``, ``w:tcPr``) once. Applying it replaces
+the target's property element with a deep copy, so everything is carried
+over and the per-target cost is one clone. Children that describe the
+target's own structure rather than its look (cell spans and widths,
+section breaks, tracked property changes) are never copied and are kept
+from the target.
+"""
+
+import copy
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from lxml import etree
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+logger = logging.getLogger(__name__)
+
+FORMAT_KINDS = ("run", "paragraph", "table", "cell")
+
+_R, _P, _TBL, _TC = qn("w:r"), qn("w:p"), qn("w:tbl"), qn("w:tc")
+_KIND_OF_TAG = {_R: "run", _P: "paragraph", _TBL: "table", _TC: "cell"}
+
+# Property element -> (children kept from the target that lead the element,
+#                      children kept from the target that end it), in schema order
+_PRESERVED: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "rPr": ((), (qn("w:rPrChange"),)),
+    "pPr": ((), (qn("w:sectPr"), qn("w:pPrChange"))),
+    "tblPr": ((), (qn("w:tblCaption"), qn("w:tblDescription"), qn("w:tblPrChange"))),
+    "tcPr": (
+        (qn("w:cnfStyle"), qn("w:tcW"), qn("w:gridSpan"), qn("w:hMerge"), qn("w:vMerge")),
+        (qn("w:tcPrChange"),),
+    ),
+}
+
+# Fragments recorded per kind of source element
+_FRAGMENTS = {
+    "run": ("rPr",),
+    "paragraph": ("pPr", "rPr"),
+    "table": ("tblPr",),
+    "cell": ("tcPr", "pPr", "rPr"),
+}
+
+
+def _empty(name: str):
+    return parse_xml(f"<w:{name} {nsdecls('w')}/>")
+
+
+def _compile(prop, name: str):
+    """Canonical fragment of property element ``prop`` (None -> empty)."""
+    if prop is None:
+        return _empty(name)
+    fragment = copy.deepcopy(prop)
+    head, tail = _PRESERVED[name]
+    for child in list(fragment):
+        if child.tag in head or child.tag in tail:
+            fragment.remove(child)
+    return fragment
+
+
+def _first_run_rpr(container) -> Any:
+    r = next(container.iter(_R), None)
+    return r.find(qn("w:rPr")) if r is not None else None
+
+
+def _own(cell, tag: str) -> Iterable[Any]:
+    """Descendants ``tag`` of a cell, skipping those of nested tables."""
+    for el in cell.iter(tag):
+        if next(el.iterancestors(_TC), None) is cell:
+            yield el
+
+
+class CompiledFormat:
+    """Formatting of one element as property XML fragments.
+
+    Args:
+        kind: One of ``FORMAT_KINDS``, the kind of the source element.
+        fragments: Property element name (``"rPr"``, ``"pPr"``, ``"tblPr"``,
+            ``"tcPr"``) -> element. An empty element means "no direct
+            formatting" and clears the target's.
+    """
+
+    def __init__(self, kind: str, fragments: Dict[str, Any]):
+        if kind not in FORMAT_KINDS:
+            raise ValueError(f"Unsupported format kind '{kind}'. Supported: {', '.join(FORMAT_KINDS)}")
+        self.kind = kind
+        self.fragments = fragments
+
+    @classmethod
+    def from_element(cls, element: Any) -> "CompiledFormat":
+        """Compile the direct formatting of a Run, Paragraph, Table or cell."""
+        el = getattr(element, "_element", element)
+        kind = _KIND_OF_TAG.get(getattr(el, "tag", None))
+        if kind is None:
+            raise ValueError(f"Unsupported element type: {type(element).__name__}")
+        if kind == "run":
+            fragments = {"rPr": _compile(el.find(qn("w:rPr")), "rPr")}
+        elif kind == "paragraph":
+            fragments = {
+                "pPr": _compile(el.find(qn("w:pPr")), "pPr"),
+                "rPr": _compile(_first_run_rpr(el), "rPr"),
+            }
+        elif kind == "table":
+            fragments = {"tblPr": _compile(el.find(qn("w:tblPr")), "tblPr")}
+        else:
+            p = el.find(_P)
+            fragments = {
+                "tcPr": _compile(el.find(qn("w:tcPr")), "tcPr"),
+                "pPr": _compile(p.find(qn("w:pPr")) if p is not None else None, "pPr"),
+                "rPr": _compile(_first_run_rpr(p) if p is not None else None, "rPr"),
+            }
+        return cls(kind, fragments)
+
+    @classmethod
+    def from_xml(cls, kind: str, xml: Dict[str, str]) -> "CompiledFormat":
+        """Rebuild a format from ``to_xml`` output.
+
+        Raises:
+            ValueError: On an unknown kind, a missing or malformed fragment,
+                or a fragment whose root is not the expected property element.
+        """
+        if kind not in FORMAT_KINDS:
+            raise ValueError(f"Unsupported format kind '{kind}'. Supported: {', '.join(FORMAT_KINDS)}")
+        fragments = {}
+        for name in _FRAGMENTS[kind]:
+            if name not in xml:
+                raise ValueError(f"Format of kind '{kind}' needs a '{name}' fragment")
+            try:
+                fragment = parse_xml(xml[name])
+            except etree.XMLSyntaxError as e:
+                raise ValueError(f"Invalid '{name}' fragment: {e}")
+            if fragment.tag != qn(f"w:{name}"):
+                raise ValueError(f"Fragment '{name}' must be a <w:{name}> element")
+            fragments[name] = _compile(fragment, name)
+        return cls(kind, fragments)
+
+    def to_xml(self) -> Dict[str, str]:
+        """Fragments as XML strings (JSON-serializable)."""
+        return {
+            name: etree.tostring(fragment, encoding="unicode")
+            for name, fragment in self.fragments.items()
+        }
+
+    # -- application ------------------------------------------------------
+
+    def _set(self, owner, name: str) -> None:
+        """Give ``owner`` the fragment as its ``name`` property element.
+
+        An existing property element is refilled in place so references to
+        it stay valid.
+        """
+        fragment = self.fragments[name]
+        old = owner.find(qn(f"w:{name}"))
+        if old is None:
+            # tblPr is required; an empty rPr/pPr/tcPr is just omitted
+            if len(fragment) or fragment.attrib or name == "tblPr":
+                # Property elements come first in their parent
+                owner.insert(0, copy.deepcopy(fragment))
+            return
+        head, tail = _PRESERVED[name]
+        keep_head = [child for child in old if child.tag in head]
+        keep_tail = [child for child in old if child.tag in tail]
+        old.clear()
+        old.attrib.update(fragment.attrib)
+        old.extend(keep_head)
+        old.extend(copy.deepcopy(child) for child in fragment)
+        old.extend(keep_tail)
+        if not len(old) and not old.attrib and name != "tblPr":
+            owner.remove(old)
+
+    def _apply_runs(self, container) -> int:
+        count = 0
+        for r in (container.iter(_R) if container.tag == _P else _own(container, _R)):
+            self._set(r, "rPr")
+            count += 1
+        return count
+
+    def apply(self, target: Any, include_runs: bool = False) -> None:
+        """Apply the format to one target.
+
+        Compatible targets:
+            - run format: runs; paragraphs and cells (every run in them)
+            - paragraph format: paragraphs; cells (every paragraph). With
+              ``include_runs`` the runs also take the source's first-run
+              formatting.
+            - table format: tables
+            - cell format: cells (cell properties, plus paragraph and run
+              formatting of the cell's own paragraphs)
+
+        Raises:
+            ValueError: If the target kind does not fit the format kind.
+        """
+        el = getattr(target, "_element", target)
+        target_kind = _KIND_OF_TAG.get(getattr(el, "tag", None))
+        kind = self.kind
+
+        if kind == "run" and target_kind == "run":
+            self._set(el, "rPr")
+        elif kind == "run" and target_kind in ("paragraph", "cell"):
+            self._apply_runs(el)
+        elif kind == "paragraph" and target_kind == "paragraph":
+            self._set(el, "pPr")
+            if include_runs:
+                self._apply_runs(el)
+        elif kind == "paragraph" and target_kind == "cell":
+            for p in _own(el, _P):
+                self._set(p, "pPr")
+                if include_runs:
+                    self._apply_runs(p)
+        elif kind == "table" and target_kind == "table":
+            self._set(el, "tblPr")
+        elif kind == "cell" and target_kind == "cell":
+            self._set(el, "tcPr")
+            for p in _own(el, _P):
+                self._set(p, "pPr")
+                self._apply_runs(p)
+        else:
+            raise ValueError(f"Cannot apply a {kind} format to {target_kind or type(target).__name__}")
+
+    def apply_all(self, targets: Iterable[Any], include_runs: bool = False) -> Dict[str, Any]:
+        """Apply the format to many targets.
+
+        Returns:
+            dict: ``applied`` (count) and ``failed`` (list of ``(index,
+            error)`` for targets of an incompatible kind).
+        """
+        applied = 0
+        failed: List[Tuple[int, str]] = []
+        for index, target in enumerate(targets):
+            try:
+                self.apply(target, include_runs=include_runs)
+                applied += 1
+            except ValueError as e:
+                failed.append((index, str(e)))
+        logger.debug(f"CompiledFormat({self.kind}): applied to {applied} targets, {len(failed)} failed")
+        return {"applied": applied, "failed": failed}
+
+
+def compile_format(element: Any) -> Optional[CompiledFormat]:
+    """``CompiledFormat.from_element`` for python-docx objects backed by XML, else None.
+
+    Lets callers keep a descriptor-based fallback for objects that only look
+    like python-docx objects.
+    """
+    el = getattr(element, "_element", None)
+    if not isinstance(el, etree._Element) or el.tag not in _KIND_OF_TAG:
+        return None
+    return CompiledFormat.from_element(element)
+
+
+# Schema order of w:rPr children (ECMA-376 CT_RPr)
+_RPR_ORDER = {
+    qn(f"w:{name}"): index
+    for index, name in enumerate((
+        "rStyle", "rFonts", "b", "bCs", "i", "iCs", "caps", "smallCaps", "strike",
+        "dstrike", "outline", "shadow", "emboss", "imprint", "noProof", "snapToGrid",
+        "vanish", "webHidden", "color", "spacing", "w", "kern", "position", "sz",
+        "szCs", "highlight", "u", "effect", "bdr", "shd", "fitText", "vertAlign",
+        "rtl", "cs", "em", "lang", "eastAsianLayout", "specVanish", "oMath", "rPrChange",
+    ))
+}
+
+
+class RunPropertiesPatch:
+    """Partial run formatting merged into each run's own ``w:rPr``.
+
+    Unlike ``CompiledFormat``, which replaces the whole property element,
+    a patch only sets the properties it carries and keeps the rest of each
+    run's formatting. The patch is built once with the python-docx font API
+    (so the XML is exactly what ``run.font`` would write) and then merged
+    into every target by cloning its children in schema order.
+    """
+
+    def __init__(self, rpr):
+        self.rpr = rpr
+
+    @classmethod
+    def from_font(cls, size=None, bold=None, italic=None, rgb=None) -> "RunPropertiesPatch":
+        """Patch setting the given font properties; None leaves a property alone."""
+        from docx.shared import Pt
+        from docx.text.run import Run
+
+        r = parse_xml(f"<w:r {nsdecls('w')}/>")
+        font = Run(r, None).font
+        if size is not None:
+            font.size = Pt(size)
+        if bold is not None:
+            font.bold = bold
+        if italic is not None:
+            font.italic = italic
+        if rgb is not None:
+            font.color.rgb = rgb
+        rpr = r.find(qn("w:rPr"))
+        return cls(rpr if rpr is not None else _empty("rPr"))
+
+    def apply(self, r) -> None:
+        """Merge the patch into the ``w:r`` element ``r``."""
+        if not len(self.rpr):
+            return
+        rpr = r.find(qn("w:rPr"))
+        if rpr is None:
+            r.insert(0, copy.deepcopy(self.rpr))
+            return
+        last = len(_RPR_ORDER)
+        for child in self.rpr:
+            clone = copy.deepcopy(child)
+            old = rpr.find(child.tag)
+            if old is not None:
+                rpr.replace(old, clone)
+                continue
+            order = _RPR_ORDER.get(child.tag, last)
+            successor = next((el for el in rpr if _RPR_ORDER.get(el.tag, last) > order), None)
+            if successor is not None:
+                successor.addprevious(clone)
+            else:
+                rpr.append(clone)
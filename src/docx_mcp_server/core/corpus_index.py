@@ -0,0 +1,317 @@
+"""Persistent full-text index over a directory tree of .docx files.
+
+Answering "which of these documents contain X" by opening every file in a
+session does not scale to archives of thousands of documents. This module
+keeps an inverted index in a SQLite file next to (or away from) the corpus:
+
+- ``files``: one row per indexed document, keyed by relative path and
+  tracked by (mtime, size) so refreshes only re-extract changed files
+- ``paragraphs``: the text of every non-empty paragraph (body and tables)
+- ``postings``: normalized term -> paragraph rows
+
+Text extraction runs in a process pool; queries intersect term postings in
+SQLite (the last query term as a prefix, so a partially typed word still
+matches) and only verify the few candidate paragraphs in Python.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from docx_mcp_server.core.fuzzy_index import normalize_text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_NAME = ".docx-mcp-index.sqlite3"
+SCHEMA_VERSION = 1
+
+_CJK = "\u3040-\u30ff\u3400-\u9fff\uf900-\ufaff\uac00-\ud7af"
+# CJK text has no word separators, so every CJK character is its own term;
+# everything else is split into runs of word characters.
+_TOKEN_RE = re.compile(f"[{_CJK}]|[^\\W{_CJK}]+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS paragraphs (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL,
+    idx INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS paragraphs_file ON paragraphs(file_id);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    para_id INTEGER NOT NULL,
+    PRIMARY KEY (term, para_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_para ON postings(para_id);
+"""
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into normalized index terms."""
+    return _TOKEN_RE.findall(normalize_text(text))
+
+
+def extract_paragraphs(path: str) -> List[Tuple[int, str]]:
+    """Return ``(paragraph_index, text)`` for the non-empty paragraphs of a file.
+
+    Paragraph indices count every ``w:p`` of the body in document order,
+    including paragraphs inside table cells.
+    """
+    from docx import Document
+    from docx.oxml.ns import qn
+    from docx_mcp_server.core.text_extractor import paragraph_text
+
+    body = Document(path).element.body
+    result = []
+    for idx, p in enumerate(body.iter(qn("w:p"))):
+        text = paragraph_text(p)
+        if text.strip():
+            result.append((idx, text))
+    return result
+
+
+def _extract_worker(path: str) -> Tuple[str, Optional[List[Tuple[int, str]]], Optional[str]]:
+    """Process-pool entry point; never raises so one bad file cannot abort a refresh."""
+    try:
+        return path, extract_paragraphs(path), None
+    except Exception as e:
+        return path, None, str(e)
+
+
+def _make_snippet(text: str, query: str, width: int = 160) -> str:
+    """Cut a window of ``width`` characters around the first match of ``query``."""
+    if len(text) <= width:
+        return text
+    pos = text.lower().find(query.strip().lower())
+    if pos < 0:
+        return text[:width - 3] + "..."
+    start = max(0, pos - (width - len(query)) // 2)
+    end = min(len(text), start + width)
+    start = max(0, end - width)
+    return ("..." if start > 0 else "") + text[start:end] + ("..." if end < len(text) else "")
+
+
+class DocxSearchIndex:
+    """On-disk inverted index for all .docx files below a root directory."""
+
+    def __init__(self, root_path: str, index_path: Optional[str] = None):
+        if not os.path.isdir(root_path):
+            raise ValueError(f"Directory not found: {root_path}")
+        self.root_path = os.path.abspath(root_path)
+        self.index_path = os.path.abspath(index_path or os.path.join(self.root_path, DEFAULT_INDEX_NAME))
+        with closing(self._connect()) as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SCHEMA_VERSION):
+                raise ValueError(f"Unsupported index schema version {version} in {self.index_path}")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.index_path)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    def _scan(self, recursive: bool) -> Dict[str, Tuple[float, int]]:
+        """Return ``{relative_path: (mtime, size)}`` for the .docx files on disk."""
+        found = {}
+
+        def visit(directory: str):
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and not entry.name.startswith("."):
+                            visit(entry.path)
+                    elif entry.name.lower().endswith(".docx") and not entry.name.startswith("~$"):
+                        stat = entry.stat()
+                        rel = os.path.relpath(entry.path, self.root_path).replace(os.sep, "/")
+                        found[rel] = (stat.st_mtime, stat.st_size)
+
+        visit(self.root_path)
+        return found
+
+    def refresh(self, recursive: bool = True, workers: Optional[int] = None) -> Dict[str, Any]:
+        """Bring the index up to date with the directory tree.
+
+        Only files whose (mtime, size) changed since the last refresh are
+        re-extracted. Extraction runs in a process pool of ``workers``
+        processes (default: CPU count); ``workers=1`` extracts in-process.
+
+        Returns:
+            dict: Counts of added/updated/removed/unchanged/failed files, the
+            total number of indexed files and the elapsed time.
+        """
+        started = time.perf_counter()
+        on_disk = self._scan(recursive)
+
+        with closing(self._connect()) as conn:
+            indexed = {
+                path: (file_id, mtime, size)
+                for file_id, path, mtime, size in conn.execute("SELECT id, path, mtime, size FROM files")
+            }
+
+            removed = [path for path in indexed if path not in on_disk]
+            stale = [
+                path for path, stat in on_disk.items()
+                if path not in indexed or indexed[path][1:] != stat
+            ]
+            for path in removed:
+                self._delete_file(conn, indexed[path][0])
+
+            stats = {"added": 0, "updated": 0, "removed": len(removed), "failed": 0, "errors": []}
+            absolute = [os.path.join(self.root_path, path) for path in stale]
+            for abs_path, paragraphs, error in self._extract_all(absolute, workers):
+                rel = os.path.relpath(abs_path, self.root_path).replace(os.sep, "/")
+                if rel in indexed:
+                    self._delete_file(conn, indexed[rel][0])
+                if error is not None:
+                    stats["failed"] += 1
+                    stats["errors"].append({"path": rel, "error": error})
+                    logger.warning(f"Failed to index {rel}: {error}")
+                    continue
+                mtime, size = on_disk[rel]
+                self._insert_file(conn, rel, mtime, size, paragraphs)
+                stats["updated" if rel in indexed else "added"] += 1
+            conn.commit()
+
+            stats["unchanged"] = len(on_disk) - len(stale)
+            stats["indexed_files"] = conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+        stats["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(
+            f"Search index refreshed for {self.root_path}: +{stats['added']} "
+            f"~{stats['updated']} -{stats['removed']} !{stats['failed']} ({stats['elapsed_ms']} ms)"
+        )
+        return stats
+
+    def _extract_all(self, paths: List[str], workers: Optional[int]) -> Iterable[Tuple[str, Any, Any]]:
+        if not paths:
+            return []
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(paths) == 1:
+            return map(_extract_worker, paths)
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+                chunksize = max(1, len(paths) // (workers * 4))
+                return list(pool.map(_extract_worker, paths, chunksize=chunksize))
+        except (BrokenProcessPool, OSError) as e:
+            # e.g. frozen executables or sandboxes that cannot spawn processes
+            logger.warning(f"Process pool unavailable ({e}), extracting serially")
+            return map(_extract_worker, paths)
+
+    @staticmethod
+    def _delete_file(conn: sqlite3.Connection, file_id: int):
+        conn.execute(
+            "DELETE FROM postings WHERE para_id IN (SELECT id FROM paragraphs WHERE file_id = ?)",
+            (file_id,),
+        )
+        conn.execute("DELETE FROM paragraphs WHERE file_id = ?", (file_id,))
+        conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    @staticmethod
+    def _insert_file(conn: sqlite3.Connection, path: str, mtime: float, size: int,
+                     paragraphs: List[Tuple[int, str]]):
+        file_id = conn.execute(
+            "INSERT INTO files (path, mtime, size) VALUES (?, ?, ?)", (path, mtime, size)
+        ).lastrowid
+        for idx, text in paragraphs:
+            para_id = conn.execute(
+                "INSERT INTO paragraphs (file_id, idx, text) VALUES (?, ?, ?)", (file_id, idx, text)
+            ).lastrowid
+            conn.executemany(
+                "INSERT OR IGNORE INTO postings (term, para_id) VALUES (?, ?)",
+                ((term, para_id) for term in set(tokenize(text))),
+            )
+
+    def search(self, query: str, max_results: int = 20) -> List[Dict[str, Any]]:
+        """Find paragraphs containing ``query`` (normalized phrase match).
+
+        Candidates are paragraphs containing every query term, the last one
+        as a prefix ("limitation of liab" finds "limitation of liability");
+        they are then checked for the normalized phrase.
+
+        Returns:
+            list: ``{"path", "paragraph_index", "snippet"}`` dicts ordered by
+            path and paragraph index.
+        """
+        tokens = tokenize(query)
+        phrase = normalize_text(query)
+        if not tokens:
+            return []
+
+        last = tokens[-1]
+        terms = sorted(set(tokens[:-1]) - {last})
+        # Prefix range on the (term, para_id) key: last <= term < last with its final character bumped
+        selects = ["SELECT para_id FROM postings WHERE term = ?"] * len(terms)
+        selects.append("SELECT para_id FROM postings WHERE term >= ? AND term < ?")
+        params = terms + [last, last[:-1] + chr(ord(last[-1]) + 1)]
+        sql = (
+            "SELECT f.path, p.idx, p.text FROM paragraphs p JOIN files f ON f.id = p.file_id "
+            f"WHERE p.id IN ({' INTERSECT '.join(selects)}) ORDER BY f.path, p.idx"
+        )
+
+        results = []
+        with closing(self._connect()) as conn:
+            for path, idx, text in conn.execute(sql, params):
+                if phrase not in normalize_text(text):
+                    continue
+                results.append({
+                    "path": path,
+                    "paragraph_index": idx,
+                    "snippet": _make_snippet(text, query),
+                })
+                if len(results) >= max_results:
+                    break
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of indexed files and paragraphs."""
+        with closing(self._connect()) as conn:
+            files = conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            paragraphs = conn.execute("SELECT COUNT(*) FROM paragraphs").fetchone()[0]
+        return {"files": files, "paragraphs": paragraphs}
+
+
+def search_directory(
+    root_path: str,
+    query: str,
+    max_results: int = 20,
+    refresh: bool = False,
+    recursive: bool = True,
+    index_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Search the index of ``root_path``, building it on first use.
+
+    Shared by the ``docx_search_directory`` tool and the ``/api/search``
+    HTTP route.
+    """
+    index = DocxSearchIndex(root_path, index_path=index_path)
+    refreshed = None
+    if refresh or index.stats()["files"] == 0:
+        refreshed = index.refresh(recursive=recursive)
+
+    started = time.perf_counter()
+    results = index.search(query, max_results=max_results)
+    return {
+        "root": index.root_path,
+        "index_path": index.index_path,
+        "query": query,
+        "count": len(results),
+        "results": results,
+        "query_ms": round((time.perf_counter() - started) * 1000, 2),
+        "refresh": refreshed,
+    }
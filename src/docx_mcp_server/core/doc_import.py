@@ -0,0 +1,325 @@
+"""Copying content between documents.
+
+``CopyEngine`` deep-copies XML inside one document. Content copied into
+*another* document also carries references into its source package: style
+IDs (``w:pStyle``/``w:rStyle``/``w:tblStyle``), numbering instances
+(``w:numId``) and relationship IDs (``r:embed`` images, ``r:id``
+hyperlinks, charts, embedded objects). Left as-is they dangle or, worse,
+silently point at unrelated definitions of the target.
+
+``DocumentImporter`` belongs to one target document and rewrites those
+references while copying:
+
+- styles the target already has (same ID, or same name and type) are
+  reused; missing ones are copied once, together with their ``basedOn`` /
+  ``next`` / ``link`` chain
+- abstract numbering definitions are matched by content, so identical list
+  definitions from many sources share one ``w:abstractNum``; every source
+  list gets its own ``w:num`` so numbering does not run on across sources
+- images go through the package image store (deduplicated by SHA1); other
+  internal parts are copied with their own relationships, external
+  relationships are re-created
+
+Mappings are kept per source (``ImportMap``), so importing more content
+from the same source reuses every definition imported before.
+"""
+
+import copy
+import hashlib
+import io
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from lxml import etree
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.packuri import PackURI
+from docx.opc.part import Part
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.parts.numbering import NumberingPart
+
+from docx_mcp_server.core.style_cache import invalidate_style_cache
+
+logger = logging.getLogger(__name__)
+
+_R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+_VAL = qn("w:val")
+_TYPE = qn("w:type")
+_ABSTRACT_NUM_ID = qn("w:abstractNumId")
+_NUM_ID = qn("w:numId")
+_NUM_PR = qn("w:numPr")
+
+# Elements whose w:val is a style ID
+_STYLE_REFS = {
+    qn("w:pStyle"), qn("w:rStyle"), qn("w:tblStyle"),
+    qn("w:basedOn"), qn("w:next"), qn("w:link"),
+    qn("w:styleLink"), qn("w:numStyleLink"),
+}
+# Attributes that identify one particular list rather than its look
+_IDENTITY = (qn("w:nsid"), qn("w:tmpl"))
+
+_DIGITS = re.compile(r"\d+(?=\.[^./]*$)")
+
+
+def _partname_template(partname: str) -> str:
+    """``/word/charts/chart3.xml`` -> ``/word/charts/chart%d.xml``."""
+    if _DIGITS.search(partname):
+        return _DIGITS.sub("%d", partname, count=1)
+    base, dot, ext = partname.rpartition(".")
+    return f"{base}%d{dot}{ext}" if dot else f"{partname}%d"
+
+
+def _abstract_key(abstract_num) -> str:
+    """Content hash of a ``w:abstractNum``, ignoring its ID and list identity."""
+    clone = copy.deepcopy(abstract_num)
+    clone.attrib.pop(_ABSTRACT_NUM_ID, None)
+    for child in list(clone):
+        if child.tag in _IDENTITY:
+            clone.remove(child)
+    return hashlib.sha1(etree.tostring(clone, method="c14n")).hexdigest()
+
+
+class ImportMap:
+    """Source -> target ID mappings for one source document."""
+
+    def __init__(self, source_document):
+        self.source = source_document
+        self.styles: Dict[str, str] = {}
+        self.nums: Dict[str, str] = {}
+        # Relationship ID in the source part -> ID in the target part
+        self.rels: Dict[str, str] = {}
+        # id() of copied source parts -> their copy, for shared sub-parts
+        self.parts: Dict[int, Part] = {}
+
+
+class DocumentImporter:
+    """Imports elements of other documents into ``document``.
+
+    Args:
+        document: Target python-docx Document.
+    """
+
+    def __init__(self, document):
+        self.document = document
+        self.part = document.part
+        self._maps: Dict[Any, ImportMap] = {}
+        self._abstracts: Optional[Dict[str, str]] = None
+        self.stats = {"styles": 0, "abstract_nums": 0, "nums": 0, "parts": 0}
+
+    def source_map(self, source_document, source_key: Any = None) -> ImportMap:
+        """Mappings for ``source_document``, created on first use.
+
+        ``source_key`` identifies the source across calls (e.g. its session
+        ID or file path); by default the source document part itself.
+        """
+        key = source_key if source_key is not None else id(source_document.part)
+        mapping = self._maps.get(key)
+        if mapping is None or mapping.source.part is not source_document.part:
+            mapping = ImportMap(source_document)
+            self._maps[key] = mapping
+        return mapping
+
+    def import_elements(
+        self,
+        source_document,
+        elements: Iterable[Any],
+        source_key: Any = None,
+    ) -> Dict[str, Any]:
+        """Copy ``elements`` of ``source_document`` for use in the target.
+
+        The copies are returned detached; the caller inserts them.
+
+        Args:
+            source_document: Document the elements belong to.
+            elements: XML elements (or python-docx objects) to copy.
+            source_key: Stable key of the source, see ``source_map``.
+
+        Returns:
+            dict: ``elements`` (the copies), ``styles``, ``abstract_nums``,
+            ``nums`` and ``parts`` (definitions and parts added to the target
+            by this call).
+        """
+        before = dict(self.stats)
+        sources = [getattr(el, "_element", el) for el in elements]
+        if source_document.part is self.part:
+            copies = [copy.deepcopy(el) for el in sources]
+        else:
+            mapping = self.source_map(source_document, source_key)
+            copies = []
+            for el in sources:
+                clone = copy.deepcopy(el)
+                self._remap(mapping, clone)
+                copies.append(clone)
+        result: Dict[str, Any] = {"elements": copies}
+        for key, value in self.stats.items():
+            result[key] = value - before[key]
+        logger.debug(
+            f"DocumentImporter: {len(copies)} elements, "
+            f"{result['styles']} styles, {result['nums']} lists, {result['parts']} parts added"
+        )
+        return result
+
+    def _remap(self, mapping: ImportMap, root) -> None:
+        """Rewrite style, numbering and relationship references under ``root``."""
+        for el in root.iter():
+            if not isinstance(el.tag, str):
+                continue
+            if el.tag in _STYLE_REFS:
+                value = el.get(_VAL)
+                if value:
+                    el.set(_VAL, self._style(mapping, value))
+            elif el.tag == _NUM_ID and el.getparent() is not None and el.getparent().tag == _NUM_PR:
+                value = el.get(_VAL)
+                if value:
+                    el.set(_VAL, self._num(mapping, value))
+            for attr, value in el.attrib.items():
+                if attr.startswith(_R_NS) and value:
+                    el.set(attr, self._rel(mapping, value))
+
+    # -- styles -----------------------------------------------------------
+
+    def _style(self, mapping: ImportMap, style_id: str) -> str:
+        if style_id in mapping.styles:
+            return mapping.styles[style_id]
+        target_styles = self.document.styles.element
+        source_style = mapping.source.styles.element.get_by_id(style_id)
+        if source_style is None or target_styles.get_by_id(style_id) is not None:
+            # Unknown in the source (Word ignores it) or already in the target
+            mapping.styles[style_id] = style_id
+            return style_id
+
+        name = source_style.name_val
+        existing = target_styles.get_by_name(name) if name else None
+        if existing is not None and existing.get(_TYPE) == source_style.get(_TYPE):
+            mapping.styles[style_id] = existing.styleId
+            return existing.styleId
+
+        # Mapped before recursing: basedOn/link chains may lead back here
+        mapping.styles[style_id] = style_id
+        clone = copy.deepcopy(source_style)
+        clone.attrib.pop(qn("w:default"), None)
+        target_styles.append(clone)
+        invalidate_style_cache(self.document)
+        self.stats["styles"] += 1
+        self._remap(mapping, clone)
+        return style_id
+
+    # -- numbering --------------------------------------------------------
+
+    def _numbering(self):
+        """The target ``w:numbering`` element, adding a numbering part if needed."""
+        try:
+            return self.part.part_related_by(RT.NUMBERING).element
+        except KeyError:
+            package = self.part.package
+            numbering = parse_xml(f"<w:numbering {nsdecls('w')}/>")
+            part = NumberingPart(
+                PackURI("/word/numbering.xml"), CT.WML_NUMBERING, numbering, package
+            )
+            self.part.relate_to(part, RT.NUMBERING)
+            return numbering
+
+    def _num(self, mapping: ImportMap, num_id: str) -> str:
+        if num_id in mapping.nums:
+            return mapping.nums[num_id]
+        try:
+            source_numbering = mapping.source.part.part_related_by(RT.NUMBERING).element
+            source_num = source_numbering.num_having_numId(int(num_id))
+        except (KeyError, ValueError):
+            # numId 0 ("no numbering") or a reference the source cannot resolve
+            mapping.nums[num_id] = num_id
+            return num_id
+
+        abstract_id = source_num.abstractNumId.val
+        source_abstract = source_numbering.find(
+            f"{qn('w:abstractNum')}[@{qn('w:abstractNumId')}='{abstract_id}']"
+        )
+        numbering = self._numbering()
+        target_abstract = self._abstract(mapping, numbering, source_abstract) if source_abstract is not None else str(abstract_id)
+
+        num = numbering.add_num(int(target_abstract))
+        for override in source_num.findall(qn("w:lvlOverride")):
+            num.append(copy.deepcopy(override))
+        new_id = str(num.numId)
+        mapping.nums[num_id] = new_id
+        self.stats["nums"] += 1
+        self._remap(mapping, num)
+        return new_id
+
+    def _abstract(self, mapping: ImportMap, numbering, source_abstract) -> str:
+        if self._abstracts is None:
+            self._abstracts = {
+                _abstract_key(el): el.get(_ABSTRACT_NUM_ID)
+                for el in numbering.findall(qn("w:abstractNum"))
+            }
+        key = _abstract_key(source_abstract)
+        if key in self._abstracts:
+            return self._abstracts[key]
+
+        existing = numbering.findall(qn("w:abstractNum"))
+        new_id = str(max((int(el.get(_ABSTRACT_NUM_ID)) for el in existing), default=-1) + 1)
+        clone = copy.deepcopy(source_abstract)
+        clone.set(_ABSTRACT_NUM_ID, new_id)
+        # Schema order: every w:abstractNum precedes the w:num elements
+        if existing:
+            existing[-1].addnext(clone)
+        else:
+            numbering.insert(0, clone)
+        self._abstracts[key] = new_id
+        self.stats["abstract_nums"] += 1
+        self._remap(mapping, clone)
+        return new_id
+
+    # -- relationships ----------------------------------------------------
+
+    def _rel(self, mapping: ImportMap, r_id: str) -> str:
+        if r_id in mapping.rels:
+            return mapping.rels[r_id]
+        rel = mapping.source.part.rels.get(r_id)
+        if rel is None:
+            return r_id
+        if rel.is_external:
+            new_id = self.part.relate_to(rel.target_ref, rel.reltype, is_external=True)
+        elif rel.reltype == RT.IMAGE:
+            new_id = self._image(mapping, rel.target_part)
+        else:
+            new_id = self.part.relate_to(self._copy_part(mapping, rel.target_part), rel.reltype)
+        mapping.rels[r_id] = new_id
+        return new_id
+
+    def _image(self, mapping: ImportMap, image_part) -> str:
+        try:
+            new_id, _ = self.part.get_or_add_image(io.BytesIO(image_part.blob))
+            return new_id
+        except Exception as e:
+            # Formats python-docx cannot parse (EMF, SVG, ...) are copied as raw parts
+            logger.debug(f"Copying image {image_part.partname} as a raw part: {e}")
+            return self.part.relate_to(self._copy_part(mapping, image_part), RT.IMAGE)
+
+    def _copy_part(self, mapping: ImportMap, source_part) -> Part:
+        """Copy an internal part and, recursively, the parts it relates to."""
+        copied = mapping.parts.get(id(source_part))
+        if copied is not None:
+            return copied
+        package = self.part.package
+        partname = package.next_partname(_partname_template(str(source_part.partname)))
+        copied = Part(partname, source_part.content_type, source_part.blob, package)
+        mapping.parts[id(source_part)] = copied
+        self.stats["parts"] += 1
+        # A fresh part has no relationships, so the source rIds stay valid in its XML
+        for rel in source_part.rels.values():
+            target = rel.target_ref if rel.is_external else self._copy_part(mapping, rel.target_part)
+            copied.rels.add_relationship(rel.reltype, target, rel.rId, rel.is_external)
+        return copied
+
+
+def body_elements(document) -> List[Any]:
+    """Body-level block elements of ``document`` (everything but ``w:sectPr``)."""
+    sect_pr = qn("w:sectPr")
+    return [
+        el for el in document.element.body
+        if isinstance(el.tag, str) and el.tag != sect_pr
+    ]
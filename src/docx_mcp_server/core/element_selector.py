@@ -0,0 +1,195 @@
+"""Selection of many target elements for bulk operations.
+
+Bulk tools (``docx_apply_format_batch``, ``docx_set_font_batch``) accept the
+same selection arguments:
+
+- ``ids``: explicit element IDs, used as given
+- ``start_id``/``end_id``: the sibling blocks (paragraphs and tables) from
+  one element to another, inclusive
+- ``text``/``style``: predicates on paragraphs. Within an ID or range scope
+  they filter the scope's paragraphs (tables and cells contribute the
+  paragraphs they contain); without a scope the whole document is searched.
+
+``select_targets`` parses those arguments as the tools receive them and
+turns selection errors into error responses; ``describe_failures`` lists
+the targets a batch could not format.
+
+Paragraph text and styles are read from the XML directly (see
+``text_extractor``) so a predicate over a long document does not build a
+python-docx wrapper per paragraph.
+"""
+
+import json
+import re
+from typing import Any, List, Optional
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+
+from docx_mcp_server.core.response import create_error_response
+from docx_mcp_server.core.text_extractor import paragraph_text
+from docx_mcp_server.utils.copy_engine import CopyEngine
+
+_P = qn("w:p")
+_P_STYLE = f"{qn('w:pPr')}/{qn('w:pStyle')}"
+
+
+class ElementSelector:
+    """Resolves selection arguments to python-docx objects of one session."""
+
+    def __init__(self, session):
+        self.session = session
+
+    def select(
+        self,
+        ids: Optional[List[str]] = None,
+        start_id: Optional[str] = None,
+        end_id: Optional[str] = None,
+        text: Optional[str] = None,
+        style: Optional[str] = None,
+        use_regex: bool = False,
+        case_sensitive: bool = False,
+    ) -> List[Any]:
+        """Return the selected elements in selection order, without duplicates.
+
+        Raises:
+            LookupError: If an ID does not resolve to an element.
+            ValueError: When no selection arguments are given, on an
+                incomplete range, an invalid regex or an unknown style. A
+                selection that matches nothing returns ``[]``.
+        """
+        if (start_id is None) != (end_id is None):
+            raise ValueError("start_id and end_id must be given together")
+        has_predicate = text is not None or style is not None
+        if ids is None and start_id is None and not has_predicate:
+            raise ValueError("Select targets by IDs, an ID range, or a text/style predicate")
+
+        scope: List[Any] = []
+        if ids is not None:
+            scope.extend(self._resolve(ids))
+        if start_id is not None:
+            start, end = self._resolve([start_id, end_id])
+            scope.extend(CopyEngine().get_elements_between(start, end))
+
+        if has_predicate:
+            match = self._predicate(text, style, use_regex, case_sensitive)
+            if ids is None and start_id is None:
+                containers = [self.session.document.element.body]
+            else:
+                containers = [getattr(el, "_element", None) for el in scope]
+            scope = [
+                Paragraph(p, self.session.document._body)
+                for p in self._paragraphs(containers)
+                if match(p)
+            ]
+
+        seen = set()
+        selected = []
+        for el in scope:
+            key = id(getattr(el, "_element", el))
+            if key not in seen:
+                seen.add(key)
+                selected.append(el)
+        return selected
+
+    def _resolve(self, ids: List[str]) -> List[Any]:
+        objects, missing = [], []
+        for obj_id in ids:
+            obj = self.session.get_object(obj_id)
+            if obj is None:
+                missing.append(obj_id)
+            objects.append(obj)
+        if missing:
+            more = f" (+{len(missing) - 10} more)" if len(missing) > 10 else ""
+            raise LookupError(f"Elements not found: {', '.join(missing[:10])}{more}")
+        return objects
+
+    @staticmethod
+    def _paragraphs(containers) -> List[Any]:
+        paragraphs = []
+        for el in containers:
+            if el is None:
+                continue
+            if el.tag == _P:
+                paragraphs.append(el)
+            else:
+                paragraphs.extend(el.iter(_P))
+        return paragraphs
+
+    def _predicate(self, text, style, use_regex, case_sensitive):
+        tests = []
+        if text is not None:
+            if use_regex:
+                try:
+                    pattern = re.compile(text, 0 if case_sensitive else re.IGNORECASE)
+                except re.error as e:
+                    raise ValueError(f"Invalid regex '{text}': {e}")
+                tests.append(lambda p: pattern.search(paragraph_text(p)) is not None)
+            elif case_sensitive:
+                tests.append(lambda p: text in paragraph_text(p))
+            else:
+                needle = text.lower()
+                tests.append(lambda p: needle in paragraph_text(p).lower())
+        if style is not None:
+            style_id, is_default = self._style_id(style)
+
+            def has_style(p):
+                el = p.find(_P_STYLE)
+                return el.get(qn("w:val")) == style_id if el is not None else is_default
+
+            tests.append(has_style)
+        return lambda p: all(test(p) for test in tests)
+
+    def _style_id(self, name: str):
+        styles = self.session.document.styles
+        try:
+            target = styles[name]
+        except KeyError:
+            raise ValueError(f"Style '{name}' not found")
+        if target.type != WD_STYLE_TYPE.PARAGRAPH:
+            raise ValueError(f"Style '{name}' is not a paragraph style")
+        default = styles.default(WD_STYLE_TYPE.PARAGRAPH)
+        return target.style_id, default is not None and default.style_id == target.style_id
+
+
+def _parse_id_list(value: str, name: str) -> list:
+    """Parse a JSON array of element IDs.
+
+    Raises:
+        ValueError: If ``value`` is not a JSON array of strings.
+    """
+    try:
+        ids = json.loads(value)
+    except json.JSONDecodeError:
+        raise ValueError(f"{name} must be a JSON array of element IDs")
+    if not isinstance(ids, list) or not all(isinstance(i, str) for i in ids):
+        raise ValueError(f"{name} must be a JSON array of element IDs")
+    return ids
+
+
+def select_targets(session, target_ids=None, start_id=None, end_id=None,
+                   text=None, style=None, use_regex=False):
+    """Resolve the selection arguments shared by the batch tools.
+
+    Returns:
+        tuple: (targets, None) or (None, error response)
+    """
+    try:
+        ids = _parse_id_list(target_ids, "target_ids") if target_ids is not None else None
+        targets = ElementSelector(session).select(
+            ids=ids, start_id=start_id, end_id=end_id,
+            text=text, style=style, use_regex=use_regex
+        )
+    except LookupError as e:
+        return None, create_error_response(str(e), error_type="ElementNotFound")
+    except ValueError as e:
+        return None, create_error_response(str(e), error_type="ValidationError")
+    return targets, None
+
+
+def describe_failures(failed: list, limit: int = 20) -> str:
+    """Compact one-line listing of failed targets for batch summaries."""
+    if not failed:
+        return "None"
+    return "; ".join(failed[:limit]) + (f" (+{len(failed) - limit} more)" if len(failed) > limit else "")
@@ -3,6 +3,7 @@ import logging
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run
 from docx.table import Table
+from docx_mcp_server.core.compiled_format import CompiledFormat, compile_format
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,8 @@ class FormatPainter:
                 self._copy_font_properties(source.style.font, target.font)
         elif isinstance(source, Run) and isinstance(target, Paragraph):
             # Apply Run's font to all runs in Paragraph
+            if self._clone_format(source, target):
+                return
             for run in target.runs:
                 self._copy_font_properties(source.font, run.font)
 
@@ -86,13 +89,27 @@ class FormatPainter:
             except Exception as e:
                 logger.warning(f"Failed to copy highlight color: {e}")
 
+    @staticmethod
+    def _clone_format(source: Any, target: Any) -> bool:
+        """Apply the compiled format of source to target; False if either has no XML."""
+        compiled = compile_format(source)
+        if compiled is None or compile_format(target) is None:
+            return False
+        compiled.apply(target)
+        return True
+
     def _copy_run_format(self, source: Run, target: Run) -> None:
         """Copy all font properties from source run to target run."""
+        if self._clone_format(source, target):
+            return
         self._copy_font_properties(source.font, target.font)
 
     def _copy_paragraph_format(self, source: Paragraph, target: Paragraph) -> None:
         """Copy paragraph formatting and style."""
         logger.debug("Copying paragraph format")
+        # w:pPr carries the style reference too
+        if self._clone_format(source, target):
+            return
         src_fmt = source.paragraph_format
         tgt_fmt = target.paragraph_format
 
@@ -154,42 +171,9 @@ class FormatPainter:
             logger.warning(f"Failed to copy table style: {e}")
 
         try:
-            # OXML Manipulation for Borders and Shading
-            # We act on tblPr (Table Properties)
-            src_tblPr = source._element.tblPr
-            tgt_tblPr = target._element.tblPr
-
-            # 1. Borders (tblBorders)
-            src_borders = src_tblPr.find(qn('w:tblBorders'))
-            if src_borders is not None:
-                try:
-                    # Remove existing borders in target if any
-                    old_borders = tgt_tblPr.find(qn('w:tblBorders'))
-                    if old_borders is not None:
-                        tgt_tblPr.remove(old_borders)
-
-                    # Deep copy source borders and append to target
-                    new_borders = copy.deepcopy(src_borders)
-                    tgt_tblPr.append(new_borders)
-                    logger.debug("Copied table borders")
-                except Exception as e:
-                    logger.warning(f"Failed to copy table borders: {e}")
-
-            # 2. Shading (shd)
-            src_shd = src_tblPr.find(qn('w:shd'))
-            if src_shd is not None:
-                try:
-                    # Remove existing shading
-                    old_shd = tgt_tblPr.find(qn('w:shd'))
-                    if old_shd is not None:
-                        tgt_tblPr.remove(old_shd)
-
-                    # Deep copy
-                    new_shd = copy.deepcopy(src_shd)
-                    tgt_tblPr.append(new_shd)
-                    logger.debug("Copied table shading")
-                except Exception as e:
-                    logger.warning(f"Failed to copy table shading: {e}")
+            # Table properties (style, borders, shading, widths, layout) as one clone
+            CompiledFormat.from_element(source._element).apply(target._element)
+            logger.debug("Copied table properties")
 
             # Grid/Column widths (tblGrid) - Optional but good for layout consistency
             src_grid = source._element.find(qn('w:tblGrid'))
@@ -262,6 +246,10 @@ class FormatPainter:
 
         logger.debug("Copying cell format")
 
+        # Cell properties plus the formatting of the cell's paragraphs and runs
+        if self._clone_format(source_cell, target_cell):
+            return
+
         try:
             # Copy paragraph formatting from first paragraph if exists
             if len(source_cell.paragraphs) > 0 and len(target_cell.paragraphs) > 0:
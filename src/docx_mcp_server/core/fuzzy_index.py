@@ -0,0 +1,181 @@
+"""Character trigram index for fuzzy paragraph lookup.
+
+LLM clients frequently search with text that is *almost* right: a typo,
+collapsed whitespace, straight instead of smart quotes. An exact substring
+search then returns nothing and the client falls back to reading the whole
+document. This index normalizes paragraph text, splits it into character
+trigrams and keeps an inverted index (trigram -> paragraph positions), so a
+query only touches the postings of its own trigrams instead of every
+paragraph in the document.
+"""
+
+import logging
+import re
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+
+from docx_mcp_server.core.text_extractor import paragraph_text
+
+logger = logging.getLogger(__name__)
+
+# Typographic characters that commonly differ between what a client types
+# and what Word stores. NFKC does not fold these.
+_CHAR_MAP = str.maketrans({
+    "\u2018": "'", "\u2019": "'", "\u201a": "'", "\u201b": "'",
+    "\u201c": '"', "\u201d": '"', "\u201e": '"', "\u201f": '"',
+    "\u2013": "-", "\u2014": "-", "\u2212": "-",
+    "\u00a0": " ", "\u2007": " ", "\u202f": " ",
+    "\u200b": "", "\u00ad": "",
+})
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for fuzzy comparison.
+
+    Applies NFKC, folds smart quotes/dashes/non-breaking spaces, casefolds
+    and collapses runs of whitespace to a single space.
+    """
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text).translate(_CHAR_MAP).casefold()
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def trigrams(normalized: str, pad: bool = True) -> Set[str]:
+    """Return the set of character trigrams of already-normalized text.
+
+    With ``pad`` the text gets a space on both sides so that word boundaries
+    contribute trigrams. Queries are not padded when they are long enough,
+    so that a query occurring mid-sentence still matches all its trigrams.
+    Strings shorter than three characters are always padded.
+    """
+    if not normalized:
+        return set()
+    if pad or len(normalized) < 3:
+        normalized = f" {normalized} "
+    return {normalized[i:i + 3] for i in range(len(normalized) - 2)}
+
+
+@dataclass
+class FuzzyMatch:
+    """A ranked fuzzy search hit."""
+    position: int
+    paragraph: Paragraph
+    text: str
+    score: float
+    similarity: float
+
+
+class TrigramIndex:
+    """Inverted trigram index over the body paragraphs of a document.
+
+    The index is built once and reused until the owning session reports a
+    new revision (see ``Session.get_fuzzy_index``). Query cost is
+    proportional to the postings of the query's trigrams, not to the number
+    of paragraphs in the document.
+    """
+
+    def __init__(self, document, revision: int = 0):
+        self.document = document
+        self.revision = revision
+        self._paragraphs: List[Paragraph] = []
+        self._texts: List[str] = []
+        self._sizes: List[int] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self._paragraphs)
+
+    @property
+    def body_length(self) -> int:
+        return self._body_length
+
+    def _build(self):
+        body = self.document.element.body
+        self._body_length = len(body)
+        parent = self.document
+        tag_p = qn("w:p")
+        for child in body.iterchildren(tag_p):
+            text = paragraph_text(child)
+            grams = trigrams(normalize_text(text))
+            if not grams:
+                continue
+            position = len(self._paragraphs)
+            self._paragraphs.append(Paragraph(child, parent))
+            self._texts.append(text)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings[gram].append(position)
+        logger.debug(
+            f"TrigramIndex built: {len(self._paragraphs)} paragraphs, "
+            f"{len(self._postings)} distinct trigrams"
+        )
+
+    def is_current(self, paragraph_position: int) -> bool:
+        """Check that an indexed paragraph is still attached and unchanged."""
+        paragraph = self._paragraphs[paragraph_position]
+        if paragraph._element.getparent() is None:
+            return False
+        return paragraph_text(paragraph._element) == self._texts[paragraph_position]
+
+    def search(
+        self,
+        query: str,
+        max_results: int = 10,
+        min_score: float = 0.5,
+    ) -> List[FuzzyMatch]:
+        """Return paragraphs ranked by how much of the query they contain.
+
+        ``score`` is the fraction of query trigrams present in the paragraph
+        (1.0 means every trigram of the query occurs, e.g. an exact match
+        modulo normalization). ``similarity`` is the Dice coefficient of the
+        two trigram sets and is used to break ties in favour of paragraphs
+        whose overall length is close to the query.
+        """
+        normalized = normalize_text(query)
+        query_grams = trigrams(normalized, pad=False)
+        if not query_grams:
+            return []
+
+        hits: Dict[int, int] = defaultdict(int)
+        for gram in query_grams:
+            for position in self._postings.get(gram, ()):
+                hits[position] += 1
+
+        query_size = len(query_grams)
+        ranked = []
+        for position, shared in hits.items():
+            score = shared / query_size
+            if score < min_score:
+                continue
+            similarity = 2.0 * shared / (query_size + self._sizes[position])
+            ranked.append((score, similarity, position))
+
+        ranked.sort(key=lambda item: (-item[0], -item[1], item[2]))
+
+        results = []
+        for score, similarity, position in ranked[:max_results]:
+            results.append(FuzzyMatch(
+                position=position,
+                paragraph=self._paragraphs[position],
+                text=self._texts[position],
+                score=round(score, 3),
+                similarity=round(similarity, 3),
+            ))
+        return results
+
+    def neighbours(self, position: int, span: int) -> Optional[Dict[str, List[str]]]:
+        """Return the text of up to ``span`` indexed paragraphs around a hit."""
+        if span <= 0:
+            return None
+        before = self._texts[max(0, position - span):position]
+        after = self._texts[position + 1:position + 1 + span]
+        return {"context_before": list(before), "context_after": list(after)}
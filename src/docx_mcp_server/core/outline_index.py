@@ -0,0 +1,256 @@
+"""Heading outline of a document, maintained incrementally per session.
+
+Outline questions ("where does section 4.2 start and end", "list all H2
+under chapter 3") used to need a full scan of the body through
+``docx_get_structure_summary`` or ``docx_extract_template_structure``. The
+``OutlineIndex`` keeps the headings of the body in block order:
+
+- levels come from the paragraph's own ``w:outlineLvl`` or the outline level
+  of its style (see ``StyleCache``), so custom styles based on headings are
+  part of the outline and "TOC Heading" is not
+- positions are indexes of the body's block elements (paragraphs, tables,
+  ...), kept in a sorted list so a block position resolves to its innermost
+  section by bisection
+- section numbers ("4.2") follow the heading tree; a level that is skipped
+  (Heading 1 followed by Heading 3) does not leave a gap in the numbering
+
+Single-block edits update the index in place (``block_inserted``,
+``block_removing``, ``block_restyled``): a block between two headings only
+shifts the positions of the headings after it, and the section links are
+recomputed from the heading list alone. ``Session.get_outline_index``
+rebuilds the index after any other edit.
+"""
+
+import logging
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from docx.oxml.ns import qn
+
+from docx_mcp_server.core.style_cache import StyleCache
+from docx_mcp_server.core.text_extractor import paragraph_text
+
+logger = logging.getLogger(__name__)
+
+_P = qn("w:p")
+_SECT_PR = qn("w:sectPr")
+_VAL = qn("w:val")
+_OUTLINE = f"{qn('w:pPr')}/{qn('w:outlineLvl')}"
+
+
+@dataclass
+class OutlineHeading:
+    """One heading of the outline.
+
+    ``number`` ("4.2"), ``parent`` and ``end`` (index of the next heading
+    that is not inside this section, or the heading count) are derived from
+    the heading list and refreshed whenever headings are added, removed or
+    change level.
+    """
+    element: object
+    level: int
+    position: int
+    number: str = ""
+    parent: Optional[int] = None
+    end: int = 0
+
+    @property
+    def text(self) -> str:
+        return paragraph_text(self.element)
+
+
+@dataclass
+class OutlineSection:
+    """A heading with the block range of its section (inclusive)."""
+    index: int
+    heading: OutlineHeading
+    start: int
+    end: int
+
+
+class OutlineIndex:
+    """Headings of one document's body in block order (see module docstring)."""
+
+    def __init__(self, document, revision: int = 0):
+        self.document = document
+        self.body = document.element.body
+        self.revision = revision
+        self._styles = StyleCache.of(document)
+        self.headings: List[OutlineHeading] = []
+        self._positions: List[int] = []
+        self._by_element: Dict[int, OutlineHeading] = {}
+        self._by_number: Dict[str, int] = {}
+        self.body_length = len(self.body)
+        self._build()
+
+    def _build(self):
+        for position, el in enumerate(self.body):
+            level = self.level_of(el)
+            if level is not None:
+                self.headings.append(OutlineHeading(el, level, position))
+        self._relink()
+        logger.debug(f"Outline built: {len(self.headings)} headings in {self.body_length} blocks")
+
+    def level_of(self, el) -> Optional[int]:
+        """Outline level 1-9 of a body block, None for body text and non-paragraphs."""
+        if el.tag != _P:
+            return None
+        direct = el.find(_OUTLINE)
+        if direct is not None:
+            value = direct.get(_VAL, "")
+            return int(value) + 1 if value.isdigit() and int(value) < 9 else None
+        style = self._styles.paragraph_style(el)
+        return style.outline_level if style is not None else None
+
+    def _relink(self):
+        """Recompute positions list, numbers, parents and section ends."""
+        self._positions = [h.position for h in self.headings]
+        self._by_element = {id(h.element): h for h in self.headings}
+        self._by_number = {}
+        stack: List[int] = []
+        counters: List[int] = []
+        for i, heading in enumerate(self.headings):
+            while stack and self.headings[stack[-1]].level >= heading.level:
+                self.headings[stack.pop()].end = i
+            depth = len(stack)
+            del counters[depth + 1:]
+            if len(counters) == depth:
+                counters.append(0)
+            counters[depth] += 1
+            heading.parent = stack[-1] if stack else None
+            heading.number = ".".join(str(c) for c in counters)
+            self._by_number[heading.number] = i
+            stack.append(i)
+        for i in stack:
+            self.headings[i].end = len(self.headings)
+
+    def __len__(self) -> int:
+        return len(self.headings)
+
+    @property
+    def block_count(self) -> int:
+        """Number of blocks; the trailing section properties are not a block."""
+        last = self.body[-1] if len(self.body) else None
+        return len(self.body) - (1 if last is not None and last.tag == _SECT_PR else 0)
+
+    def is_current(self) -> bool:
+        """Cheap check against edits that bypassed the index: same block count
+        and every heading still in the body. Style changes are not checked;
+        those come with a revision change or a ``block_restyled`` call."""
+        if len(self.body) != self.body_length:
+            return False
+        body = self.body
+        return all(h.element.getparent() is body for h in self.headings)
+
+    # --- incremental updates ---
+
+    def _position(self, el) -> int:
+        """Block position of a body element, counted from the nearest heading before it."""
+        heading = self._by_element.get(id(el))
+        if heading is not None and heading.element is el:
+            return heading.position
+        steps = 0
+        for sibling in el.itersiblings(preceding=True):
+            steps += 1
+            heading = self._by_element.get(id(sibling))
+            if heading is not None and heading.element is sibling:
+                return heading.position + steps
+        return steps
+
+    def _shift(self, position: int, delta: int):
+        """Move the headings at or after ``position`` by ``delta`` blocks."""
+        for heading in self.headings:
+            if heading.position >= position:
+                heading.position += delta
+        self._positions = [h.position for h in self.headings]
+
+    def block_inserted(self, el):
+        """Account for a block just inserted into the body."""
+        if el.getparent() is not self.body:
+            return
+        self._styles = StyleCache.of(self.document)
+        position = self._position(el)
+        self._shift(position, 1)
+        self.body_length += 1
+        level = self.level_of(el)
+        if level is not None:
+            self.headings.insert(bisect_left(self._positions, position), OutlineHeading(el, level, position))
+            self._relink()
+
+    def block_removing(self, el):
+        """Account for a body block that is about to be removed."""
+        if el.getparent() is not self.body:
+            return
+        position = self._position(el)
+        heading = self._by_element.get(id(el))
+        if heading is not None and heading.element is el:
+            self.headings.remove(heading)
+        self._shift(position + 1, -1)
+        self.body_length -= 1
+        if heading is not None:
+            self._relink()
+
+    def block_restyled(self, el):
+        """Account for a body paragraph whose style or outline level changed."""
+        if el.getparent() is not self.body:
+            return
+        self._styles = StyleCache.of(self.document)
+        level = self.level_of(el)
+        heading = self._by_element.get(id(el))
+        if heading is not None and heading.element is not el:
+            heading = None
+        if heading is None and level is None or heading is not None and heading.level == level:
+            return
+        if heading is None:
+            position = self._position(el)
+            self.headings.insert(bisect_left(self._positions, position), OutlineHeading(el, level, position))
+        elif level is None:
+            self.headings.remove(heading)
+        else:
+            heading.level = level
+        self._relink()
+
+    # --- queries ---
+
+    def section(self, index: int) -> OutlineSection:
+        heading = self.headings[index]
+        end = (self.headings[heading.end].position - 1 if heading.end < len(self.headings)
+               else self.block_count - 1)
+        return OutlineSection(index=index, heading=heading, start=heading.position, end=end)
+
+    def find_number(self, number: str) -> Optional[int]:
+        """Index of the heading numbered ``number`` ("4.2")."""
+        return self._by_number.get(number.strip().rstrip("."))
+
+    def find_heading(self, el) -> Optional[int]:
+        """Index of the heading whose paragraph is ``el``."""
+        heading = self._by_element.get(id(el))
+        if heading is None or heading.element is not el:
+            return None
+        return bisect_left(self._positions, heading.position)
+
+    def containing(self, el) -> Optional[int]:
+        """Index of the innermost section containing the block (or a descendant of
+        a block) ``el``; None before the first heading or outside the body."""
+        while el is not None and el.getparent() is not self.body:
+            el = el.getparent()
+        if el is None:
+            return None
+        index = bisect_right(self._positions, self._position(el)) - 1
+        return index if index >= 0 else None
+
+    def subsections(self, index: Optional[int] = None, level: Optional[int] = None) -> List[int]:
+        """Headings inside a section (the whole document when ``index`` is None).
+
+        Args:
+            level: Only headings of this level; without it only the direct
+                children in the heading tree.
+        """
+        if index is None:
+            first, stop, parent = 0, len(self.headings), None
+        else:
+            first, stop, parent = index + 1, self.headings[index].end, index
+        if level is not None:
+            return [i for i in range(first, stop) if self.headings[i].level == level]
+        return [i for i in range(first, stop) if self.headings[i].parent == parent]
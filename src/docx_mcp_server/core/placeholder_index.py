@@ -0,0 +1,223 @@
+"""Placeholder index for template filling.
+
+Filling a template through repeated ``docx_replace_text`` calls rescans
+every paragraph and cell for each key. This module scans the document once
+for delimiter-bounded tokens (``{{NAME}}`` by default), including tokens
+that Word split across several runs, and records the exact ``w:t`` nodes
+and character offsets each token occupies. Filling then only touches the
+text nodes of the indexed slots.
+"""
+
+import logging
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from docx.oxml.ns import qn
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OPEN = "{{"
+DEFAULT_CLOSE = "}}"
+
+# Text nodes that make up the visible text of a paragraph, in order. Matches
+# the run selection of text_extractor.paragraph_text.
+_TEXT_NODES_XPATH = "w:r/w:t | w:hyperlink/w:r/w:t"
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+
+@dataclass
+class PlaceholderSlot:
+    """One occurrence of a placeholder in the document.
+
+    ``segments`` lists ``(w:t element, start, end)`` for every text node the
+    token spans, in order. Offsets refer to the node text at scan time;
+    ``offset`` is the token position in the paragraph text.
+    """
+    name: str
+    token: str
+    paragraph: object
+    offset: int
+    segments: List[Tuple[object, int, int]]
+
+    @property
+    def split_across_runs(self) -> bool:
+        return len(self.segments) > 1
+
+    def is_current(self) -> bool:
+        """Check that the indexed text nodes still hold the token.
+
+        Setting ``run.text`` replaces the ``w:t`` nodes, so the nodes must
+        also still belong to the paragraph.
+        """
+        for t, _, _ in self.segments:
+            if not any(ancestor is self.paragraph for ancestor in t.iterancestors()):
+                return False
+        text = "".join((t.text or "")[start:end] for t, start, end in self.segments)
+        return text == self.token
+
+
+def _set_text(t, text: str):
+    t.text = text
+    if text[:1].isspace() or text[-1:].isspace():
+        t.set(_XML_SPACE, "preserve")
+
+
+def placeholder_pattern(open_delim: str = DEFAULT_OPEN, close_delim: str = DEFAULT_CLOSE):
+    """Regex matching a delimited token; group 1 is the stripped name."""
+    return re.compile(re.escape(open_delim) + r"\s*(.+?)\s*" + re.escape(close_delim))
+
+
+def text_nodes(p) -> List[object]:
+    """The ``w:t`` nodes making up the visible text of a paragraph, in order."""
+    return p.xpath(_TEXT_NODES_XPATH)
+
+
+def scan_paragraph(p, pattern, open_delim: str = DEFAULT_OPEN) -> List[PlaceholderSlot]:
+    """Find the placeholder slots of one ``w:p``."""
+    nodes = text_nodes(p)
+    if not nodes:
+        return []
+    texts = [t.text or "" for t in nodes]
+    flat = "".join(texts)
+    if open_delim not in flat:
+        return []
+
+    # Start offset of every node within the flat paragraph text
+    starts = []
+    acc = 0
+    for text in texts:
+        starts.append(acc)
+        acc += len(text)
+
+    slots = []
+    for match in pattern.finditer(flat):
+        segments = []
+        for t, text, node_start in zip(nodes, texts, starts):
+            node_end = node_start + len(text)
+            if node_end <= match.start() or node_start >= match.end() or not text:
+                continue
+            segments.append((
+                t,
+                max(match.start(), node_start) - node_start,
+                min(match.end(), node_end) - node_start,
+            ))
+        slots.append(PlaceholderSlot(match.group(1), match.group(0), p, match.start(), segments))
+    return slots
+
+
+def write_slot(segments: List[Tuple[object, int, int]], value: str):
+    """Replace a token spanning ``segments`` with ``value``.
+
+    The value goes into the first text node, keeping that run's formatting;
+    the token's remainder is removed from the following nodes.
+    """
+    first_t, first_start, first_end = segments[0]
+    text = first_t.text or ""
+    _set_text(first_t, text[:first_start] + value + text[first_end:])
+    for t, start, end in segments[1:]:
+        text = t.text or ""
+        _set_text(t, text[:start] + text[end:])
+
+
+class PlaceholderIndex:
+    """All placeholder slots of a document body, grouped by name."""
+
+    def __init__(self, document, revision: int = 0,
+                 open_delim: str = DEFAULT_OPEN, close_delim: str = DEFAULT_CLOSE):
+        self.revision = revision
+        self.open_delim = open_delim
+        self.close_delim = close_delim
+        self._body = document.element.body
+        self.body_length = len(self._body)
+        self._pattern = placeholder_pattern(open_delim, close_delim)
+        self.slots: Dict[str, List[PlaceholderSlot]] = defaultdict(list)
+        # id(w:p) -> slots of that paragraph, for rescanning after a fill
+        self._by_paragraph: Dict[int, List[PlaceholderSlot]] = {}
+        self._build()
+
+    def _build(self):
+        for p in self._body.iter(qn("w:p")):
+            self._add_paragraph(p)
+        logger.debug(
+            f"Placeholder index built: {len(self.slots)} names, "
+            f"{sum(len(s) for s in self.slots.values())} slots"
+        )
+
+    def _scan_paragraph(self, p) -> List[PlaceholderSlot]:
+        return scan_paragraph(p, self._pattern, self.open_delim)
+
+    def _add_paragraph(self, p):
+        slots = self._scan_paragraph(p)
+        if slots:
+            self._by_paragraph[id(p)] = slots
+            for slot in slots:
+                self.slots[slot.name].append(slot)
+
+    def _is_attached(self, p) -> bool:
+        return any(ancestor is self._body for ancestor in p.iterancestors())
+
+    def is_current(self) -> bool:
+        """Verify every slot still points at its token inside the body."""
+        return all(
+            slot.is_current() and self._is_attached(slot.paragraph)
+            for slots in self.slots.values() for slot in slots
+        )
+
+    def names(self) -> List[str]:
+        return list(self.slots)
+
+    def key_to_name(self, key: str) -> str:
+        """Accept both ``NAME`` and ``{{NAME}}`` as keys."""
+        key = key.strip()
+        if key.startswith(self.open_delim) and key.endswith(self.close_delim):
+            key = key[len(self.open_delim):len(key) - len(self.close_delim)].strip()
+        return key
+
+    def fill(self, values: Dict[str, str]) -> Dict[str, int]:
+        """Replace the slots of the given names with their values.
+
+        The value is written into the first text node of a slot, keeping that
+        run's formatting; the token's remainder is removed from the following
+        nodes. Touched paragraphs are rescanned so the index stays usable for
+        the placeholders that were not filled.
+
+        Returns:
+            dict: Number of replaced slots per name (only names that exist).
+        """
+        counts: Dict[str, int] = {}
+        to_fill = []
+        for key, value in values.items():
+            name = self.key_to_name(key)
+            slots = self.slots.get(name)
+            if not slots:
+                continue
+            counts[name] = len(slots)
+            to_fill.extend((slot, "" if value is None else str(value)) for slot in slots)
+
+        # Several slots can share a text node. Filling each paragraph from
+        # its end backwards keeps the recorded offsets of earlier slots valid.
+        to_fill.sort(key=lambda item: item[0].offset, reverse=True)
+
+        touched = {}
+        for slot, value in to_fill:
+            write_slot(slot.segments, value)
+            touched[id(slot.paragraph)] = slot.paragraph
+
+        for name in counts:
+            del self.slots[name]
+        self._rescan(touched.values())
+        return counts
+
+    def _rescan(self, paragraphs):
+        """Refresh the slots of the given paragraphs after an edit."""
+        for p in paragraphs:
+            for slot in self._by_paragraph.pop(id(p), []):
+                remaining = self.slots.get(slot.name)
+                if remaining is None:
+                    continue
+                remaining[:] = [s for s in remaining if s is not slot]
+                if not remaining:
+                    del self.slots[slot.name]
+            self._add_paragraph(p)
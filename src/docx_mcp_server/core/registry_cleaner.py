@@ -1,8 +1,10 @@
 """Registry cleaner for managing element_id mappings after deletions."""
 import logging
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Union, TYPE_CHECKING
 from docx.table import Table
 
+from docx_mcp_server.core.cell_index import CellRemap
+
 if TYPE_CHECKING:
     from docx_mcp_server.core.session import Session
 
@@ -12,8 +14,70 @@ logger = logging.getLogger(__name__)
 class RegistryCleaner:
     """
     Handles cleanup of element_id mappings when table rows/columns are deleted.
+
+    Cell IDs are looked up in ``session.cell_index`` (registered cells per
+    table with their grid positions), so the cost depends on the cells
+    registered for the edited table, not on the registry or table size.
     """
 
+    @staticmethod
+    def plan_structural_change(
+        session: 'Session',
+        table: Table,
+        operation: str,
+        index: Union[int, List[int]]
+    ) -> CellRemap:
+        """
+        Compute the cell ID changes of a row/column edit before performing it.
+
+        Args:
+            session: Session object containing the cell index
+            table: Table object being modified
+            operation: "delete_row", "delete_col", "insert_row", "insert_col",
+                or "delete_cols"/"insert_cols" for several columns at once
+            index: Row or column index of the edit (for inserts: the index
+                the new row/column will have); for the multi-column
+                operations, the list of current column indexes
+
+        Returns:
+            CellRemap to pass to ``apply_structural_change`` once the edit succeeded
+        """
+        plan = getattr(session.cell_index, f"plan_{operation}", None)
+        if plan is None:
+            raise ValueError(f"Unknown structural operation: {operation}")
+        return plan(table._tbl, index)
+
+    @staticmethod
+    def plan_row_mapping(
+        session: 'Session',
+        table: Table,
+        mapping: Dict[int, Optional[int]]
+    ) -> CellRemap:
+        """
+        Compute the cell ID changes of reordering or removing many rows at once.
+
+        Args:
+            session: Session object containing the cell index
+            table: Table object being modified
+            mapping: Old row index -> new row index, or None for removed rows
+
+        Returns:
+            CellRemap to pass to ``apply_structural_change`` once the edit succeeded
+        """
+        return session.cell_index.plan_row_mapping(table._tbl, mapping)
+
+    @staticmethod
+    def apply_structural_change(session: 'Session', remap: CellRemap) -> None:
+        """
+        Drop the invalidated cell IDs from the registry and move the rest.
+
+        Args:
+            session: Session object containing the object_registry
+            remap: Plan returned by ``plan_structural_change``
+        """
+        RegistryCleaner.invalidate_ids(session, remap.removed)
+        session.cell_index.apply(remap)
+
     @staticmethod
     def find_invalidated_ids(
         session: 'Session',
@@ -34,47 +98,15 @@ class RegistryCleaner:
             List of element_ids that will be invalidated
         """
         invalidated_ids = []
-
-        # Iterate through the object registry to find cell IDs
-        for element_id, obj in list(session.object_registry.items()):
-            # Check if this is a cell ID
-            if not element_id.startswith('cell_'):
-                continue
-
-            # Try to determine if this cell belongs to the deleted row/column
-            try:
-                # Check if the object is still a valid cell
-                if not hasattr(obj, '_tc'):
-                    continue
-
-                # Find which table this cell belongs to
-                cell_table = None
-                for row in table.rows:
-                    if obj in row.cells:
-                        cell_table = table
-                        break
-
-                if cell_table != table:
-                    # This cell doesn't belong to the table being modified
-                    continue
-
-                # Find the cell's position in the table
-                for r_idx, row in enumerate(table.rows):
-                    for c_idx, cell in enumerate(row.cells):
-                        if cell == obj:
-                            # Check if this cell is in the deleted row or column
-                            if row_index is not None and r_idx == row_index:
-                                invalidated_ids.append(element_id)
-                                logger.debug(f"Cell {element_id} at row {r_idx} will be invalidated")
-                            elif col_index is not None and c_idx == col_index:
-                                invalidated_ids.append(element_id)
-                                logger.debug(f"Cell {element_id} at col {c_idx} will be invalidated")
-                            break
-
-            except Exception as e:
-                logger.warning(f"Error checking cell {element_id}: {e}")
-                continue
-
+        if row_index is not None:
+            invalidated_ids.extend(
+                RegistryCleaner.plan_structural_change(session, table, "delete_row", row_index).removed
+            )
+        if col_index is not None:
+            for element_id in RegistryCleaner.plan_structural_change(session, table, "delete_col", col_index).removed:
+                if element_id not in invalidated_ids:
+                    invalidated_ids.append(element_id)
+        logger.debug(f"Cells to invalidate: {invalidated_ids}")
         return invalidated_ids
 
     @staticmethod
@@ -87,6 +119,7 @@ class RegistryCleaner:
             ids: List of element_ids to remove
         """
         for element_id in ids:
+            session.cell_index.discard(element_id)
             if element_id in session.object_registry:
                 del session.object_registry[element_id]
                 logger.debug(f"Removed {element_id} from object registry")
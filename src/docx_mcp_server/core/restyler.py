@@ -0,0 +1,226 @@
+"""Assign a style to every element matching a predicate.
+
+Setting ``paragraph.style = "Heading 2"`` resolves the name through
+python-docx's style lookup (a scan of styles.xml) for each element. For
+migrating a document to a house style the ``Restyler`` resolves style names
+to style IDs once through the document's ``StyleCache``, walks the document
+tree once and writes ``w:pStyle`` / ``w:rStyle`` / ``w:tblStyle`` directly.
+
+Targets depend on the type of the new style:
+
+- paragraph style: paragraphs
+- character style: runs (predicates on text apply to the run's text,
+  ``in_table`` and ``heading_level`` to its paragraph)
+- table style: tables (text predicates apply to the table's cell text)
+"""
+
+import logging
+import re
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from lxml import etree
+
+from docx_mcp_server.core.style_cache import StyleCache
+from docx_mcp_server.core.text_extractor import paragraph_text, run_text
+
+logger = logging.getLogger(__name__)
+
+_P, _R, _TBL = qn("w:p"), qn("w:r"), qn("w:tbl")
+_VAL = qn("w:val")
+_TYPES = {
+    "paragraph": WD_STYLE_TYPE.PARAGRAPH,
+    "character": WD_STYLE_TYPE.CHARACTER,
+    "table": WD_STYLE_TYPE.TABLE,
+}
+# Property element and style reference per style type, e.g. w:pPr/w:pStyle
+_REFS = {
+    "paragraph": ("w:pPr", "w:pStyle"),
+    "character": ("w:rPr", "w:rStyle"),
+    "table": ("w:tblPr", "w:tblStyle"),
+}
+
+
+class StyleTable:
+    """Style names resolved to IDs, backed by the document's ``StyleCache``."""
+
+    def __init__(self, document):
+        self._cache = StyleCache.of(document)
+        self.defaults: Dict[str, Optional[str]] = {}
+        for kind in _TYPES:
+            info = self._cache.default(kind)
+            self.defaults[kind] = info.style_id if info is not None else None
+
+    def resolve(self, name: str) -> Tuple[str, str]:
+        """``(style_id, kind)`` of a style by UI or stored name.
+
+        Raises:
+            ValueError: If there is no such paragraph, character or table style.
+        """
+        info = self._cache.resolve(name)
+        if info.type not in _TYPES:
+            raise ValueError(f"Style '{name}' not found")
+        return info.style_id, info.type
+
+    def heading_level(self, style_id: Optional[str]) -> Optional[int]:
+        info = self._cache.get(style_id)
+        return info.outline_level if info is not None and info.type == "paragraph" else None
+
+
+def _style_ref(el, kind: str, default: Optional[str]) -> Optional[str]:
+    props, ref = _REFS[kind]
+    ref_el = el.find(f"{qn(props)}/{qn(ref)}")
+    return ref_el.get(_VAL) if ref_el is not None else default
+
+
+def _set_style_ref(el, kind: str, style_id: Optional[str]) -> None:
+    """Point ``el`` at ``style_id``; None (the default style) removes the reference."""
+    props_tag, ref_tag = _REFS[kind]
+    props = el.find(qn(props_tag))
+    ref = props.find(qn(ref_tag)) if props is not None else None
+    if style_id is None:
+        if ref is not None:
+            props.remove(ref)
+        return
+    if ref is None:
+        if props is None:
+            props = OxmlElement(props_tag)
+            el.insert(0, props)
+        ref = OxmlElement(ref_tag)
+        # The style reference is the first child of every property element
+        props.insert(0, ref)
+    ref.set(_VAL, style_id)
+
+
+class Restyler:
+    """Restyles the elements of one document (see module docstring)."""
+
+    def __init__(self, document):
+        self.document = document
+        self.styles = StyleTable(document)
+
+    def restyle(
+        self,
+        style: str,
+        current_style: Optional[str] = None,
+        text: Optional[str] = None,
+        use_regex: bool = False,
+        case_sensitive: bool = False,
+        in_table: Optional[bool] = None,
+        heading_level: Optional[int] = None,
+        scope=None,
+        on_change: Optional[Callable[[Any], None]] = None,
+    ) -> Dict[str, Any]:
+        """Assign ``style`` to every matching element below ``scope`` (default: body).
+
+        ``on_change`` is called with every element whose style reference was
+        changed.
+
+        Returns:
+            dict: ``style_type``, ``matched`` and ``changed`` (matched elements
+            that did not have the style already)
+
+        Raises:
+            ValueError: On unknown styles, a current_style of another type,
+                an invalid regex, or heading_level with a table style.
+        """
+        style_id, kind = self.styles.resolve(style)
+        default = self.styles.defaults[kind]
+        new_ref = None if style_id == default else style_id
+
+        current_id = None
+        if current_style is not None:
+            current_id, current_kind = self.styles.resolve(current_style)
+            if current_kind != kind:
+                raise ValueError(
+                    f"current_style '{current_style}' is a {current_kind} style, "
+                    f"but '{style}' is a {kind} style"
+                )
+        if heading_level is not None and kind == "table":
+            raise ValueError("heading_level does not apply to table styles")
+        text_match = self._text_predicate(text, use_regex, case_sensitive)
+        para_default = self.styles.defaults["paragraph"]
+
+        def paragraph_ok(p, depth) -> bool:
+            if in_table is not None and (depth > 0) != in_table:
+                return False
+            if heading_level is not None:
+                level_el = p.find(f"{qn('w:pPr')}/{qn('w:outlineLvl')}")
+                level = (int(level_el.get(_VAL)) + 1 if level_el is not None
+                         else self.styles.heading_level(_style_ref(p, "paragraph", para_default)))
+                if level != heading_level:
+                    return False
+            return True
+
+        matched = changed = 0
+        root = scope if scope is not None else self.document.element.body
+        # Number of tables around the current element, tracked during the walk
+        depth = 1 if next(root.iterancestors(_TBL), None) is not None else 0
+        for event, el in etree.iterwalk(root, events=("start", "end"), tag=(_P, _TBL)):
+            if el.tag == _TBL:
+                if event == "start":
+                    if kind == "table" and \
+                            (in_table is None or (depth > 0) == in_table) and \
+                            (current_id is None or _style_ref(el, kind, default) == current_id) and \
+                            (text_match is None or text_match(self._table_text(el))):
+                        matched += 1
+                        changed += self._apply(el, kind, new_ref, style_id, default, on_change)
+                    depth += 1
+                else:
+                    depth -= 1
+                continue
+            if event != "start" or kind == "table":
+                continue
+            if not paragraph_ok(el, depth):
+                continue
+            if kind == "paragraph":
+                if current_id is not None and _style_ref(el, kind, default) != current_id:
+                    continue
+                if text_match is not None and not text_match(paragraph_text(el)):
+                    continue
+                matched += 1
+                changed += self._apply(el, kind, new_ref, style_id, default, on_change)
+            else:
+                for r in el.iter(_R):
+                    # Runs of nested paragraphs (text boxes) are visited with them
+                    if next(r.iterancestors(_P)) is not el:
+                        continue
+                    if current_id is not None and _style_ref(r, kind, default) != current_id:
+                        continue
+                    if text_match is not None and not text_match(run_text(r)):
+                        continue
+                    matched += 1
+                    changed += self._apply(r, kind, new_ref, style_id, default, on_change)
+
+        logger.debug(f"Restyle to {style_id} ({kind}): {matched} matched, {changed} changed")
+        return {"style_id": style_id, "style_type": kind, "matched": matched, "changed": changed}
+
+    @staticmethod
+    def _apply(el, kind, new_ref, style_id, default, on_change) -> int:
+        if _style_ref(el, kind, default) == style_id:
+            return 0
+        _set_style_ref(el, kind, new_ref)
+        if on_change is not None:
+            on_change(el)
+        return 1
+
+    @staticmethod
+    def _table_text(tbl) -> str:
+        return "\n".join(paragraph_text(p) for p in tbl.iter(_P))
+
+    @staticmethod
+    def _text_predicate(text, use_regex, case_sensitive) -> Optional[Callable[[str], bool]]:
+        if text is None:
+            return None
+        if use_regex:
+            try:
+                pattern = re.compile(text, 0 if case_sensitive else re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"Invalid regex '{text}': {e}")
+            return lambda value: pattern.search(value) is not None
+        if case_sensitive:
+            return lambda value: text in value
+        needle = text.lower()
+        return lambda value: needle in value.lower()
@@ -0,0 +1,233 @@
+"""Repeating-row table templates.
+
+Invoices and reports are usually a table whose body is one block of rows
+with placeholders (``{{sku}}``, ``{{qty}}``) repeated once per record.
+Building that through row inserts, fills and replace calls rescans the
+table for every step. ``RowTemplate`` scans the template rows once and
+records, per paragraph, where each placeholder sits; rendering deep-copies
+the template rows per record and writes the record values straight into
+the recorded text nodes of the copy.
+
+A template is ``row_count`` consecutive rows per record. With ``variants``
+> 1 the template area holds that many alternative blocks (e.g. two
+differently shaded rows) used in turn, for alternating row styles.
+"""
+
+import copy
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from docx.oxml.ns import qn
+from docx.table import Table
+
+from docx_mcp_server.core.placeholder_index import (
+    DEFAULT_CLOSE,
+    DEFAULT_OPEN,
+    placeholder_pattern,
+    scan_paragraph,
+    text_nodes,
+    write_slot,
+)
+from docx_mcp_server.core.table_grid import TableGrid
+from docx_mcp_server.core.table_import import format_value
+
+logger = logging.getLogger(__name__)
+
+INDEX_FIELD = "_index"
+
+_P = qn("w:p")
+
+# Per template row: [(paragraph position in tr.iter(w:p),
+#                     [(name, [(text node position, start, end), ...]), ...]), ...]
+_RowSlots = List[Tuple[int, List[Tuple[str, List[Tuple[int, int, int]]]]]]
+
+
+def lookup(record: Dict[str, Any], name: str, index: int) -> Tuple[bool, Any]:
+    """Value of placeholder ``name`` in ``record``: ``(found, value)``.
+
+    Dotted names walk nested objects (``customer.name``); ``_index`` is the
+    1-based record number.
+    """
+    if name == INDEX_FIELD:
+        return True, index + 1
+    if name in record:
+        return True, record[name]
+    value: Any = record
+    for part in name.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return False, None
+        value = value[part]
+    return True, value
+
+
+class RowTemplate:
+    """Template rows of a table, scanned once for placeholders.
+
+    Args:
+        table: Table holding the template rows.
+        start_row: First template row.
+        row_count: Rows per record.
+        variants: Alternative row blocks, used in turn per record.
+        grid: Optional ``TableGrid`` of ``table``.
+
+    Raises:
+        IndexError: If the template area is outside the table.
+        ValueError: If a vertical merge crosses the template area boundary
+            or the boundary between two variant blocks.
+    """
+
+    def __init__(
+        self,
+        table: Table,
+        start_row: int,
+        row_count: int = 1,
+        variants: int = 1,
+        grid: Optional[TableGrid] = None,
+        open_delim: str = DEFAULT_OPEN,
+        close_delim: str = DEFAULT_CLOSE,
+    ):
+        if row_count < 1 or variants < 1:
+            raise ValueError("row_count and variants must be >= 1")
+        grid = grid or TableGrid(table._tbl)
+        end_row = start_row + row_count * variants
+        if start_row < 0 or end_row > grid.row_count:
+            raise IndexError(
+                f"Template rows {start_row}-{end_row - 1} out of range (table has {grid.row_count} rows)"
+            )
+        # Every block boundary: a merge running into the next variant block
+        # would be cloned per record
+        for row in range(start_row, end_row + 1, row_count):
+            if row < grid.row_count and any(
+                grid.origin(row, col)[0] < row for col in range(len(grid.anchors[row]))
+            ):
+                raise ValueError(f"A vertical merge crosses the template boundary at row {row}")
+
+        self.table = table
+        self.start_row = start_row
+        self.row_count = row_count
+        self.variants = variants
+        self.rows = grid.rows[start_row:end_row]
+        self._pattern = placeholder_pattern(open_delim, close_delim)
+        self._open = open_delim
+        self.slots: List[_RowSlots] = [self._scan(tr) for tr in self.rows]
+
+    def _scan(self, tr) -> _RowSlots:
+        row_slots: _RowSlots = []
+        for p_pos, p in enumerate(tr.iter(_P)):
+            slots = scan_paragraph(p, self._pattern, self._open)
+            if not slots:
+                continue
+            nodes = {id(t): pos for pos, t in enumerate(text_nodes(p))}
+            row_slots.append((p_pos, [
+                (slot.name, [(nodes[id(t)], start, end) for t, start, end in slot.segments])
+                for slot in slots
+            ]))
+        return row_slots
+
+    def names(self) -> List[str]:
+        """Placeholder names used by the template, in order of appearance."""
+        seen: Dict[str, None] = {}
+        for row_slots in self.slots:
+            for _, slots in row_slots:
+                for name, _ in slots:
+                    seen.setdefault(name)
+        return list(seen)
+
+    def render_record(self, record: Dict[str, Any], index: int, blank_missing: bool = False,
+                      number_format: Optional[str] = None) -> List[Any]:
+        """Copies of the template rows for one record, placeholders filled."""
+        variant = index % self.variants
+        first = variant * self.row_count
+        rows = []
+        for tr, row_slots in zip(self.rows[first:first + self.row_count],
+                                 self.slots[first:first + self.row_count]):
+            clone = copy.deepcopy(tr)
+            if row_slots:
+                paragraphs = list(clone.iter(_P))
+                for p_pos, slots in row_slots:
+                    nodes = text_nodes(paragraphs[p_pos])
+                    # Back to front: earlier offsets in shared nodes stay valid
+                    for name, segments in reversed(slots):
+                        found, value = lookup(record, name, index)
+                        if not found and not blank_missing:
+                            continue
+                        write_slot(
+                            [(nodes[pos], start, end) for pos, start, end in segments],
+                            format_value(value, None if name == INDEX_FIELD else number_format),
+                        )
+            rows.append(clone)
+        return rows
+
+    def render(
+        self,
+        records: Sequence[Dict[str, Any]],
+        keep_template: bool = False,
+        blank_missing: bool = False,
+        number_format: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Insert one block of rows per record in place of the template.
+
+        Args:
+            records: JSON-like objects; placeholders are looked up by name
+                (see ``lookup``).
+            keep_template: Keep the template rows after the rendered rows
+                (to render more later); otherwise they are removed.
+            blank_missing: Blank placeholders a record has no value for
+                (default: leave the token in place).
+            number_format: Format spec applied to numeric values.
+
+        Returns:
+            dict: ``records``, ``rows_added`` (rendered rows), ``first_row``
+            of the rendered rows and ``mapping`` (old row index -> new row
+            index, None for removed template rows).
+
+        Raises:
+            ValueError: If a record is not an object, or if removing the
+                template would leave the table without rows.
+        """
+        tbl = self.table._tbl
+        all_rows = list(tbl.tr_lst)
+        if not records and not keep_template and len(all_rows) == len(self.rows):
+            raise ValueError("Rendering no records would remove every row of the table")
+
+        for index, record in enumerate(records):
+            if not isinstance(record, dict):
+                raise ValueError(f"Record {index} must be an object")
+
+        anchor = self.rows[0]
+        for index, record in enumerate(records):
+            for tr in self.render_record(record, index, blank_missing, number_format):
+                anchor.addprevious(tr)
+        added = len(records) * self.row_count
+
+        template_count = len(self.rows)
+        end_row = self.start_row + template_count
+        mapping: Dict[int, Optional[int]] = {}
+        if keep_template:
+            for row in range(self.start_row, len(all_rows)):
+                mapping[row] = row + added
+        else:
+            for tr in self.rows:
+                tbl.remove(tr)
+            for row in range(self.start_row, end_row):
+                mapping[row] = None
+            for row in range(end_row, len(all_rows)):
+                mapping[row] = row - template_count + added
+        logger.debug(f"RowTemplate.render: {len(records)} records, {added} rows")
+        return {
+            "records": len(records),
+            "rows_added": added,
+            "first_row": self.start_row,
+            "mapping": {row: new for row, new in mapping.items() if new != row},
+        }
+
+
+def find_template_row(table: Table, grid: Optional[TableGrid] = None,
+                      open_delim: str = DEFAULT_OPEN, close_delim: str = DEFAULT_CLOSE) -> Optional[int]:
+    """Index of the first row containing a placeholder, or None."""
+    grid = grid or TableGrid(table._tbl)
+    pattern = placeholder_pattern(open_delim, close_delim)
+    for row, tr in enumerate(grid.rows):
+        if any(scan_paragraph(p, pattern, open_delim) for p in tr.iter(_P)):
+            return row
+    return None
@@ -3,7 +3,7 @@ import time
 import os
 import logging
 import threading
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import shutil
 from dataclasses import dataclass, field
 from docx import Document
@@ -14,6 +14,7 @@ from docx.text.run import Run
 from docx_mcp_server.core.validators import validate_path_safety
 from docx_mcp_server.core.cursor import Cursor
 from docx_mcp_server.core.commit import Commit
+from docx_mcp_server.core.cell_index import CellIndex
 from docx_mcp_server.preview.manager import PreviewManager
 
 logger = logging.getLogger(__name__)
@@ -59,6 +60,22 @@ class Session:
     _last_save_commit_index: int = -1
     _lock: threading.Lock = field(default_factory=threading.Lock)
 
+    # Document revision, bumped by mark_dirty(). Derived indexes record the
+    # revision they were built at and are rebuilt when it moves on.
+    revision: int = 0
+    _fuzzy_index: Any = None
+    _placeholder_index: Any = None
+    # TableGrid per table, keyed by id() of the w:tbl element
+    _table_grids: Dict[int, Any] = field(default_factory=dict)
+    # Revision at which grids of removed tables were last dropped
+    _table_grids_revision: int = -1
+    # Registered cell IDs per table with their grid positions
+    cell_index: CellIndex = field(default_factory=CellIndex)
+    # Style/numbering/relationship mappings for content copied in from other documents
+    _importer: Any = None
+    # Heading outline of the body, updated in place by note_block_change()
+    _outline_index: Any = None
+
     def __post_init__(self):
         self.preview_controller = PreviewManager.get_controller()
 
@@ -79,10 +96,12 @@ class Session:
         if action == "create":
             self.last_created_id = element_id
             self.last_insert_id = element_id
+            self.note_block_change(self.object_registry.get(element_id), "insert")
             # T-003: Mark as dirty when creating new content
             self.mark_dirty()
         elif action == "update":
             self.last_update_id = element_id
+            self.note_block_change(self.object_registry.get(element_id), "restyle")
             # T-003: Mark as dirty when updating content
             self.mark_dirty()
         logger.debug(f"Context updated: element_id={element_id}, action={action}")
@@ -111,12 +130,75 @@ class Session:
         if hasattr(obj, '_element'):
             self._element_id_cache[id(obj._element)] = obj_id
 
+        if isinstance(obj, _Cell):
+            self._index_cells([(obj_id, obj)])
+
         if metadata:
             self.element_metadata[obj_id] = metadata
 
         logger.debug(f"Object registered: {obj_id} (type={type(obj).__name__})")
         return obj_id
 
+    def register_objects(self, items: List[Tuple[Any, str, Optional[Dict[str, Any]]]]) -> List[str]:
+        """Register many docx objects at once; return their IDs in order.
+
+        Same effect as calling ``register_object`` for every
+        ``(obj, prefix, metadata)`` item, without the per-object logging.
+        """
+        registry = self.object_registry
+        id_cache = self._element_id_cache
+        element_metadata = self.element_metadata
+        ids = []
+        cells = []
+        for obj, prefix, metadata in items:
+            obj_id = f"{prefix}_{uuid.uuid4().hex[:8]}"
+            registry[obj_id] = obj
+            element = getattr(obj, "_element", None)
+            if element is not None:
+                id_cache[id(element)] = obj_id
+            if isinstance(obj, _Cell):
+                cells.append((obj_id, obj))
+            if metadata:
+                element_metadata[obj_id] = metadata
+            ids.append(obj_id)
+        if cells:
+            self._index_cells(cells)
+        logger.debug(f"Objects registered: {len(ids)}")
+        return ids
+
+    def registered_id(self, element: Any) -> Optional[str]:
+        """ID under which the XML ``element`` is registered, or None.
+
+        Uses the reverse cache filled by ``register_object``; entries whose
+        object no longer wraps ``element`` are ignored.
+        """
+        obj_id = self._element_id_cache.get(id(element))
+        if obj_id is None:
+            return None
+        obj = self.object_registry.get(obj_id)
+        if obj is None or getattr(obj, "_element", None) is not element:
+            return None
+        return obj_id
+
+    def _index_cells(self, cells: List[Tuple[str, _Cell]]):
+        """Record the grid positions of registered cells in ``cell_index``.
+
+        The grid of each table is fetched once for all of its cells.
+        """
+        grids: Dict[int, Any] = {}
+        for cell_id, cell in cells:
+            tc = cell._tc
+            tr = tc.getparent()
+            tbl = tr.getparent() if tr is not None else None
+            if tbl is None:
+                continue
+            grid = grids.get(id(tbl))
+            if grid is None:
+                grid = grids[id(tbl)] = self.get_table_grid(tbl)
+            position = grid.position_of(tc)
+            if position is not None:
+                self.cell_index.add(cell_id, tc, *position)
+
     def get_metadata(self, obj_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve metadata for a registered object."""
         return self.element_metadata.get(obj_id)
@@ -208,7 +290,31 @@ class Session:
             # Let the ValueError propagate to the caller
             raise
 
-        return self.object_registry.get(resolved_id)
+        obj = self.object_registry.get(resolved_id)
+        if obj is None:
+            obj = self._resolve_virtual_cell(resolved_id)
+        return obj
+
+    def _resolve_virtual_cell(self, element_id: str) -> Optional[Any]:
+        """Resolve a ``table_id:rN:cM`` virtual cell ID through the table grid.
+
+        The grid is checked against the table once per session revision (see
+        ``get_table_grid``), so resolving many IDs in a loop costs one lookup
+        each.
+        """
+        from docx_mcp_server.core.table_grid import parse_virtual_cell_id
+
+        parsed = parse_virtual_cell_id(element_id)
+        if parsed is None:
+            return None
+        table_id, row, col = parsed
+        table = self.object_registry.get(table_id)
+        if not isinstance(table, Table):
+            return None
+        try:
+            return self.get_table_grid(table).cell(row, col, table)
+        except IndexError:
+            return None
 
     def _get_element_id(self, element: Any, auto_register: bool = True) -> Optional[str]:
         """Get element ID from cache, optionally auto-register if not found.
@@ -245,6 +351,165 @@ class Session:
         logger.debug(f"Element ID cache miss, auto_register=False (type={type(element).__name__})")
         return None
 
+    def get_fuzzy_index(self, refresh: bool = False):
+        """Return the trigram index for fuzzy paragraph lookup, building it lazily.
+
+        The index is rebuilt when the session revision has moved on or the
+        number of body elements changed since it was built.
+
+        Args:
+            refresh: Force a rebuild regardless of the staleness checks.
+        """
+        from docx_mcp_server.core.fuzzy_index import TrigramIndex
+
+        index = self._fuzzy_index
+        if (
+            refresh
+            or index is None
+            or index.revision != self.revision
+            or index.body_length != len(self.document.element.body)
+        ):
+            index = TrigramIndex(self.document, revision=self.revision)
+            self._fuzzy_index = index
+        return index
+
+    def get_placeholder_index(self, refresh: bool = False):
+        """Return the template placeholder index, building it lazily.
+
+        Besides the revision and body-length checks used for the fuzzy
+        index, every slot is verified against the XML, because not all
+        mutating tools mark the session dirty.
+
+        Args:
+            refresh: Force a rebuild regardless of the staleness checks.
+        """
+        from docx_mcp_server.core.placeholder_index import PlaceholderIndex
+
+        index = self._placeholder_index
+        if (
+            refresh
+            or index is None
+            or index.revision != self.revision
+            or index.body_length != len(self.document.element.body)
+            or not index.is_current()
+        ):
+            index = PlaceholderIndex(self.document, revision=self.revision)
+            self._placeholder_index = index
+        return index
+
+    def get_table_grid(self, table: Any, refresh: bool = False):
+        """Return the cached layout grid of a table, building it lazily.
+
+        Within one session revision a cached grid is returned as is; tools
+        that add or remove rows and columns drop it explicitly via
+        ``invalidate_table_grid``. After the revision moved on, the grid's
+        structural signature (rows, cells, spans, merges) is checked once and
+        the grid rebuilt if it no longer matches. Grids of tables that were
+        removed from the document are dropped at the same time.
+
+        Args:
+            table: python-docx Table or ``w:tbl`` element.
+            refresh: Force a rebuild regardless of the staleness check.
+        """
+        from docx_mcp_server.core.table_grid import TableGrid
+
+        if self._table_grids_revision != self.revision:
+            self._prune_table_grids()
+        tbl = getattr(table, "_tbl", table)
+        grid = self._table_grids.get(id(tbl))
+        if not refresh and grid is not None and grid.tbl is tbl:
+            if grid.revision == self.revision:
+                return grid
+            if grid.is_current():
+                grid.revision = self.revision
+                return grid
+        grid = TableGrid(tbl)
+        grid.revision = self.revision
+        self._table_grids[id(tbl)] = grid
+        return grid
+
+    def _prune_table_grids(self):
+        """Drop the cached grids of tables that are no longer in the document."""
+        root = self.document.element
+        for key, grid in list(self._table_grids.items()):
+            top = grid.tbl
+            parent = top.getparent()
+            while parent is not None:
+                top, parent = parent, parent.getparent()
+            if top is not root:
+                del self._table_grids[key]
+        self._table_grids_revision = self.revision
+
+    def get_importer(self):
+        """Return the importer for copying other documents' content into this one.
+
+        It keeps the mappings of every source imported so far, so styles,
+        lists and images copied in before are reused rather than added again.
+        """
+        from docx_mcp_server.core.doc_import import DocumentImporter
+
+        if self._importer is None or self._importer.document is not self.document:
+            self._importer = DocumentImporter(self.document)
+        return self._importer
+
+    def get_outline_index(self, refresh: bool = False):
+        """Return the heading outline of the body, building it lazily.
+
+        Edits reported through ``note_block_change`` keep the outline current;
+        it is rebuilt when the session revision moved on for any other edit or
+        when the body no longer matches it.
+
+        Args:
+            refresh: Force a rebuild regardless of the staleness checks.
+        """
+        from docx_mcp_server.core.outline_index import OutlineIndex
+
+        index = self._outline_index
+        if (
+            refresh
+            or index is None
+            or index.document is not self.document
+            or index.revision != self.revision
+            or not index.is_current()
+        ):
+            index = OutlineIndex(self.document, revision=self.revision)
+            self._outline_index = index
+        return index
+
+    def note_block_change(self, element: Any, change: str):
+        """Update the outline for one edited element ahead of ``mark_dirty``.
+
+        Only body blocks affect the outline; other elements (runs, cells,
+        nested paragraphs) are accepted and ignored. The outline counts the
+        change as covered by the next ``mark_dirty`` call, so callers report
+        every element they edit and then mark the session dirty once.
+
+        Args:
+            element: python-docx object or XML element.
+            change: "insert" (after insertion), "remove" (before removal) or
+                "restyle" (after a style or outline level change).
+        """
+        index = self._outline_index
+        # revision + 1: an earlier element of the same edit was already noted
+        if index is None or index.revision not in (self.revision, self.revision + 1) or element is None:
+            return
+        el = getattr(element, "_element", element)
+        if getattr(el, "tag", None) is not None:
+            if change == "insert":
+                index.block_inserted(el)
+            elif change == "remove":
+                index.block_removing(el)
+            else:
+                index.block_restyled(el)
+        index.revision = self.revision + 1
+
+    def invalidate_table_grid(self, table: Any = None):
+        """Drop the cached grid of ``table``, or of every table when omitted."""
+        if table is None:
+            self._table_grids.clear()
+        else:
+            self._table_grids.pop(id(getattr(table, "_tbl", table)), None)
+
     def _get_siblings(self, parent: Any) -> List[Any]:
         """Get all child elements from parent container."""
         elements = []
@@ -481,13 +746,14 @@ class Session:
 
     def _restore_table_cells(self, table: Table, cells_data: List[Dict[str, Any]]):
         """Restore table cells from saved data."""
+        grid = self.get_table_grid(table)
         for cell_data in cells_data:
             row = cell_data.get("row")
             col = cell_data.get("col")
             text = cell_data.get("text", "")
             if row is not None and col is not None:
                 try:
-                    cell = table.rows[row].cells[col]
+                    cell = grid.cell(row, col, table)
                     cell.text = text
                 except IndexError:
                     logger.warning(f"Cell ({row}, {col}) out of range")
@@ -592,6 +858,7 @@ class Session:
         """
         with self._lock:
             self._is_dirty = True
+            self.revision += 1
             logger.debug(f"Session {self.session_id} marked as dirty")
 
     def has_unsaved_changes(self) -> bool:
@@ -660,8 +927,15 @@ class SessionManager:
         backup_on_save: bool = False,
         backup_dir: Optional[str] = None,
         backup_suffix: Optional[str] = None,
+        normalize: Optional[bool] = None,
     ) -> str:
-        """Create a new session, optionally loading a file."""
+        """Create a new session, optionally loading a file.
+
+        Args:
+            normalize: Merge fragmented runs of a loaded file (see
+                core.normalizer). Defaults to the DOCX_MCP_NORMALIZE_ON_LOAD
+                environment variable.
+        """
         # Shortened session id for usability while retaining randomness
         session_id = uuid.uuid4().hex[:12]
 
@@ -673,6 +947,11 @@ class SessionManager:
                 try:
                     doc = Document(file_path)
                     logger.info(f"Session created: {session_id}, loaded file: {file_path}, auto_save={auto_save}")
+                    if normalize is None:
+                        normalize = os.environ.get("DOCX_MCP_NORMALIZE_ON_LOAD", "").strip().lower() in ("1", "true", "yes")
+                    if normalize:
+                        from docx_mcp_server.core.normalizer import normalize_document
+                        normalize_document(doc)
                 except Exception as e:
                     # If file exists but fails to load (e.g. locked, corrupt), raise error
                     # so user knows why instead of silently returning empty doc
@@ -0,0 +1,156 @@
+"""Per-document cache of resolved style information.
+
+``paragraph.style.name`` resolves the ``w:pStyle`` ID through the styles part
+(an XPath search of styles.xml plus a new proxy object) on every access, and
+structure tools then detect headings with string checks on the name of every
+paragraph. ``StyleCache`` reads styles.xml once into ``StyleInfo`` records
+keyed by style ID (UI name, type, base style chain, outline level), so both
+become dictionary lookups.
+
+The cache is attached to the document part. It is rebuilt by itself when
+the styles part changes shape (a different styles element or a different
+number of styles, e.g. after ``add_style``); that check is all it does on
+a lookup, so a style edited in place (renamed, rebased, given an outline
+level) is not detected. Code that edits or adds style definitions, such as
+the cross-document importer, calls ``invalidate_style_cache`` afterwards.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from docx.oxml.ns import qn
+from docx.styles import BabelFish
+
+_VAL = qn("w:val")
+_P_STYLE = f"{qn('w:pPr')}/{qn('w:pStyle')}"
+_OUTLINE = f"{qn('w:pPr')}/{qn('w:outlineLvl')}"
+_HEADING_NAME = re.compile(r"heading ([1-9])")
+_CACHE_ATTR = "_docx_mcp_style_cache"
+
+
+@dataclass(frozen=True)
+class StyleInfo:
+    """Resolved information about one style.
+
+    Attributes:
+        style_id: The ``w:styleId``.
+        name: UI name, as ``style.name`` reports it (e.g. "Heading 1").
+        type: "paragraph", "character", "table" or "numbering".
+        based_on: IDs of the base style chain, nearest first.
+        outline_level: Heading level 1-9 (own or inherited ``w:outlineLvl``,
+            or a built-in "heading N" name), None for body text.
+    """
+
+    style_id: str
+    name: Optional[str]
+    type: str
+    based_on: Tuple[str, ...]
+    outline_level: Optional[int]
+
+    @property
+    def is_heading(self) -> bool:
+        """True for styles named like headings ("Heading 1", "TOC Heading", ...)."""
+        return bool(self.name) and "Heading" in self.name
+
+
+class StyleCache:
+    """Style ID -> ``StyleInfo`` for one document; see ``StyleCache.of``."""
+
+    def __init__(self, styles_element):
+        self._element = styles_element
+        self._count = len(styles_element)
+        # style ID -> (stored name, type, basedOn ID, outline level, has own w:outlineLvl)
+        raw: Dict[str, Tuple[Optional[str], str, Optional[str], Optional[int], bool]] = {}
+        self._defaults: Dict[str, str] = {}
+        for style in styles_element.iterchildren(qn("w:style")):
+            style_id = style.get(qn("w:styleId"))
+            if style_id is None:
+                continue
+            kind = style.get(qn("w:type"), "paragraph")
+            name_el = style.find(qn("w:name"))
+            name = name_el.get(_VAL) if name_el is not None else None
+            based_el = style.find(qn("w:basedOn"))
+            level_el = style.find(_OUTLINE)
+            level = None
+            if level_el is not None and level_el.get(_VAL, "").isdigit() and int(level_el.get(_VAL)) < 9:
+                level = int(level_el.get(_VAL)) + 1
+            elif level_el is None and name and _HEADING_NAME.fullmatch(name.lower()):
+                level = int(name[-1])
+            based_on = based_el.get(_VAL) if based_el is not None else None
+            raw[style_id] = (name, kind, based_on, level, level_el is not None)
+            if style.get(qn("w:default")) in ("1", "true", "on") and kind not in self._defaults:
+                self._defaults[kind] = style_id
+
+        self._by_id: Dict[str, StyleInfo] = {}
+        self._by_name: Dict[str, StyleInfo] = {}
+        for style_id, (name, kind, base, level, level_set) in raw.items():
+            chain = []
+            while base in raw and base not in chain and base != style_id:
+                chain.append(base)
+                # The nearest style with a w:outlineLvl decides ("9" is body text)
+                if not level_set and (raw[base][4] or raw[base][3] is not None):
+                    level, level_set = raw[base][3], True
+                base = raw[base][2]
+            info = StyleInfo(
+                style_id=style_id,
+                name=BabelFish.internal2ui(name) if name is not None else None,
+                type=kind,
+                based_on=tuple(chain),
+                outline_level=level,
+            )
+            self._by_id[style_id] = info
+            if name is not None:
+                self._by_name.setdefault(name.lower(), info)
+
+    @classmethod
+    def of(cls, obj: Any) -> "StyleCache":
+        """The cache of the document ``obj`` belongs to (a Document or any block item)."""
+        part = obj.part.package.main_document_part
+        styles_element = part.styles.element
+        cache = getattr(part, _CACHE_ATTR, None)
+        if cache is None or cache._element is not styles_element or cache._count != len(styles_element):
+            cache = cls(styles_element)
+            setattr(part, _CACHE_ATTR, cache)
+        return cache
+
+    def get(self, style_id: Optional[str]) -> Optional[StyleInfo]:
+        return self._by_id.get(style_id) if style_id else None
+
+    def default(self, kind: str = "paragraph") -> Optional[StyleInfo]:
+        """The default style of a type, as used for elements without a style reference."""
+        return self._by_id.get(self._defaults.get(kind))
+
+    def resolve(self, name: str) -> StyleInfo:
+        """Look a style up by UI name ("Heading 1") or stored name ("heading 1").
+
+        Raises:
+            ValueError: If there is no such style.
+        """
+        info = self._by_name.get(BabelFish.ui2internal(name).lower()) or self._by_name.get(name.lower())
+        if info is None:
+            raise ValueError(f"Style '{name}' not found")
+        return info
+
+    def paragraph_style(self, p) -> Optional[StyleInfo]:
+        """Style of a ``w:p`` element, like ``Paragraph(p, parent).style``.
+
+        Paragraphs without a style, or referencing a missing or non-paragraph
+        style, get the default paragraph style.
+        """
+        ref = p.find(_P_STYLE)
+        info = self._by_id.get(ref.get(_VAL)) if ref is not None else None
+        if info is None or info.type != "paragraph":
+            return self.default("paragraph")
+        return info
+
+
+def invalidate_style_cache(obj: Any) -> None:
+    """Drop the cached styles of the document ``obj`` belongs to.
+
+    Call after editing style definitions in place; the next ``StyleCache.of``
+    rebuilds the cache.
+    """
+    part = obj.part.package.main_document_part
+    if hasattr(part, _CACHE_ATTR):
+        delattr(part, _CACHE_ATTR)
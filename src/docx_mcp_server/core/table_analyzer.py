@@ -2,13 +2,18 @@
 Table structure analyzer for detecting irregular structures and generating visualizations.
 
 This module provides utilities for analyzing table structures, detecting merged cells,
-nested tables, and generating ASCII visualizations.
+nested tables, and generating ASCII visualizations. All queries read a
+``TableGrid`` (built once per table, or passed in from the session cache)
+instead of walking ``table.rows``/``row.cells``.
 """
 
 import logging
 from typing import Dict, Any, List, Tuple, Optional
 from docx.table import Table, _Cell
 
+from docx_mcp_server.core import text_extractor
+from docx_mcp_server.core.table_grid import TableGrid, virtual_cell_id
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,102 +21,80 @@ class TableStructureAnalyzer:
     """Analyzer for table structures."""
 
     @staticmethod
-    def detect_irregular_structure(table: Table, session: Optional[Any] = None) -> Dict[str, Any]:
+    def _grid(table: Table, grid: Optional[TableGrid]) -> TableGrid:
+        return grid if grid is not None else TableGrid(table._tbl)
+
+    @staticmethod
+    def _window(grid: TableGrid, start_row: int, end_row: Optional[int],
+                start_col: int, end_col: Optional[int]) -> Tuple[int, int, int, int]:
+        """Clamp a row/column window to the grid; ``end_*`` are exclusive."""
+        start_row = max(start_row, 0)
+        start_col = max(start_col, 0)
+        end_row = grid.row_count if end_row is None else min(end_row, grid.row_count)
+        end_col = grid.col_count if end_col is None else min(end_col, grid.col_count)
+        return start_row, max(end_row, start_row), start_col, max(end_col, start_col)
+
+    @staticmethod
+    def detect_irregular_structure(
+        table: Table,
+        session: Optional[Any] = None,
+        grid: Optional[TableGrid] = None,
+        start_row: int = 0,
+        end_row: Optional[int] = None,
+        start_col: int = 0,
+        end_col: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Detect if table contains irregular structures.
 
+        The ``is_irregular``/``has_*`` flags always describe the whole table;
+        ``irregular_regions`` and ``grid_structure`` only cover the row and
+        column window (``end_*`` exclusive, default: everything).
+
         Args:
             table: Table object to analyze
-            session: Optional Session object for cell ID registration
+            session: Optional Session object; when given, grid_structure is
+                generated with virtual cell IDs (``table_id:rN:cM``)
+            grid: Optional pre-built TableGrid (defaults to the session's
+                cached grid, or a fresh one)
+            start_row: First row of the window
+            end_row: Row after the last row of the window
+            start_col: First column of the window
+            end_col: Column after the last column of the window
 
         Returns:
             Dictionary with detection results and optionally grid_structure with cell_ids
         """
-        result = {
-            "is_irregular": False,
-            "has_merged_cells": False,
-            "has_nested_tables": False,
-            "row_col_inconsistent": False,
-            "irregular_regions": [],
-            "grid_structure": []
-        }
-
-        if not table.rows:
-            return result
-
-        # Check for merged cells
-        for row_idx, row in enumerate(table.rows):
-            for col_idx, cell in enumerate(row.cells):
-                # Check grid_span (column span)
-                try:
-                    tc_pr = cell._element.tcPr
-                    if tc_pr is not None and tc_pr.gridSpan is not None:
-                        grid_span = tc_pr.gridSpan.val
-                        if grid_span > 1:
-                            result["has_merged_cells"] = True
-                            result["is_irregular"] = True
-                            result["irregular_regions"].append({
-                                "type": "merged",
-                                "row": row_idx,
-                                "col": col_idx,
-                                "colspan": grid_span
-                            })
-                except Exception as e:
-                    logger.debug(f"Error checking grid_span at ({row_idx}, {col_idx}): {e}")
-
-                # Check vMerge (row span)
-                try:
-                    tc_pr = cell._element.tcPr
-                    if tc_pr is not None and tc_pr.vMerge is not None:
-                        result["has_merged_cells"] = True
-                        result["is_irregular"] = True
-                        result["irregular_regions"].append({
-                            "type": "merged_vertical",
-                            "row": row_idx,
-                            "col": col_idx
-                        })
-                except Exception as e:
-                    logger.debug(f"Error checking vMerge at ({row_idx}, {col_idx}): {e}")
-
-        # Check for nested tables
-        for row_idx, row in enumerate(table.rows):
-            for col_idx, cell in enumerate(row.cells):
-                if len(cell.tables) > 0:
-                    result["has_nested_tables"] = True
-                    result["is_irregular"] = True
-                    result["irregular_regions"].append({
-                        "type": "nested",
-                        "row": row_idx,
-                        "col": col_idx
-                    })
-
-        # Check row/column consistency
-        col_counts = [len(row.cells) for row in table.rows]
-        if len(set(col_counts)) > 1:
-            result["row_col_inconsistent"] = True
-            result["is_irregular"] = True
-
-        # Generate grid_structure with cell_ids if session is provided
-        if session is not None:
+        if grid is None and session is not None:
+            grid = session.get_table_grid(table)
+        grid = TableStructureAnalyzer._grid(table, grid)
+        result = grid.structure()
+
+        row_lo, row_hi, col_lo, col_hi = TableStructureAnalyzer._window(
+            grid, start_row, end_row, start_col, end_col
+        )
+        result["irregular_regions"] = [
+            region for region in result["irregular_regions"]
+            if row_lo <= region["row"] < row_hi and col_lo <= region["col"] < col_hi
+        ]
+
+        # Generate grid_structure with cell_ids if session is provided.
+        # Cells are addressed through virtual IDs resolved by
+        # Session.get_object, so no registry entry is created per cell.
+        if session is not None and grid.rows:
+            table_id = session._get_element_id(table, auto_register=True)
             grid_structure = []
-            for row_idx, row in enumerate(table.rows):
+            for row_idx in range(row_lo, row_hi):
+                row = grid.anchors[row_idx]
                 row_data = []
-                for col_idx, cell in enumerate(row.cells):
-                    cell_info = {
+                for col_idx in range(col_lo, min(col_hi, len(row))):
+                    text = text_extractor.cell_text(row[col_idx])
+                    row_data.append({
                         "row": row_idx,
                         "col": col_idx,
-                        "text": cell.text[:50] if cell.text else ""
-                    }
-
-                    # Add cell_id if session is provided
-                    try:
-                        cell_id = session._get_element_id(cell, auto_register=True)
-                        if cell_id:
-                            cell_info["cell_id"] = cell_id
-                    except Exception as e:
-                        logger.warning(f"Failed to generate cell_id for cell ({row_idx}, {col_idx}): {e}")
-
-                    row_data.append(cell_info)
+                        "text": text[:50] if text else "",
+                        "cell_id": virtual_cell_id(table_id, row_idx, col_idx)
+                    })
                 grid_structure.append(row_data)
 
             result["grid_structure"] = grid_structure
@@ -119,93 +102,104 @@ class TableStructureAnalyzer:
         return result
 
     @staticmethod
-    def generate_ascii_visualization(table: Table) -> str:
+    def generate_ascii_visualization(
+        table: Table,
+        grid: Optional[TableGrid] = None,
+        start_row: int = 0,
+        end_row: Optional[int] = None,
+        start_col: int = 0,
+        end_col: Optional[int] = None
+    ) -> str:
         """
         Generate ASCII visualization of table structure.
 
         Args:
             table: Table object to visualize
+            grid: Optional pre-built TableGrid
+            start_row, end_row, start_col, end_col: Optional row/column
+                window (``end_*`` exclusive, default: the whole table)
 
         Returns:
             ASCII string representation
         """
-        if not table.rows:
+        grid = TableStructureAnalyzer._grid(table, grid)
+        if not grid.rows:
             return "Empty table (0 rows)"
 
-        rows_count = len(table.rows)
-        cols_count = len(table.columns) if table.rows else 0
+        rows_count, cols_count = text_extractor.table_dimensions(table._tbl)
+        row_lo, row_hi, col_lo, col_hi = TableStructureAnalyzer._window(
+            grid, start_row, end_row, start_col, end_col
+        )
 
         # Detect irregular structure
-        structure_info = TableStructureAnalyzer.detect_irregular_structure(table)
+        structure_info = grid.structure()
 
         lines = []
         lines.append(f"Table: {rows_count} rows x {cols_count} cols "
                      f"(merged cells: {'yes' if structure_info['has_merged_cells'] else 'no'})")
+        if (row_lo, row_hi, col_lo, col_hi) != (0, grid.row_count, 0, grid.col_count):
+            lines.append(f"Showing rows {row_lo}-{row_hi - 1}, cols {col_lo}-{col_hi - 1}")
         lines.append("")
 
-        # Calculate column widths (fixed at 20 for simplicity)
-        col_widths = [20] * cols_count
+        # Column width is fixed at 20 for simplicity
+        width = 20
+        border = "+" + "+".join(["-" * (width + 2)] * min(cols_count, col_hi - col_lo)) + "+"
 
         # Generate table rows
-        for row_idx, row in enumerate(table.rows):
+        for row in grid.anchors[row_lo:row_hi]:
             # Top border
-            border = "+" + "+".join(["-" * (w + 2) for w in col_widths]) + "+"
             lines.append(border)
 
             # Cell contents
             cell_texts = []
-            for col_idx, cell in enumerate(row.cells):
-                text = cell.text.replace('\n', ' ')
+            for tc in row[col_lo:col_hi]:
+                text = text_extractor.cell_text(tc).replace('\n', ' ')
                 if len(text) > 20:
                     text = text[:17] + "..."
                 if not text:
                     text = "[empty]"
-                cell_texts.append(f" {text:<{col_widths[col_idx]}} ")
+                cell_texts.append(f" {text:<{width}} ")
 
             lines.append("|" + "|".join(cell_texts) + "|")
 
         # Bottom border
-        border = "+" + "+".join(["-" * (w + 2) for w in col_widths]) + "+"
         lines.append(border)
 
         return "\n".join(lines)
 
     @staticmethod
-    def get_fillable_cells(table: Table, structure_info: Dict[str, Any] = None) -> List[Tuple[int, int]]:
+    def get_fillable_cells(
+        table: Table,
+        structure_info: Dict[str, Any] = None,
+        grid: Optional[TableGrid] = None
+    ) -> List[Tuple[int, int]]:
         """
         Get list of fillable cell coordinates.
 
         Args:
             table: Table object
             structure_info: Optional pre-computed structure info
+            grid: Optional pre-built TableGrid
 
         Returns:
             List of (row, col) tuples for fillable cells
         """
-        if not table.rows:
+        grid = TableStructureAnalyzer._grid(table, grid)
+        if not grid.rows:
             return []
 
         if structure_info is None:
-            structure_info = TableStructureAnalyzer.detect_irregular_structure(table)
-
-        fillable_cells = []
+            structure_info = grid.structure()
 
-        # If no irregular structure, all cells are fillable
-        if not structure_info["is_irregular"]:
-            for row_idx, row in enumerate(table.rows):
-                for col_idx in range(len(row.cells)):
-                    fillable_cells.append((row_idx, col_idx))
-            return fillable_cells
-
-        # Build set of irregular cell positions
+        # Build set of irregular cell positions (empty for regular tables)
         irregular_positions = set()
-        for region in structure_info["irregular_regions"]:
-            irregular_positions.add((region["row"], region["col"]))
-
-        # Add all non-irregular cells
-        for row_idx, row in enumerate(table.rows):
-            for col_idx in range(len(row.cells)):
-                if (row_idx, col_idx) not in irregular_positions:
-                    fillable_cells.append((row_idx, col_idx))
-
-        return fillable_cells
+        if structure_info["is_irregular"]:
+            for region in structure_info["irregular_regions"]:
+                irregular_positions.add((region["row"], region["col"]))
+
+        return [
+            (row_idx, col_idx)
+            for row_idx, row in enumerate(grid.anchors)
+            for col_idx in range(len(row))
+            if (row_idx, col_idx) not in irregular_positions
+        ]
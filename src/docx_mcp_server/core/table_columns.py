@@ -0,0 +1,425 @@
+"""Columnar view of a table with vectorized numeric transforms.
+
+Formatting a column or adding a computed totals column used to take one
+``docx_get_cell`` + ``docx_update_paragraph_text`` round trip per cell.
+``ColumnarTable`` reads the data rows of a ``TableGrid`` into one text array
+per column, parses numbers column-wise (NumPy arrays when NumPy is
+installed, ``array('d')`` otherwise), applies formatting, computed columns
+and totals to whole columns, and writes only the changed cells back in a
+single pass.
+
+Merged regions contribute their text once, at their top-left position; the
+other positions they cover read as "" and are never written.
+"""
+
+import ast
+import logging
+import math
+import operator
+import re
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from docx.oxml.ns import qn
+from docx.table import Table
+
+from docx_mcp_server.core import text_extractor
+from docx_mcp_server.core.table_fill import append_rows, write_cells
+from docx_mcp_server.core.table_grid import TableGrid
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+NUMBER_STYLES = ("number", "plain", "percent", "currency")
+
+_TC = qn("w:tc")
+
+_NAN = float("nan")
+# Currency symbols and whitespace around a number
+_NUMBER_NOISE = re.compile(r"[\s $€£¥₩₹]|USD|EUR|GBP|CNY|RMB|JPY")
+_NUMBER = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+# Comma thousands separators; any other comma (e.g. a decimal comma) is not a number
+_THOUSANDS = re.compile(r"^[+-]?\d{1,3}(,\d{3})+(\.\d*)?([eE][+-]?\d+)?$")
+_COLUMN_REF = re.compile(r"\[([^\[\]]+)\]")
+
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+_UNARY_SIGNS = {ast.UAdd: 1.0, ast.USub: -1.0}
+
+
+def parse_number(text: str) -> float:
+    """Parse a cell text as a number; NaN if it is not one.
+
+    Accepts comma thousands separators in valid groups (``"1,234.5"``; a
+    decimal comma such as ``"1,5"`` is NaN rather than 15), currency
+    symbols/codes, a trailing ``%`` (``"12.5%"`` -> 0.125) and accounting
+    negatives (``"(1,200)"``).
+    """
+    value = _NUMBER_NOISE.sub("", text)
+    negative = value.startswith("(") and value.endswith(")")
+    if negative:
+        value = value[1:-1]
+    percent = value.endswith("%")
+    if percent:
+        value = value[:-1]
+    if "," in value:
+        if not _THOUSANDS.match(value):
+            return _NAN
+        value = value.replace(",", "")
+    if not _NUMBER.match(value):
+        return _NAN
+    number = float(value)
+    if percent:
+        number /= 100
+    return -number if negative else number
+
+
+def format_number(value: float, style: str = "number", decimals: int = 2, symbol: str = "$") -> str:
+    """Render a number; NaN renders as "".
+
+    Styles: ``number`` (``1,234.50``), ``plain`` (``1234.50``), ``percent``
+    (0.125 -> ``12.50%``) and ``currency`` (``$1,234.50``, ``-$5.00``).
+    """
+    if value is None or math.isnan(value):
+        return ""
+    if style == "plain":
+        return f"{value:.{decimals}f}"
+    if style == "percent":
+        return f"{value * 100:,.{decimals}f}%"
+    if style == "currency":
+        sign = "-" if value < 0 else ""
+        return f"{sign}{symbol}{abs(value):,.{decimals}f}"
+    if style == "number":
+        return f"{value:,.{decimals}f}"
+    raise ValueError(f"Unknown number style '{style}'. Supported: {', '.join(NUMBER_STYLES)}")
+
+
+def resolve_column(names: Sequence[str], col_count: int, key: Union[str, int]) -> int:
+    """Resolve a column by header name or 0-based index.
+
+    Names take precedence; a digit string that is not a header name is read
+    as an index.
+
+    Raises:
+        ValueError: If no such column exists.
+    """
+    if isinstance(key, int) and not isinstance(key, bool):
+        if not 0 <= key < col_count:
+            raise ValueError(f"Column {key} out of range (table has {col_count} columns)")
+        return key
+    name = str(key).strip()
+    if name in names:
+        return list(names).index(name)
+    if name.isdigit():
+        return resolve_column(names, col_count, int(name))
+    raise ValueError(f"Column '{key}' not found in header {list(names)}")
+
+
+def _vector(values: Sequence[float]):
+    if HAS_NUMPY:
+        return np.asarray(values, dtype=float)
+    return array("d", values)
+
+
+def _apply(op, left, right):
+    """Element-wise ``op``; scalars broadcast. Division by zero gives NaN."""
+    if HAS_NUMPY:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = op(np.asarray(left, dtype=float), np.asarray(right, dtype=float))
+        return np.where(np.isinf(result), np.nan, result) if isinstance(result, np.ndarray) else result
+
+    def scalar(a, b):
+        try:
+            return op(a, b)
+        except ZeroDivisionError:
+            return _NAN
+
+    left_seq = not isinstance(left, float)
+    right_seq = not isinstance(right, float)
+    if left_seq and right_seq:
+        return array("d", (scalar(a, b) for a, b in zip(left, right)))
+    if left_seq:
+        return array("d", (scalar(a, right) for a in left))
+    if right_seq:
+        return array("d", (scalar(left, b) for b in right))
+    return scalar(left, right)
+
+
+class ColumnarTable:
+    """The data rows of a table as column arrays.
+
+    Args:
+        table: Source table.
+        grid: Its ``TableGrid``.
+        header_rows: Leading rows excluded from the data; the last of them
+            supplies the column names.
+        footer_rows: Trailing rows excluded from the data (e.g. an existing
+            totals row).
+    """
+
+    def __init__(self, table: Table, grid: TableGrid, header_rows: int = 1, footer_rows: int = 0):
+        if header_rows < 0 or footer_rows < 0:
+            raise ValueError("header_rows and footer_rows must be >= 0")
+        if header_rows + footer_rows > grid.row_count:
+            raise ValueError(
+                f"header_rows + footer_rows ({header_rows + footer_rows}) exceed the "
+                f"{grid.row_count} rows of the table"
+            )
+        self.table = table
+        self.grid = grid
+        self.header_rows = header_rows
+        self.footer_rows = footer_rows
+        self.first_row = header_rows
+        self.row_count = grid.row_count - header_rows - footer_rows
+        self.col_count = grid.col_count
+
+        texts: Dict[int, str] = {}
+
+        def text_at(row: int, col: int) -> str:
+            if col >= len(grid.anchors[row]) or grid.origin(row, col) != (row, col):
+                return ""
+            tc = grid.anchors[row][col]
+            if id(tc) not in texts:
+                texts[id(tc)] = text_extractor.cell_text(tc)
+            return texts[id(tc)]
+
+        self.names: List[str] = (
+            [text_at(header_rows - 1, c).strip() for c in range(self.col_count)]
+            if header_rows else [""] * self.col_count
+        )
+        rows = range(self.first_row, self.first_row + self.row_count)
+        self.columns: List[List[str]] = [[text_at(r, c) for r in rows] for c in range(self.col_count)]
+        self._original = [list(column) for column in self.columns]
+        self._extra: Dict[Tuple[int, int], str] = {}
+        self._append: Optional[Dict[int, str]] = None
+
+    def column_index(self, key: Union[str, int]) -> int:
+        """Resolve a column by header name or 0-based index (see ``resolve_column``)."""
+        return resolve_column(self.names, self.col_count, key)
+
+    def numbers(self, key: Union[str, int]):
+        """Parsed values of a column (NaN where a cell is not numeric)."""
+        return _vector([parse_number(text) for text in self.columns[self.column_index(key)]])
+
+    def evaluate(self, expression: str):
+        """Evaluate an arithmetic expression over columns, element-wise.
+
+        Columns are referenced as ``[Name]`` or ``[index]``; only numbers,
+        ``+ - * /``, unary signs and parentheses are allowed, e.g.
+        ``"[Qty] * [Unit Price] * 1.2"``.
+
+        Raises:
+            ValueError: On an unknown column or unsupported syntax.
+        """
+        refs: Dict[str, Any] = {}
+
+        def substitute(match):
+            name = f"_c{self.column_index(match.group(1))}"
+            refs[name] = None
+            return name
+
+        source = _COLUMN_REF.sub(substitute, expression)
+        try:
+            tree = ast.parse(source, mode="eval")
+        except SyntaxError:
+            raise ValueError(f"Invalid expression: {expression}")
+
+        def visit(node):
+            if isinstance(node, ast.Expression):
+                return visit(node.body)
+            if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+                return _apply(_BINARY_OPS[type(node.op)], visit(node.left), visit(node.right))
+            if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_SIGNS:
+                return _apply(operator.mul, _UNARY_SIGNS[type(node.op)], visit(node.operand))
+            if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                    and not isinstance(node.value, bool):
+                return float(node.value)
+            if isinstance(node, ast.Name) and node.id in refs:
+                if refs[node.id] is None:
+                    refs[node.id] = self.numbers(int(node.id[2:]))
+                return refs[node.id]
+            raise ValueError(f"Unsupported syntax in expression: {expression}")
+
+        result = visit(tree)
+        if isinstance(result, float):
+            result = _vector([result] * self.row_count)
+        return result
+
+    def set_column(self, key: Union[str, int], values: Sequence[str]):
+        """Replace the texts of a column."""
+        col = self.column_index(key)
+        if len(values) != self.row_count:
+            raise ValueError(f"Expected {self.row_count} values, got {len(values)}")
+        self.columns[col] = list(values)
+
+    def format_column(self, key: Union[str, int], style: str = "number", decimals: int = 2,
+                      symbol: str = "$", target: Union[str, int, None] = None) -> int:
+        """Reformat the numeric cells of a column; non-numeric cells are kept.
+
+        Returns:
+            int: Number of cells that were numeric.
+        """
+        source = self.columns[self.column_index(key)]
+        values = self.numbers(key)
+        formatted = []
+        numeric = 0
+        for text, value in zip(source, values):
+            if math.isnan(value):
+                formatted.append(text)
+            else:
+                formatted.append(format_number(value, style, decimals, symbol))
+                numeric += 1
+        self.set_column(key if target is None else target, formatted)
+        return numeric
+
+    def compute_column(self, target: Union[str, int], expression: str, style: str = "number",
+                       decimals: int = 2, symbol: str = "$"):
+        """Fill ``target`` with ``expression`` evaluated per row."""
+        values = self.evaluate(expression)
+        self.set_column(target, [format_number(float(v), style, decimals, symbol) for v in values])
+        return values
+
+    def total(self, key: Union[str, int]) -> float:
+        """Sum of the numeric cells of a column (non-numeric cells are skipped)."""
+        values = self.numbers(key)
+        if HAS_NUMPY:
+            return float(np.nansum(values))
+        return math.fsum(v for v in values if not math.isnan(v))
+
+    def set_cell(self, row: int, key: Union[str, int], text: str):
+        """Set a cell outside the data rows (header or footer row)."""
+        if self.first_row <= row < self.first_row + self.row_count:
+            self.columns[self.column_index(key)][row - self.first_row] = text
+        else:
+            self._extra[(row, self.column_index(key))] = text
+
+    def set_appended(self, key: Union[str, int], text: str):
+        """Set a cell of a row appended after the table on write-back."""
+        if self._append is None:
+            self._append = {}
+        self._append[self.column_index(key)] = text
+
+    def write_back(self, preserve_formatting: bool = True) -> Dict[str, int]:
+        """Write changed cells to the table in one pass.
+
+        Returns:
+            dict: ``cells_written`` and ``rows_added``.
+        """
+        grid = self.grid
+
+        def cells():
+            for col, (column, original) in enumerate(zip(self.columns, self._original)):
+                for offset, (text, before) in enumerate(zip(column, original)):
+                    row = self.first_row + offset
+                    if text != before and self._is_origin(row, col):
+                        yield grid.anchors[row][col], text
+            for (row, col), text in self._extra.items():
+                if self._is_origin(row, col):
+                    yield grid.anchors[row][col], text
+
+        written = write_cells(self.table, cells(), preserve_formatting=preserve_formatting)
+        rows_added = 0
+        if self._append is not None:
+            new_tr = append_rows(self.table, 1)[0]
+            new_cells = [tc for tc in new_tr.iterchildren(_TC)
+                         for _ in range(text_extractor.grid_span(tc))]
+            written += write_cells(
+                self.table,
+                ((new_cells[col], text) for col, text in self._append.items() if col < len(new_cells)),
+                preserve_formatting=preserve_formatting,
+            )
+            rows_added = 1
+        logger.debug(f"ColumnarTable.write_back: {written} cells, {rows_added} rows added")
+        return {"cells_written": written, "rows_added": rows_added}
+
+    def _is_origin(self, row: int, col: int) -> bool:
+        return (
+            0 <= row < self.grid.row_count
+            and col < len(self.grid.anchors[row])
+            and self.grid.origin(row, col) == (row, col)
+        )
+
+
+def transform_columns(
+    table: Table,
+    operations: List[Dict[str, Any]],
+    header_rows: int = 1,
+    footer_rows: int = 0,
+    preserve_formatting: bool = True,
+    grid: Optional[TableGrid] = None,
+) -> Dict[str, Any]:
+    """Apply a list of column operations and write the result back once.
+
+    Operations (applied in order, each a dict with an ``op`` key):
+
+    - ``{"op": "format", "column", "style", "decimals", "symbol", "target"}``
+    - ``{"op": "compute", "target", "expression", "style", "decimals", "symbol"}``
+    - ``{"op": "total", "column", "row", "style", "decimals", "symbol",
+      "label", "label_column"}``: ``row`` is a table row index or
+      ``"append"`` (default: the first footer row, else ``"append"``).
+
+    Returns:
+        dict: ``cells_written``, ``rows_added``, ``data_rows`` and
+        ``totals`` (column name or index -> total).
+
+    Raises:
+        ValueError: On an unknown operation, column or style.
+    """
+    if grid is None:
+        grid = TableGrid(table._tbl)
+    view = ColumnarTable(table, grid, header_rows=header_rows, footer_rows=footer_rows)
+    totals: Dict[str, float] = {}
+
+    for index, spec in enumerate(operations):
+        if not isinstance(spec, dict):
+            raise ValueError(f"Operation {index} must be an object")
+        op = spec.get("op")
+        style = spec.get("style", "number")
+        if style not in NUMBER_STYLES:
+            raise ValueError(f"Operation {index}: unknown style '{style}'. Supported: {', '.join(NUMBER_STYLES)}")
+        decimals = int(spec.get("decimals", 2))
+        symbol = spec.get("symbol", "$")
+        if op == "format":
+            view.format_column(_required(spec, "column", index), style, decimals, symbol, spec.get("target"))
+        elif op == "compute":
+            view.compute_column(
+                _required(spec, "target", index), _required(spec, "expression", index), style, decimals, symbol
+            )
+        elif op == "total":
+            column = _required(spec, "column", index)
+            value = view.total(column)
+            totals[str(column)] = value
+            row = spec.get("row", grid.row_count - footer_rows if footer_rows else "append")
+            cells = [(column, format_number(value, style, decimals, symbol))]
+            if spec.get("label") is not None:
+                cells.append((spec.get("label_column", 0), str(spec["label"])))
+            for key, text in cells:
+                if row == "append":
+                    view.set_appended(key, text)
+                elif isinstance(row, int) and 0 <= row < grid.row_count:
+                    view.set_cell(row, key, text)
+                else:
+                    raise ValueError(f"Operation {index}: row must be a table row index or \"append\"")
+        else:
+            raise ValueError(f"Operation {index}: unknown op '{op}' (expected format, compute or total)")
+
+    result = view.write_back(preserve_formatting=preserve_formatting)
+    result["data_rows"] = view.row_count
+    result["totals"] = totals
+    return result
+
+
+def _required(spec: Dict[str, Any], key: str, index: int):
+    if spec.get(key) is None:
+        raise ValueError(f"Operation {index} ({spec.get('op')}) requires '{key}'")
+    return spec[key]
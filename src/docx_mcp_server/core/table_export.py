@@ -0,0 +1,174 @@
+"""Streaming export of tables to CSV/TSV/JSON-lines.
+
+Reading table data back out used to go through ``docx_read_content`` or
+``docx_get_table_structure``, both of which materialise the whole grid (the
+latter also registers cells and renders an ASCII view). The exporter walks
+each ``w:tbl`` once with ``text_extractor.iter_table_rows``, which resolves
+merged cells as it goes, and writes every row as soon as it is produced.
+"""
+
+import csv
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+from docx.oxml.ns import qn
+
+from docx_mcp_server.core import text_extractor
+from docx_mcp_server.core.table_import import SUPPORTED_FORMATS, detect_format
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = SUPPORTED_FORMATS
+
+_FILE_EXTENSIONS = {"csv": ".csv", "tsv": ".tsv", "jsonl": ".jsonl"}
+
+_TBL = qn("w:tbl")
+
+
+def body_tables(document) -> List[Any]:
+    """Body-level ``w:tbl`` elements, indexed like ``document.tables``."""
+    return list(document.element.body.iterchildren(_TBL))
+
+
+def _unique_names(names: List[str]) -> List[str]:
+    """Header names usable as JSON keys: blanks get ``column_N``, duplicates a suffix."""
+    seen: Dict[str, int] = {}
+    result = []
+    for idx, name in enumerate(names, 1):
+        name = name.strip() or f"column_{idx}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}_{seen[name]}"
+        else:
+            seen[name] = 1
+        result.append(name)
+    return result
+
+
+def write_rows(rows: Iterable[List[str]], f, file_format: str, header: bool = False) -> int:
+    """Write ``rows`` to the open text file ``f``; return the number of data rows.
+
+    With ``header`` the first row is the header: it is written as-is for
+    CSV/TSV and turns JSON-lines records into objects keyed by its names.
+    """
+    rows = iter(rows)
+    count = 0
+    if file_format == "jsonl":
+        names = None
+        if header:
+            first = next(rows, None)
+            if first is None:
+                return 0
+            names = _unique_names(first)
+        for row in rows:
+            if names is not None:
+                record: Any = dict(zip(names, row))
+                # Rows wider than the header keep their extra values
+                for idx in range(len(names), len(row)):
+                    record[f"column_{idx + 1}"] = row[idx]
+            else:
+                record = row
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+        return count
+
+    writer = csv.writer(f, delimiter="\t" if file_format == "tsv" else ",")
+    for idx, row in enumerate(rows):
+        writer.writerow(row)
+        if idx or not header:
+            count += 1
+    return count
+
+
+def export_table(
+    tbl,
+    path: str,
+    file_format: Optional[str] = None,
+    header: bool = False,
+    repeat_merged: bool = True,
+    encoding: str = "utf-8",
+) -> Dict[str, Any]:
+    """Write one ``w:tbl`` to ``path``.
+
+    Args:
+        tbl: Table element.
+        path: Output file.
+        file_format: "csv", "tsv" or "jsonl" (default: from the extension).
+        header: Treat the first table row as a header (JSON-lines records
+            become objects).
+        repeat_merged: Repeat the text of merged cells in every position they
+            cover; otherwise only the top-left position carries it.
+        encoding: Output encoding.
+
+    Returns:
+        dict: ``path``, ``format`` and ``rows`` (data rows written).
+
+    Raises:
+        ValueError: If the format is unknown or cannot be detected.
+    """
+    fmt = detect_format(path, file_format)
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    with open(path, "w", newline="" if fmt != "jsonl" else None, encoding=encoding) as f:
+        count = write_rows(text_extractor.iter_table_rows(tbl, repeat_merged), f, fmt, header=header)
+    logger.info(f"Exported {count} rows to {path} ({fmt})")
+    return {"path": path, "format": fmt, "rows": count}
+
+
+def export_tables(
+    tables: List[Any],
+    directory: str,
+    file_format: str = "csv",
+    header: bool = False,
+    repeat_merged: bool = True,
+    encoding: str = "utf-8",
+    prefix: str = "table",
+) -> List[Dict[str, Any]]:
+    """Write each table to ``{directory}/{prefix}_{index}.{ext}``.
+
+    Returns:
+        list: One ``export_table`` result per table, with its ``index``.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    fmt = file_format.lower() if file_format else "csv"
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported format '{file_format}'. Supported: {', '.join(EXPORT_FORMATS)}")
+    os.makedirs(directory, exist_ok=True)
+    results = []
+    for index, tbl in enumerate(tables):
+        path = os.path.join(directory, f"{prefix}_{index}{_FILE_EXTENSIONS[fmt]}")
+        result = export_table(tbl, path, fmt, header=header, repeat_merged=repeat_merged, encoding=encoding)
+        result["index"] = index
+        results.append(result)
+    return results
+
+
+def read_rows(tbl, start_row: int = 0, max_rows: int = 50, repeat_merged: bool = True) -> Dict[str, Any]:
+    """Return a window of table rows without materialising the rest.
+
+    Rows before the window are still walked (vertical merges carry text
+    down from them); iteration stops at the end of the window.
+
+    Returns:
+        dict: ``rows`` (the window), ``start_row``, ``total_rows`` and
+        ``truncated`` (rows remain after the window).
+    """
+    total, _ = text_extractor.table_dimensions(tbl)
+    window: List[List[str]] = []
+    if max_rows > 0:
+        for idx, row in enumerate(text_extractor.iter_table_rows(tbl, repeat_merged)):
+            if idx >= start_row:
+                window.append(row)
+                if len(window) >= max_rows:
+                    break
+    return {
+        "rows": window,
+        "start_row": start_row,
+        "total_rows": total,
+        "truncated": start_row + len(window) < total,
+    }
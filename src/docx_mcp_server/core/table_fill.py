@@ -0,0 +1,363 @@
+"""Bulk table fill engine.
+
+``docx_fill_table`` used to address every cell through ``table.rows[i]``
+and ``row.cells[j]``; python-docx rebuilds the row list and the cell grid on
+each access, which makes large fills quadratic. ``fill_table`` addresses
+cells through a ``TableGrid``, resolves run formatting once per distinct
+source format and writes cell content with direct XML edits.
+"""
+
+import copy
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from lxml import etree
+from docx.oxml import OxmlElement
+from docx.oxml.ns import nsmap, qn
+from docx.table import Table, _Cell
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+
+from docx_mcp_server.core import text_extractor
+from docx_mcp_server.core.format_painter import FormatPainter
+from docx_mcp_server.core.table_grid import TableGrid
+
+logger = logging.getLogger(__name__)
+
+_TR = qn("w:tr")
+_TC = qn("w:tc")
+_P = qn("w:p")
+_R = qn("w:r")
+_RPR = qn("w:rPr")
+_TC_PR = qn("w:tcPr")
+_P_PR = qn("w:pPr")
+_V_MERGE = qn("w:vMerge")
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+_P_STYLE = etree.XPath("string(w:pPr/w:pStyle/@w:val)", namespaces={"w": nsmap["w"]})
+
+
+class _FormatTemplates:
+    """Resolved run formatting, computed once per distinct source format.
+
+    The result is what ``FormatPainter.copy_format`` would write to a fresh
+    run; cells whose source run carries the same ``w:rPr`` (typically every
+    cell of a column) share one template.
+    """
+
+    def __init__(self):
+        self._painter = FormatPainter()
+        self._cache: Dict[Any, Optional[Any]] = {}
+
+    def for_run(self, r):
+        rpr = r.find(_RPR)
+        key = ("run", b"" if rpr is None else etree.tostring(rpr, method="c14n"))
+        if key not in self._cache:
+            self._cache[key] = self._resolve(Run(r, None))
+        return self._cache[key]
+
+    def for_paragraph(self, p, tc, table: Table):
+        key = ("style", _P_STYLE(p))
+        if key not in self._cache:
+            paragraph = Paragraph(p, _Cell(tc, table))
+            template = None
+            if paragraph.style and hasattr(paragraph.style, "font"):
+                template = self._resolve(paragraph)
+            self._cache[key] = template
+        return self._cache[key]
+
+    def _resolve(self, source):
+        scratch = OxmlElement("w:r")
+        self._painter.copy_format(source, Run(scratch, None))
+        rpr = scratch.find(_RPR)
+        return rpr if rpr is not None and len(rpr) else None
+
+
+def _set_run_text(r, text: str):
+    """Write ``text`` into an empty run, like ``CT_R.text`` without its clearing pass."""
+    if any(ch in text for ch in "\t\n\r"):
+        # Tabs and line breaks become w:tab/w:br elements
+        r.text = text
+        return
+    t = OxmlElement("w:t")
+    t.text = text
+    if text[:1].isspace() or text[-1:].isspace():
+        t.set(_XML_SPACE, "preserve")
+    r.append(t)
+
+
+def _write_preserving_format(tc, table: Table, text: str, templates: _FormatTemplates):
+    """Replace the runs of the first paragraph of ``tc`` with one run of ``text``.
+
+    Same result as ``_set_cell_text(..., preserve_formatting=True)``: the new
+    run takes the font of the first run with text (or the first run, or the
+    paragraph style font when the paragraph has no runs).
+    """
+    p = tc.find(_P)
+    if p is None:
+        p = tc.add_p()
+    runs = list(p.iterchildren(_R))
+
+    source = None
+    for r in runs:
+        if text_extractor.run_text(r):
+            source = r
+            break
+    if source is None and runs:
+        source = runs[0]
+
+    if source is not None:
+        template = templates.for_run(source)
+    else:
+        template = templates.for_paragraph(p, tc, table)
+
+    for r in runs:
+        p.remove(r)
+
+    new_r = OxmlElement("w:r")
+    if template is not None:
+        new_r.append(copy.deepcopy(template))
+    _set_run_text(new_r, text)
+    p.append(new_r)
+
+
+def _write_cell(tc, table: Table, text: str, templates: _FormatTemplates, preserve_formatting: bool):
+    if preserve_formatting:
+        _write_preserving_format(tc, table, text, templates)
+        return
+    # Same as _Cell.text: replace all content with one run
+    for child in list(tc):
+        if child.tag != _TC_PR:
+            tc.remove(child)
+    p = OxmlElement("w:p")
+    r = OxmlElement("w:r")
+    _set_run_text(r, text)
+    p.append(r)
+    tc.append(p)
+
+
+def blank_cell(tc, keep_format: bool = True):
+    """Strip a ``w:tc`` (in place) down to its formatting.
+
+    ``w:tcPr`` is kept minus vertical merges. With ``keep_format`` the cell
+    keeps one paragraph with the original paragraph properties and an empty
+    run carrying the first run's properties, so a later preserve-formatting
+    fill picks up the template's font; otherwise it gets one empty paragraph.
+    """
+    tc_pr = tc.find(_TC_PR)
+    if tc_pr is not None:
+        for v_merge in tc_pr.findall(_V_MERGE):
+            tc_pr.remove(v_merge)
+    first_p = tc.find(_P) if keep_format else None
+    for child in list(tc):
+        if child is not tc_pr and child is not first_p:
+            tc.remove(child)
+    if first_p is None:
+        tc.append(OxmlElement("w:p"))
+        return tc
+    first_r = first_p.find(_R)
+    for child in list(first_p):
+        if child.tag != _P_PR:
+            first_p.remove(child)
+    if first_r is not None and first_r.find(_RPR) is not None:
+        r = OxmlElement("w:r")
+        r.append(first_r.find(_RPR))
+        first_p.append(r)
+    return tc
+
+
+def _blank_row_copy(tr):
+    """Copy a ``w:tr`` keeping its formatting but none of its content (see ``blank_cell``)."""
+    new_tr = copy.deepcopy(tr)
+    for tc in new_tr.iterchildren(_TC):
+        blank_cell(tc)
+    return new_tr
+
+
+def append_rows(table: Table, count: int, template_row: Optional[int] = None) -> List[Any]:
+    """Append ``count`` rows cloned from a template row in one pass.
+
+    The template (default: the last row) is copied once with its content
+    stripped (see ``_blank_row_copy``), then deep-copied ``count`` times and
+    inserted after the last row. Falls back to ``table.add_row()`` for a
+    table without rows.
+
+    Returns:
+        list: The new ``w:tr`` elements.
+    """
+    if count <= 0:
+        return []
+    rows = list(table._tbl.iterchildren(_TR))
+    created = []
+    if not rows:
+        created.append(table.add_row()._tr)
+        rows = list(created)
+    template = _blank_row_copy(rows[-1 if template_row is None else template_row])
+
+    anchor = rows[-1]
+    for _ in range(count - len(created)):
+        tr = copy.deepcopy(template)
+        anchor.addnext(tr)
+        anchor = tr
+        created.append(tr)
+    logger.debug(f"append_rows: appended {count} rows")
+    return created
+
+
+def fill_table(
+    table: Table,
+    rows_data: List[List[Any]],
+    start_row: int = 0,
+    preserve_formatting: bool = True,
+    skip_spanned: bool = False,
+    grid: Optional[TableGrid] = None,
+) -> Dict[str, Any]:
+    """Write a 2D array into ``table`` starting at ``start_row``.
+
+    Rows are appended when the data runs past the end of the table. Values
+    beyond the number of cells in a row are ignored.
+
+    Args:
+        table: Target table.
+        rows_data: Row-major cell values; ``None`` is written as "".
+        start_row: First table row to write.
+        preserve_formatting: Keep the existing run font of each cell.
+        skip_spanned: Skip cells spanning several grid columns (used for
+            irregular tables).
+        grid: Optional pre-built ``TableGrid`` of ``table``; it is not
+            modified.
+
+    Returns:
+        dict: ``filled_range`` and ``skipped_regions`` as reported by
+        ``docx_fill_table``.
+    """
+    if grid is None:
+        grid = TableGrid(table._tbl)
+    rows = list(grid.anchors)
+    templates = _FormatTemplates()
+    filled_range = {"start_row": start_row, "start_col": 0, "end_row": start_row, "end_col": 0}
+    skipped_regions = []
+
+    # Rows appended past the end are copies of one row created by
+    # table.add_row(): add_row() itself re-reads tblGrid and inserts through
+    # python-docx's child-order lookup on every call.
+    blank_row = last_tr = None
+    row_idx = start_row
+    for row_data in rows_data:
+        if row_idx >= len(rows):
+            if blank_row is None:
+                last_tr = table.add_row()._tr
+                blank_row = copy.deepcopy(last_tr)
+            else:
+                new_tr = copy.deepcopy(blank_row)
+                last_tr.addnext(new_tr)
+                last_tr = new_tr
+            rows.append(list(last_tr.iterchildren(_TC)))
+        cells = rows[row_idx]
+
+        for col_idx, value in enumerate(row_data):
+            if col_idx >= len(cells):
+                break
+            tc = cells[col_idx]
+            if skip_spanned and text_extractor.grid_span(tc) > 1:
+                skipped_regions.append({"row": row_idx, "col": col_idx, "reason": "irregular_cell"})
+                continue
+
+            text = "" if value is None else str(value)
+            _write_cell(tc, table, text, templates, preserve_formatting)
+            filled_range["end_row"] = row_idx
+            filled_range["end_col"] = max(filled_range["end_col"], col_idx)
+
+        row_idx += 1
+
+    logger.debug(f"fill_table: wrote {len(rows_data)} rows, {len(templates._cache)} format templates")
+    return {"filled_range": filled_range, "skipped_regions": skipped_regions}
+
+
+def write_cells(table: Table, cells: Iterable[Any], preserve_formatting: bool = True) -> int:
+    """Write ``(w:tc, text)`` pairs, sharing format templates across cells.
+
+    Returns:
+        int: Number of cells written.
+    """
+    templates = _FormatTemplates()
+    count = 0
+    for tc, text in cells:
+        _write_cell(tc, table, "" if text is None else str(text), templates, preserve_formatting)
+        count += 1
+    return count
+
+
+def stream_rows(
+    table: Table,
+    rows: Iterable[Sequence[Any]],
+    start_row: Optional[int] = None,
+    template_row: Optional[int] = None,
+    preserve_formatting: bool = True,
+    grid: Optional[TableGrid] = None,
+) -> Dict[str, int]:
+    """Write rows from an iterable into ``table`` without materializing them.
+
+    Existing rows from ``start_row`` on are overwritten; once the table runs
+    out of rows, each further row is a blank copy of ``template_row``
+    (default: the last row, see ``_blank_row_copy``) appended right away.
+    Only one input row is held at a time. A merged cell takes the value of
+    its first grid column; values beyond the end of a row are ignored.
+
+    Args:
+        table: Target table.
+        rows: Row-major cell values; ``None`` is written as "".
+        start_row: First table row to write (default: append after the
+            last row).
+        template_row: Row whose formatting appended rows copy.
+        preserve_formatting: Keep the existing run font of each cell.
+        grid: Optional pre-built ``TableGrid`` of ``table``; it is not
+            modified.
+
+    Returns:
+        dict: ``rows_written``, ``rows_added`` and the ``first_row`` written.
+    """
+    if grid is None:
+        grid = TableGrid(table._tbl)
+    existing = grid.anchors
+    if start_row is None:
+        start_row = len(existing)
+    if not 0 <= start_row <= len(existing):
+        raise IndexError(f"Start row {start_row} out of range (table has {len(existing)} rows)")
+    if template_row is not None and not 0 <= template_row < len(grid.rows):
+        raise IndexError(f"Template row {template_row} out of range (table has {len(grid.rows)} rows)")
+    templates = _FormatTemplates()
+
+    blank_row = None
+    last_tr = grid.rows[-1] if grid.rows else None
+    row_idx = start_row
+    rows_added = 0
+    for values in rows:
+        if row_idx < len(existing):
+            cells = existing[row_idx]
+        else:
+            if last_tr is None:
+                # Table without rows: python-docx builds the first one from tblGrid
+                new_tr = table.add_row()._tr
+            else:
+                if blank_row is None:
+                    source = last_tr if template_row is None else grid.rows[template_row]
+                    blank_row = _blank_row_copy(source)
+                new_tr = copy.deepcopy(blank_row)
+                last_tr.addnext(new_tr)
+            last_tr = new_tr
+            rows_added += 1
+            cells = [tc for tc in new_tr.iterchildren(_TC) for _ in range(text_extractor.grid_span(tc))]
+
+        previous = None
+        for col_idx, value in enumerate(values):
+            if col_idx >= len(cells):
+                break
+            tc = cells[col_idx]
+            if tc is previous:
+                continue
+            previous = tc
+            _write_cell(tc, table, "" if value is None else str(value), templates, preserve_formatting)
+        row_idx += 1
+
+    logger.debug(f"stream_rows: wrote {row_idx - start_row} rows, appended {rows_added}")
+    return {"rows_written": row_idx - start_row, "rows_added": rows_added, "first_row": start_row}
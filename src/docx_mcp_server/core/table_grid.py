@@ -0,0 +1,237 @@
+"""Logical layout grid of a table.
+
+python-docx recomputes the cell grid on every ``table.rows``/``row.cells``
+access, and the analyzer, the fill engine, ``docx_get_cell`` and the
+registry cleaner each used to walk it again. ``TableGrid`` reads
+``w:tr``/``w:tc``/``gridSpan``/``vMerge`` once and answers position queries
+from plain lists and dicts:
+
+- ``anchors[r][c]`` is the ``w:tc`` that ``table.rows[r].cells[c]`` wraps,
+  i.e. the cell that starts the merge covering ``(r, c)``;
+- ``physical[r][c]`` is the ``w:tc`` that sits in row ``r`` at that grid
+  column (the ``vMerge`` continuation cell for vertically merged regions).
+
+Grids are cached per table by ``Session.get_table_grid``: reused within a
+session revision and rebuilt when the structural signature of the table
+changed by the time the revision moved on. The grid also backs virtual
+cell IDs (``table_abc:r12:c3``), which ``Session.get_object`` resolves on
+demand instead of keeping one registry entry per cell.
+"""
+
+import copy
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from lxml import etree
+from docx.oxml.ns import nsmap, qn
+from docx.table import Table, _Cell
+
+from docx_mcp_server.core import text_extractor
+
+_TR = qn("w:tr")
+_TC = qn("w:tc")
+_TBL = qn("w:tbl")
+_TC_PR = qn("w:tcPr")
+_V_MERGE = qn("w:vMerge")
+
+# Everything that changes the layout grid: rows, cells, spans, merges,
+# skipped grid columns and nested tables.
+_SIGNATURE = etree.XPath(
+    "concat(count(w:tr), ',', count(w:tr/w:tc), ',',"
+    " sum(w:tr/w:tc/w:tcPr/w:gridSpan/@w:val), ',',"
+    " count(w:tr/w:tc/w:tcPr/w:vMerge), ',',"
+    " count(w:tr/w:tc/w:tcPr/w:vMerge[@w:val='restart']), ',',"
+    " sum(w:tr/w:trPr/w:gridBefore/@w:val), ',',"
+    " count(w:tr/w:tc/w:tbl))",
+    namespaces={"w": nsmap["w"]},
+)
+
+
+_VIRTUAL_CELL_ID = re.compile(r"^(?P<table>[^\s:]+):r(?P<row>\d+):c(?P<col>\d+)$")
+
+
+def virtual_cell_id(table_id: str, row: int, col: int) -> str:
+    """ID addressing cell ``(row, col)`` of a registered table."""
+    return f"{table_id}:r{row}:c{col}"
+
+
+def parse_virtual_cell_id(element_id: str) -> Optional[Tuple[str, int, int]]:
+    """Split a virtual cell ID into ``(table_id, row, col)``; None for other IDs."""
+    match = _VIRTUAL_CELL_ID.match(element_id)
+    if match is None:
+        return None
+    return match.group("table"), int(match.group("row")), int(match.group("col"))
+
+
+def _has_vmerge(tc) -> bool:
+    tc_pr = tc.find(_TC_PR)
+    return tc_pr is not None and tc_pr.find(_V_MERGE) is not None
+
+
+class TableGrid:
+    """Row/column model of a ``w:tbl`` with its merged-cell map.
+
+    Attributes:
+        tbl: The table element the grid was built from.
+        rows: The ``w:tr`` elements in order.
+        anchors: Per row, the merge-anchor ``w:tc`` of every grid position
+            (same layout as ``row.cells``).
+        physical: Per row, the ``w:tc`` physically present at every grid
+            position.
+        signature: Structural signature at build time, see ``is_current``.
+        revision: Session revision the grid was last checked at (set by
+            ``Session.get_table_grid``).
+    """
+
+    def __init__(self, tbl):
+        self.tbl = tbl
+        self.rows: List[Any] = list(tbl.iterchildren(_TR))
+        self.anchors: List[List[Any]] = []
+        self.physical: List[List[Any]] = []
+        # id(anchor tc) -> [first_row, first_col, last_row, last_col]
+        self._extent: Dict[int, List[int]] = {}
+        self.signature = _SIGNATURE(tbl)
+        self.revision: Optional[int] = None
+        self._structure: Optional[Dict[str, Any]] = None
+
+        above: Dict[int, Any] = {}
+        for row_idx, tr in enumerate(self.rows):
+            offset = text_extractor.grid_before(tr)
+            current: Dict[int, Any] = {}
+            anchor_row: List[Any] = []
+            physical_row: List[Any] = []
+            for tc in tr.iterchildren(_TC):
+                span = text_extractor.grid_span(tc)
+                anchor = tc
+                if text_extractor.is_vmerge_continue(tc):
+                    anchor = above.get(offset, tc)
+                col_idx = len(anchor_row)
+                extent = self._extent.get(id(anchor))
+                if extent is None:
+                    self._extent[id(anchor)] = [row_idx, col_idx, row_idx, col_idx + span - 1]
+                else:
+                    extent[2] = row_idx
+                for i in range(span):
+                    anchor_row.append(anchor)
+                    physical_row.append(tc)
+                    current[offset + i] = anchor
+                offset += span
+            self.anchors.append(anchor_row)
+            self.physical.append(physical_row)
+            above = current
+
+    def is_current(self) -> bool:
+        """True if the table structure still matches the grid (one XPath over the table)."""
+        return _SIGNATURE(self.tbl) == self.signature
+
+    @property
+    def row_count(self) -> int:
+        return len(self.rows)
+
+    @property
+    def col_count(self) -> int:
+        """Widest row, in grid positions."""
+        return max((len(row) for row in self.anchors), default=0)
+
+    def _check(self, row: int, col: int):
+        if row < 0 or col < 0 or row >= len(self.anchors) or col >= len(self.anchors[row]):
+            raise IndexError(f"Cell ({row}, {col}) out of range")
+
+    def anchor(self, row: int, col: int):
+        """The ``w:tc`` that starts the merge covering ``(row, col)``.
+
+        Raises:
+            IndexError: If the position is outside the grid.
+        """
+        self._check(row, col)
+        return self.anchors[row][col]
+
+    def physical_cell(self, row: int, col: int):
+        """The ``w:tc`` physically located at ``(row, col)``.
+
+        Raises:
+            IndexError: If the position is outside the grid.
+        """
+        self._check(row, col)
+        return self.physical[row][col]
+
+    def cell(self, row: int, col: int, table: Table) -> _Cell:
+        """``_Cell`` for ``(row, col)``, equivalent to ``table.rows[row].cells[col]``."""
+        return _Cell(self.anchor(row, col), table)
+
+    def origin(self, row: int, col: int) -> Tuple[int, int]:
+        """Grid position of the merge anchor covering ``(row, col)``."""
+        first_row, first_col, _, _ = self._extent[id(self.anchor(row, col))]
+        return first_row, first_col
+
+    def span(self, row: int, col: int) -> Tuple[int, int]:
+        """``(rowspan, colspan)`` of the merged region covering ``(row, col)``."""
+        first_row, first_col, last_row, last_col = self._extent[id(self.anchor(row, col))]
+        return last_row - first_row + 1, last_col - first_col + 1
+
+    def is_merged(self, row: int, col: int) -> bool:
+        return self.span(row, col) != (1, 1)
+
+    def position_of(self, tc) -> Optional[Tuple[int, int]]:
+        """Top-left grid position of a merge-anchor ``w:tc``, or None if not in this table."""
+        extent = self._extent.get(id(tc))
+        return (extent[0], extent[1]) if extent is not None else None
+
+    def row_cells(self, row: int) -> List[Any]:
+        """Distinct ``w:tc`` elements physically in row ``row``."""
+        return list(self.rows[row].iterchildren(_TC))
+
+    def col_anchors(self, col: int) -> List[Any]:
+        """Distinct merge-anchor ``w:tc`` elements covering grid column ``col``."""
+        seen = set()
+        result = []
+        for row in self.anchors:
+            if col < len(row) and id(row[col]) not in seen:
+                seen.add(id(row[col]))
+                result.append(row[col])
+        return result
+
+    def structure(self) -> Dict[str, Any]:
+        """Irregular-structure report as returned by ``detect_irregular_structure``.
+
+        Computed once per grid; callers get their own copy.
+        """
+        if self._structure is None:
+            self._structure = self._analyze()
+        return copy.deepcopy(self._structure)
+
+    def _analyze(self) -> Dict[str, Any]:
+        result = {
+            "is_irregular": False,
+            "has_merged_cells": False,
+            "has_nested_tables": False,
+            "row_col_inconsistent": False,
+            "irregular_regions": [],
+            "grid_structure": []
+        }
+        if not self.rows:
+            return result
+
+        regions = result["irregular_regions"]
+        nested = []
+        for row_idx, row in enumerate(self.anchors):
+            for col_idx, tc in enumerate(row):
+                colspan = text_extractor.grid_span(tc)
+                if colspan > 1:
+                    regions.append({"type": "merged", "row": row_idx, "col": col_idx, "colspan": colspan})
+                if _has_vmerge(tc):
+                    regions.append({"type": "merged_vertical", "row": row_idx, "col": col_idx})
+                if tc.find(_TBL) is not None:
+                    nested.append({"type": "nested", "row": row_idx, "col": col_idx})
+
+        if regions:
+            result["has_merged_cells"] = True
+            result["is_irregular"] = True
+        if nested:
+            result["has_nested_tables"] = True
+            result["is_irregular"] = True
+            regions.extend(nested)
+        if len({len(row) for row in self.anchors}) > 1:
+            result["row_col_inconsistent"] = True
+            result["is_irregular"] = True
+        return result
@@ -0,0 +1,272 @@
+"""Streaming import of CSV/TSV/JSON-lines files into tables.
+
+``docx_fill_table`` takes the whole dataset as a JSON string in the tool
+call, so large datasets hit message size limits and are held in memory
+twice. ``import_table_file`` reads a local file record by record, maps and
+formats each record and hands it straight to ``table_fill.stream_rows``;
+only one record is held at a time.
+"""
+
+import csv
+import json
+import logging
+import os
+import re
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from docx.table import Table
+
+from docx_mcp_server.core.table_fill import stream_rows
+from docx_mcp_server.core.table_grid import TableGrid
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_FORMATS = ("csv", "tsv", "jsonl")
+
+_EXTENSIONS = {
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".tab": "tsv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+_INT = re.compile(r"^[+-]?\d+$")
+_FLOAT = re.compile(r"^[+-]?(\d+\.\d*|\.\d+|\d+)([eE][+-]?\d+)?$")
+# Zero-padded codes (zip codes, IDs) are text, not numbers
+_ZERO_PADDED = re.compile(r"^[+-]?0\d")
+
+
+def detect_format(path: str, file_format: Optional[str] = None) -> str:
+    """Return the import format, explicit or from the file extension.
+
+    Raises:
+        ValueError: If the format is unknown or cannot be detected.
+    """
+    if file_format:
+        fmt = file_format.lower()
+        if fmt not in SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported format '{file_format}'. Supported: {', '.join(SUPPORTED_FORMATS)}")
+        return fmt
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in _EXTENSIONS:
+        raise ValueError(
+            f"Cannot detect format from extension '{ext}'. "
+            f"Pass file_format ({', '.join(SUPPORTED_FORMATS)})"
+        )
+    return _EXTENSIONS[ext]
+
+
+def iter_records(
+    path: str,
+    file_format: str,
+    delimiter: Optional[str] = None,
+    encoding: str = "utf-8",
+) -> Iterator[Union[List[Any], Dict[str, Any]]]:
+    """Yield the records of a file one at a time.
+
+    CSV/TSV records are lists of strings. JSON-lines records are the decoded
+    lines, which must be arrays or objects; blank lines are skipped.
+
+    Raises:
+        ValueError: On a JSON-lines record that is not valid JSON or not an
+            array/object.
+    """
+    # utf-8-sig: tolerate the BOM spreadsheet exports put in front of CSVs
+    if encoding.lower().replace("_", "-") == "utf-8":
+        encoding = "utf-8-sig"
+    with open(path, newline="" if file_format != "jsonl" else None, encoding=encoding) as f:
+        if file_format == "jsonl":
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Line {line_no}: invalid JSON ({e.msg})")
+                if not isinstance(record, (list, dict)):
+                    raise ValueError(f"Line {line_no}: expected a JSON array or object")
+                yield record
+        else:
+            if delimiter is None:
+                delimiter = "\t" if file_format == "tsv" else ","
+            yield from csv.reader(f, delimiter=delimiter)
+
+
+def format_value(value: Any, number_format: Optional[str] = None) -> str:
+    """Render a cell value, applying ``number_format`` to numbers.
+
+    ``number_format`` is a Python format spec (e.g. ``",.2f"``). It applies
+    to JSON numbers and to strings that read as plain numbers; zero-padded
+    strings such as ``"007"`` are kept as text.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    if not number_format:
+        return str(value)
+
+    number: Any = value
+    if isinstance(value, str):
+        text = value.strip()
+        if _ZERO_PADDED.match(text) and _INT.match(text):
+            return value
+        if _INT.match(text):
+            number = int(text)
+        elif _FLOAT.match(text):
+            number = float(text)
+        else:
+            return value
+    try:
+        return format(number, number_format)
+    except (TypeError, ValueError):
+        # e.g. an integer spec applied to a float
+        return str(value)
+
+
+class _ColumnMapper:
+    """Turns records into value lists in table column order.
+
+    List records are mapped by position (column names are looked up in the
+    header once); keyed records (JSON objects) are mapped by key, so sparse
+    objects simply leave cells empty.
+    """
+
+    def __init__(
+        self,
+        columns: Optional[Sequence[Union[str, int]]],
+        header: Optional[List[str]],
+        keyed: bool = False,
+    ):
+        self.columns = list(columns) if columns else None
+        self.header = header
+        self.keyed = keyed
+        self._indexes: Optional[List[int]] = None
+        if keyed:
+            if self.columns is not None and any(not isinstance(col, str) for col in self.columns):
+                raise ValueError("JSON object records are mapped by key; columns must be names")
+        elif self.columns is not None:
+            self._indexes = [self._resolve(col) for col in self.columns]
+
+    def _resolve(self, col: Union[str, int]) -> int:
+        if isinstance(col, int):
+            return col
+        if self.header is None:
+            raise ValueError("Column names require a header row; use column indexes instead")
+        try:
+            return self.header.index(col)
+        except ValueError:
+            raise ValueError(f"Column '{col}' not found in header {self.header}")
+
+    def names(self) -> Optional[List[str]]:
+        """Header names in output order (None without a header)."""
+        if self.keyed:
+            return list(self.columns) if self.columns is not None else self.header
+        if self.header is None:
+            return None
+        if self._indexes is None:
+            return list(self.header)
+        return [self.header[i] if 0 <= i < len(self.header) else "" for i in self._indexes]
+
+    def map(self, record: Union[List[Any], Dict[str, Any]]) -> List[Any]:
+        if isinstance(record, dict):
+            keys = self.columns if self.columns is not None else self.header
+            return [record.get(key) for key in keys or ()]
+        if self._indexes is None:
+            return list(record)
+        return [record[i] if 0 <= i < len(record) else None for i in self._indexes]
+
+
+def import_table_file(
+    table: Table,
+    path: str,
+    file_format: Optional[str] = None,
+    has_header: bool = True,
+    write_header: bool = False,
+    columns: Optional[Sequence[Union[str, int]]] = None,
+    start_row: Optional[int] = None,
+    template_row: Optional[int] = None,
+    number_format: Optional[str] = None,
+    delimiter: Optional[str] = None,
+    encoding: str = "utf-8",
+    preserve_formatting: bool = True,
+    grid: Optional[TableGrid] = None,
+) -> Dict[str, Any]:
+    """Stream the records of a CSV/TSV/JSON-lines file into ``table``.
+
+    Args:
+        table: Target table.
+        path: Local file path.
+        file_format: "csv", "tsv" or "jsonl" (default: from the extension).
+        has_header: The first CSV/TSV record (or JSON-lines array) is a
+            header. JSON-lines objects always use the keys of the first
+            object as the header.
+        write_header: Also write the header as a table row.
+        columns: Source columns in table order, by header name or index.
+        start_row: First table row to write (default: append).
+        template_row: Row whose formatting appended rows copy (default: the
+            last row).
+        number_format: Format spec applied to numeric values.
+        delimiter: CSV delimiter override.
+        encoding: File encoding.
+        preserve_formatting: Keep the existing run font of each cell.
+        grid: Optional pre-built ``TableGrid`` of ``table``.
+
+    Returns:
+        dict: ``rows_written``, ``rows_added``, ``first_row``, ``format``
+        and ``header`` (None without one).
+
+    Raises:
+        FileNotFoundError: If ``path`` does not exist.
+        ValueError: On an unsupported format, bad column mapping, invalid
+            number format or malformed JSON-lines record.
+        IndexError: If ``start_row`` or ``template_row`` is out of range.
+    """
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"File not found: {path}")
+    fmt = detect_format(path, file_format)
+    if number_format:
+        try:
+            format(0, number_format)
+        except ValueError:
+            try:
+                format(0.0, number_format)
+            except ValueError:
+                raise ValueError(f"Invalid number format '{number_format}'")
+
+    records = iter_records(path, fmt, delimiter=delimiter, encoding=encoding)
+    header = None
+    first = next(records, None)
+    keyed = isinstance(first, dict)
+    if keyed:
+        # Objects carry their own header; later objects are read by the same keys
+        header = list(first)
+    elif has_header and first is not None:
+        header = [str(name).strip() for name in first]
+        first = None
+
+    mapper = _ColumnMapper(columns, header, keyed=keyed)
+
+    def rows():
+        if write_header and mapper.names() is not None:
+            yield mapper.names()
+        if first is not None:
+            yield [format_value(v, number_format) for v in mapper.map(first)]
+        for record in records:
+            yield [format_value(v, number_format) for v in mapper.map(record)]
+
+    result = stream_rows(
+        table,
+        rows(),
+        start_row=start_row,
+        template_row=template_row,
+        preserve_formatting=preserve_formatting,
+        grid=grid,
+    )
+    result["format"] = fmt
+    result["header"] = mapper.names()
+    logger.info(f"Imported {result['rows_written']} rows from {path} ({fmt})")
+    return result
@@ -0,0 +1,313 @@
+"""Row-level sort, filter and dedupe of tables.
+
+Agents used to sort a table by reading every cell and rewriting every cell
+in the new order, which is slow and drops per-cell formatting. These
+functions work on whole rows instead: keys are read once through the
+``TableGrid``, and rows are reordered by moving their ``w:tr`` elements (or
+removed by deleting them), so cell content and formatting travel with the
+row untouched.
+
+Rows joined by a vertical merge form one block that is kept, moved and
+removed as a unit, keyed by its first row. A merge crossing the boundary
+between header/footer rows and data rows is rejected.
+"""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from lxml import etree
+from docx.table import Table
+
+from docx_mcp_server.core import text_extractor
+from docx_mcp_server.core.table_columns import parse_number, resolve_column
+from docx_mcp_server.core.table_grid import TableGrid
+
+logger = logging.getLogger(__name__)
+
+FILTER_OPS = (
+    "eq", "ne", "contains", "not_contains", "starts_with", "ends_with",
+    "gt", "ge", "lt", "le", "empty", "not_empty", "regex",
+)
+
+_NUMERIC_OPS = {
+    "gt": lambda a, b: a > b,
+    "ge": lambda a, b: a >= b,
+    "lt": lambda a, b: a < b,
+    "le": lambda a, b: a <= b,
+}
+_WHITESPACE = re.compile(r"\s+")
+
+
+class _Rows:
+    """Data rows of a table split into vertically merged blocks."""
+
+    def __init__(self, table: Table, grid: TableGrid, header_rows: int, footer_rows: int):
+        if header_rows < 0 or footer_rows < 0:
+            raise ValueError("header_rows and footer_rows must be >= 0")
+        if header_rows + footer_rows > grid.row_count:
+            raise ValueError(
+                f"header_rows + footer_rows ({header_rows + footer_rows}) exceed the "
+                f"{grid.row_count} rows of the table"
+            )
+        self.table = table
+        self.grid = grid
+        self.first = header_rows
+        self.end = grid.row_count - footer_rows
+        self.names = (
+            [text_extractor.cell_text(tc).strip() for tc in grid.anchors[header_rows - 1]]
+            if header_rows else []
+        )
+        self._texts: Dict[int, str] = {}
+
+        self.blocks: List[List[int]] = []
+        for row in range(self.first, self.end):
+            if self._continues(row):
+                if row == self.first:
+                    raise ValueError(f"Row {row} is vertically merged with the header rows")
+                self.blocks[-1].append(row)
+            else:
+                self.blocks.append([row])
+        if self.end < grid.row_count and self.end > self.first and self._continues(self.end):
+            raise ValueError(f"Row {self.end} is vertically merged with the data rows above")
+
+    def _continues(self, row: int) -> bool:
+        """True if a vertical merge from the row above reaches into ``row``."""
+        return any(self.grid.origin(row, col)[0] < row for col in range(len(self.grid.anchors[row])))
+
+    def column_index(self, key: Union[str, int]) -> int:
+        return resolve_column(self.names, self.grid.col_count, key)
+
+    def text(self, block: List[int], col: int) -> str:
+        """Key text of a block: the cell at ``col`` of its first row."""
+        anchors = self.grid.anchors[block[0]]
+        if col >= len(anchors):
+            return ""
+        tc = anchors[col]
+        if id(tc) not in self._texts:
+            self._texts[id(tc)] = text_extractor.cell_text(tc)
+        return self._texts[id(tc)]
+
+    def reorder(self, blocks: List[List[int]]) -> Dict[int, Optional[int]]:
+        """Put the data rows in the order of ``blocks``, dropping rows not listed.
+
+        Rows are moved, never copied; rows after the data (footer rows) move
+        up when data rows are dropped.
+
+        Returns:
+            dict: Old row index -> new row index, None for dropped rows.
+        """
+        rows = self.grid.rows
+        kept = [row for block in blocks for row in block]
+        if not kept and self.first == 0 and self.end == len(rows):
+            raise ValueError("Operation would remove every row of the table")
+
+        mapping: Dict[int, Optional[int]] = {row: None for row in range(self.first, self.end)}
+        # A marker keeps each data row slot in place while rows move around
+        slots = []
+        for row in range(self.first, self.end):
+            marker = etree.Comment("")
+            rows[row].addprevious(marker)
+            slots.append(marker)
+        for new_row, (marker, row) in enumerate(zip(slots, kept), self.first):
+            marker.addnext(rows[row])
+            mapping[row] = new_row
+        removed = set(range(self.first, self.end)) - set(kept)
+        tbl = self.table._tbl
+        for row in removed:
+            tbl.remove(rows[row])
+        for marker in slots:
+            tbl.remove(marker)
+        for offset, row in enumerate(range(self.end, len(rows))):
+            mapping[row] = self.first + len(kept) + offset
+        return {row: new for row, new in mapping.items() if new != row}
+
+
+def _normalize(text: str, case_sensitive: bool) -> str:
+    text = _WHITESPACE.sub(" ", text).strip()
+    return text if case_sensitive else text.casefold()
+
+
+def sort_rows(
+    table: Table,
+    keys: Sequence[Dict[str, Any]],
+    header_rows: int = 1,
+    footer_rows: int = 0,
+    grid: Optional[TableGrid] = None,
+) -> Dict[str, Any]:
+    """Sort the data rows of ``table`` in place by one or more columns.
+
+    Each key is ``{"column": name or index, "descending": bool,
+    "numeric": true/false/"auto", "case_sensitive": bool}``. With
+    ``numeric="auto"`` (the default) a column sorts numerically when all its
+    non-empty cells parse as numbers. Empty cells (and, for numeric keys,
+    non-numeric cells) sort last in either direction; the sort is stable.
+
+    Returns:
+        dict: ``rows`` (data rows sorted), ``moved`` (rows whose index
+        changed) and ``mapping`` (old row -> new row).
+
+    Raises:
+        ValueError: On an unknown column or a merge crossing the data rows.
+    """
+    if not keys:
+        raise ValueError("At least one sort key is required")
+    rows = _Rows(table, grid or TableGrid(table._tbl), header_rows, footer_rows)
+    order = list(rows.blocks)
+
+    # Stable sorts from the last key to the first give a lexicographic order
+    for spec in reversed(list(keys)):
+        if not isinstance(spec, dict):
+            spec = {"column": spec}
+        col = rows.column_index(spec.get("column"))
+        case_sensitive = bool(spec.get("case_sensitive", False))
+        texts = {id(block): rows.text(block, col).strip() for block in order}
+        numeric = spec.get("numeric", "auto")
+        numbers = {key: parse_number(text) for key, text in texts.items() if text}
+        if numeric == "auto":
+            numeric = all(value == value for value in numbers.values())
+        if numeric:
+            values = {key: value for key, value in numbers.items() if value == value}
+        else:
+            values = {key: _normalize(text, case_sensitive) for key, text in texts.items() if text}
+
+        filled = [block for block in order if id(block) in values]
+        empty = [block for block in order if id(block) not in values]
+        filled.sort(key=lambda block: values[id(block)], reverse=bool(spec.get("descending", False)))
+        order = filled + empty
+
+    mapping = rows.reorder(order)
+    logger.debug(f"sort_rows: {len(order)} blocks, {len(mapping)} rows moved")
+    return {"rows": rows.end - rows.first, "moved": len(mapping), "mapping": mapping}
+
+
+def _matches(text: str, condition: Dict[str, Any]) -> bool:
+    op = condition.get("op", "eq")
+    value = condition.get("value")
+    case_sensitive = bool(condition.get("case_sensitive", False))
+    if op == "empty":
+        return not text.strip()
+    if op == "not_empty":
+        return bool(text.strip())
+    if value is None:
+        raise ValueError(f"Filter op '{op}' requires a value")
+    if op in _NUMERIC_OPS:
+        cell = parse_number(text)
+        target = value if isinstance(value, (int, float)) else parse_number(str(value))
+        return cell == cell and target == target and _NUMERIC_OPS[op](cell, target)
+    if op == "regex":
+        flags = 0 if case_sensitive else re.IGNORECASE
+        try:
+            return re.search(str(value), text, flags) is not None
+        except re.error as e:
+            raise ValueError(f"Invalid regex '{value}': {e}")
+
+    cell = _normalize(text, case_sensitive)
+    target = _normalize(str(value), case_sensitive)
+    if op == "eq":
+        return cell == target
+    if op == "ne":
+        return cell != target
+    if op == "contains":
+        return target in cell
+    if op == "not_contains":
+        return target not in cell
+    if op == "starts_with":
+        return cell.startswith(target)
+    if op == "ends_with":
+        return cell.endswith(target)
+    raise ValueError(f"Unknown filter op '{op}'. Supported: {', '.join(FILTER_OPS)}")
+
+
+def filter_rows(
+    table: Table,
+    conditions: Sequence[Dict[str, Any]],
+    match: str = "all",
+    keep_matching: bool = True,
+    header_rows: int = 1,
+    footer_rows: int = 0,
+    grid: Optional[TableGrid] = None,
+) -> Dict[str, Any]:
+    """Remove data rows that do not match (or, with ``keep_matching=False``, that match).
+
+    Each condition is ``{"column", "op", "value", "case_sensitive"}``; see
+    ``FILTER_OPS``. Text comparisons collapse whitespace and ignore case by
+    default; ``gt``/``ge``/``lt``/``le`` compare parsed numbers and never
+    match non-numeric cells.
+
+    Returns:
+        dict: ``rows_before``, ``rows_after`` (data rows), ``removed``,
+        ``moved`` (kept data rows whose position changed) and ``mapping``.
+
+    Raises:
+        ValueError: On an unknown column/op, an invalid regex or when every
+            row of the table would be removed.
+    """
+    if match not in ("all", "any"):
+        raise ValueError("match must be 'all' or 'any'")
+    if not conditions:
+        raise ValueError("At least one condition is required")
+    rows = _Rows(table, grid or TableGrid(table._tbl), header_rows, footer_rows)
+    resolved: List[Tuple[int, Dict[str, Any]]] = []
+    for condition in conditions:
+        if not isinstance(condition, dict):
+            raise ValueError("Each condition must be an object")
+        if condition.get("op", "eq") not in FILTER_OPS:
+            raise ValueError(f"Unknown filter op '{condition.get('op')}'. Supported: {', '.join(FILTER_OPS)}")
+        resolved.append((rows.column_index(condition.get("column")), condition))
+
+    combine = all if match == "all" else any
+    kept = [
+        block for block in rows.blocks
+        if combine(_matches(rows.text(block, col), cond) for col, cond in resolved) == keep_matching
+    ]
+    return _drop(rows, kept)
+
+
+def dedupe_rows(
+    table: Table,
+    columns: Optional[Sequence[Union[str, int]]] = None,
+    keep: str = "first",
+    case_sensitive: bool = False,
+    header_rows: int = 1,
+    footer_rows: int = 0,
+    grid: Optional[TableGrid] = None,
+) -> Dict[str, Any]:
+    """Remove data rows whose key columns repeat an earlier (or later) row.
+
+    Args:
+        columns: Key columns by name or index (default: every column).
+        keep: "first" or "last" occurrence to keep.
+        case_sensitive: Compare keys case-sensitively (whitespace is always
+            collapsed).
+
+    Returns:
+        dict: ``rows_before``, ``rows_after`` (data rows), ``removed``,
+        ``moved`` (kept data rows whose position changed) and ``mapping``.
+    """
+    if keep not in ("first", "last"):
+        raise ValueError("keep must be 'first' or 'last'")
+    rows = _Rows(table, grid or TableGrid(table._tbl), header_rows, footer_rows)
+    cols = [rows.column_index(col) for col in columns] if columns else list(range(rows.grid.col_count))
+
+    seen = set()
+    kept = []
+    blocks = rows.blocks if keep == "first" else list(reversed(rows.blocks))
+    for block in blocks:
+        key = tuple(_normalize(rows.text(block, col), case_sensitive) for col in cols)
+        if key not in seen:
+            seen.add(key)
+            kept.append(block)
+    if keep == "last":
+        kept.reverse()
+    return _drop(rows, kept)
+
+
+def _drop(rows: _Rows, kept: List[List[int]]) -> Dict[str, Any]:
+    before = rows.end - rows.first
+    after = sum(len(block) for block in kept)
+    mapping = rows.reorder(kept) if after != before else {}
+    # Footer rows that only shifted up are in the mapping but not counted
+    moved = sum(1 for row, new in mapping.items() if new is not None and row < rows.end)
+    logger.debug(f"table rows: kept {after} of {before} data rows, {moved} moved")
+    return {"rows_before": before, "rows_after": after, "removed": before - after, "moved": moved, "mapping": mapping}
@@ -0,0 +1,173 @@
+"""Server-side library of named format templates.
+
+``docx_extract_format_template`` hands the client a JSON blob that has to be
+sent back and parsed again on every ``docx_apply_format_template`` call. The
+library keeps templates by name instead, each stored together with its
+``CompiledFormat`` so applying ``house-caption`` clones ready-made XML
+fragments without any deserialization.
+
+The library lives in memory; when a file path is configured (argument or the
+``DOCX_MCP_TEMPLATE_LIBRARY`` environment variable) it is loaded from and
+written back to a JSON file, so templates survive server restarts:
+
+    {"version": 1, "templates": {"house-caption": {<FormatTemplate fields>}}}
+
+Writes go to a temporary file that replaces the library file atomically.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+
+from docx_mcp_server.core.compiled_format import CompiledFormat
+from docx_mcp_server.utils.format_template import FormatTemplate
+
+logger = logging.getLogger(__name__)
+
+LIBRARY_ENV = "DOCX_MCP_TEMPLATE_LIBRARY"
+LIBRARY_VERSION = 1
+
+
+class TemplateLibrary:
+    """Named format templates with their compiled XML fragments.
+
+    Thread-safe; the backing file (if any) is read on first use.
+
+    Args:
+        path: JSON file to persist to, or None for an in-memory library.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self._lock = threading.RLock()
+        self._path = path
+        self._entries: Dict[str, Tuple[FormatTemplate, Optional[CompiledFormat]]] = {}
+        self._loaded = False
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
+    def configure(self, path: Optional[str]) -> None:
+        """Switch to another backing file (None: memory only) and drop loaded templates."""
+        with self._lock:
+            self._path = path
+            self._entries = {}
+            self._loaded = False
+
+    def save(self, name: str, template: FormatTemplate, overwrite: bool = True) -> bool:
+        """Store a template under ``name``; compiles it once.
+
+        Returns:
+            bool: True if an existing template was replaced
+
+        Raises:
+            ValueError: On an empty name, an existing name without overwrite,
+                or template XML that does not compile.
+        """
+        if not name or not name.strip():
+            raise ValueError("Template name must not be empty")
+        name = name.strip()
+        compiled = self._compile(template)
+        with self._lock:
+            self._ensure_loaded()
+            replaced = name in self._entries
+            if replaced and not overwrite:
+                raise ValueError(f"Template '{name}' already exists")
+            self._entries[name] = (template, compiled)
+            self._flush()
+        logger.debug(f"Template '{name}' saved ({template.element_type}, replaced={replaced})")
+        return replaced
+
+    def get(self, name: str) -> Tuple[FormatTemplate, Optional[CompiledFormat]]:
+        """Template and compiled format (None for descriptor-only templates).
+
+        Raises:
+            KeyError: If no template has that name.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            try:
+                return self._entries[name.strip()]
+            except KeyError:
+                raise KeyError(f"Format template '{name}' not found")
+
+    def delete(self, name: str) -> None:
+        """Remove a template.
+
+        Raises:
+            KeyError: If no template has that name.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            if self._entries.pop(name.strip(), None) is None:
+                raise KeyError(f"Format template '{name}' not found")
+            self._flush()
+
+    def list(self) -> List[Dict[str, str]]:
+        """Name, element type and fragment names of every template, sorted by name."""
+        with self._lock:
+            self._ensure_loaded()
+            return [
+                {
+                    "name": name,
+                    "element_type": template.element_type,
+                    "fragments": ", ".join(sorted(template.xml)) if template.xml else "none",
+                }
+                for name, (template, _) in sorted(self._entries.items())
+            ]
+
+    # --- persistence ---
+
+    @staticmethod
+    def _compile(template: FormatTemplate) -> Optional[CompiledFormat]:
+        if not template.xml:
+            return None
+        return CompiledFormat.from_xml(template.element_type, template.xml)
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self._path or not os.path.exists(self._path):
+            return
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            templates = data["templates"]
+            entries = {}
+            for name, fields in templates.items():
+                template = FormatTemplate(**fields)
+                entries[name] = (template, self._compile(template))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Keep the unreadable file untouched; the library stays empty and read-only
+            self._loaded = False
+            raise ValueError(f"Cannot read template library {self._path}: {e}")
+        self._entries = entries
+        logger.info(f"Loaded {len(entries)} format templates from {self._path}")
+
+    def _flush(self) -> None:
+        if not self._path:
+            return
+        data = {
+            "version": LIBRARY_VERSION,
+            "templates": {name: asdict(template) for name, (template, _) in self._entries.items()},
+        }
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".templates-", suffix=".json", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+# Process-wide library used by the format tools
+template_library = TemplateLibrary(os.environ.get(LIBRARY_ENV) or None)
@@ -7,6 +7,8 @@ from docx.document import Document as DocumentType
 from docx.table import Table
 from docx.text.paragraph import Paragraph
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx_mcp_server.core import text_extractor
+from docx_mcp_server.core.style_cache import StyleCache
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,8 @@ class TemplateParser:
             "document_structure": []
         }
 
+        styles = StyleCache.of(document)
+
         # Traverse document elements in order
         for element in document.element.body:
             tag = element.tag.split('}')[-1] if '}' in element.tag else element.tag
@@ -46,9 +50,10 @@ class TemplateParser:
             if tag == 'p':  # Paragraph
                 para = Paragraph(element, document)
                 # Check if it's a heading
-                if para.style and para.style.name and 'Heading' in para.style.name:
+                style = styles.paragraph_style(element)
+                if style is not None and style.is_heading:
                     result["document_structure"].append(self.extract_heading_structure(para, session=session))
-                elif para.text.strip():  # Only add non-empty paragraphs
+                elif text_extractor.paragraph_text(element).strip():  # Only add non-empty paragraphs
                     result["document_structure"].append(self.extract_paragraph_structure(para, session=session))
 
             elif tag == 'tbl':  # Table
@@ -133,16 +138,12 @@ class TemplateParser:
         Returns:
             dict: Heading structure with type, level, text, style, and optionally element_id.
         """
-        # Extract level from style name (e.g., "Heading 1" -> 1)
-        style_name = paragraph.style.name
-        level = 1
-        if "Heading" in style_name:
-            parts = style_name.split()
-            if len(parts) > 1 and parts[1].isdigit():
-                level = int(parts[1])
+        # Heading level of the style (e.g., "Heading 1" -> 1, custom headings by outline level)
+        style = StyleCache.of(paragraph).paragraph_style(paragraph._p)
+        level = style.outline_level if style is not None and style.outline_level else 1
 
         # Extract text and style from first run
-        text = paragraph.text
+        text = text_extractor.paragraph_text(paragraph._element)
         style = {}
 
         if paragraph.runs:
@@ -187,7 +188,7 @@ class TemplateParser:
         Returns:
             dict: Paragraph structure with type, text, style, and optionally element_id.
         """
-        text = paragraph.text
+        text = text_extractor.paragraph_text(paragraph._element)
 
         # Extract style from first run
         style = {
@@ -0,0 +1,143 @@
+"""Read-only text extraction directly over the document XML.
+
+python-docx builds a ``Paragraph``/``Table``/``_Cell`` wrapper for every
+element and each ``.text`` access runs an XPath query per paragraph plus one
+per run; ``row.cells`` recomputes the layout grid on every access. For
+read-only tools that only need strings this module walks ``w:p``/``w:tbl``
+elements with precompiled XPath and ``iterchildren`` instead, producing the
+same text and table grids as the python-docx accessors:
+
+- ``paragraph_text(p)`` == ``Paragraph(p, parent).text``
+- ``run_text(r)`` == ``Run(r, parent).text``
+- ``cell_text(tc)`` == ``_Cell(tc, table).text``
+- ``table_rows(tbl)`` == ``[[c.text for c in row.cells] for row in table.rows]``
+  (``iter_table_rows`` yields the same rows lazily)
+"""
+
+from typing import Dict, Iterator, List, Tuple
+
+from lxml import etree
+from docx.oxml.ns import nsmap, qn
+
+_NS = {"w": nsmap["w"]}
+
+_P = qn("w:p")
+_TBL = qn("w:tbl")
+_TR = qn("w:tr")
+_TC = qn("w:tc")
+
+# Run inner-content of a paragraph, including runs nested in hyperlinks,
+# in document order (same scope as CT_P.text).
+_RUN_CONTENT = etree.XPath("w:r/* | w:hyperlink/w:r/*", namespaces=_NS)
+_GRID_SPAN = etree.XPath("w:tcPr/w:gridSpan/@w:val", namespaces=_NS)
+_V_MERGE = etree.XPath("w:tcPr/w:vMerge", namespaces=_NS)
+_GRID_BEFORE = etree.XPath("w:trPr/w:gridBefore/@w:val", namespaces=_NS)
+_GRID_COLS = etree.XPath("count(w:tblGrid/w:gridCol)", namespaces=_NS)
+
+_T = qn("w:t")
+_BR = qn("w:br")
+_TYPE = qn("w:type")
+_VAL = qn("w:val")
+_CHAR_EQUIVALENTS = {
+    qn("w:tab"): "\t",
+    qn("w:ptab"): "\t",
+    qn("w:cr"): "\n",
+    qn("w:noBreakHyphen"): "-",
+}
+
+
+def _content_text(nodes) -> str:
+    parts = []
+    for node in nodes:
+        tag = node.tag
+        if tag == _T:
+            if node.text:
+                parts.append(node.text)
+        elif tag == _BR:
+            # Only text-wrapping breaks are rendered as newlines
+            if node.get(_TYPE) in (None, "textWrapping"):
+                parts.append("\n")
+        else:
+            char = _CHAR_EQUIVALENTS.get(tag)
+            if char:
+                parts.append(char)
+    return "".join(parts)
+
+
+def paragraph_text(p) -> str:
+    """Return the text of a ``w:p`` element without wrapping it."""
+    return _content_text(_RUN_CONTENT(p))
+
+
+def run_text(r) -> str:
+    """Return the text of a ``w:r`` element (same as ``Run.text``)."""
+    return _content_text(r.iterchildren())
+
+
+def cell_text(tc) -> str:
+    """Return the text of a ``w:tc`` element (its direct paragraphs, newline-joined)."""
+    return "\n".join(paragraph_text(p) for p in tc.iterchildren(_P))
+
+
+def grid_span(tc) -> int:
+    """Number of layout-grid columns spanned by a ``w:tc``."""
+    span = _GRID_SPAN(tc)
+    return int(span[0]) if span else 1
+
+
+def is_vmerge_continue(tc) -> bool:
+    """True if the cell continues a vertical merge from the row above."""
+    v_merge = _V_MERGE(tc)
+    return bool(v_merge) and v_merge[0].get(_VAL, "continue") == "continue"
+
+
+def grid_before(tr) -> int:
+    """Number of empty layout-grid columns before the first cell of a ``w:tr``."""
+    before = _GRID_BEFORE(tr)
+    return int(before[0]) if before else 0
+
+
+def iter_table_rows(tbl, repeat_merged: bool = True) -> Iterator[List[str]]:
+    """Yield the cell texts of a ``w:tbl`` row by row in one pass.
+
+    With ``repeat_merged`` (the default) horizontally merged cells are
+    repeated once per spanned grid column and vertically merged continuation
+    cells repeat the text of their anchor, mirroring ``_Row.cells``. Without
+    it only the top-left position of a merged region carries the text and
+    the other positions are empty strings.
+    """
+    above: Dict[int, str] = {}
+    for tr in tbl.iterchildren(_TR):
+        offset = grid_before(tr)
+        current: Dict[int, str] = {}
+        row: List[str] = []
+        for tc in tr.iterchildren(_TC):
+            span = grid_span(tc)
+            if is_vmerge_continue(tc):
+                text = above.get(offset, "")
+                first = text if repeat_merged else ""
+            else:
+                text = first = cell_text(tc)
+            row.append(first)
+            row.extend([text if repeat_merged else ""] * (span - 1))
+            for i in range(span):
+                current[offset + i] = text
+            offset += span
+        yield row
+        above = current
+
+
+def table_rows(tbl) -> List[List[str]]:
+    """Return the cell texts of a ``w:tbl`` row by row (see ``iter_table_rows``)."""
+    return list(iter_table_rows(tbl))
+
+
+def table_dimensions(tbl) -> Tuple[int, int]:
+    """Return ``(rows, cols)`` as ``len(table.rows)``/``len(table.columns)``."""
+    return sum(1 for _ in tbl.iterchildren(_TR)), int(_GRID_COLS(tbl))
+
+
+def iter_blocks(body) -> Iterator[Tuple[str, object]]:
+    """Yield ``("paragraph", w:p)`` / ``("table", w:tbl)`` for body-level blocks."""
+    for child in body.iterchildren(_P, _TBL):
+        yield ("paragraph" if child.tag == _P else "table"), child
@@ -10,6 +10,7 @@ from difflib import SequenceMatcher
 from docx.text.paragraph import Paragraph
 from docx.table import Table
 from docx.text.run import Run
+from docx_mcp_server.core import text_extractor
 
 logger = logging.getLogger(__name__)
 
@@ -66,8 +67,9 @@ class DocumentVisualizer:
         Returns:
             ASCII table representation
         """
-        rows = len(table.rows)
-        cols = len(table.columns) if table.rows else 0
+        rows, cols = text_extractor.table_dimensions(table._tbl)
+        if not rows:
+            cols = 0
 
         # Build title
         title = f"Table ({element_id})"
@@ -78,20 +80,16 @@ class DocumentVisualizer:
         max_display_rows = min(rows, 20)
         max_display_cols = min(cols, 10)
 
-        # Extract cell contents
+        # Extract cell contents (one pass over the table XML)
+        grid = text_extractor.table_rows(table._tbl)
         cell_data = []
         for i in range(max_display_rows):
             row_data = []
             for j in range(max_display_cols):
-                try:
-                    cell = table.rows[i].cells[j]
-                    # Get first paragraph text
-                    text = cell.text.strip() if cell.text else "(empty)"
-                    # Truncate cell content
-                    text = self._truncate_text(text, 20)
-                    row_data.append(text)
-                except (IndexError, AttributeError):
-                    row_data.append("(empty)")
+                text = grid[i][j] if j < len(grid[i]) else ""
+                text = text.strip() if text else "(empty)"
+                # Truncate cell content
+                row_data.append(self._truncate_text(text, 20))
             cell_data.append(row_data)
 
         # Calculate column widths
@@ -152,38 +150,26 @@ class DocumentVisualizer:
         if context_range is None:
             context_range = self.context_range
 
-        # Get all top-level elements (paragraphs and tables)
-        elements = []
-        for element in self.session.document.element.body:
-            # Check if it's a paragraph or table
-            if element.tag.endswith('p'):
-                # Find corresponding Paragraph object
-                for para in self.session.document.paragraphs:
-                    if para._element == element:
-                        para_id = self.session._get_element_id(para, auto_register=True)
-                        elements.append(('paragraph', para, para_id))
-                        break
-            elif element.tag.endswith('tbl'):
-                # Find corresponding Table object
-                for table in self.session.document.tables:
-                    if table._element == element:
-                        table_id = self.session._get_element_id(table, auto_register=True)
-                        elements.append(('table', table, table_id))
-                        break
-
-        # Find current element index
+        # Locate the current element among top-level blocks. Only the blocks
+        # inside the context window are wrapped and registered below.
+        document = self.session.document
+        blocks = list(text_extractor.iter_blocks(document.element.body))
+        target = self.session.object_registry.get(element_id)
+        target_xml = getattr(target, "_element", None)
+
         current_index = -1
-        for i, (elem_type, elem_obj, elem_id) in enumerate(elements):
-            if elem_id == element_id:
-                current_index = i
-                break
+        if target_xml is not None:
+            for i, (_, element) in enumerate(blocks):
+                if element is target_xml:
+                    current_index = i
+                    break
 
         if current_index == -1:
             return f"Element {element_id} not found in document"
 
         # Calculate context range
         start_index = max(0, current_index - context_range)
-        end_index = min(len(elements), current_index + context_range + 1)
+        end_index = min(len(blocks), current_index + context_range + 1)
 
         # Build context visualization
         lines = []
@@ -197,7 +183,13 @@ class DocumentVisualizer:
 
         # Render elements in range
         for i in range(start_index, end_index):
-            elem_type, elem_obj, elem_id = elements[i]
+            elem_type, element = blocks[i]
+            if i == current_index:
+                elem_obj, elem_id = target, element_id
+            else:
+                wrapper = Paragraph if elem_type == 'paragraph' else Table
+                elem_obj = wrapper(element, document)
+                elem_id = self.session._get_element_id(elem_obj, auto_register=True)
 
             # Add cursor marker before current element
             if i == current_index:
@@ -217,8 +209,8 @@ class DocumentVisualizer:
             lines.append("")
 
         # Add ellipsis if not at end
-        if end_index < len(elements):
-            lines.append(f"  ... ({len(elements) - end_index} more elements below) ...")
+        if end_index < len(blocks):
+            lines.append(f"  ... ({len(blocks) - end_index} more elements below) ...")
 
         return "\n".join(lines)
 
@@ -1,4 +1,4 @@
-from typing import Optional, List, Any, Iterator, Union, TYPE_CHECKING
+from typing import Optional, List, Any, Dict, Iterator, Union, TYPE_CHECKING
 from docx.text.paragraph import Paragraph
 from docx.table import Table, _Cell
 from docx.oxml.xmlchemy import BaseOxmlElement
@@ -324,3 +324,173 @@ class ElementManipulator:
 
         # Return the new column count
         return len(table.rows[0].cells) if len(table.rows) > 0 else 0
+
+    @staticmethod
+    def _row_layout(tr) -> List[Any]:
+        """``[(tc, first_col, span), ...]`` for the cells of a ``w:tr``, as in ``row.cells``."""
+        from docx.oxml.ns import qn
+        from docx_mcp_server.core import text_extractor
+
+        layout = []
+        col = 0
+        for tc in tr.iterchildren(qn("w:tc")):
+            span = text_extractor.grid_span(tc)
+            layout.append((tc, col, span))
+            col += span
+        return layout
+
+    @staticmethod
+    def insert_cols(
+        table: Table,
+        indexes: List[int],
+        copy_format_from: Optional[Union[int, List[Optional[int]]]] = None,
+    ) -> int:
+        """
+        Insert several columns in one pass over the rows.
+
+        Each index is a position in the current table: a new column is
+        inserted before column ``index`` (``index == column count`` appends).
+        Repeated indexes insert several columns at the same place. Inserting
+        inside a horizontally merged cell widens the merge. ``tblGrid`` is
+        updated once.
+
+        Args:
+            table: python-docx Table object
+            indexes: Insertion positions (0-based, in the current table)
+            copy_format_from: Column whose cells (properties, paragraph and
+                run format) the new cells copy: one column for all insertion
+                points, or a list with one column (or None) per entry of
+                ``indexes``. Without a column the new cells get the cell
+                properties of the first cell of each row.
+
+        Returns:
+            The new column count after insertion
+
+        Raises:
+            IndexError: If an index is out of valid range
+            ValueError: If ``copy_format_from`` is a list of another length
+        """
+        import copy as copy_module
+        from docx.oxml.table import CT_TblGridCol
+        from docx.shared import Inches
+        from docx_mcp_server.core.table_fill import blank_cell
+
+        rows = list(table._tbl.tr_lst)
+        num_cols = sum(span for _, _, span in ElementManipulator._row_layout(rows[0])) if rows else 0
+        for index in indexes:
+            if index < 0 or index > num_cols:
+                raise IndexError(f"Column index {index} out of range (table has {num_cols} columns, valid range: 0-{num_cols})")
+        if copy_format_from is None or isinstance(copy_format_from, int):
+            sources = [copy_format_from] * len(indexes)
+        else:
+            sources = list(copy_format_from)
+            if len(sources) != len(indexes):
+                raise ValueError("copy_format_from needs one entry per insertion point")
+        order = sorted(range(len(indexes)), key=lambda i: indexes[i])
+        points = [indexes[i] for i in order]
+        point_sources = [sources[i] for i in order]
+        if not points:
+            return num_cols
+
+        for tr in rows:
+            layout = ElementManipulator._row_layout(tr)
+            if not layout:
+                continue
+            # One blank cell per format source column in this row
+            blanks: Dict[Optional[int], Any] = {}
+
+            def blank_for(source):
+                if source not in blanks:
+                    template = layout[0][0]
+                    if source is not None:
+                        for tc, first_col, span in layout:
+                            if first_col <= source < first_col + span:
+                                template = tc
+                                break
+                    blank = blank_cell(copy_module.deepcopy(template), keep_format=source is not None)
+                    blank.grid_span = 1
+                    blanks[source] = blank
+                return copy_module.deepcopy(blanks[source])
+
+            k = 0
+            for tc, first_col, span in layout:
+                widen = 0
+                while k < len(points) and points[k] < first_col + span:
+                    if points[k] <= first_col:
+                        tc.addprevious(blank_for(point_sources[k]))
+                    else:
+                        widen += 1
+                    k += 1
+                if widen:
+                    tc.grid_span = span + widen
+            last = layout[-1][0]
+            while k < len(points):
+                new_tc = blank_for(point_sources[k])
+                last.addnext(new_tc)
+                last = new_tc
+                k += 1
+
+        tbl_grid = table._tbl.tblGrid
+        if tbl_grid is not None:
+            grid_cols = list(tbl_grid.gridCol_lst)
+            for index in reversed(points):
+                if grid_cols:
+                    source = grid_cols[min(index, len(grid_cols) - 1)]
+                    new_grid_col = copy_module.deepcopy(source)
+                    if index < len(grid_cols):
+                        source.addprevious(new_grid_col)
+                    else:
+                        grid_cols[-1].addnext(new_grid_col)
+                else:
+                    new_grid_col = CT_TblGridCol()
+                    new_grid_col.w = Inches(1.0)
+                    tbl_grid.append(new_grid_col)
+
+        return num_cols + len(points)
+
+    @staticmethod
+    def delete_cols(table: Table, indexes: List[int]) -> int:
+        """
+        Delete several columns in one pass over the rows.
+
+        Cells entirely inside deleted columns are removed; horizontally
+        merged cells that keep at least one column are narrowed. ``tblGrid``
+        is updated once.
+
+        Args:
+            table: python-docx Table object
+            indexes: Column indexes to delete (0-based, in the current table)
+
+        Returns:
+            The new column count after deletion
+
+        Raises:
+            IndexError: If an index is out of valid range
+            ValueError: If every column would be deleted
+        """
+        rows = list(table._tbl.tr_lst)
+        num_cols = sum(span for _, _, span in ElementManipulator._row_layout(rows[0])) if rows else 0
+        for index in indexes:
+            if index < 0 or index >= num_cols:
+                raise IndexError(f"Column index {index} out of range (table has {num_cols} columns)")
+        deleted = set(indexes)
+        if len(deleted) >= num_cols:
+            raise ValueError("Cannot delete the last column")
+
+        for tr in rows:
+            for tc, first_col, span in ElementManipulator._row_layout(tr):
+                removed = sum(1 for col in range(first_col, first_col + span) if col in deleted)
+                if removed == span:
+                    tr.remove(tc)
+                elif removed:
+                    tc.grid_span = span - removed
+
+        tbl_grid = table._tbl.tblGrid
+        if tbl_grid is not None:
+            grid_cols = list(tbl_grid.gridCol_lst)
+            for index in sorted(deleted, reverse=True):
+                if index < len(grid_cols):
+                    tbl_grid.remove(grid_cols[index])
+
+        return num_cols - len(deleted)
+
@@ -22,33 +22,40 @@ from docx_mcp_server.tools.session_tools import (
     docx_get_current_session, docx_switch_session, docx_save, docx_get_context
 )
 from docx_mcp_server.tools.content_tools import (
-    docx_read_content, docx_find_paragraphs, docx_extract_template_structure
+    docx_read_content, docx_find_paragraphs, docx_find_paragraphs_fuzzy,
+    docx_index_directory, docx_search_directory, docx_extract_template_structure,
+    docx_get_outline
 )
 from docx_mcp_server.tools.paragraph_tools import (
     docx_insert_paragraph, docx_insert_heading, docx_update_paragraph_text,
     docx_copy_paragraph, docx_delete, docx_insert_page_break
 )
 from docx_mcp_server.tools.run_tools import (
-    docx_insert_run, docx_update_run_text, docx_set_font
+    docx_insert_run, docx_update_run_text, docx_set_font, docx_set_font_batch
 )
 from docx_mcp_server.tools.table_tools import (
     docx_insert_table, docx_get_table, docx_find_table, docx_get_cell,
     docx_insert_paragraph_to_cell, docx_insert_table_row, docx_insert_table_col,
-    docx_fill_table, docx_copy_table
+    docx_fill_table, docx_fill_table_from_file, docx_export_table, docx_copy_table,
+    docx_get_table_columns, docx_transform_table_columns, docx_render_table_rows
 )
 from docx_mcp_server.tools.cursor_tools import (
     docx_cursor_move, docx_cursor_get
 )
 from docx_mcp_server.tools.advanced_tools import (
-    docx_replace_text, docx_insert_image, docx_batch_replace_text
+    docx_replace_text, docx_insert_image, docx_batch_replace_text,
+    docx_list_placeholders, docx_fill_placeholders, docx_normalize
 )
 from docx_mcp_server.tools.format_tools import (
     docx_set_alignment, docx_set_properties, docx_set_margins,
-    docx_format_copy, docx_extract_format_template, docx_apply_format_template
+    docx_format_copy, docx_extract_format_template, docx_apply_format_template,
+    docx_apply_format_batch, docx_save_format_template, docx_list_format_templates,
+    docx_delete_format_template, docx_restyle
 )
 from docx_mcp_server.tools.system_tools import docx_server_status
 from docx_mcp_server.tools.copy_tools import (
-    docx_get_element_source, docx_copy_elements_range
+    docx_get_element_source, docx_copy_elements_range, docx_copy_from_session,
+    docx_insert_document
 )
 
 # Configure logging (default level can be overridden by env/CLI)
@@ -112,6 +119,7 @@ register_all_tools(mcp)
 # Custom HTTP Routes for Launcher GUI
 # ============================================================================
 
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import JSONResponse
 from starlette.requests import Request
 
@@ -214,6 +222,108 @@ def register_custom_routes(mcp_instance: FastMCP):
                 status_code=500
             )
 
+    @mcp_instance.custom_route("/api/search", methods=["POST"])
+    async def search_directory_route(request: Request):
+        """Search the on-disk index of a directory of .docx files."""
+        from docx_mcp_server.core.corpus_index import search_directory
+        from docx_mcp_server.core.validators import validate_path_safety
+        try:
+            body = await request.json()
+            root = body.get("root")
+            query = body.get("query")
+
+            if not root or not query:
+                return JSONResponse(
+                    {"error": "Missing 'root' or 'query' parameter"},
+                    status_code=400
+                )
+
+            validate_path_safety(root)
+            # Indexing walks and parses files; keep it off the event loop
+            result = await run_in_threadpool(
+                search_directory,
+                root,
+                query,
+                max_results=int(body.get("maxResults", 20)),
+                refresh=bool(body.get("refresh", False)),
+                index_path=body.get("indexPath"),
+            )
+            return JSONResponse(result)
+
+        except ValueError as e:
+            logger.error(f"Invalid search request: {e}")
+            return JSONResponse({"error": str(e)}, status_code=400)
+        except Exception as e:
+            logger.exception(f"Error searching directory: {e}")
+            return JSONResponse(
+                {"error": f"Internal server error: {str(e)}"},
+                status_code=500
+            )
+
+    @mcp_instance.custom_route("/api/table/import", methods=["POST"])
+    async def import_table_route(request: Request):
+        """Stream a local CSV/TSV/JSON-lines file into a table of the active session."""
+        from docx.table import Table
+        from docx_mcp_server.core.global_state import global_state
+        from docx_mcp_server.core.table_import import import_table_file
+        from docx_mcp_server.core.validators import validate_path_safety
+        try:
+            body = await request.json()
+            path = body.get("path")
+            table_id = body.get("tableId")
+
+            if not path or not table_id:
+                return JSONResponse(
+                    {"error": "Missing 'path' or 'tableId' parameter"},
+                    status_code=400
+                )
+
+            session = session_manager.get_session(global_state.active_session_id) \
+                if global_state.active_session_id else None
+            if session is None:
+                return JSONResponse({"error": "No active session"}, status_code=404)
+
+            table = session.get_object(table_id)
+            if not isinstance(table, Table):
+                return JSONResponse({"error": f"Table {table_id} not found"}, status_code=404)
+
+            validate_path_safety(path)
+            # Streams the whole file; keep it off the event loop
+            result = await run_in_threadpool(
+                import_table_file,
+                table,
+                path,
+                file_format=body.get("format"),
+                has_header=bool(body.get("hasHeader", True)),
+                write_header=bool(body.get("writeHeader", False)),
+                columns=body.get("columns"),
+                start_row=body.get("startRow"),
+                template_row=body.get("templateRow"),
+                number_format=body.get("numberFormat"),
+                delimiter=body.get("delimiter"),
+                encoding=body.get("encoding", "utf-8"),
+                preserve_formatting=bool(body.get("preserveFormatting", True)),
+                grid=session.get_table_grid(table),
+            )
+            if result["rows_added"]:
+                session.invalidate_table_grid(table)
+            session.update_context(table_id, action="update")
+            return JSONResponse(result)
+
+        except FileNotFoundError as e:
+            logger.error(f"Import file not found: {e}")
+            return JSONResponse({"error": str(e)}, status_code=404)
+        except (ValueError, IndexError, UnicodeDecodeError) as e:
+            logger.error(f"Invalid import request: {e}")
+            return JSONResponse({"error": str(e)}, status_code=400)
+        except Exception as e:
+            logger.exception(f"Error importing table data: {e}")
+            return JSONResponse(
+                {"error": f"Internal server error: {str(e)}"},
+                status_code=500
+            )
+
+
 def main():
     """Main entry point for the server with configurable transport"""
     parser = argparse.ArgumentParser(
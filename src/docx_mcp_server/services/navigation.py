@@ -2,6 +2,7 @@ from typing import Any, List, Optional
 from docx.text.paragraph import Paragraph
 from docx.table import Table
 from docx_mcp_server.core.xml_util import ElementNavigator
+from docx_mcp_server.core.style_cache import StyleCache
 
 class ContextVisualizer:
     """
@@ -32,10 +33,10 @@ class ContextVisualizer:
             elif not text:
                 text = ""
 
-            # Check style for Heading
-            style_name = element.style.name if element.style else "Normal"
-            if "Heading" in style_name:
-                return f"{style_name}: \"{text}\""
+            # Check style for Heading (resolved through the per-document cache)
+            style = StyleCache.of(element).paragraph_style(element._p)
+            if style is not None and style.is_heading:
+                return f"{style.name}: \"{text}\""
             return f"Para: \"{text}\""
 
         elif isinstance(element, Table):
@@ -216,6 +216,194 @@ def docx_batch_replace_text(replacements_json: str, scope_id: str = None) -> str
         scope_id=scope_id
     )
 
+
+def docx_list_placeholders(refresh: bool = False) -> str:
+    """
+    List the template placeholders ({{NAME}}) found in the document.
+
+    Scans the body (paragraphs and table cells) once and caches the result
+    in the session's placeholder index, which docx_fill_placeholders reuses.
+    Placeholders that Word split across several runs are found as well.
+
+    Typical Use Cases:
+        - Discover which keys a template expects before filling it
+
+    Args:
+        refresh (bool, optional): Force a rescan of the document.
+            Defaults to False.
+
+    Returns:
+        str: Markdown list of placeholder names with occurrence counts.
+
+    See Also:
+        - docx_fill_placeholders: Fill the listed placeholders
+    """
+    session, error = get_active_session()
+    if error:
+        return error
+    logger.debug(f"docx_list_placeholders called: session_id={session.session_id}, refresh={refresh}")
+
+    index = session.get_placeholder_index(refresh=refresh)
+    if not index.slots:
+        return "No placeholders found."
+
+    md_lines = [f"# Found {len(index.slots)} placeholder(s)\n"]
+    for name, slots in index.slots.items():
+        split = sum(1 for slot in slots if slot.split_across_runs)
+        note = f" ({split} split across runs)" if split else ""
+        md_lines.append(f"- `{slots[0].token}`: {len(slots)} occurrence(s){note}")
+    return "\n".join(md_lines)
+
+
+def docx_fill_placeholders(values_json: str, refresh: bool = False) -> str:
+    """
+    Fill template placeholders ({{NAME}}) from a JSON map.
+
+    Uses the session's placeholder index, so only the runs holding the
+    placeholders are touched instead of rescanning every paragraph per key.
+    Placeholders split across runs are filled too; the value takes the
+    formatting of the run where the placeholder starts.
+
+    Typical Use Cases:
+        - Fill a contract or letter template in one call
+
+    Args:
+        values_json (str): JSON object mapping placeholder names to values.
+            Keys may be given with or without delimiters.
+            Example: '{"NAME": "John Doe", "{{DATE}}": "2024-01-01"}'
+        refresh (bool, optional): Force a rescan before filling.
+            Defaults to False.
+
+    Returns:
+        str: Markdown response with the number of filled slots, keys that
+            matched no placeholder and placeholders still unfilled.
+
+    Examples:
+        >>> docx_fill_placeholders('{"COMPANY": "Acme Corp", "YEAR": "2024"}')
+
+    Notes:
+        - Values are inserted as plain text
+        - Does not search headers/footers
+
+    See Also:
+        - docx_list_placeholders: Show the placeholders a template expects
+        - docx_batch_replace_text: Replace arbitrary text
+    """
+    session, error = get_active_session()
+    if error:
+        return error
+    logger.debug(f"docx_fill_placeholders called: session_id={session.session_id}, values_len={len(values_json)}")
+
+    try:
+        values = json.loads(values_json)
+    except json.JSONDecodeError as e:
+        logger.error(f"docx_fill_placeholders failed: Invalid JSON - {e}")
+        return create_error_response("Invalid JSON for values", error_type="ValidationError")
+    if not isinstance(values, dict):
+        return create_error_response("values_json must be a JSON object", error_type="ValidationError")
+
+    index = session.get_placeholder_index(refresh=refresh)
+    first_paragraph = None
+    for key in values:
+        slots = index.slots.get(index.key_to_name(key))
+        if slots:
+            first_paragraph = slots[0].paragraph
+            break
+
+    counts = index.fill(values)
+    total = sum(counts.values())
+    unmatched = [key for key in values if index.key_to_name(key) not in counts]
+    remaining = index.names()
+
+    element_id = None
+    if total:
+        from docx.text.paragraph import Paragraph
+        # Body as parent even for paragraphs in table cells, as the read tools do
+        element_id = session._get_element_id(Paragraph(first_paragraph, session.document._body), auto_register=True)
+        session.update_context(element_id, action="update")
+        # The index was updated in place; keep it valid for the new revision
+        index.revision = session.revision
+
+    logger.debug(f"docx_fill_placeholders success: filled {total} slots")
+
+    return create_markdown_response(
+        session=session,
+        message=f"Filled {total} placeholder(s) for {len(counts)} key(s).",
+        element_id=element_id,
+        operation="Fill Placeholders",
+        # Context rendering only covers body-level blocks
+        show_context=element_id is not None and first_paragraph.getparent() is session.document.element.body,
+        filled=total,
+        unmatched_keys=", ".join(unmatched) if unmatched else "None",
+        unfilled_placeholders=", ".join(remaining) if remaining else "None"
+    )
+
+
+def docx_normalize() -> str:
+    """
+    Compact run fragmentation in the active document.
+
+    Documents edited in Word are split into many runs by revision IDs and
+    spell-check markers. This removes ``w:proofErr`` markers and ``w:rsid*``
+    attributes and merges adjacent runs with identical formatting, which
+    makes text replacement, format painting and previews faster and their
+    output shorter. Visible text and formatting are unchanged.
+
+    Typical Use Cases:
+        - Clean up a Word-edited template before filling it
+        - Reduce noise in run-level tool output
+
+    Returns:
+        str: Markdown response with merged run count, removed markers and
+            attributes, and the size reduction of document.xml.
+
+    Notes:
+        - IDs of runs merged into their predecessor become invalid
+        - Set DOCX_MCP_NORMALIZE_ON_LOAD=1 to normalize every loaded file
+        - Headers and footers are not processed
+
+    See Also:
+        - docx_replace_text: Benefits from fewer run boundaries
+    """
+    from docx_mcp_server.core.normalizer import normalize_document
+    from docx_mcp_server.core.registry_cleaner import RegistryCleaner
+
+    session, error = get_active_session()
+    if error:
+        return error
+    logger.debug(f"docx_normalize called: session_id={session.session_id}")
+
+    result = normalize_document(session.document)
+
+    # Drop IDs of runs that were merged away
+    removed = {id(r) for r in result.removed_runs}
+    stale_ids = [
+        element_id for element_id, obj in session.object_registry.items()
+        if id(getattr(obj, "_element", None)) in removed
+    ]
+    RegistryCleaner.invalidate_ids(session, stale_ids)
+    for key in removed:
+        session._element_id_cache.pop(key, None)
+
+    if result.runs_merged or result.proof_marks_removed or result.rsid_attributes_removed:
+        session.mark_dirty()
+
+    logger.debug(f"docx_normalize success: merged {result.runs_merged} runs")
+
+    return create_markdown_response(
+        session=session,
+        message=f"Merged {result.runs_merged} of {result.runs_before} runs.",
+        operation="Normalize Document",
+        show_context=False,
+        runs_before=result.runs_before,
+        runs_merged=result.runs_merged,
+        proof_marks_removed=result.proof_marks_removed,
+        rsid_attributes_removed=result.rsid_attributes_removed,
+        bytes_removed=result.bytes_removed,
+        invalidated_ids=len(stale_ids)
+    )
+
+
 def docx_insert_image(image_path: str, position: str, width: float = None, height: float = None) -> str:
     """
     Insert an image into the document.
@@ -380,4 +568,7 @@ def register_tools(mcp: FastMCP):
     """Register advanced document operations"""
     mcp.tool()(docx_replace_text)
     mcp.tool()(docx_batch_replace_text)
+    mcp.tool()(docx_list_placeholders)
+    mcp.tool()(docx_fill_placeholders)
+    mcp.tool()(docx_normalize)
     mcp.tool()(docx_insert_image)
@@ -4,11 +4,20 @@ import json
 import re
 from typing import Optional
 from mcp.server.fastmcp import FastMCP
+from docx.oxml.ns import qn
+from docx.shared import RGBColor
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+from docx_mcp_server.core.style_cache import StyleCache
+from docx_mcp_server.core.text_extractor import paragraph_text
 from docx_mcp_server.core.response import create_markdown_response, create_error_response
 from docx_mcp_server.utils.session_helpers import get_active_session
 
 logger = logging.getLogger(__name__)
 
+_P = qn("w:p")
+_TBL = qn("w:tbl")
+
 
 def _extract_element_id(response: str) -> str:
     """
@@ -35,25 +44,6 @@ def _extract_element_id(response: str) -> str:
         return response
 
 
-def _extract_metadata_field(response: str, field_name: str) -> Optional[str]:
-    """
-    Extract a metadata field from Markdown response.
-
-    Args:
-        response: Markdown response string
-        field_name: Field name to extract (e.g., "rows_filled")
-
-    Returns:
-        str: Field value or None if not found
-    """
-    display_name = field_name.replace('_', ' ').title()
-    pattern = rf'\*\*{re.escape(display_name)}\*\*:\s*(.+?)(?:\n|$)'
-    match = re.search(pattern, response)
-    if match:
-        return match.group(1).strip()
-    return None
-
-
 def docx_insert_formatted_paragraph(
     text: str,
     position: str,
@@ -128,31 +118,48 @@ def docx_insert_formatted_paragraph(
         raise ValueError(f"Failed to create formatted paragraph: {e}")
 
 
+def _parse_color(color_hex: Optional[str]):
+    """RGBColor for a 'RRGGBB' string, None if not given.
+
+    Raises:
+        ValueError: If color_hex is not a valid hex color.
+    """
+    if not color_hex:
+        return None
+    try:
+        return RGBColor.from_string(color_hex)
+    except ValueError:
+        raise ValueError(f"Invalid hex color: {color_hex}")
+
+
 def docx_quick_edit(
     search_text: str,
     new_text: str = None,
     bold: bool = None,
     italic: bool = None,
     size: float = None,
-    color_hex: str = None
+    color_hex: str = None,
+    max_results: int = 10
 ) -> str:
     """
     Find and edit paragraphs in one step.
 
     Combines docx_find_paragraphs + docx_update_paragraph_text + formatting
-    for quick editing workflows.
+    for quick editing workflows. Matching paragraphs are edited directly in one
+    pass with a single summary response.
 
     Typical Use Cases:
         - Edit existing documents quickly
         - Find and replace with formatting changes
         - Update specific content without manual ID tracking
 
-    Args:        search_text (str): Text to search for in paragraphs.
+    Args:        search_text (str): Text to search for in paragraphs (case-insensitive).
         new_text (str): New text to replace (if None, only formatting changes).
         bold (bool): Set bold formatting.
         italic (bool): Set italic formatting.
         size (float): Font size in points.
         color_hex (str): Hex color without '#'.
+        max_results (int): Maximum number of paragraphs to edit. Defaults to 10.
 
     Returns:
         str: JSON with modified paragraph count and IDs.
@@ -164,64 +171,43 @@ def docx_quick_edit(
         Change formatting only:
         >>> result = docx_quick_edit("important", bold=True, color_hex="FF0000")
     """
-    from docx_mcp_server.tools.content_tools import docx_find_paragraphs
-    from docx_mcp_server.tools.paragraph_tools import docx_update_paragraph_text
-    from docx_mcp_server.tools.run_tools import docx_set_font
-    from docx_mcp_server.server import session_manager
+    from docx_mcp_server.tools.run_tools import apply_font
 
-    try:
-        # Find matching paragraphs
-        matches_md = docx_find_paragraphs(search_text)
-
-        # Parse Markdown response
-        if "No matching paragraphs found" in matches_md:
-            # Return Markdown format
-            md_lines = ["# Quick Edit Result\n"]
-            md_lines.append(f"**Modified Count**: 0")
-            md_lines.append(f"\n**Modified Paragraph IDs**: None")
-            return "\n".join(md_lines)
+    session, error = get_active_session()
+    if error:
+        return error
 
-        # Extract matches from Markdown
+    try:
+        rgb = _parse_color(color_hex)
+        needle = search_text.lower()
+        body = session.document._body
         matches = []
-        match_pattern = r'## Match \d+\s*\n\*\*ID\*\*:\s*`([^`]+)`\s*\n\*\*Text\*\*:\s*(.+?)(?=\n##|\n\*\*Context|\Z)'
-        for match in re.finditer(match_pattern, matches_md, re.DOTALL):
-            para_id = match.group(1).strip()
-            text = match.group(2).strip()
-            matches.append({'id': para_id, 'text': text})
-
-        if not matches:
-            # Return Markdown format
-            md_lines = ["# Quick Edit Result\n"]
-            md_lines.append(f"**Modified Count**: 0")
-            md_lines.append(f"\n**Modified Paragraph IDs**: None")
-            return "\n".join(md_lines)
+        for p in body._element.iterchildren(_P):
+            if needle in paragraph_text(p).lower():
+                matches.append(Paragraph(p, body))
+                if len(matches) >= max_results:
+                    break
 
         modified_ids = []
-
-        for match in matches:
-            para_id = match["id"]
-
-            # Update text if specified
+        for paragraph in matches:
             if new_text is not None:
-                docx_update_paragraph_text(para_id, new_text)
-
-            # Apply formatting if specified
-            if any([bold is not None, italic is not None, size, color_hex]):
-                session, error = get_active_session()
-                paragraph = session.get_object(para_id)
+                paragraph.clear()
+                paragraph.add_run(new_text)
+            modified_ids.append(session._get_element_id(paragraph, auto_register=True))
 
-                # Apply formatting to all runs in paragraph
-                for run in paragraph.runs:
-                    run_id = session._get_element_id(run, auto_register=True)
-                    docx_set_font(run_id, size=size, bold=bold, italic=italic, color_hex=color_hex)
-
-            modified_ids.append(para_id)
+        if matches and any([bold is not None, italic is not None, size, rgb]):
+            apply_font(matches, size=size, bold=bold, italic=italic, rgb=rgb)
+        if modified_ids:
+            session.update_context(modified_ids[-1], action="update")
 
         logger.info(f"Quick edit modified {len(modified_ids)} paragraphs")
 
         # Return Markdown format
         md_lines = ["# Quick Edit Result\n"]
         md_lines.append(f"**Modified Count**: {len(modified_ids)}")
+        if not modified_ids:
+            md_lines.append(f"\n**Modified Paragraph IDs**: None")
+            return "\n".join(md_lines)
         md_lines.append(f"\n**Modified Paragraph IDs**:")
         for pid in modified_ids:
             md_lines.append(f"- `{pid}`")
@@ -283,47 +269,51 @@ def docx_get_structure_summary(
         table_count = 0
         para_count = 0
 
-        for element in doc.element.body:
+        body = doc._body
+        styles = StyleCache.of(doc)
+        for element in body._element:
             # Process headings
-            if element.tag.endswith('p'):
-                para = next((p for p in doc.paragraphs if p._element == element), None)
-                if para and para.style.name.startswith('Heading'):
+            if element.tag == _P:
+                style = styles.paragraph_style(element)
+                style_name = style.name if style is not None else None
+                if style_name and style_name.startswith('Heading'):
                     if heading_count < max_headings:
+                        para = Paragraph(element, body)
                         heading_info = {
-                            "level": int(para.style.name.split()[-1]) if para.style.name.split()[-1].isdigit() else 1,
-                            "style": para.style.name,
+                            "level": style.outline_level or 1,
+                            "style": style_name,
                             "element_id": session._get_element_id(para, auto_register=True)
                         }
                         if include_content:
-                            heading_info["text"] = para.text
+                            heading_info["text"] = paragraph_text(element)
                         structure["headings"].append(heading_info)
                         heading_count += 1
 
                 # Process regular paragraphs
-                elif para and max_paragraphs > 0 and para_count < max_paragraphs:
+                elif max_paragraphs > 0 and para_count < max_paragraphs:
+                    para = Paragraph(element, body)
                     para_info = {
-                        "style": para.style.name,
+                        "style": style_name,
                         "element_id": session._get_element_id(para, auto_register=True)
                     }
                     if include_content:
-                        para_info["text"] = para.text[:100]  # Truncate long text
+                        para_info["text"] = paragraph_text(element)[:100]  # Truncate long text
                     structure["paragraphs"].append(para_info)
                     para_count += 1
 
             # Process tables
-            elif element.tag.endswith('tbl') and table_count < max_tables:
-                table = next((t for t in doc.tables if t._element == element), None)
-                if table:
-                    table_info = {
-                        "rows": len(table.rows),
-                        "cols": len(table.columns),
-                        "element_id": session._get_element_id(table, auto_register=True)
-                    }
-                    if include_content:
-                        # Include first row as header sample
-                        table_info["first_row"] = [cell.text[:50] for cell in table.rows[0].cells]
-                    structure["tables"].append(table_info)
-                    table_count += 1
+            elif element.tag == _TBL and table_count < max_tables:
+                table = Table(element, body)
+                table_info = {
+                    "rows": len(table.rows),
+                    "cols": len(table.columns),
+                    "element_id": session._get_element_id(table, auto_register=True)
+                }
+                if include_content:
+                    # Include first row as header sample
+                    table_info["first_row"] = [cell.text[:50] for cell in table.rows[0].cells]
+                structure["tables"].append(table_info)
+                table_count += 1
 
         structure["summary"] = {
             "total_headings": heading_count,
@@ -409,10 +399,9 @@ def docx_smart_fill_table(
         Fill table by content:
         >>> result = docx_smart_fill_table("Employee", data)
     """
-    from docx_mcp_server.tools.table_tools import (
-        docx_get_table, docx_find_table, docx_fill_table, docx_insert_table_row
-    )
-    from docx_mcp_server.server import session_manager
+    from docx_mcp_server.tools.table_tools import docx_get_table, docx_find_table
+    from docx_mcp_server.core.table_analyzer import TableStructureAnalyzer
+    from docx_mcp_server.core.table_fill import append_rows, fill_table
 
     session, error = get_active_session()
     if error:
@@ -457,30 +446,40 @@ def docx_smart_fill_table(
 
         # Calculate rows needed
         data_rows = len(data_array) - (1 if has_header else 0)
-        existing_rows = len(table.rows) - (1 if has_header else 0)
+        existing_rows = session.get_table_grid(table).row_count - (1 if has_header else 0)
 
-        # Add rows if needed
+        # Add rows if needed: one XML pass cloning the last row, instead of
+        # one docx_insert_table_row call (and rendered response) per row
+        rows_added = 0
         if auto_resize and data_rows > existing_rows:
-            rows_to_add = data_rows - existing_rows
-            for _ in range(rows_to_add):
-                docx_insert_table_row(position=f"inside:{table_id}")
-            logger.info(f"Added {rows_to_add} rows to table")
+            rows_added = len(append_rows(table, data_rows - existing_rows))
+            session.invalidate_table_grid(table)
+            logger.info(f"Added {rows_added} rows to table")
 
-        # Fill table
+        # Fill table directly through the fill engine
         start_row = 1 if has_header else 0
-        fill_result = docx_fill_table(data, table_id, start_row=start_row, preserve_formatting=preserve_formatting)
-
-        # Extract metadata from Markdown response
-        rows_filled_str = _extract_metadata_field(fill_result, "rows_filled")
-        rows_filled = int(rows_filled_str) if rows_filled_str else len(data_array)
+        grid = session.get_table_grid(table)
+        structure_info = TableStructureAnalyzer.detect_irregular_structure(table, grid=grid)
+        fill_table(
+            table,
+            data_array,
+            start_row=start_row,
+            preserve_formatting=preserve_formatting,
+            skip_spanned=structure_info["is_irregular"],
+            grid=grid,
+        )
+        if start_row + len(data_array) > grid.row_count:
+            session.invalidate_table_grid(table)
+        session.update_context(table_id, action="update")
+        rows_filled = len(data_array)
 
-        logger.info(f"Smart fill completed: rows_filled={rows_filled}, rows_added={max(0, data_rows - existing_rows) if auto_resize else 0}")
+        logger.info(f"Smart fill completed: rows_filled={rows_filled}, rows_added={rows_added}")
 
         return create_markdown_response(
             session=session,
             message=f"Smart filled table with {rows_filled} rows",
             rows_filled=rows_filled,
-            rows_added=max(0, data_rows - existing_rows) if auto_resize else 0,
+            rows_added=rows_added,
             preserve_formatting=preserve_formatting
         )
 
@@ -524,25 +523,26 @@ def docx_format_range(
         ...     session_id, "Chapter 1", "Chapter 2", bold=True, size=14
         ... )
     """
-    from docx_mcp_server.server import session_manager
-    from docx_mcp_server.tools.run_tools import docx_set_font
+    from docx_mcp_server.tools.run_tools import apply_font
 
     session, error = get_active_session()
     if error:
         return error
 
     try:
-        doc = session.document
-        paragraphs = list(doc.paragraphs)
+        rgb = _parse_color(color_hex)
+        body = session.document._body
+        paragraphs = list(body._element.iterchildren(_P))
 
         # Find start and end indices
         start_idx = None
         end_idx = None
 
-        for i, para in enumerate(paragraphs):
-            if start_text in para.text and start_idx is None:
+        for i, p in enumerate(paragraphs):
+            text = paragraph_text(p)
+            if start_text in text and start_idx is None:
                 start_idx = i
-            if end_text in para.text:
+            if end_text in text:
                 end_idx = i
 
         if start_idx is None:
@@ -552,20 +552,19 @@ def docx_format_range(
         if start_idx > end_idx:
             raise ValueError("Start text appears after end text")
 
-        # Format range
-        formatted_count = 0
-        for i in range(start_idx, end_idx + 1):
-            para = paragraphs[i]
-            for run in para.runs:
-                run_id = session._get_element_id(run, auto_register=True)
-                docx_set_font(run_id, size=size, bold=bold, italic=italic, color_hex=color_hex)
-            formatted_count += 1
+        # Format range directly, one pass over its runs
+        selected = [Paragraph(p, body) for p in paragraphs[start_idx:end_idx + 1]]
+        run_count = apply_font(selected, size=size, bold=bold, italic=italic, rgb=rgb)
+        formatted_count = len(selected)
+        if run_count:
+            session.mark_dirty()
 
-        logger.info(f"Formatted range: {formatted_count} paragraphs")
+        logger.info(f"Formatted range: {formatted_count} paragraphs, {run_count} runs")
 
         # Return Markdown format
         md_lines = ["# Format Range Result\n"]
         md_lines.append(f"**Formatted Count**: {formatted_count}")
+        md_lines.append(f"**Run Count**: {run_count}")
         md_lines.append(f"**Start Index**: {start_idx}")
         md_lines.append(f"**End Index**: {end_idx}")
 
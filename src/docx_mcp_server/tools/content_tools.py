@@ -1,14 +1,22 @@
 """Content reading and search tools"""
 import json
 import logging
+import sqlite3
 from mcp.server.fastmcp import FastMCP
 from typing import Optional, Dict, List, Any
+from docx.oxml.ns import qn
+from docx.table import Table
+from docx.text.paragraph import Paragraph
 from docx_mcp_server.core.finder import Finder
 from docx_mcp_server.utils.session_helpers import get_active_session
 from docx_mcp_server.core.template_parser import TemplateParser
+from docx_mcp_server.core.response import create_error_response
+from docx_mcp_server.core import text_extractor
 
 logger = logging.getLogger(__name__)
 
+_P, _TBL = qn("w:p"), qn("w:tbl")
+
 
 def docx_read_content(
     max_paragraphs: Optional[int] = None,
@@ -91,22 +99,16 @@ def docx_read_content(
                 if el is not None:
                     anchor_element = el
 
-    # Iterate document blocks (paragraphs and tables) in order
-    def iter_blocks(doc):
-        body = doc.element.body
-        for child in body.iterchildren():
-            tag = child.tag.split('}')[-1]
-            if tag == 'p':
-                yield Paragraph(child, doc)
-            elif tag == 'tbl':
-                yield Table(child, doc)
-
-    blocks = list(iter_blocks(session.document))
+    # Walk body-level blocks directly over the XML; wrappers are only created
+    # when an element has to be registered for its ID
+    body = session.document.element.body
+    parent = session.document
+    blocks = list(text_extractor.iter_blocks(body))
 
     start_index = 0
     if anchor_element is not None:
-        for idx, blk in enumerate(blocks):
-            if getattr(blk, "_element", None) is anchor_element:
+        for idx, (_, element) in enumerate(blocks):
+            if element is anchor_element:
                 start_index = idx + 1
                 break
 
@@ -114,40 +116,43 @@ def docx_read_content(
     para_count = 0
     table_count = 0
 
-    for blk in blocks[start_index:]:
-        if isinstance(blk, Paragraph):
-            if not blk.text.strip():
+    for kind, element in blocks[start_index:]:
+        if kind == "paragraph":
+            text = text_extractor.paragraph_text(element)
+            if not text.strip():
                 continue
             # Only enforce paragraph limit during scan when anchored; otherwise slice later
             if start_element_id is not None and max_paragraphs is not None and para_count >= max_paragraphs:
                 continue
-            entry: Dict[str, Any] = {"text": blk.text, "type": "paragraph"}
+            entry: Dict[str, Any] = {"text": text, "type": "paragraph"}
             if include_ids:
-                entry["id"] = session._get_element_id(blk, auto_register=True)
+                entry["id"] = session._get_element_id(Paragraph(element, parent), auto_register=True)
             entries.append(entry)
             para_count += 1
-        elif include_tables and isinstance(blk, Table):
+        elif include_tables and kind == "table":
             if start_element_id is not None and max_tables is not None and table_count >= max_tables:
                 continue
-            table_id = session._get_element_id(blk, auto_register=True) if include_ids else None
+            table_id = session._get_element_id(Table(element, parent), auto_register=True) if include_ids else None
             mode = table_mode if table_mode in ["text", "cells"] else "text"
             if mode != table_mode:
                 logger.warning(f"Unsupported table_mode '{table_mode}', fallback to 'text'")
 
+            grid = text_extractor.table_rows(element)
             if mode == "cells":
-                table_data = [[cell.text for cell in row.cells] for row in blk.rows]
+                table_data = grid
                 text_repr = "\n".join(["\t".join(r) for r in table_data])
             else:
                 table_data = None
-                text_repr = "\n".join([cell.text for row in blk.rows for cell in row.cells])
+                text_repr = "\n".join([text for row in grid for text in row])
 
             entry: Dict[str, Any] = {"text": text_repr, "type": "table"}
             if table_id is not None:
                 entry["id"] = table_id
             if table_data is not None:
                 entry["cells"] = table_data
-            entry["rows"] = int(len(blk.rows))
-            entry["cols"] = int(len(blk.columns)) if blk.rows else 0
+            rows, cols = text_extractor.table_dimensions(element)
+            entry["rows"] = rows
+            entry["cols"] = cols if rows else 0
             entries.append(entry)
             table_count += 1
 
@@ -307,6 +312,356 @@ def docx_find_paragraphs(
 
     return "\n".join(md_lines)
 
+
+def docx_find_paragraphs_fuzzy(
+    query: str,
+    max_results: int = 10,
+    min_score: float = 0.5,
+    context_span: int = 0
+) -> str:
+    """
+    Find paragraphs approximately matching a query, ranked by similarity.
+
+    Tolerates typos, different whitespace, letter case and smart vs straight
+    quotes/dashes. Uses a per-session character trigram index, so repeated
+    searches only touch the paragraphs sharing trigrams with the query
+    instead of scanning the whole document.
+
+    Typical Use Cases:
+        - Locate a paragraph when docx_find_paragraphs returns nothing
+        - Find text copied from a rendered view (smart quotes, nbsp)
+        - Avoid reading the full document just to find one passage
+
+    Args:
+        query (str): Approximate text to look for.
+        max_results (int, optional): Maximum results to return. Defaults to 10.
+        min_score (float, optional): Minimum fraction (0-1) of the query's
+            trigrams that must occur in a paragraph. Defaults to 0.5.
+        context_span (int, optional): Number of neighbouring paragraphs to
+            include before/after each hit. Defaults to 0.
+
+    Returns:
+        str: Markdown list of matches, best first, each with ID, score,
+            similarity and text. Returns "No matching paragraphs found." if
+            nothing reaches min_score.
+
+    Examples:
+        Find a clause despite a typo:
+        >>> docx_find_paragraphs_fuzzy("termination for convenence")
+
+        Stricter matching:
+        >>> docx_find_paragraphs_fuzzy("Payment due in 30 days", min_score=0.8)
+
+    Notes:
+        - Score 1.0 means the whole query occurs after normalization
+        - Only body paragraphs are indexed (same scope as docx_find_paragraphs)
+        - The index is rebuilt automatically after document edits
+
+    See Also:
+        - docx_find_paragraphs: Exact substring search
+        - docx_read_content: Read document text
+    """
+    session, error = get_active_session()
+    if error:
+        return error
+
+    logger.debug(
+        f"docx_find_paragraphs_fuzzy called: session_id={session.session_id}, "
+        f"query='{query}', max={max_results}, min_score={min_score}"
+    )
+
+    if not 0 <= min_score <= 1:
+        return create_error_response("min_score must be between 0 and 1", error_type="ValidationError")
+
+    index = session.get_fuzzy_index()
+    matches = index.search(query, max_results=max_results, min_score=min_score)
+    if any(not index.is_current(m.position) for m in matches):
+        # Paragraphs were edited without bumping the session revision
+        index = session.get_fuzzy_index(refresh=True)
+        matches = index.search(query, max_results=max_results, min_score=min_score)
+
+    logger.debug(
+        f"docx_find_paragraphs_fuzzy success: {len(matches)} matches "
+        f"(indexed paragraphs={len(index)})"
+    )
+
+    if not matches:
+        return "No matching paragraphs found."
+
+    md_lines = [f"# Found {len(matches)} similar paragraph(s)\n"]
+    for idx, match in enumerate(matches, 1):
+        p_id = session._get_element_id(match.paragraph, auto_register=True)
+        md_lines.append(f"## Match {idx}")
+        md_lines.append(f"**ID**: `{p_id}`")
+        md_lines.append(f"**Score**: {match.score}")
+        md_lines.append(f"**Similarity**: {match.similarity}")
+        md_lines.append(f"**Text**: {match.text}")
+
+        context = index.neighbours(match.position, context_span)
+        if context:
+            if context["context_before"]:
+                md_lines.append(f"\n**Context Before**:")
+                for ctx in context["context_before"]:
+                    md_lines.append(f"> {ctx}")
+            if context["context_after"]:
+                md_lines.append(f"\n**Context After**:")
+                for ctx in context["context_after"]:
+                    md_lines.append(f"> {ctx}")
+        md_lines.append("")
+
+    return "\n".join(md_lines)
+
+
+def docx_index_directory(
+    root_path: str,
+    recursive: bool = True,
+    index_path: Optional[str] = None
+) -> str:
+    """
+    Build or incrementally refresh the on-disk search index for a directory.
+
+    Scans root_path for .docx files and (re-)extracts only the files whose
+    modification time or size changed since the last refresh. Extraction
+    runs in parallel worker processes. The index is stored in a SQLite file
+    (default: <root_path>/.docx-mcp-index.sqlite3).
+
+    Typical Use Cases:
+        - Prepare a document archive for docx_search_directory
+        - Pick up new, changed or deleted files after an archive update
+
+    Args:
+        root_path (str): Directory containing .docx files.
+        recursive (bool, optional): Include subdirectories. Defaults to True.
+        index_path (str, optional): Custom location of the index file.
+
+    Returns:
+        str: Markdown summary with added/updated/removed/unchanged/failed
+            file counts and timing.
+
+    See Also:
+        - docx_search_directory: Query the index
+    """
+    from docx_mcp_server.core.corpus_index import DocxSearchIndex
+    from docx_mcp_server.core.validators import validate_path_safety
+
+    logger.debug(f"docx_index_directory called: root_path={root_path}, recursive={recursive}")
+
+    try:
+        validate_path_safety(root_path)
+        index = DocxSearchIndex(root_path, index_path=index_path)
+        stats = index.refresh(recursive=recursive)
+    except ValueError as e:
+        return create_error_response(str(e), error_type="ValidationError")
+    except (sqlite3.Error, OSError) as e:
+        logger.exception(f"docx_index_directory failed: {e}")
+        return create_error_response(f"Failed to refresh index: {str(e)}", error_type="SearchIndexError")
+
+    md_lines = ["# Search Index Refreshed\n"]
+    md_lines.append(f"- **Root**: {index.root_path}")
+    md_lines.append(f"- **Index File**: {index.index_path}")
+    md_lines.append(f"- **Indexed Files**: {stats['indexed_files']}")
+    md_lines.append(f"- **Added**: {stats['added']}")
+    md_lines.append(f"- **Updated**: {stats['updated']}")
+    md_lines.append(f"- **Removed**: {stats['removed']}")
+    md_lines.append(f"- **Unchanged**: {stats['unchanged']}")
+    md_lines.append(f"- **Failed**: {stats['failed']}")
+    md_lines.append(f"- **Elapsed**: {stats['elapsed_ms']} ms")
+    for err in stats["errors"][:10]:
+        md_lines.append(f"  - `{err['path']}`: {err['error']}")
+    return "\n".join(md_lines)
+
+
+def docx_search_directory(
+    query: str,
+    root_path: str,
+    max_results: int = 20,
+    refresh: bool = False,
+    index_path: Optional[str] = None
+) -> str:
+    """
+    Search all .docx files below a directory using the on-disk index.
+
+    Returns the files and paragraph positions containing the query without
+    opening any document in a session. The index is built automatically on
+    first use; pass refresh=True (or call docx_index_directory) to pick up
+    changed files.
+
+    Typical Use Cases:
+        - Find which contracts in an archive contain a clause
+        - Locate a document before switching to it
+
+    Args:
+        query (str): Text to find (case-, whitespace- and quote-insensitive
+            phrase match; the last word may be partial, e.g. "liab").
+        root_path (str): Directory containing .docx files.
+        max_results (int, optional): Maximum matches to return. Defaults to 20.
+        refresh (bool, optional): Refresh the index before searching.
+            Defaults to False.
+        index_path (str, optional): Custom location of the index file.
+
+    Returns:
+        str: Markdown list of matches with relative file path, paragraph
+            index (document order, including table cells) and snippet.
+
+    Examples:
+        >>> docx_search_directory("limitation of liability", "./contracts")
+
+    See Also:
+        - docx_index_directory: Build or refresh the index
+        - docx_find_paragraphs: Search inside the active document
+    """
+    from docx_mcp_server.core.corpus_index import search_directory
+    from docx_mcp_server.core.validators import validate_path_safety
+
+    logger.debug(f"docx_search_directory called: query='{query}', root_path={root_path}, refresh={refresh}")
+
+    try:
+        validate_path_safety(root_path)
+        result = search_directory(
+            root_path, query, max_results=max_results, refresh=refresh, index_path=index_path
+        )
+    except ValueError as e:
+        return create_error_response(str(e), error_type="ValidationError")
+    except (sqlite3.Error, OSError) as e:
+        logger.exception(f"docx_search_directory failed: {e}")
+        return create_error_response(f"Failed to search index: {str(e)}", error_type="SearchIndexError")
+
+    logger.debug(f"docx_search_directory success: {result['count']} matches in {result['query_ms']} ms")
+
+    if not result["results"]:
+        return f"No matches for '{query}' in {result['root']}."
+
+    md_lines = [f"# Found {result['count']} match(es) for '{query}'\n"]
+    md_lines.append(f"**Root**: {result['root']}")
+    md_lines.append(f"**Query Time**: {result['query_ms']} ms")
+    md_lines.append("")
+    for idx, match in enumerate(result["results"], 1):
+        md_lines.append(f"## Match {idx}")
+        md_lines.append(f"**Path**: `{match['path']}`")
+        md_lines.append(f"**Paragraph Index**: {match['paragraph_index']}")
+        md_lines.append(f"**Snippet**: {match['snippet']}")
+        md_lines.append("")
+    return "\n".join(md_lines)
+
+
+def docx_get_outline(
+    section: Optional[str] = None,
+    element_id: Optional[str] = None,
+    level: Optional[int] = None,
+    max_results: int = 50,
+) -> str:
+    """
+    Query the heading outline: section ranges and subsections.
+
+    The outline is kept per session and updated in place when paragraphs are
+    inserted, deleted or restyled, so outline questions do not rescan the
+    document. Heading levels come from the outline level of the paragraph or
+    its style; sections are numbered by the heading tree ("3.2").
+
+    Typical Use Cases:
+        - Find where a section starts and ends before editing or copying it
+        - List all level-2 headings under chapter 3
+        - Find the section an element belongs to
+
+    Args:
+        section (str, optional): Section number ("3.2") or heading element ID.
+        element_id (str, optional): Any element; selects the innermost section
+            containing it. Ignored when section is given.
+        level (int, optional): List only headings of this level (1-9) inside
+            the selected section (or the whole document). Without it the
+            direct subsections are listed.
+        max_results (int): Maximum number of headings to list. Defaults to 50.
+
+    Returns:
+        str: Markdown response with the selected section's range (block
+        indexes of the body, inclusive, plus the ID of its last block) and
+        one line per listed heading with its number, level, ID and range.
+
+    Examples:
+        Top-level outline:
+        >>> docx_get_outline()
+
+        Where does section 4.2 start and end:
+        >>> docx_get_outline(section="4.2")
+
+        All H2 headings under chapter 3:
+        >>> docx_get_outline(section="3", level=2)
+
+    See Also:
+        - docx_get_structure_summary: Headings, tables and paragraphs in one scan
+        - docx_copy_elements_range: Copy a section by its first and last ID
+    """
+    session, error = get_active_session()
+    if error:
+        return error
+
+    logger.debug(
+        f"docx_get_outline called: session_id={session.session_id}, section={section}, "
+        f"element_id={element_id}, level={level}"
+    )
+
+    if level is not None and not 1 <= level <= 9:
+        return create_error_response("level must be between 1 and 9", error_type="ValidationError")
+
+    outline = session.get_outline_index()
+    body = session.document._body
+    selected = None
+    if section is not None:
+        selected = outline.find_number(section)
+        if selected is None:
+            obj = session.get_object(section)
+            if obj is not None:
+                selected = outline.find_heading(getattr(obj, "_element", None))
+                if selected is None:
+                    return create_error_response(f"Element {section} is not an outline heading", error_type="ValidationError")
+        if selected is None:
+            return create_error_response(f"Section '{section}' not found", error_type="ElementNotFound")
+    elif element_id is not None:
+        obj = session.get_object(element_id)
+        if obj is None:
+            return create_error_response(f"Element {element_id} not found", error_type="ElementNotFound")
+        selected = outline.containing(getattr(obj, "_element", None))
+        if selected is None:
+            return create_error_response(f"Element {element_id} is not inside a section", error_type="ElementNotFound")
+
+    def heading_id(heading):
+        return session._get_element_id(Paragraph(heading.element, body), auto_register=True)
+
+    md_lines = ["# Document Outline\n"]
+    md_lines.append(f"**Heading Count**: {len(outline)}")
+    md_lines.append(f"**Block Count**: {outline.block_count}")
+
+    if selected is not None:
+        info = outline.section(selected)
+        last = outline.body[info.end]
+        last_obj = {_P: Paragraph, _TBL: Table}.get(last.tag)
+        md_lines.append(f"\n## Section {info.heading.number}: {info.heading.text}\n")
+        md_lines.append(f"**Heading ID**: `{heading_id(info.heading)}`")
+        md_lines.append(f"**Level**: {info.heading.level}")
+        md_lines.append(f"**Start Index**: {info.start}")
+        md_lines.append(f"**End Index**: {info.end}")
+        if last_obj is not None:
+            md_lines.append(f"**End ID**: `{session._get_element_id(last_obj(last, body), auto_register=True)}`")
+        if info.heading.parent is not None:
+            md_lines.append(f"**Parent Section**: {outline.headings[info.heading.parent].number}")
+
+    listed = outline.subsections(selected, level=level)
+    if listed:
+        title = f"Level {level} Headings" if level is not None else "Subsections" if selected is not None else "Sections"
+        md_lines.append(f"\n## {title} ({len(listed)})\n")
+        for i in listed[:max_results]:
+            info = outline.section(i)
+            md_lines.append(
+                f"- {info.heading.number} [H{info.heading.level}] {info.heading.text[:80]} "
+                f"`{heading_id(info.heading)}` (blocks {info.start}-{info.end})"
+            )
+        if len(listed) > max_results:
+            md_lines.append(f"- ... {len(listed) - max_results} more")
+
+    logger.debug(f"docx_get_outline success: {len(listed)} headings listed")
+    return "\n".join(md_lines)
+
+
 def docx_extract_template_structure(
     max_depth: int = None,
     include_content: bool = True,
@@ -456,4 +811,8 @@ def register_tools(mcp: FastMCP):
     """Register content reading and search tools"""
     mcp.tool()(docx_read_content)
     mcp.tool()(docx_find_paragraphs)
+    mcp.tool()(docx_find_paragraphs_fuzzy)
+    mcp.tool()(docx_index_directory)
+    mcp.tool()(docx_search_directory)
+    mcp.tool()(docx_get_outline)
     mcp.tool()(docx_extract_template_structure)
@@ -1,7 +1,17 @@
 """Copy and Metadata tools"""
 import json
 import logging
+import os
+from typing import Optional
+from docx import Document
+from docx.oxml.table import CT_Tbl
+from docx.oxml.text.paragraph import CT_P
+from docx.table import Table
+from docx.text.paragraph import Paragraph
 from mcp.server.fastmcp import FastMCP
+from docx_mcp_server.core.doc_import import body_elements
+from docx_mcp_server.core.response import create_error_response, create_markdown_response
+from docx_mcp_server.core.validators import validate_path_safety
 from docx_mcp_server.utils.copy_engine import CopyEngine
 from docx_mcp_server.utils.metadata_tools import MetadataTools
 from docx_mcp_server.services.navigation import PositionResolver
@@ -51,6 +61,54 @@ def docx_get_element_source(element_id: str) -> str:
     return "\n".join(md_lines)
 
 
+def _wrap(element, parent):
+    if isinstance(element, CT_P):
+        return Paragraph(element, parent)
+    if isinstance(element, CT_Tbl):
+        return Table(element, parent)
+    return None
+
+
+def _copy_registrations(session, sources, copies, parent, base_meta):
+    """Registration items for the copies of a range, plus the source -> new ID pairs.
+
+    Every top-level copy is registered. Inside them, each node whose source
+    node has an ID (cell paragraphs, cells, nested tables, runs) gets one
+    too; deep copies keep the tree shape, so source and copy nodes pair up
+    by walking both trees in step. Source IDs come from the session's
+    reverse index, never from a registry scan. The items are registered in
+    one ``register_objects`` call, which indexes the copied cells with one
+    grid per copied table.
+    """
+    items = []
+    pairs = []
+    for source_xml, copy_xml in zip(sources, copies):
+        top = _wrap(copy_xml, parent)
+        source_id = session.registered_id(source_xml)
+        prefix = "para" if isinstance(top, Paragraph) else "table"
+        items.append((top, prefix, dict(base_meta, source_id=source_id) if source_id else dict(base_meta)))
+        pairs.append(source_id)
+
+        wrappers = {id(copy_xml): top}
+        for source_node, copy_node in zip(source_xml.iterdescendants(), copy_xml.iterdescendants()):
+            source_id = session.registered_id(source_node)
+            if source_id is None:
+                continue
+            # Nodes come in document order, so the nearest wrapped ancestor exists already
+            ancestor = copy_node.getparent()
+            while id(ancestor) not in wrappers:
+                ancestor = ancestor.getparent()
+            source_obj = session.object_registry[source_id]
+            try:
+                obj = type(source_obj)(copy_node, wrappers[id(ancestor)])
+            except TypeError:
+                continue
+            wrappers[id(copy_node)] = obj
+            items.append((obj, source_id.rsplit("_", 1)[0], dict(base_meta, source_id=source_id)))
+            pairs.append(source_id)
+    return items, pairs
+
+
 def docx_copy_elements_range(start_id: str, end_id: str, position: str) -> str:
     """
     Copy a range of elements (e.g., from one heading to another) to a target location.
@@ -58,6 +116,11 @@ def docx_copy_elements_range(start_id: str, end_id: str, position: str) -> str:
     Copies all supported elements (paragraphs, tables) between the start and end elements
     (inclusive). Maintains the relative order and structure.
 
+    Every copied element is registered, and so is the copy of every element
+    inside the range that already had an ID (cell paragraphs, cells, nested
+    tables, runs). The response maps each such source ID to the ID of its
+    copy.
+
     Typical Use Cases:
         - Copy entire chapters or sections
         - Duplicate complex document structures
@@ -70,8 +133,9 @@ def docx_copy_elements_range(start_id: str, end_id: str, position: str) -> str:
         position (str): Insertion position string (e.g., "after:para_123").
 
     Returns:
-        str: JSON array of new element IDs mapped to their original source IDs.
-            Example: [{"source": "para_1", "new": "para_99"}, ...]
+        str: Markdown with the new top-level element IDs and a JSON object
+            mapping source IDs to the IDs of their copies.
+            Example: {"para_1": "para_99", "cell_5": "cell_a1"}
 
     Raises:
         ValueError: If elements are invalid or not siblings.
@@ -110,67 +174,32 @@ def docx_copy_elements_range(start_id: str, end_id: str, position: str) -> str:
 
     engine = CopyEngine()
     try:
-        # Perform range copy
-        # We append to target_parent
-        ref_xml = None
-        if mode == "after" and ref_element:
-            ref_xml = ref_element._element
-        elif mode == "before" and ref_element:
-            ref_xml = ref_element._element.getprevious()
-
-        new_objects = engine.copy_range(start_el, end_el, target_parent, ref_element_xml=ref_xml)
-
-        if mode in ["start", "before"] and ref_xml is None:
-            container_xml = target_parent._element
-            if hasattr(target_parent, '_body'):
-                container_xml = target_parent._body._element
-            for obj in reversed(new_objects):
-                obj._element.getparent().remove(obj._element)
-                ElementManipulator.insert_at_index(container_xml, obj._element, 0)
-
-        # Register all new objects
-        result_map = []
-        # We need to map back to source?
-        # copy_range returns a list of new objects.
-        # We know they correspond 1:1 to the range logic, but we need to re-fetch the source range
-        # to map IDs correctly if we want to return a mapping.
-        # For MVP, let's just register them and return the list of new IDs.
-        # Or better: track source IDs.
-
-        # Re-fetch source elements to map IDs (assuming stability)
         source_elements = engine.get_elements_between(start_el, end_el)
+        sources = [el._element for el in source_elements]
+        copies = engine.insert_elements(
+            target_parent, [engine.copy_element(el) for el in source_elements], mode, ref_element
+        )
 
-        if len(source_elements) != len(new_objects):
-            logger.warning("Source and new object count mismatch during registration")
-
-        for i, new_obj in enumerate(new_objects):
-            # Attempt to determine type for prefix
-            prefix = "obj"
-            if hasattr(new_obj, "add_run"): prefix = "para"
-            elif hasattr(new_obj, "rows"): prefix = "table"
-
-            # Metadata using shared utility
-            meta = MetadataTools.create_copy_metadata(operation_type="range_copy")
+        base_meta = MetadataTools.create_copy_metadata(operation_type="range_copy")
+        items, source_ids = _copy_registrations(session, sources, copies, target_parent, base_meta)
+        new_ids = session.register_objects(items)
+        mapping = {source_id: new_id for source_id, new_id in zip(source_ids, new_ids) if source_id}
 
-            # If we can map to source
-            if i < len(source_elements):
-                # We can't easily get the ID of the source_element object unless we do a reverse lookup
-                # in session.object_registry. This is expensive (O(N)).
-                # For now, we skip precise source ID mapping in the return value
-                # unless we want to implement reverse lookup.
-                pass
-
-            new_id = session.register_object(new_obj, prefix, metadata=meta)
-            result_map.append({"new_id": new_id, "type": prefix})
-
-        logger.debug(f"docx_copy_elements_range success: copied {len(new_objects)} elements")
+        logger.debug(f"docx_copy_elements_range success: copied {len(copies)} elements, mapped {len(mapping)} IDs")
 
         # Return Markdown format
         md_lines = ["# Copy Elements Range Result\n"]
-        md_lines.append(f"**Copied Count**: {len(new_objects)}\n")
+        md_lines.append(f"**Copied Count**: {len(copies)}")
+        md_lines.append(f"**Mapped Count**: {len(mapping)}\n")
         md_lines.append("## New Element IDs\n")
-        for item in result_map:
-            md_lines.append(f"- **{item['type']}**: `{item['new_id']}`")
+        top_level = {id(el) for el in copies}
+        for (obj, prefix, _), new_id in zip(items, new_ids):
+            if id(obj._element) in top_level:
+                md_lines.append(f"- **{prefix}**: `{new_id}`")
+        md_lines.append("\n## Source Mapping\n")
+        md_lines.append("```json")
+        md_lines.append(json.dumps(mapping, indent=2))
+        md_lines.append("```")
 
         return "\n".join(md_lines)
 
@@ -179,7 +208,234 @@ def docx_copy_elements_range(start_id: str, end_id: str, position: str) -> str:
         raise ValueError(f"Range copy failed: {str(e)}")
 
 
+def _import_fields(result: dict) -> dict:
+    return {
+        "styles_added": result["styles"],
+        "lists_added": result["nums"],
+        "list_definitions_added": result["abstract_nums"],
+        "parts_added": result["parts"],
+    }
+
+
+def docx_copy_from_session(source_session_id: str, start_id: str, position: str, end_id: str = None) -> str:
+    """
+    Copy an element, or a range of elements, from another open session into the active document.
+
+    Unlike docx_copy_elements_range, the copy is made portable: styles the
+    active document lacks are imported (reusing same-named styles it already
+    has), list numbering is re-created in its numbering part, and images,
+    hyperlinks and other relationships are re-attached. Definitions imported
+    from the same source session are reused on later copies.
+
+    Typical Use Cases:
+        - Assemble a proposal from sections of several boilerplate documents
+        - Pull a formatted table or numbered list from a reference document
+
+    Args:
+        source_session_id (str): Session holding the content to copy.
+        start_id (str): Element ID (in the source session) of the paragraph or
+            table to copy, or of the first element of the range.
+        position (str): Insertion position in the active document
+            (e.g. "after:para_123", "end:document_body").
+        end_id (str, optional): Last element of the range (inclusive); must
+            be a sibling of start_id.
+
+    Returns:
+        str: Markdown with the new element IDs and the number of styles,
+            lists and parts added to the active document.
+    """
+    from docx_mcp_server.server import session_manager
+
+    session, error = get_active_session()
+    if error:
+        return error
+
+    logger.debug(
+        f"docx_copy_from_session called: source={source_session_id}, start_id={start_id}, "
+        f"end_id={end_id}, position={position}"
+    )
+
+    source = session_manager.get_session(source_session_id)
+    if not source:
+        return create_error_response(
+            f"Session {source_session_id} not found or expired", error_type="SessionNotFound"
+        )
+
+    try:
+        start_el = source.get_object(start_id)
+        end_el = source.get_object(end_id) if end_id else start_el
+    except ValueError as e:
+        return create_error_response(str(e), error_type="SpecialIDNotAvailable")
+    if not start_el or not end_el:
+        return create_error_response(
+            f"Element {start_id if not start_el else end_id} not found in session {source_session_id}",
+            error_type="ElementNotFound"
+        )
+
+    engine = CopyEngine()
+    try:
+        elements = engine.get_elements_between(start_el, end_el)
+        resolver = PositionResolver(session)
+        target_parent, ref_element, mode = resolver.resolve(position, default_parent=session.document)
+    except ValueError as e:
+        return create_error_response(str(e), error_type="ValidationError")
+    if not elements:
+        return create_error_response("No paragraphs or tables in the given range", error_type="ValidationError")
+
+    sources = [el._element for el in elements]
+    try:
+        result = session.get_importer().import_elements(source.document, elements, source_key=source_session_id)
+        copies = engine.insert_elements(target_parent, result["elements"], mode, ref_element)
+    except Exception as e:
+        logger.exception(f"docx_copy_from_session failed: {e}")
+        return create_error_response(f"Failed to copy from session: {str(e)}", error_type="CopyError")
+
+    base_meta = MetadataTools.create_copy_metadata(
+        operation_type="session_copy", source_session_id=source_session_id
+    )
+    items = []
+    for source_xml, element in zip(sources, copies):
+        obj = _wrap(element, target_parent)
+        source_id = source.registered_id(source_xml)
+        items.append((
+            obj,
+            "para" if isinstance(obj, Paragraph) else "table",
+            dict(base_meta, source_id=source_id) if source_id else dict(base_meta),
+        ))
+    new_ids = session.register_objects(items)
+    session.update_context(new_ids[-1], action="create")
+    session.cursor.element_id = new_ids[-1]
+    session.cursor.position = "after"
+
+    logger.debug(f"docx_copy_from_session success: copied {len(copies)} elements")
+    return create_markdown_response(
+        session=session,
+        message=f"Copied {len(copies)} elements from session {source_session_id}",
+        element_id=new_ids[-1],
+        operation="Copy From Session",
+        show_context=True,
+        copied_count=len(copies),
+        new_element_ids=", ".join(new_ids),
+        **_import_fields(result)
+    )
+
+
+def docx_insert_document(file_path: str = None, source_session_id: str = None,
+                         position: str = "end:document_body") -> str:
+    """
+    Insert the whole body of another document into the active document.
+
+    The source is a .docx on disk or another open session. Every body
+    paragraph and table is copied in one pass with the same remapping as
+    docx_copy_from_session: missing styles are imported once, list numbering
+    is re-created (identical list definitions are shared), and images and
+    hyperlinks are re-attached. Section properties of the source are not
+    copied; the inserted content takes the layout of the target section.
+
+    Typical Use Cases:
+        - Assemble a proposal from many boilerplate documents, one call each
+        - Append an appendix or terms-and-conditions file
+
+    Args:
+        file_path (str, optional): Path of the .docx to insert.
+        source_session_id (str, optional): Open session to insert instead of a file.
+        position (str): Insertion position in the active document.
+            Defaults to "end:document_body".
+
+    Returns:
+        str: Markdown with the number of inserted elements, the IDs of the
+            first and last of them, and the styles, lists and parts added.
+    """
+    from docx_mcp_server.server import session_manager
+
+    session, error = get_active_session()
+    if error:
+        return error
+
+    logger.debug(
+        f"docx_insert_document called: file_path={file_path}, source_session_id={source_session_id}, "
+        f"position={position}"
+    )
+
+    if bool(file_path) == bool(source_session_id):
+        return create_error_response(
+            "Provide exactly one of file_path or source_session_id", error_type="ValidationError"
+        )
+    source_key: Optional[str] = None
+    if source_session_id:
+        source = session_manager.get_session(source_session_id)
+        if not source:
+            return create_error_response(
+                f"Session {source_session_id} not found or expired", error_type="SessionNotFound"
+            )
+        if source is session:
+            return create_error_response(
+                "Cannot insert a document into itself", error_type="ValidationError"
+            )
+        document = source.document
+        source_key = source_session_id
+    else:
+        try:
+            validate_path_safety(file_path)
+        except ValueError as e:
+            return create_error_response(str(e), error_type="ValidationError")
+        if not os.path.isfile(file_path):
+            return create_error_response(f"File not found: {file_path}", error_type="FileNotFound")
+        try:
+            document = Document(file_path)
+        except Exception as e:
+            return create_error_response(f"Failed to open {file_path}: {str(e)}", error_type="FileNotFound")
+
+    try:
+        resolver = PositionResolver(session)
+        target_parent, ref_element, mode = resolver.resolve(position, default_parent=session.document)
+    except ValueError as e:
+        return create_error_response(str(e), error_type="ValidationError")
+
+    elements = body_elements(document)
+    if not elements:
+        return create_error_response("Source document has no content", error_type="ValidationError")
+
+    try:
+        result = session.get_importer().import_elements(document, elements, source_key=source_key)
+        copies = CopyEngine().insert_elements(target_parent, result["elements"], mode, ref_element)
+    except Exception as e:
+        logger.exception(f"docx_insert_document failed: {e}")
+        return create_error_response(f"Failed to insert document: {str(e)}", error_type="CopyError")
+
+    # Only the ends are registered: enough to position the next insert
+    blocks = [el for el in copies if isinstance(el, (CT_P, CT_Tbl))]
+    ends = {}
+    if blocks:
+        source_field = {"source_file": file_path} if file_path else {"source_session_id": source_session_id}
+        meta = MetadataTools.create_copy_metadata(operation_type="document_insert", **source_field)
+        for label, element in (("first", blocks[0]), ("last", blocks[-1])):
+            obj = _wrap(element, target_parent)
+            prefix = "para" if isinstance(obj, Paragraph) else "table"
+            ends[label] = session.register_object(obj, prefix, metadata=meta)
+        session.update_context(ends["last"], action="create")
+        session.cursor.element_id = ends["last"]
+        session.cursor.position = "after"
+    else:
+        session.mark_dirty()
+
+    logger.debug(f"docx_insert_document success: inserted {len(copies)} elements")
+    return create_markdown_response(
+        session=session,
+        message=f"Inserted {len(copies)} elements from {file_path or source_session_id}",
+        element_id=ends.get("last"),
+        operation="Insert Document",
+        show_context=False,
+        inserted_count=len(copies),
+        first_element_id=ends.get("first", "None"),
+        last_element_id=ends.get("last", "None"),
+        **_import_fields(result)
+    )
+
+
 def register_tools(mcp: FastMCP):
     """Register copy tools"""
     mcp.tool()(docx_get_element_source)
     mcp.tool()(docx_copy_elements_range)
+    mcp.tool()(docx_copy_from_session)
+    mcp.tool()(docx_insert_document)
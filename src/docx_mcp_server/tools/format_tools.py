@@ -7,6 +7,10 @@ from docx.shared import Inches
 from docx_mcp_server.core.properties import set_properties
 from docx_mcp_server.utils.session_helpers import get_active_session
 from docx_mcp_server.core.format_painter import FormatPainter
+from docx_mcp_server.core.compiled_format import compile_format
+from docx_mcp_server.core.element_selector import describe_failures, select_targets
+from docx_mcp_server.core.restyler import Restyler
+from docx_mcp_server.core.template_library import template_library
 from docx_mcp_server.utils.format_template import TemplateManager
 from docx_mcp_server.core.response import (
     create_markdown_response,
@@ -220,8 +224,8 @@ def docx_set_properties(properties: str, element_id: str = None) -> str:
     try:
         set_properties(obj, props_dict)
 
-        # Update context: we accessed/modified this object
-        session.update_context(target_id, action="access")
+        # Update context: we modified this object (its style may have changed)
+        session.update_context(target_id, action="update")
 
         # Update cursor
         session.cursor.element_id = target_id
@@ -338,8 +342,8 @@ def docx_format_copy(source_id: str, target_id: str) -> str:
     try:
         painter.copy_format(source, target)
 
-        # Update context: we modified the target
-        session.update_context(target_id, action="access")
+        # Update context: we modified the target (its style may have changed)
+        session.update_context(target_id, action="update")
 
         # Update cursor
         session.cursor.element_id = target_id
@@ -508,12 +512,13 @@ def docx_extract_format_template(element_id: str) -> str:
         return create_error_response(f"Failed to extract template: {str(e)}", error_type="ExtractionError")
 
 
-def docx_apply_format_template(element_id: str, template_json: str) -> str:
+def docx_apply_format_template(element_id: str, template_json: str = None, template_name: str = None) -> str:
     """
     Apply a format template to an element.
 
-    Applies properties defined in the template JSON to the target element.
-    Ignores properties that don't apply to the target type.
+    Applies properties defined in the template JSON, or in a template saved in
+    the server-side library with docx_save_format_template, to the target
+    element. Ignores properties that don't apply to the target type.
 
     Typical Use Cases:
         - Apply standard styles
@@ -521,7 +526,10 @@ def docx_apply_format_template(element_id: str, template_json: str) -> str:
         - Batch format elements
 
     Args:        element_id (str): Target element ID.
-        template_json (str): JSON string returned by docx_extract_format_template.
+        template_json (str, optional): JSON string returned by docx_extract_format_template.
+        template_name (str, optional): Name of a saved template; applied from its
+            pre-compiled XML without parsing. Exactly one of template_json and
+            template_name is required.
 
     Returns:
         str: JSON response with success message.
@@ -532,7 +540,12 @@ def docx_apply_format_template(element_id: str, template_json: str) -> str:
     session, error = get_active_session()
     if error:
         return error
-    logger.debug(f"docx_apply_format_template called: session_id={session.session_id}, element_id={element_id}, template_len={len(template_json)}")
+    logger.debug(f"docx_apply_format_template called: session_id={session.session_id}, element_id={element_id}, template_name={template_name}")
+
+    if (template_json is None) == (template_name is None):
+        return create_error_response(
+            "Provide exactly one of template_json or template_name", error_type="ValidationError"
+        )
 
     try:
 
@@ -557,11 +570,17 @@ def docx_apply_format_template(element_id: str, template_json: str) -> str:
 
     manager = TemplateManager()
     try:
-        template = manager.from_json(template_json)
-        manager.apply_template(element, template)
-
-        # Update context
-        session.update_context(element_id, action="access")
+        if template_name is not None:
+            template, compiled = template_library.get(template_name)
+            if compiled is not None and compile_format(element) is not None:
+                compiled.apply(element)
+            else:
+                manager.apply_template(element, template)
+        else:
+            manager.apply_template(element, manager.from_json(template_json))
+
+        # Update context: the template may have changed the style
+        session.update_context(element_id, action="update")
 
         # Update cursor
         session.cursor.element_id = element_id
@@ -574,10 +593,356 @@ def docx_apply_format_template(element_id: str, template_json: str) -> str:
             element_id=element_id
         )
     except Exception as e:
+        if isinstance(e, KeyError) and template_name is not None:
+            return create_error_response(str(e.args[0]), error_type="TemplateNotFound")
         logger.exception(f"docx_apply_format_template failed: {e}")
         return create_error_response(f"Failed to apply template: {str(e)}", error_type="ApplicationError")
 
 
+def docx_apply_format_batch(
+    target_ids: str = None,
+    source_id: str = None,
+    template_json: str = None,
+    include_runs: bool = False,
+    start_id: str = None,
+    end_id: str = None,
+    text: str = None,
+    style: str = None,
+    use_regex: bool = False,
+    template_name: str = None
+) -> str:
+    """
+    Apply one format to many elements in a single call.
+
+    The format (taken from source_id, or from a template) is compiled once into
+    Word's own property XML (w:rPr, w:pPr, w:tblPr, w:tcPr) and cloned onto
+    each target. Everything Word stores is carried over, including borders,
+    shading and East Asian fonts.
+
+    Targets are selected by IDs, by a range of sibling elements, and/or by a
+    text/style predicate on paragraphs (see Notes).
+
+    Typical Use Cases:
+        - Restyle every figure caption like a sample caption
+        - Format every cell of a column like a sample cell
+        - Re-apply a stored template across a long document
+
+    Args:
+        target_ids (str, optional): JSON array of element IDs to format.
+        source_id (str, optional): Element to take the format from.
+        template_json (str, optional): Template from docx_extract_format_template.
+        template_name (str, optional): Name of a template saved with
+            docx_save_format_template. Exactly one of source_id, template_json
+            and template_name is required.
+        include_runs (bool): For paragraph formats, also apply the source's
+            first-run formatting to every run of the targets.
+        start_id (str, optional): First element of a range (with end_id).
+        end_id (str, optional): Last element of a range, same parent as start_id.
+        text (str, optional): Only paragraphs containing this text.
+        style (str, optional): Only paragraphs with this paragraph style name.
+        use_regex (bool): Treat text as a regular expression.
+
+    Returns:
+        str: Markdown summary with matched, applied and failed counts.
+
+    Notes:
+        - Without target_ids or a range, text/style search the whole document
+        - With target_ids or a range, text/style filter the paragraphs inside them
+        - Run formats apply to runs, and to every run of paragraphs and cells
+        - Paragraph formats apply to paragraphs and to the paragraphs of cells
+        - Table formats apply to tables; cell formats to cells
+        - Targets of another kind are reported as failed; the rest are applied
+        - Cell spans, widths and merges of the targets are kept
+
+    Examples:
+        >>> docx_apply_format_batch('["cell_2", "cell_3"]', source_id="cell_1")
+        >>> docx_apply_format_batch(source_id="para_7", text=r"^Figure \\d+", use_regex=True)
+    """
+    session, error = get_active_session()
+    if error:
+        return error
+    logger.debug(f"docx_apply_format_batch called: session_id={session.session_id}, source_id={source_id}")
+
+    if sum(arg is not None for arg in (source_id, template_json, template_name)) != 1:
+        return create_error_response(
+            "Provide exactly one of source_id, template_json or template_name", error_type="ValidationError"
+        )
+    targets, error = select_targets(session, target_ids, start_id, end_id, text, style, use_regex)
+    if error:
+        return error
+
+    try:
+        if source_id is not None:
+            source = session.get_object(source_id)
+            if source is None:
+                return create_error_response(f"Source object {source_id} not found", error_type="ElementNotFound")
+            compiled = compile_format(source)
+            if compiled is None:
+                return create_error_response(
+                    f"Cannot take a format from {source_id}", error_type="ValidationError"
+                )
+        elif template_name is not None:
+            try:
+                _, compiled = template_library.get(template_name)
+            except KeyError as e:
+                return create_error_response(str(e.args[0]), error_type="TemplateNotFound")
+            if compiled is None:
+                return create_error_response(
+                    f"Template '{template_name}' has no compiled XML; save it again from an element",
+                    error_type="ValidationError"
+                )
+        else:
+            manager = TemplateManager()
+            compiled = manager.compile(manager.from_json(template_json))
+            if compiled is None:
+                return create_error_response(
+                    "Template has no compiled XML; extract it again with docx_extract_format_template",
+                    error_type="ValidationError"
+                )
+
+        result = compiled.apply_all(targets, include_runs=include_runs)
+    except ValueError as e:
+        return create_error_response(str(e), error_type="ValidationError")
+    except Exception as e:
+        logger.exception(f"docx_apply_format_batch failed: {e}")
+        return create_error_response(f"Failed to apply format: {str(e)}", error_type="ApplicationError")
+
+    if result["applied"]:
+        session.mark_dirty()
+    failed = [
+        f"{session.registered_id(targets[index]._element) or f'#{index}'}: {message}"
+        for index, message in result["failed"]
+    ]
+    logger.debug(f"docx_apply_format_batch success: {result['applied']} applied, {len(failed)} failed")
+    return create_markdown_response(
+        session=session,
+        message=f"Applied {compiled.kind} format to {result['applied']} of {len(targets)} elements",
+        operation="Apply Format Batch",
+        show_context=False,
+        format_kind=compiled.kind,
+        matched_count=len(targets),
+        applied_count=result["applied"],
+        failed_count=len(failed),
+        failed=describe_failures(failed)
+    )
+
+
+def docx_save_format_template(
+    name: str,
+    element_id: str = None,
+    template_json: str = None,
+    overwrite: bool = True
+) -> str:
+    """
+    Save a named format template in the server-side template library.
+
+    The template is compiled into XML fragments once; later applications by
+    name (docx_apply_format_template / docx_apply_format_batch with
+    template_name) clone the fragments without shipping or parsing JSON.
+    The library is kept in memory and, when the DOCX_MCP_TEMPLATE_LIBRARY
+    environment variable names a JSON file, persisted there.
+
+    Typical Use Cases:
+        - Define house styles once ("house-caption", "warning-cell")
+        - Share formats between sessions and documents
+
+    Args:
+        name (str): Template name.
+        element_id (str, optional): Element to extract the template from.
+        template_json (str, optional): Template from docx_extract_format_template.
+            Exactly one of element_id and template_json is required.
+        overwrite (bool): Replace an existing template of the same name.
+
+    Returns:
+        str: Markdown response with the template name and kind.
+
+    Examples:
+        >>> docx_save_format_template("house-caption", element_id="para_12")
+        >>> docx_apply_format_batch(template_name="house-caption", style="Caption")
+    """
+    logger.debug(f"docx_save_format_template called: name={name}, element_id={element_id}")
+
+    if (element_id is None) == (template_json is None):
+        return create_error_response(
+            "Provide exactly one of element_id or template_json", error_type="ValidationError"
+        )
+
+    manager = TemplateManager()
+    session = None
+    try:
+        if element_id is not None:
+            session, error = get_active_session()
+            if error:
+                return error
+            element = session.get_object(element_id)
+            if element is None:
+                return create_error_response(f"Element {element_id} not found", error_type="ElementNotFound")
+            template = manager.extract_template(element)
+        else:
+            template = manager.from_json(template_json)
+        replaced = template_library.save(name, template, overwrite=overwrite)
+    except (ValueError, TypeError) as e:
+        return create_error_response(f"Failed to save template: {str(e)}", error_type="ValidationError")
+    except OSError as e:
+        logger.exception(f"docx_save_format_template failed: {e}")
+        return create_error_response(f"Failed to write template library: {str(e)}", error_type="FileError")
+
+    logger.debug(f"docx_save_format_template success: {name}")
+    return create_markdown_response(
+        session=session,
+        message=f"Template '{name.strip()}' {'replaced' if replaced else 'saved'}",
+        operation="Save Format Template",
+        show_context=False,
+        template_name=name.strip(),
+        element_type=template.element_type,
+        compiled=bool(template.xml),
+        library_file=template_library.path or "None (memory only)"
+    )
+
+
+def docx_list_format_templates() -> str:
+    """
+    List the templates saved in the server-side template library.
+
+    Returns:
+        str: Markdown response with one line per template (name, element type
+        and compiled XML fragments).
+    """
+    try:
+        entries = template_library.list()
+    except ValueError as e:
+        return create_error_response(str(e), error_type="FileError")
+
+    md_lines = ["# Format Templates\n"]
+    md_lines.append(f"**Template Count**: {len(entries)}")
+    md_lines.append(f"**Library File**: {template_library.path or 'None (memory only)'}")
+    if entries:
+        md_lines.append("\n## Templates\n")
+        for entry in entries:
+            md_lines.append(f"- **{entry['name']}**: {entry['element_type']} ({entry['fragments']})")
+    return "\n".join(md_lines)
+
+
+def docx_delete_format_template(name: str) -> str:
+    """
+    Delete a template from the server-side template library.
+
+    Args:
+        name (str): Template name.
+
+    Returns:
+        str: Markdown response confirming the deletion.
+    """
+    try:
+        template_library.delete(name)
+    except KeyError as e:
+        return create_error_response(str(e.args[0]), error_type="TemplateNotFound")
+    except (ValueError, OSError) as e:
+        return create_error_response(f"Failed to update template library: {str(e)}", error_type="FileError")
+
+    return create_markdown_response(
+        session=None,
+        message=f"Template '{name}' deleted",
+        operation="Delete Format Template",
+        show_context=False,
+        template_name=name
+    )
+
+
+def docx_restyle(
+    style: str,
+    current_style: str = None,
+    text: str = None,
+    use_regex: bool = False,
+    in_table: bool = None,
+    heading_level: int = None,
+    scope_id: str = None
+) -> str:
+    """
+    Assign a style to every element matching a predicate, in one pass.
+
+    The kind of element restyled follows the type of the new style: paragraph
+    styles restyle paragraphs, character styles restyle runs, table styles
+    restyle tables. Style names are resolved once per call and the document
+    is walked once.
+
+    Typical Use Cases:
+        - Migrate legacy documents to a house style
+        - Turn every "Old Caption" paragraph into "Caption"
+        - Give every table the same table style
+
+    Args:
+        style (str): Name of the style to assign.
+        current_style (str, optional): Only elements that currently have this
+            style (same style type as style).
+        text (str, optional): Only elements whose text contains this (the run
+            text for character styles, the cell text for table styles).
+        use_regex (bool): Treat text as a regular expression.
+        in_table (bool, optional): True: only elements inside tables; False:
+            only elements outside tables. For table styles this selects nested
+            or top-level tables.
+        heading_level (int, optional): Only paragraphs (or runs of paragraphs)
+            at this heading/outline level (1-9).
+        scope_id (str, optional): Only restyle inside this element (e.g. a table).
+
+    Returns:
+        str: Markdown summary with matched and changed counts.
+
+    Examples:
+        >>> docx_restyle("Caption", current_style="Legacy Caption")
+        >>> docx_restyle("Heading 2", heading_level=3)
+        >>> docx_restyle("Strong", text=r"^WARNING", use_regex=True)
+        >>> docx_restyle("Table Grid", in_table=False)
+    """
+    session, error = get_active_session()
+    if error:
+        return error
+    logger.debug(f"docx_restyle called: session_id={session.session_id}, style={style}, current_style={current_style}")
+
+    if heading_level is not None and not 1 <= heading_level <= 9:
+        return create_error_response("heading_level must be between 1 and 9", error_type="ValidationError")
+
+    scope = None
+    if scope_id is not None:
+        scope_obj = session.get_object(scope_id)
+        if scope_obj is None:
+            return create_error_response(f"Element {scope_id} not found", error_type="ElementNotFound")
+        scope = getattr(scope_obj, "_element", None)
+        if scope is None:
+            return create_error_response(f"Element {scope_id} cannot be used as a scope", error_type="ValidationError")
+
+    try:
+        result = Restyler(session.document).restyle(
+            style,
+            current_style=current_style,
+            text=text,
+            use_regex=use_regex,
+            in_table=in_table,
+            heading_level=heading_level,
+            scope=scope,
+            on_change=lambda el: session.note_block_change(el, "restyle")
+        )
+    except ValueError as e:
+        return create_error_response(str(e), error_type="ValidationError")
+    except Exception as e:
+        logger.exception(f"docx_restyle failed: {e}")
+        return create_error_response(f"Failed to restyle: {str(e)}", error_type="UpdateError")
+
+    if result["changed"]:
+        session.mark_dirty()
+    logger.debug(f"docx_restyle success: {result}")
+    return create_markdown_response(
+        session=session,
+        message=f"Restyled {result['changed']} of {result['matched']} matching elements to '{style}'",
+        operation="Restyle",
+        show_context=False,
+        style_id=result["style_id"],
+        style_type=result["style_type"],
+        matched_count=result["matched"],
+        changed_count=result["changed"]
+    )
+
+
 def register_tools(mcp: FastMCP):
     """Register formatting and styling tools"""
     mcp.tool()(docx_set_alignment)
@@ -586,3 +951,8 @@ def register_tools(mcp: FastMCP):
     mcp.tool()(docx_set_margins)
     mcp.tool()(docx_extract_format_template)
     mcp.tool()(docx_apply_format_template)
+    mcp.tool()(docx_apply_format_batch)
+    mcp.tool()(docx_save_format_template)
+    mcp.tool()(docx_list_format_templates)
+    mcp.tool()(docx_delete_format_template)
+    mcp.tool()(docx_restyle)
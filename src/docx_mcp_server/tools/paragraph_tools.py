@@ -516,7 +516,9 @@ def docx_delete(element_id: str = None) -> str:
     try:
         if hasattr(obj, "_element") and obj._element.getparent() is not None:
             parent = obj._element.getparent()
+            session.note_block_change(obj, "remove")
             parent.remove(obj._element)
+            session.mark_dirty()
 
             # Remove from registry
             if element_id in session.object_registry:
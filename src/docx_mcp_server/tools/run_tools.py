@@ -1,7 +1,10 @@
 """Text run (formatting) tools"""
 import logging
 from mcp.server.fastmcp import FastMCP
+from docx.oxml.ns import qn
 from docx.shared import Pt, RGBColor
+from docx_mcp_server.core.compiled_format import RunPropertiesPatch
+from docx_mcp_server.core.element_selector import select_targets
 from docx_mcp_server.core.response import (
     create_markdown_response,
     create_error_response
@@ -11,6 +14,31 @@ from docx_mcp_server.core.xml_util import ElementManipulator
 
 logger = logging.getLogger(__name__)
 
+_R = qn("w:r")
+
+
+def apply_font(targets, size: float = None, bold: bool = None, italic: bool = None,
+               rgb: RGBColor = None) -> int:
+    """Set font properties on every run of the given elements, directly.
+
+    Runs are formatted themselves; paragraphs, cells and tables have every
+    run they contain (hyperlinks included) formatted. The change is built
+    once as a RunPropertiesPatch and merged into each run; nothing is
+    registered and no response is rendered, so composite tools can format
+    whole ranges in one pass.
+
+    Returns:
+        int: Number of runs formatted
+    """
+    patch = RunPropertiesPatch.from_font(size=size, bold=bold, italic=italic, rgb=rgb)
+    run_count = 0
+    for target in targets:
+        el = target._element
+        for r in ([el] if el.tag == _R else el.iter(_R)):
+            patch.apply(r)
+            run_count += 1
+    return run_count
+
 
 def docx_insert_run(text: str, position: str) -> str:
     """
@@ -335,8 +363,91 @@ def docx_set_font(
         return create_error_response(f"Failed to update font: {str(e)}", error_type="UpdateError")
 
 
+def docx_set_font_batch(
+    target_ids: str = None,
+    start_id: str = None,
+    end_id: str = None,
+    text: str = None,
+    style: str = None,
+    use_regex: bool = False,
+    size: float = None,
+    bold: bool = None,
+    italic: bool = None,
+    color_hex: str = None
+) -> str:
+    """
+    Set font properties on many runs in a single call.
+
+    Bulk variant of docx_set_font. Targets are selected like in
+    docx_apply_format_batch; runs are formatted directly, paragraphs, cells
+    and tables have every run they contain formatted.
+
+    Typical Use Cases:
+        - Make every caption italic
+        - Recolor all paragraphs of a style or between two headings
+
+    Args:
+        target_ids (str, optional): JSON array of element IDs.
+        start_id (str, optional): First element of a range (with end_id).
+        end_id (str, optional): Last element of a range, same parent as start_id.
+        text (str, optional): Only paragraphs containing this text.
+        style (str, optional): Only paragraphs with this paragraph style name.
+        use_regex (bool): Treat text as a regular expression.
+        size (float, optional): Font size in points.
+        bold (bool, optional): True to make bold, False to remove bold.
+        italic (bool, optional): True to make italic, False to remove italic.
+        color_hex (str, optional): Hex color code without '#' (RRGGBB).
+
+    Returns:
+        str: Markdown summary with matched element and formatted run counts.
+
+    Examples:
+        >>> docx_set_font_batch(style="Caption", italic=True, color_hex="555555")
+        >>> docx_set_font_batch(start_id="para_3", end_id="para_40", size=11)
+    """
+    from docx_mcp_server.utils.session_helpers import get_active_session
+
+    session, error = get_active_session()
+    if error:
+        return error
+
+    logger.debug(f"docx_set_font_batch called: size={size}, bold={bold}, italic={italic}, color_hex={color_hex}")
+
+    if size is None and bold is None and italic is None and not color_hex:
+        return create_error_response("No font properties given", error_type="ValidationError")
+    rgb = None
+    if color_hex:
+        try:
+            rgb = RGBColor.from_string(color_hex)
+        except ValueError:
+            return create_error_response(f"Invalid hex color: {color_hex}", error_type="ValidationError")
+
+    targets, error = select_targets(session, target_ids, start_id, end_id, text, style, use_regex)
+    if error:
+        return error
+
+    try:
+        run_count = apply_font(targets, size=size, bold=bold, italic=italic, rgb=rgb)
+    except Exception as e:
+        logger.exception(f"docx_set_font_batch failed: {e}")
+        return create_error_response(f"Failed to update font: {str(e)}", error_type="UpdateError")
+
+    if run_count:
+        session.mark_dirty()
+    logger.debug(f"docx_set_font_batch success: {len(targets)} elements, {run_count} runs")
+    return create_markdown_response(
+        session=session,
+        message=f"Font updated on {run_count} runs in {len(targets)} elements",
+        operation="Set Font Batch",
+        show_context=False,
+        matched_count=len(targets),
+        run_count=run_count
+    )
+
+
 def register_tools(mcp: FastMCP):
     """Register text run (formatting) tools"""
     mcp.tool()(docx_insert_run)
     mcp.tool()(docx_update_run_text)
     mcp.tool()(docx_set_font)
+    mcp.tool()(docx_set_font_batch)
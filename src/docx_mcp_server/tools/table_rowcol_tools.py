@@ -1,4 +1,5 @@
 """Table row and column manipulation tools"""
+import json
 import logging
 from mcp.server.fastmcp import FastMCP
 from docx.table import Table
@@ -14,6 +15,21 @@ from docx_mcp_server.utils.session_helpers import get_active_session
 logger = logging.getLogger(__name__)
 
 
+def _parse_index_list(value: str, name: str) -> list:
+    """Parse a JSON array of integer indexes.
+
+    Raises:
+        ValueError: If ``value`` is not a JSON array of integers.
+    """
+    try:
+        indexes = json.loads(value)
+    except json.JSONDecodeError:
+        raise ValueError(f"{name} must be a JSON array of integers")
+    if not isinstance(indexes, list) or not all(isinstance(i, int) and not isinstance(i, bool) for i in indexes):
+        raise ValueError(f"{name} must be a JSON array of integers")
+    return indexes
+
+
 def docx_insert_row_at(
         table_id: str,
     position: str,
@@ -105,8 +121,11 @@ def docx_insert_row_at(
                     error_type="ValidationError"
                 )
 
-        # Insert the row
+        # Insert the row, then shift the registered cells below it
+        remap = RegistryCleaner.plan_structural_change(session, table, "insert_row", insert_index)
         new_row = ElementManipulator.insert_row_at(table, insert_index, copy_format_from=copy_format_from)
+        session.invalidate_table_grid(table)
+        RegistryCleaner.apply_structural_change(session, remap)
 
         # Update context
         session.update_context(table_id, action="modify")
@@ -148,7 +167,9 @@ def docx_insert_col_at(
         table_id: str,
     position: str,
     col_index: int = None,
-    copy_format: bool = False
+    copy_format: bool = False,
+    count: int = 1,
+    col_indices: str = None
 ) -> str:
     """
     Insert a new column at a specific position in a table.
@@ -165,6 +186,11 @@ def docx_insert_col_at(
             - "end:table_id" - Insert at table end
         col_index (int, optional): Direct column index (alternative to position).
         copy_format (bool): If True, copy formatting from adjacent column (default: False).
+        count (int): Number of columns to insert at the position (default: 1).
+        col_indices (str, optional): JSON array of insertion points in the
+            current table, e.g. "[0, 3, 3]" inserts one column before column 0
+            and two before column 3; position is then ignored. All columns are
+            inserted in a single pass.
 
     Returns:
         str: JSON response with table_id, new_col_count, inserted_at, and cursor info.
@@ -206,7 +232,12 @@ def docx_insert_col_at(
         insert_index = None
         copy_format_from = None
 
-        if col_index is not None:
+        if col_indices is not None:
+            indexes = _parse_index_list(col_indices, "col_indices")
+            if copy_format:
+                # Each new column copies the column before it (after it at index 0)
+                copy_format_from = [max(index - 1, 0) for index in indexes]
+        elif col_index is not None:
             # Direct index provided
             insert_index = col_index
         else:
@@ -235,8 +266,22 @@ def docx_insert_col_at(
                     error_type="ValidationError"
                 )
 
-        # Insert the column
-        new_col_count = ElementManipulator.insert_col_at(table, insert_index, copy_format_from=copy_format_from)
+        if col_indices is None and count != 1:
+            if count < 1:
+                return create_error_response("count must be >= 1", error_type="ValidationError")
+            indexes = [insert_index] * count
+
+        if col_indices is not None or count != 1:
+            # All columns in one pass, registered cells remapped once
+            remap = RegistryCleaner.plan_structural_change(session, table, "insert_cols", indexes)
+            new_col_count = ElementManipulator.insert_cols(table, indexes, copy_format_from=copy_format_from)
+            insert_index = sorted(indexes)
+        else:
+            # Insert the column, then shift the registered cells right of it
+            remap = RegistryCleaner.plan_structural_change(session, table, "insert_col", insert_index)
+            new_col_count = ElementManipulator.insert_col_at(table, insert_index, copy_format_from=copy_format_from)
+        session.invalidate_table_grid(table)
+        RegistryCleaner.apply_structural_change(session, remap)
 
         # Update context
         session.update_context(table_id, action="modify")
@@ -246,7 +291,7 @@ def docx_insert_col_at(
         # Build response
         return create_context_aware_response(
             session,
-            message=f"Column inserted at position {insert_index}",
+            message=f"Column(s) inserted at position {insert_index}",
             element_id=table_id,
             table_id=table_id,
             new_col_count=new_col_count,
@@ -351,14 +396,16 @@ def docx_delete_row(
                 error_type="ValidationError"
             )
 
-        # Find invalidated cell IDs before deletion
-        invalidated_ids = RegistryCleaner.find_invalidated_ids(session, table, row_index=delete_index)
+        # Find invalidated cell IDs (and the moves of the others) before deletion
+        remap = RegistryCleaner.plan_structural_change(session, table, "delete_row", delete_index)
+        invalidated_ids = remap.removed
 
         # Delete the row
         ElementManipulator.delete_row(table, delete_index)
+        session.invalidate_table_grid(table)
 
         # Clean up invalidated IDs
-        RegistryCleaner.invalidate_ids(session, invalidated_ids)
+        RegistryCleaner.apply_structural_change(session, remap)
 
         # Update context
         session.update_context(table_id, action="modify")
@@ -399,7 +446,8 @@ def docx_delete_row(
 def docx_delete_col(
         table_id: str,
     col_index: int = None,
-    col_id: str = None
+    col_id: str = None,
+    col_indices: str = None
 ) -> str:
     """
     Delete a column from a table.
@@ -412,6 +460,9 @@ def docx_delete_col(
         table_id (str): Table element_id (e.g., "table_abc123").
         col_index (int, optional): Column index to delete (0-based).
         col_id (str, optional): Column element_id to delete (alternative to col_index).
+        col_indices (str, optional): JSON array of column indexes (in the
+            current table) to delete in a single pass, e.g. "[1, 4, 5]".
+            Merged cells spanning a deleted column are narrowed.
 
     Returns:
         str: JSON response with table_id, new_col_count, deleted_index,
@@ -458,7 +509,9 @@ def docx_delete_col(
         # Determine deletion index
         delete_index = None
 
-        if col_index is not None:
+        if col_indices is not None:
+            delete_index = _parse_index_list(col_indices, "col_indices")
+        elif col_index is not None:
             delete_index = col_index
         elif col_id is not None:
             # Find the column by element_id (not commonly used, but supported)
@@ -473,14 +526,18 @@ def docx_delete_col(
                 error_type="ValidationError"
             )
 
-        # Find invalidated cell IDs before deletion
-        invalidated_ids = RegistryCleaner.find_invalidated_ids(session, table, col_index=delete_index)
-
-        # Delete the column
-        new_col_count = ElementManipulator.delete_col(table, delete_index)
+        # Find invalidated cell IDs (and the moves of the others) before deletion
+        if col_indices is not None:
+            remap = RegistryCleaner.plan_structural_change(session, table, "delete_cols", delete_index)
+            new_col_count = ElementManipulator.delete_cols(table, delete_index)
+        else:
+            remap = RegistryCleaner.plan_structural_change(session, table, "delete_col", delete_index)
+            new_col_count = ElementManipulator.delete_col(table, delete_index)
+        invalidated_ids = remap.removed
+        session.invalidate_table_grid(table)
 
         # Clean up invalidated IDs
-        RegistryCleaner.invalidate_ids(session, invalidated_ids)
+        RegistryCleaner.apply_structural_change(session, remap)
 
         # Update context
         session.update_context(table_id, action="modify")
@@ -490,7 +547,7 @@ def docx_delete_col(
         # Build response
         return create_context_aware_response(
             session,
-            message=f"Column deleted at index {delete_index}",
+            message=f"Column(s) deleted at index {delete_index}",
             element_id=table_id,
             table_id=table_id,
             new_col_count=new_col_count,
@@ -518,9 +575,185 @@ def docx_delete_col(
         )
 
 
+def _row_operation(table_id: str, operation: str, run) -> str:
+    """Run a sort/filter/dedupe on a table and keep the cell registry in step.
+
+    ``run(table, grid)`` performs the edit and returns a result dict with
+    the row ``mapping`` and the ``moved`` (and, for filter and dedupe,
+    ``removed``) data row counts; the keys other than ``mapping`` are passed
+    to the response.
+    """
+    session, error = get_active_session()
+    if error:
+        return error
+    logger.debug(f"docx_table_{operation} called: session_id={session.session_id}, table_id={table_id}")
+
+    table = session.get_object(table_id)
+    if not table:
+        return create_error_response(f"Table {table_id} not found", error_type="ElementNotFound")
+    if not isinstance(table, Table):
+        return create_error_response(f"Element {table_id} is not a table", error_type="InvalidElementType")
+
+    try:
+        result = run(table, session.get_table_grid(table))
+    except json.JSONDecodeError as e:
+        return create_error_response(f"Invalid JSON: {e.msg}", error_type="JSONDecodeError")
+    except ValueError as e:
+        return create_error_response(str(e), error_type="ValidationError")
+    except Exception as e:
+        logger.exception(f"docx_table_{operation} failed: {e}")
+        return create_error_response(f"Failed to {operation} table rows: {str(e)}", error_type="UpdateError")
+
+    mapping = result.pop("mapping")
+    session.invalidate_table_grid(table)
+    remap = RegistryCleaner.plan_row_mapping(session, table, mapping)
+    RegistryCleaner.apply_structural_change(session, remap)
+
+    session.update_context(table_id, action="update")
+    session.cursor.element_id = table_id
+    session.cursor.position = "inside_end"
+
+    summary = f"{result['moved']} rows moved"
+    if "removed" in result:
+        summary = f"{result['removed']} rows removed, {summary}"
+    return create_context_aware_response(
+        session,
+        message=f"Table rows {operation}: {summary}",
+        element_id=table_id,
+        table_id=table_id,
+        new_row_count=len(table.rows),
+        invalidated_ids=remap.removed,
+        **result
+    )
+
+
+def docx_table_sort(
+    table_id: str,
+    keys: str,
+    header_rows: int = 1,
+    footer_rows: int = 0
+) -> str:
+    """
+    Sort table rows in place by one or more columns.
+
+    Rows are reordered by moving whole rows, so cell formatting is kept.
+    Rows joined by a vertical merge move together, keyed by their first row.
+    Registered cell IDs follow their rows.
+
+    Args:
+        table_id (str): Table element_id (e.g., "table_abc123").
+        keys (str): JSON array of sort keys, first key first:
+            '[{"column": "Amount", "descending": true}, {"column": 0}]'.
+            Each key may set "numeric" (true/false/"auto", default "auto":
+            numeric when every non-empty cell is a number) and
+            "case_sensitive". Column names refer to the last header row;
+            empty cells sort last.
+        header_rows (int): Leading rows kept in place. Defaults to 1.
+        footer_rows (int): Trailing rows kept in place (e.g. totals).
+
+    Returns:
+        str: Markdown response with rows, moved, new_row_count and cursor info.
+
+    Example:
+        >>> docx_table_sort("table_123", '[{"column": "Price", "descending": true}]')
+    """
+    from docx_mcp_server.core.table_reorder import sort_rows
+
+    def run(table, grid):
+        sort_keys = json.loads(keys)
+        if not isinstance(sort_keys, list):
+            raise ValueError("keys must be a JSON array")
+        return sort_rows(table, sort_keys, header_rows=header_rows, footer_rows=footer_rows, grid=grid)
+
+    return _row_operation(table_id, "sort", run)
+
+
+def docx_table_filter(
+    table_id: str,
+    conditions: str,
+    match: str = "all",
+    keep_matching: bool = True,
+    header_rows: int = 1,
+    footer_rows: int = 0
+) -> str:
+    """
+    Remove table rows by column conditions.
+
+    Args:
+        table_id (str): Table element_id (e.g., "table_abc123").
+        conditions (str): JSON array of conditions, e.g.
+            '[{"column": "Status", "op": "eq", "value": "Open"},
+              {"column": "Amount", "op": "gt", "value": 1000}]'.
+            Ops: eq, ne, contains, not_contains, starts_with, ends_with,
+            gt, ge, lt, le (numeric), empty, not_empty, regex. Text
+            comparisons ignore case unless "case_sensitive": true.
+        match (str): "all" (every condition holds) or "any".
+        keep_matching (bool): Keep matching rows (True) or remove them.
+        header_rows (int): Leading rows never removed. Defaults to 1.
+        footer_rows (int): Trailing rows never removed.
+
+    Returns:
+        str: Markdown response with rows_before, rows_after, removed, moved,
+             invalidated_ids and cursor info.
+    """
+    from docx_mcp_server.core.table_reorder import filter_rows
+
+    def run(table, grid):
+        parsed = json.loads(conditions)
+        if not isinstance(parsed, list):
+            raise ValueError("conditions must be a JSON array")
+        return filter_rows(
+            table, parsed, match=match, keep_matching=keep_matching,
+            header_rows=header_rows, footer_rows=footer_rows, grid=grid
+        )
+
+    return _row_operation(table_id, "filter", run)
+
+
+def docx_table_dedupe(
+    table_id: str,
+    columns: str = None,
+    keep: str = "first",
+    case_sensitive: bool = False,
+    header_rows: int = 1,
+    footer_rows: int = 0
+) -> str:
+    """
+    Remove table rows that duplicate another row on the key columns.
+
+    Args:
+        table_id (str): Table element_id (e.g., "table_abc123").
+        columns (str, optional): JSON array of key columns by name or index.
+            Defaults to all columns.
+        keep (str): Keep the "first" or "last" occurrence.
+        case_sensitive (bool): Compare keys case-sensitively.
+        header_rows (int): Leading rows never removed. Defaults to 1.
+        footer_rows (int): Trailing rows never removed.
+
+    Returns:
+        str: Markdown response with rows_before, rows_after, removed, moved,
+             invalidated_ids and cursor info.
+    """
+    from docx_mcp_server.core.table_reorder import dedupe_rows
+
+    def run(table, grid):
+        key_columns = json.loads(columns) if columns else None
+        if key_columns is not None and not isinstance(key_columns, list):
+            raise ValueError("columns must be a JSON array")
+        return dedupe_rows(
+            table, key_columns, keep=keep, case_sensitive=case_sensitive,
+            header_rows=header_rows, footer_rows=footer_rows, grid=grid
+        )
+
+    return _row_operation(table_id, "dedupe", run)
+
+
 def register_tools(mcp: FastMCP):
     """Register table row/column tools with the MCP server."""
     mcp.tool()(docx_insert_row_at)
     mcp.tool()(docx_insert_col_at)
     mcp.tool()(docx_delete_row)
     mcp.tool()(docx_delete_col)
+    mcp.tool()(docx_table_sort)
+    mcp.tool()(docx_table_filter)
+    mcp.tool()(docx_table_dedupe)
@@ -1,14 +1,17 @@
 """Table manipulation tools"""
 import json
 import logging
+import os
 from mcp.server.fastmcp import FastMCP
 from docx.shared import Inches
 from docx.table import _Cell, Table
+from docx_mcp_server.core import text_extractor
 from docx_mcp_server.core.finder import Finder
+from docx_mcp_server.core.registry_cleaner import RegistryCleaner
 from docx_mcp_server.utils.copy_engine import CopyEngine
-from docx_mcp_server.core.format_painter import FormatPainter
 from docx_mcp_server.utils.metadata_tools import MetadataTools
 from docx_mcp_server.core.table_analyzer import TableStructureAnalyzer
+from docx_mcp_server.core.table_fill import fill_table
 from docx_mcp_server.utils.session_helpers import get_active_session
 from docx_mcp_server.core.response import (
     create_markdown_response,
@@ -306,8 +309,11 @@ def docx_get_cell(table_id: str, row: int, col: int) -> str:
     if not table:
         return create_error_response(f"Table {table_id} not found", error_type="ElementNotFound")
 
+    if not isinstance(table, Table):
+        return create_error_response(f"Object {table_id} is not a table", error_type="InvalidElementType")
+
     try:
-        cell = table.cell(row, col)
+        cell = session.get_table_grid(table).cell(row, col, table)
         c_id = session.register_object(cell, "cell")
 
         session.update_context(c_id, action="access")
@@ -428,10 +434,13 @@ def docx_insert_table_row(position: str) -> str:
     try:
         row = table.add_row()
         if mode == "start":
+            remap = RegistryCleaner.plan_structural_change(session, table, "insert_row", 0)
             table._tbl.remove(row._tr)
             table._tbl.insert(0, row._tr)
+            RegistryCleaner.apply_structural_change(session, remap)
         elif mode not in ["append"]:
             return create_error_response("Table row insertion only supports inside/end/start on a table", error_type="ValidationError")
+        session.invalidate_table_grid(table)
         session.update_context(table_id, action="access")
 
         # We don't have an ID for the Row object usually, we focus on the table or cells.
@@ -487,6 +496,7 @@ def docx_insert_table_col(position: str) -> str:
             return create_error_response("Table column insertion only supports inside/end on a table", error_type="ValidationError")
 
         table.add_column(width=Inches(1.0))
+        session.invalidate_table_grid(table)
         session.update_context(table_id, action="access")
 
         builder = ContextBuilder(session)
@@ -503,40 +513,6 @@ def docx_insert_table_col(position: str) -> str:
         logger.exception(f"docx_insert_table_col failed: {e}")
         return create_error_response(f"Failed to add column: {str(e)}", error_type="ModificationError")
 
-def _set_cell_text(cell, text: str, preserve_formatting: bool, painter: FormatPainter) -> None:
-    """Set cell text, optionally preserving existing run formatting."""
-    safe_text = "" if text is None else str(text)
-
-    if not preserve_formatting:
-        cell.text = safe_text
-        return
-
-    # Ensure there is at least one paragraph
-    paragraph = cell.paragraphs[0] if cell.paragraphs else cell.add_paragraph("")
-
-    # Choose a source run to copy format from (prefer first run with text)
-    source_run = None
-    for run in paragraph.runs:
-        if run.text:
-            source_run = run
-            break
-    if source_run is None and paragraph.runs:
-        source_run = paragraph.runs[0]
-
-    # Clear existing runs to avoid leftover text
-    for run in list(paragraph.runs):
-        r_el = run._element
-        r_el.getparent().remove(r_el)
-
-    new_run = paragraph.add_run(safe_text)
-
-    if source_run:
-        painter.copy_format(source_run, new_run)
-    elif paragraph.style and hasattr(paragraph.style, "font"):
-        # Fallback: copy paragraph style font to the run
-        painter.copy_format(paragraph, new_run)
-
-
 def docx_fill_table(
     data: str,
     table_id: str = None,
@@ -581,52 +557,24 @@ def docx_fill_table(
 
     try:
          # Detect irregular structure
-         structure_info = TableStructureAnalyzer.detect_irregular_structure(table)
+         grid = session.get_table_grid(table)
+         structure_info = TableStructureAnalyzer.detect_irregular_structure(table, grid=grid)
          is_irregular = structure_info["is_irregular"]
 
-         current_row_idx = start_row
-         painter = FormatPainter()
-         skipped_regions = []
-         filled_range = {"start_row": start_row, "start_col": 0, "end_row": start_row, "end_col": 0}
-
-         for row_data in rows_data:
-             if current_row_idx >= len(table.rows):
-                 table.add_row()
-
-             row = table.rows[current_row_idx]
-
-             for col_idx, cell_value in enumerate(row_data):
-                 if col_idx < len(row.cells):
-                     # Check if cell is fillable (for irregular tables only)
-                     is_fillable = True
-                     if is_irregular:
-                         # Re-check fillability for this specific cell
-                         cell = row.cells[col_idx]
-                         try:
-                             tc_pr = cell._element.tcPr
-                             if tc_pr is not None and tc_pr.gridSpan is not None:
-                                 grid_span = tc_pr.gridSpan.val
-                                 if grid_span > 1:
-                                     is_fillable = False
-                         except:
-                             pass
-
-                     if is_fillable:
-                         cell = row.cells[col_idx]
-                         _set_cell_text(cell, cell_value, preserve_formatting, painter)
-                         filled_range["end_row"] = current_row_idx
-                         filled_range["end_col"] = max(filled_range["end_col"], col_idx)
-                     else:
-                         # Skip irregular cell
-                         skipped_regions.append({
-                             "row": current_row_idx,
-                             "col": col_idx,
-                             "reason": "irregular_cell"
-                         })
-
-             current_row_idx += 1
-
-         session.update_context(table_id, action="access")
+         result = fill_table(
+             table,
+             rows_data,
+             start_row=start_row,
+             preserve_formatting=preserve_formatting,
+             skip_spanned=is_irregular,
+             grid=grid,
+         )
+         if start_row + len(rows_data) > grid.row_count:
+             session.invalidate_table_grid(table)
+         filled_range = result["filled_range"]
+         skipped_regions = result["skipped_regions"]
+
+         session.update_context(table_id, action="update")
 
          builder = ContextBuilder(session)
          data = builder.build_response_data(table, table_id)
@@ -646,6 +594,575 @@ def docx_fill_table(
          logger.exception(f"docx_fill_table failed: {e}")
          return create_error_response(f"Failed to fill table: {str(e)}", error_type="FillError")
 
+def docx_fill_table_from_file(
+    file_path: str,
+    table_id: str = None,
+    file_format: str = None,
+    has_header: bool = True,
+    write_header: bool = False,
+    columns: str = None,
+    start_row: int = None,
+    template_row: int = None,
+    number_format: str = None,
+    delimiter: str = None,
+    encoding: str = "utf-8",
+    preserve_formatting: bool = True
+) -> str:
+    """
+    Stream rows from a local CSV/TSV/JSON-lines file into a table.
+
+    Unlike docx_fill_table, the data never passes through the tool call:
+    the file is read record by record and written straight into the table,
+    so datasets of any size can be imported.
+
+    Typical Use Cases:
+        - Fill a report table from a CSV export
+        - Append thousands of rows that would exceed the message size limit
+
+    Args:
+        file_path (str): Local .csv, .tsv or .jsonl file.
+        table_id (str, optional): Target table. Defaults to last accessed table.
+        file_format (str, optional): "csv", "tsv" or "jsonl". Detected from
+            the extension when omitted.
+        has_header (bool): First CSV/TSV record (or JSON-lines array) is a
+            header. JSON-lines objects always use the keys of the first
+            object. Defaults to True.
+        write_header (bool): Also write the header as a table row.
+        columns (str, optional): JSON array choosing source columns in table
+            column order, by header name or 0-based index
+            (e.g. '["Name", "Total"]' or '[0, 3]').
+        start_row (int, optional): First table row to overwrite. Defaults to
+            appending after the last row.
+        template_row (int, optional): Row whose formatting (cell properties,
+            paragraph and font) appended rows copy. Defaults to the last row.
+        number_format (str, optional): Python format spec applied to numeric
+            values, e.g. ",.2f" or ".1%". Zero-padded codes stay text.
+        delimiter (str, optional): CSV delimiter override.
+        encoding (str): File encoding. Defaults to "utf-8".
+        preserve_formatting (bool): Keep the run font of overwritten cells.
+
+    Returns:
+        str: Markdown response with rows_written, rows_added and first_row.
+
+    See Also:
+        - docx_fill_table: Fill from an inline JSON 2D array
+    """
+    from docx_mcp_server.core.table_import import import_table_file
+    from docx_mcp_server.core.validators import validate_path_safety
+
+    session, error = get_active_session()
+    if error:
+        return error
+    logger.debug(f"docx_fill_table_from_file called: session_id={session.session_id}, file_path={file_path}, table_id={table_id}")
+
+    if not table_id:
+        table_id = session.last_accessed_id
+
+    if not table_id:
+        return create_error_response("No table specified and no context available", error_type="NoContext")
+
+    table = session.get_object(table_id)
+    if not isinstance(table, Table):
+        return create_error_response(f"Valid table context not found for ID {table_id}", error_type="InvalidElementType")
+
+    column_list = None
+    if columns:
+        try:
+            column_list = json.loads(columns)
+        except json.JSONDecodeError:
+            return create_error_response("columns must be a JSON array", error_type="JSONDecodeError")
+        if not isinstance(column_list, list):
+            return create_error_response("columns must be a JSON array", error_type="InvalidDataFormat")
+
+    try:
+        validate_path_safety(file_path)
+        result = import_table_file(
+            table,
+            file_path,
+            file_format=file_format,
+            has_header=has_header,
+            write_header=write_header,
+            columns=column_list,
+            start_row=start_row,
+            template_row=template_row,
+            number_format=number_format,
+            delimiter=delimiter,
+            encoding=encoding,
+            preserve_formatting=preserve_formatting,
+            grid=session.get_table_grid(table),
+        )
+    except FileNotFoundError as e:
+        return create_error_response(str(e), error_type="FileNotFound")
+    except (ValueError, UnicodeDecodeError) as e:
+        return create_error_response(str(e), error_type="ValidationError")
+    except IndexError as e:
+        return create_error_response(str(e), error_type="IndexError")
+    except Exception as e:
+        logger.exception(f"docx_fill_table_from_file failed: {e}")
+        return create_error_response(f"Failed to import table data: {str(e)}", error_type="FillError")
+
+    if result["rows_added"]:
+        session.invalidate_table_grid(table)
+    session.update_context(table_id, action="update")
+
+    return create_markdown_response(
+        session=session,
+        message=f"Imported {result['rows_written']} rows from {file_path}",
+        element_id=table_id,
+        rows_written=result["rows_written"],
+        rows_added=result["rows_added"],
+        first_row=result["first_row"],
+        format=result["format"],
+        header=result["header"]
+    )
+
+def docx_export_table(
+    table_id: str = None,
+    table_index: int = None,
+    all_tables: bool = False,
+    output_path: str = None,
+    file_format: str = None,
+    header: bool = False,
+    repeat_merged: bool = True,
+    start_row: int = 0,
+    max_rows: int = 50,
+    source_path: str = None,
+    encoding: str = "utf-8"
+) -> str:
+    """
+    Export table data to CSV/TSV/JSON-lines files, or return a row window.
+
+    Rows are produced in a single pass over the table XML with merged cells
+    resolved, and written as they are produced; nothing is registered in
+    the session.
+
+    Typical Use Cases:
+        - Extract pricing tables from many contracts (use source_path)
+        - Dump every table of a document to a directory
+        - Page through a large table without building its structure view
+
+    Args:
+        table_id (str, optional): Registered table (active session only).
+        table_index (int, optional): 0-based index of a body-level table.
+            Defaults to the last accessed table, or table 0 with source_path.
+        all_tables (bool): Export every body-level table. output_path is then
+            a directory receiving table_0.csv, table_1.csv, ...
+        output_path (str, optional): Output file (or directory with
+            all_tables). Omit to return rows in the response instead.
+        file_format (str, optional): "csv", "tsv" or "jsonl". Detected from
+            the output extension; defaults to "csv" for directories.
+        header (bool): First row is a header. JSON-lines records then become
+            objects keyed by the header names.
+        repeat_merged (bool): Repeat merged cell text in every covered
+            position (True) or only in the top-left position (False).
+        start_row (int): First row of the returned window (no output_path).
+        max_rows (int): Row count of the returned window (no output_path).
+        source_path (str, optional): Read from a .docx on disk instead of the
+            active session; the file is not modified.
+        encoding (str): Output file encoding. Defaults to "utf-8".
+
+    Returns:
+        str: Markdown response with the written files and row counts, or the
+        requested rows as JSON arrays.
+
+    See Also:
+        - docx_fill_table_from_file: The reverse direction
+        - docx_get_table_structure: Layout and merge analysis
+    """
+    from docx import Document
+    from docx_mcp_server.core import table_export
+    from docx_mcp_server.core.validators import validate_path_safety
+
+    logger.debug(
+        f"docx_export_table called: table_id={table_id}, table_index={table_index}, "
+        f"all_tables={all_tables}, output_path={output_path}, source_path={source_path}"
+    )
+
+    if start_row < 0 or max_rows < 1:
+        return create_error_response("start_row must be >= 0 and max_rows >= 1", error_type="ValidationError")
+    if all_tables and not output_path:
+        return create_error_response("all_tables requires an output_path directory", error_type="ValidationError")
+
+    try:
+        for path in (source_path, output_path):
+            if path:
+                validate_path_safety(path)
+    except ValueError as e:
+        return create_error_response(str(e), error_type="ValidationError")
+
+    session = None
+    if source_path:
+        if table_id:
+            return create_error_response(
+                "table_id refers to the active session; use table_index with source_path",
+                error_type="ValidationError"
+            )
+        if not os.path.isfile(source_path):
+            return create_error_response(f"File not found: {source_path}", error_type="FileNotFound")
+        try:
+            document = Document(source_path)
+        except Exception as e:
+            return create_error_response(f"Failed to open {source_path}: {str(e)}", error_type="FileNotFound")
+    else:
+        session, error = get_active_session()
+        if error:
+            return error
+        document = session.document
+
+    tables = table_export.body_tables(document)
+    if all_tables:
+        selected = None
+    elif table_index is not None:
+        if not 0 <= table_index < len(tables):
+            return create_error_response(
+                f"Table index {table_index} out of range (document has {len(tables)} tables)",
+                error_type="IndexError"
+            )
+        selected = tables[table_index]
+    elif session is not None:
+        table_id = table_id or session.last_accessed_id
+        table = session.get_object(table_id) if table_id else None
+        if not isinstance(table, Table):
+            return create_error_response(
+                f"Valid table context not found for ID {table_id}" if table_id
+                else "No table specified and no context available",
+                error_type="InvalidElementType" if table_id else "NoContext"
+            )
+        selected = table._tbl
+    elif tables:
+        selected = tables[0]
+    else:
+        return create_error_response("Document contains no tables", error_type="IndexError")
+
+    source = source_path or "active document"
+    try:
+        if all_tables:
+            results = table_export.export_tables(
+                tables, output_path, file_format or "csv",
+                header=header, repeat_merged=repeat_merged, encoding=encoding
+            )
+            md_lines = [f"# Exported {len(results)} table(s) from {source}\n"]
+            md_lines.append(f"**Directory**: `{output_path}`")
+            md_lines.append(f"**Rows Total**: {sum(r['rows'] for r in results)}")
+            md_lines.append("")
+            for result in results:
+                md_lines.append(f"- Table {result['index']}: `{result['path']}` ({result['rows']} rows)")
+            return "\n".join(md_lines)
+
+        if output_path:
+            result = table_export.export_table(
+                selected, output_path, file_format,
+                header=header, repeat_merged=repeat_merged, encoding=encoding
+            )
+            return create_markdown_response(
+                session=session,
+                message=f"Exported {result['rows']} rows to {result['path']}",
+                element_id=table_id,
+                operation="Export Table",
+                path=result["path"],
+                format=result["format"],
+                rows=result["rows"],
+                show_context=False
+            )
+    except ValueError as e:
+        return create_error_response(str(e), error_type="ValidationError")
+    except OSError as e:
+        return create_error_response(f"Failed to write export: {str(e)}", error_type="ExportError")
+
+    window = table_export.read_rows(selected, start_row, max_rows, repeat_merged=repeat_merged)
+    if not window["rows"]:
+        return create_error_response(
+            f"start_row {start_row} out of range (table has {window['total_rows']} rows)",
+            error_type="IndexError"
+        )
+    md_lines = [f"# Table rows {start_row}-{start_row + len(window['rows']) - 1} of {window['total_rows']}\n"]
+    md_lines.append(f"**Source**: {source}")
+    md_lines.append(f"**Truncated**: {window['truncated']}")
+    if window["truncated"]:
+        md_lines.append(f"**Next Start Row**: {start_row + len(window['rows'])}")
+    md_lines.append("")
+    md_lines.append("```jsonl")
+    for row in window["rows"]:
+        md_lines.append(json.dumps(row, ensure_ascii=False))
+    md_lines.append("```")
+    return "\n".join(md_lines)
+
+
+def _resolve_table(session, table_id):
+    """Return ``(table_id, table, error)`` for an explicit or last accessed table."""
+    if not table_id:
+        table_id = session.last_accessed_id
+    if not table_id:
+        return None, None, create_error_response("No table specified and no context available", error_type="NoContext")
+    table = session.get_object(table_id)
+    if not isinstance(table, Table):
+        return table_id, None, create_error_response(
+            f"Valid table context not found for ID {table_id}", error_type="InvalidElementType"
+        )
+    return table_id, table, None
+
+
+def docx_get_table_columns(
+    table_id: str = None,
+    columns: str = None,
+    header_rows: int = 1,
+    footer_rows: int = 0,
+    numeric: bool = False,
+    start_row: int = 0,
+    max_rows: int = 200
+) -> str:
+    """
+    Read table data rows as column arrays.
+
+    Each column is returned as one JSON array keyed by its header name (or
+    index when the header cell is empty). With numeric=True values are
+    parsed as numbers (currency symbols, thousands separators, "12%" and
+    "(5)" are understood; non-numeric cells become null).
+
+    Args:
+        table_id (str, optional): Target table. Defaults to last accessed table.
+        columns (str, optional): JSON array of column names or indexes.
+            Defaults to all columns.
+        header_rows (int): Leading rows excluded from the data. Defaults to 1.
+        footer_rows (int): Trailing rows excluded (e.g. a totals row).
+        numeric (bool): Return parsed numbers instead of text.
+        start_row (int): First data row of the window.
+        max_rows (int): Data rows returned per column.
+
+    Returns:
+        str: Markdown response with the columns as a JSON object.
+
+    See Also:
+        - docx_transform_table_columns: Format/compute/total columns
+    """
+    from docx_mcp_server.core.table_columns import ColumnarTable
+
+    session, error = get_active_session()
+    if error:
+        return error
+    table_id, table, error = _resolve_table(session, table_id)
+    if error:
+        return error
+    if start_row < 0 or max_rows < 1:
+        return create_error_response("start_row must be >= 0 and max_rows >= 1", error_type="ValidationError")
+
+    try:
+        keys = json.loads(columns) if columns else None
+        if keys is not None and not isinstance(keys, list):
+            raise ValueError("columns must be a JSON array")
+        view = ColumnarTable(table, session.get_table_grid(table), header_rows=header_rows, footer_rows=footer_rows)
+        indexes = [view.column_index(key) for key in keys] if keys else list(range(view.col_count))
+    except json.JSONDecodeError:
+        return create_error_response("columns must be a JSON array", error_type="JSONDecodeError")
+    except ValueError as e:
+        return create_error_response(str(e), error_type="ValidationError")
+
+    end = start_row + max_rows
+    data = {}
+    for col in indexes:
+        name = view.names[col] or str(col)
+        if numeric:
+            data[name] = [None if v != v else v for v in view.numbers(col)[start_row:end]]
+        else:
+            data[name] = view.columns[col][start_row:end]
+
+    session.update_context(table_id, action="access")
+    md_lines = [f"# Table Columns ({len(indexes)} columns, {view.row_count} data rows)\n"]
+    md_lines.append(f"**Element ID**: {table_id}")
+    md_lines.append(f"**Start Row**: {start_row}")
+    md_lines.append(f"**Truncated**: {end < view.row_count}")
+    md_lines.append("")
+    md_lines.append("```json")
+    md_lines.append(json.dumps(data, ensure_ascii=False))
+    md_lines.append("```")
+    return "\n".join(md_lines)
+
+
+def docx_transform_table_columns(
+    operations: str,
+    table_id: str = None,
+    header_rows: int = 1,
+    footer_rows: int = 0,
+    preserve_formatting: bool = True
+) -> str:
+    """
+    Format, compute and total table columns server-side in one call.
+
+    Operations run on column arrays in order; changed cells are written back
+    in a single pass at the end.
+
+    Typical Use Cases:
+        - Format a price column as currency
+        - Fill an amount column from [Qty] * [Unit Price]
+        - Add a totals row
+
+    Args:
+        operations (str): JSON array of operations:
+            - {"op": "format", "column": "Price", "style": "currency",
+               "decimals": 2, "symbol": "$"} (non-numeric cells are kept)
+            - {"op": "compute", "target": "Amount",
+               "expression": "[Qty] * [Price]", "style": "number"}
+            - {"op": "total", "column": "Amount", "row": "append",
+               "label": "Total", "label_column": 0, "style": "currency"}
+            Styles: number (1,234.50), plain (1234.50), percent (12.50%),
+            currency ($1,234.50). Columns are header names or 0-based
+            indexes. A total goes to the first footer row by default, or to
+            an appended row without footer rows.
+        table_id (str, optional): Target table. Defaults to last accessed table.
+        header_rows (int): Leading rows excluded from the data. Defaults to 1.
+        footer_rows (int): Trailing rows excluded from the data.
+        preserve_formatting (bool): Keep the run font of rewritten cells.
+
+    Returns:
+        str: Markdown response with cells_written, rows_added and totals.
+    """
+    from docx_mcp_server.core.table_columns import transform_columns
+
+    session, error = get_active_session()
+    if error:
+        return error
+    logger.debug(f"docx_transform_table_columns called: session_id={session.session_id}, table_id={table_id}")
+    table_id, table, error = _resolve_table(session, table_id)
+    if error:
+        return error
+
+    try:
+        ops = json.loads(operations)
+    except json.JSONDecodeError:
+        return create_error_response("operations must be a JSON array", error_type="JSONDecodeError")
+    if not isinstance(ops, list):
+        return create_error_response("operations must be a JSON array", error_type="InvalidDataFormat")
+
+    try:
+        result = transform_columns(
+            table,
+            ops,
+            header_rows=header_rows,
+            footer_rows=footer_rows,
+            preserve_formatting=preserve_formatting,
+            grid=session.get_table_grid(table),
+        )
+    except ValueError as e:
+        return create_error_response(str(e), error_type="ValidationError")
+    except Exception as e:
+        logger.exception(f"docx_transform_table_columns failed: {e}")
+        return create_error_response(f"Failed to transform columns: {str(e)}", error_type="FillError")
+
+    if result["rows_added"]:
+        session.invalidate_table_grid(table)
+    session.update_context(table_id, action="update")
+
+    return create_markdown_response(
+        session=session,
+        message=f"Applied {len(ops)} column operation(s), {result['cells_written']} cells written",
+        element_id=table_id,
+        operation="Transform Table Columns",
+        cells_written=result["cells_written"],
+        rows_added=result["rows_added"],
+        data_rows=result["data_rows"],
+        totals=json.dumps(result["totals"], ensure_ascii=False)
+    )
+
+
+def docx_render_table_rows(
+    records: str,
+    table_id: str = None,
+    start_row: int = None,
+    row_count: int = 1,
+    variants: int = 1,
+    keep_template: bool = False,
+    blank_missing: bool = False,
+    number_format: str = None
+) -> str:
+    """
+    Render a list of records through repeating template rows of a table.
+
+    The template rows (rows containing placeholders such as {{sku}} and
+    {{qty}}) are copied once per record and the record values are written
+    into the copies as they are made; no separate replace pass runs. Cell
+    and run formatting comes from the template.
+
+    Typical Use Cases:
+        - Invoice line items, report detail rows
+        - Multi-row records (row_count=2: item row + description row)
+        - Zebra striping (variants=2: two differently shaded template rows
+          used in turn)
+
+    Args:
+        records (str): JSON array of objects. Placeholders are looked up by
+            name; dotted names read nested objects ({{customer.name}}) and
+            {{_index}} is the 1-based record number.
+        table_id (str, optional): Target table. Defaults to last accessed table.
+        start_row (int, optional): First template row. Defaults to the first
+            row containing a placeholder.
+        row_count (int): Template rows per record. Defaults to 1.
+        variants (int): Alternative template blocks used in turn (the
+            template area is row_count * variants rows). Defaults to 1.
+        keep_template (bool): Keep the template rows after the rendered rows.
+        blank_missing (bool): Blank placeholders a record has no value for;
+            by default their tokens are left for docx_fill_placeholders.
+        number_format (str, optional): Python format spec for numeric values.
+
+    Returns:
+        str: Markdown response with records, rows_added and first_row.
+
+    See Also:
+        - docx_fill_placeholders: Fill document-level placeholders
+        - docx_fill_table: Fill a plain 2D array
+    """
+    from docx_mcp_server.core.row_template import RowTemplate, find_template_row
+
+    session, error = get_active_session()
+    if error:
+        return error
+    logger.debug(f"docx_render_table_rows called: session_id={session.session_id}, table_id={table_id}, start_row={start_row}")
+    table_id, table, error = _resolve_table(session, table_id)
+    if error:
+        return error
+
+    try:
+        record_list = json.loads(records)
+    except json.JSONDecodeError:
+        return create_error_response("records must be a JSON array of objects", error_type="JSONDecodeError")
+    if not isinstance(record_list, list):
+        return create_error_response("records must be a JSON array of objects", error_type="InvalidDataFormat")
+
+    grid = session.get_table_grid(table)
+    if start_row is None:
+        start_row = find_template_row(table, grid)
+        if start_row is None:
+            return create_error_response("No row with placeholders found in the table", error_type="ValidationError")
+
+    try:
+        template = RowTemplate(table, start_row, row_count=row_count, variants=variants, grid=grid)
+        result = template.render(
+            record_list, keep_template=keep_template, blank_missing=blank_missing, number_format=number_format
+        )
+    except IndexError as e:
+        return create_error_response(str(e), error_type="IndexError")
+    except ValueError as e:
+        return create_error_response(str(e), error_type="ValidationError")
+    except Exception as e:
+        logger.exception(f"docx_render_table_rows failed: {e}")
+        return create_error_response(f"Failed to render rows: {str(e)}", error_type="FillError")
+
+    session.invalidate_table_grid(table)
+    remap = RegistryCleaner.plan_row_mapping(session, table, result["mapping"])
+    RegistryCleaner.apply_structural_change(session, remap)
+    session.update_context(table_id, action="update")
+
+    return create_markdown_response(
+        session=session,
+        message=f"Rendered {result['records']} record(s) into {result['rows_added']} row(s)",
+        element_id=table_id,
+        operation="Render Table Rows",
+        records=result["records"],
+        rows_added=result["rows_added"],
+        first_row=result["first_row"],
+        placeholders=", ".join(template.names()) or "None"
+    )
+
+
 def docx_copy_table(table_id: str, position: str) -> str:
     """
     Create a deep copy of an existing table.
@@ -734,12 +1251,31 @@ def docx_copy_table(table_id: str, position: str) -> str:
 
 
 
-def docx_get_table_structure(table_id: str) -> str:
+def docx_get_table_structure(
+    table_id: str,
+    start_row: int = 0,
+    max_rows: int = 100,
+    start_col: int = 0,
+    max_cols: int = 50
+) -> str:
     """
     Get table structure with ASCII visualization.
 
+    Large tables are returned in windows: only rows
+    ``start_row .. start_row + max_rows - 1`` and the matching column range
+    are rendered and listed in ``grid_structure``. Page through the table by
+    moving ``start_row``/``start_col``.
+
+    Each cell in ``grid_structure`` carries a virtual ``cell_id`` of the form
+    ``table_abc:r12:c3``; it can be passed to any tool that accepts a cell
+    element_id and is resolved on demand, without a registry entry per cell.
+
     Args:
         table_id: Table ID
+        start_row: First row of the window (default: 0).
+        max_rows: Maximum rows in the window (default: 100).
+        start_col: First column of the window (default: 0).
+        max_cols: Maximum columns in the window (default: 50).
 
     Returns:
         JSON response with ASCII visualization and metadata
@@ -757,10 +1293,26 @@ def docx_get_table_structure(table_id: str) -> str:
             error_type="ElementNotFound"
         )
 
+    if start_row < 0 or start_col < 0 or max_rows < 1 or max_cols < 1:
+        return create_error_response(
+            "start_row/start_col must be >= 0 and max_rows/max_cols must be >= 1",
+            error_type="ValidationError"
+        )
+
     try:
         # Generate visualization
-        ascii_viz = TableStructureAnalyzer.generate_ascii_visualization(table)
-        structure_info = TableStructureAnalyzer.detect_irregular_structure(table, session=session)
+        grid = session.get_table_grid(table)
+        window = dict(
+            start_row=start_row,
+            end_row=start_row + max_rows,
+            start_col=start_col,
+            end_col=start_col + max_cols,
+        )
+        ascii_viz = TableStructureAnalyzer.generate_ascii_visualization(table, grid=grid, **window)
+        structure_info = TableStructureAnalyzer.detect_irregular_structure(
+            table, session=session, grid=grid, **window
+        )
+        rows, cols = text_extractor.table_dimensions(table._tbl)
 
         return create_markdown_response(
             session=session,
@@ -770,9 +1322,15 @@ def docx_get_table_structure(table_id: str) -> str:
             element_id=table_id,
             ascii_visualization=ascii_viz,
             structure_info=structure_info,
-            rows=len(table.rows
-        ),
-            cols=len(table.columns) if table.rows else 0
+            rows=rows,
+            cols=cols if rows else 0,
+            window={
+                "start_row": start_row,
+                "end_row": min(start_row + max_rows, grid.row_count) - 1,
+                "start_col": start_col,
+                "end_col": min(start_col + max_cols, grid.col_count) - 1,
+            },
+            truncated=grid.row_count > start_row + max_rows or grid.col_count > start_col + max_cols
         )
     except Exception as e:
         logger.exception(f"Failed to get table structure: {e}")
@@ -793,5 +1351,10 @@ def register_tools(mcp: FastMCP):
     mcp.tool()(docx_insert_table_row)
     mcp.tool()(docx_insert_table_col)
     mcp.tool()(docx_fill_table)
+    mcp.tool()(docx_fill_table_from_file)
+    mcp.tool()(docx_export_table)
+    mcp.tool()(docx_get_table_columns)
+    mcp.tool()(docx_transform_table_columns)
+    mcp.tool()(docx_render_table_rows)
     mcp.tool()(docx_copy_table)
     mcp.tool()(docx_get_table_structure)
@@ -18,6 +18,7 @@ from docx.table import Table
 from docx.oxml.xmlchemy import BaseOxmlElement
 from docx.oxml.text.paragraph import CT_P
 from docx.oxml.table import CT_Tbl
+from docx.oxml.ns import qn
 
 class CopyEngine:
     """
@@ -168,6 +169,46 @@ class CopyEngine:
         # Wrap back to python-docx object
         return self._wrap_element(new_element_xml, parent)
 
+    def insert_elements(self, parent: Any, new_elements: List[BaseOxmlElement], mode: str = "append",
+                        ref_element: Optional[Any] = None) -> List[BaseOxmlElement]:
+        """
+        Inserts a sequence of detached XML elements at a resolved position.
+
+        Args:
+            parent: The python-docx container (Document, Cell, etc.)
+            new_elements: Elements to insert, in document order
+            mode: "append", "start", "before" or "after" (see PositionResolver)
+            ref_element: Anchor element for "before"/"after"
+
+        Returns:
+            The inserted elements, in document order
+        """
+        if mode in ("before", "after") and ref_element is not None:
+            anchor = ref_element._element
+            for el in new_elements:
+                if mode == "after":
+                    anchor.addnext(el)
+                    anchor = el
+                else:
+                    anchor.addprevious(el)
+            return list(new_elements)
+
+        container = parent._body._element if hasattr(parent, '_body') else parent._element
+        if mode == "start":
+            # Keep cell/body properties first
+            offset = 1 if len(container) and container[0].tag == qn('w:tcPr') else 0
+            for i, el in enumerate(new_elements):
+                container.insert(offset + i, el)
+        else:
+            # Body content must stay ahead of the final section properties
+            sect_pr = container.find(qn('w:sectPr'))
+            for el in new_elements:
+                if sect_pr is not None:
+                    sect_pr.addprevious(el)
+                else:
+                    container.append(el)
+        return list(new_elements)
+
     def _wrap_element(self, element_xml: BaseOxmlElement, parent: Any) -> Any:
         """
         Wraps an XML element into its corresponding python-docx object.
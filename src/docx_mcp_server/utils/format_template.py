@@ -3,9 +3,10 @@ from dataclasses import dataclass, field, asdict
 import json
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run
-from docx.table import Table
+from docx.table import Table, _Cell
 from docx.shared import RGBColor, Pt, Length
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx_mcp_server.core.compiled_format import CompiledFormat, compile_format
 
 @dataclass
 class FontProperties:
@@ -42,26 +43,52 @@ class TableProperties:
 
 @dataclass
 class FormatTemplate:
-    element_type: Literal["paragraph", "run", "table"]
+    element_type: Literal["paragraph", "run", "table", "cell"]
     properties: Dict[str, Any]
     font_properties: Optional[Dict[str, Any]] = None  # Paragraphs also have font props (run style)
+    # Property XML fragments (CompiledFormat.to_xml); when present they are applied
+    # instead of the descriptor properties above
+    xml: Optional[Dict[str, str]] = None
 
 class TemplateManager:
     """
     Manages extraction and application of formatting templates.
     """
 
-    def extract_template(self, element: Union[Paragraph, Run, Table]) -> FormatTemplate:
+    def extract_template(self, element: Union[Paragraph, Run, Table, _Cell]) -> FormatTemplate:
         if isinstance(element, Run):
-            return self._extract_run_template(element)
+            template = self._extract_run_template(element)
         elif isinstance(element, Paragraph):
-            return self._extract_paragraph_template(element)
+            template = self._extract_paragraph_template(element)
         elif isinstance(element, Table):
-            return self._extract_table_template(element)
+            template = self._extract_table_template(element)
+        elif isinstance(element, _Cell):
+            template = FormatTemplate(element_type="cell", properties={})
         else:
             raise ValueError(f"Unsupported element type: {type(element)}")
 
-    def apply_template(self, element: Union[Paragraph, Run, Table], template: FormatTemplate) -> None:
+        compiled = compile_format(element)
+        if compiled is not None:
+            template.xml = compiled.to_xml()
+        return template
+
+    def compile(self, template: FormatTemplate) -> Optional[CompiledFormat]:
+        """
+        Compile a template for repeated application.
+
+        Returns None for templates without XML fragments (descriptor-only
+        templates), which can only be applied through apply_template.
+        """
+        if not template.xml:
+            return None
+        return CompiledFormat.from_xml(template.element_type, template.xml)
+
+    def apply_template(self, element: Union[Paragraph, Run, Table, _Cell], template: FormatTemplate) -> None:
+        compiled = self.compile(template)
+        if compiled is not None and compile_format(element) is not None:
+            compiled.apply(element)
+            return
+
         if template.element_type == "run" and isinstance(element, Run):
             self._apply_run_template(element, template)
         elif template.element_type == "paragraph" and isinstance(element, Paragraph):
@@ -184,6 +211,5 @@ class TemplateManager:
              except (ValueError, KeyError):
                 pass
 
-        # NOTE: Deep XML structure application (borders/shading) is not implemented in MVP
-        # as it requires deepcopying OXML elements which are not easily serializable to JSON
-        # without storing raw XML strings.
+        # NOTE: Borders/shading are only carried by templates with xml fragments,
+        # which apply_template clones instead of coming here.
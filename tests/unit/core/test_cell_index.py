@@ -0,0 +1,93 @@
+"""Unit tests for the registered-cell index used by RegistryCleaner."""
+
+from docx import Document
+
+from docx_mcp_server.core.registry_cleaner import RegistryCleaner
+from docx_mcp_server.core.session import Session
+from docx_mcp_server.core.xml_util import ElementManipulator
+
+
+def _session_with_cells(doc, table, positions):
+    session = Session(session_id="cells", document=doc)
+    ids = {pos: session.register_object(table.cell(*pos), "cell") for pos in positions}
+    return session, ids
+
+
+def test_registration_indexes_merge_anchor_position():
+    doc = Document()
+    table = doc.add_table(rows=3, cols=3)
+    table.cell(1, 1).merge(table.cell(2, 2))
+    session, ids = _session_with_cells(doc, table, [(0, 2), (2, 2)])
+
+    assert session.cell_index.position(ids[(0, 2)]) == (0, 2)
+    assert session.cell_index.position(ids[(2, 2)]) == (1, 1)
+
+
+def test_delete_row_invalidates_row_and_shifts_cells_below():
+    doc = Document()
+    table = doc.add_table(rows=3, cols=2)
+    session, ids = _session_with_cells(doc, table, [(0, 0), (1, 1), (2, 0)])
+
+    remap = RegistryCleaner.plan_structural_change(session, table, "delete_row", 1)
+    ElementManipulator.delete_row(table, 1)
+    RegistryCleaner.apply_structural_change(session, remap)
+
+    assert remap.removed == [ids[(1, 1)]]
+    assert ids[(1, 1)] not in session.object_registry
+    assert session.cell_index.table_cells(table._tbl) == {ids[(0, 0)]: (0, 0), ids[(2, 0)]: (1, 0)}
+
+
+def test_delete_col_shifts_by_removed_span():
+    doc = Document()
+    table = doc.add_table(rows=2, cols=4)
+    table.cell(0, 0).merge(table.cell(0, 1))
+    session, ids = _session_with_cells(doc, table, [(0, 0), (0, 3), (1, 3)])
+
+    remap = RegistryCleaner.plan_structural_change(session, table, "delete_col", 1)
+
+    assert remap.removed == [ids[(0, 0)]]
+    # Row 0 loses the two-column merged cell, row 1 a single cell
+    assert remap.moved == {ids[(0, 3)]: (0, 1), ids[(1, 3)]: (1, 2)}
+
+
+def test_insert_plans_shift_and_plan_alone_changes_nothing():
+    doc = Document()
+    table = doc.add_table(rows=2, cols=2)
+    session, ids = _session_with_cells(doc, table, [(0, 0), (1, 1)])
+
+    RegistryCleaner.plan_structural_change(session, table, "delete_row", 0)
+    assert session.cell_index.position(ids[(0, 0)]) == (0, 0)
+
+    RegistryCleaner.apply_structural_change(
+        session, RegistryCleaner.plan_structural_change(session, table, "insert_col", 1)
+    )
+    RegistryCleaner.apply_structural_change(
+        session, RegistryCleaner.plan_structural_change(session, table, "insert_row", 0)
+    )
+    assert session.cell_index.position(ids[(0, 0)]) == (1, 0)
+    assert session.cell_index.position(ids[(1, 1)]) == (2, 2)
+
+
+def test_multi_column_plans_match_the_edited_table():
+    doc = Document()
+    table = doc.add_table(rows=2, cols=5)
+    table.cell(0, 1).merge(table.cell(0, 2))
+    session, ids = _session_with_cells(doc, table, [(0, 1), (0, 3), (1, 2), (1, 4)])
+
+    remap = RegistryCleaner.plan_structural_change(session, table, "delete_cols", [0, 2, 4])
+    ElementManipulator.delete_cols(table, [0, 2, 4])
+    RegistryCleaner.apply_structural_change(session, remap)
+
+    # The merged cell is narrowed, not removed
+    assert sorted(remap.removed) == sorted([ids[(1, 2)], ids[(1, 4)]])
+    for cell_id in (ids[(0, 1)], ids[(0, 3)]):
+        row, col = session.cell_index.position(cell_id)
+        assert table.cell(row, col)._tc is session.get_object(cell_id)._tc
+
+    remap = RegistryCleaner.plan_structural_change(session, table, "insert_cols", [0, 1, 1])
+    assert ElementManipulator.insert_cols(table, [0, 1, 1]) == 5
+    RegistryCleaner.apply_structural_change(session, remap)
+
+    assert session.cell_index.position(ids[(0, 3)]) == (0, 4)
+    assert table.cell(0, 4)._tc is session.get_object(ids[(0, 3)])._tc
+    assert len(table._tbl.tblGrid.gridCol_lst) == 5
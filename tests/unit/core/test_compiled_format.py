@@ -0,0 +1,176 @@
+"""Unit tests for formats compiled to property XML."""
+
+import pytest
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Pt, RGBColor
+
+from docx_mcp_server.core.compiled_format import CompiledFormat, RunPropertiesPatch, compile_format
+
+
+def _shaded_cell(cell, fill):
+    tcPr = cell._tc.get_or_add_tcPr()
+    tcPr.append(parse_xml(f'<w:shd {nsdecls("w")} w:val="clear" w:fill="{fill}"/>'))
+    tcPr.append(parse_xml(
+        f'<w:tcBorders {nsdecls("w")}><w:top w:val="double" w:sz="4"/></w:tcBorders>'
+    ))
+
+
+def test_run_format_copies_everything_word_stores():
+    doc = Document()
+    p = doc.add_paragraph()
+    src = p.add_run("Source")
+    src.font.bold = True
+    src.font.size = Pt(14)
+    src.font.color.rgb = RGBColor(0x12, 0x34, 0x56)
+    src._r.rPr.get_or_add_rFonts().set(qn("w:eastAsia"), "SimSun")
+    tgt = p.add_run("Target")
+    tgt.font.italic = True
+
+    CompiledFormat.from_element(src).apply(tgt)
+
+    assert tgt.font.bold is True and tgt.font.italic is None
+    assert tgt.font.size == Pt(14)
+    assert tgt._r.rPr.rFonts.get(qn("w:eastAsia")) == "SimSun"
+    assert tgt.text == "Target"
+    # The fragment is cloned, not shared
+    assert tgt._r.rPr is not src._r.rPr
+
+
+def test_paragraph_format_keeps_section_break():
+    doc = Document()
+    src = doc.add_paragraph("Source", style="Heading 1")
+    src.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    tgt = doc.add_paragraph("Target")
+    tgt._p.get_or_add_pPr().append(parse_xml(f'<w:sectPr {nsdecls("w")}/>'))
+
+    CompiledFormat.from_element(src).apply(tgt)
+
+    assert tgt.style.name == "Heading 1"
+    assert tgt.alignment == WD_ALIGN_PARAGRAPH.CENTER
+    assert tgt._p.pPr[-1].tag == qn("w:sectPr")
+
+
+def test_cell_format_copies_borders_and_shading_but_keeps_spans():
+    doc = Document()
+    table = doc.add_table(rows=2, cols=3)
+    src = table.cell(0, 0)
+    _shaded_cell(src, "FFCC00")
+    src.paragraphs[0].add_run("Head").bold = True
+    merged = table.cell(1, 0).merge(table.cell(1, 1))
+    merged.paragraphs[0].add_run("Body")
+
+    CompiledFormat.from_element(src).apply(merged)
+
+    tcPr = merged._tc.tcPr
+    assert tcPr.find(qn("w:shd")).get(qn("w:fill")) == "FFCC00"
+    assert tcPr.find(qn("w:tcBorders")) is not None
+    assert merged._tc.grid_span == 2
+    # Schema order: span ahead of shading
+    names = [child.tag for child in tcPr]
+    assert names.index(qn("w:gridSpan")) < names.index(qn("w:shd"))
+    assert merged.paragraphs[0].runs[0].bold is True
+
+
+def test_table_format_copies_borders_and_shading():
+    doc = Document()
+    src = doc.add_table(rows=1, cols=1)
+    src.style = "Table Grid"
+    src._tbl.tblPr.append(parse_xml(f'<w:shd {nsdecls("w")} w:val="clear" w:fill="EEEEEE"/>'))
+    tgt = doc.add_table(rows=1, cols=1)
+    tblPr = tgt._tbl.tblPr
+
+    CompiledFormat.from_element(src).apply(tgt)
+
+    assert tgt.style.name == "Table Grid"
+    assert tgt._tbl.tblPr.find(qn("w:shd")).get(qn("w:fill")) == "EEEEEE"
+    # Refilled in place
+    assert tgt._tbl.tblPr is tblPr
+
+
+def test_empty_format_clears_direct_formatting():
+    doc = Document()
+    p = doc.add_paragraph()
+    plain = p.add_run("Plain")
+    bold = p.add_run("Bold")
+    bold.bold = True
+
+    CompiledFormat.from_element(plain).apply(bold)
+
+    assert bold._r.rPr is None
+
+
+def test_run_format_applies_to_all_runs_of_a_paragraph():
+    doc = Document()
+    src = doc.add_paragraph().add_run("x")
+    src.italic = True
+    p = doc.add_paragraph()
+    runs = [p.add_run(t) for t in ("a", "b", "c")]
+
+    CompiledFormat.from_element(src).apply(p)
+
+    assert all(r.italic for r in runs)
+
+
+def test_apply_all_reports_incompatible_targets():
+    doc = Document()
+    src = doc.add_paragraph("Source")
+    src.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    targets = [doc.add_paragraph(str(i)) for i in range(50)]
+    table = doc.add_table(rows=1, cols=1)
+
+    result = CompiledFormat.from_element(src).apply_all(targets + [table])
+
+    assert result["applied"] == 50
+    assert [index for index, _ in result["failed"]] == [50]
+    assert all(p.alignment == WD_ALIGN_PARAGRAPH.RIGHT for p in targets)
+
+
+def test_xml_round_trip():
+    doc = Document()
+    table = doc.add_table(rows=1, cols=2)
+    _shaded_cell(table.cell(0, 0), "00FF00")
+    xml = CompiledFormat.from_element(table.cell(0, 0)).to_xml()
+
+    compiled = CompiledFormat.from_xml("cell", xml)
+    compiled.apply(table.cell(0, 1))
+
+    assert set(xml) == {"tcPr", "pPr", "rPr"}
+    assert table.cell(0, 1)._tc.tcPr.find(qn("w:shd")).get(qn("w:fill")) == "00FF00"
+
+
+def test_from_xml_rejects_bad_fragments():
+    with pytest.raises(ValueError):
+        CompiledFormat.from_xml("run", {})
+    with pytest.raises(ValueError):
+        CompiledFormat.from_xml("run", {"rPr": f'<w:pPr {nsdecls("w")}/>'})
+    with pytest.raises(ValueError):
+        CompiledFormat.from_xml("run", {"rPr": "<w:rPr"})
+    with pytest.raises(ValueError):
+        CompiledFormat.from_xml("section", {})
+
+
+def test_compile_format_skips_objects_without_xml():
+    assert compile_format(object()) is None
+
+
+def test_run_patch_merges_in_schema_order():
+    doc = Document()
+    p = doc.add_paragraph()
+    styled = p.add_run("styled")
+    styled.font.name = "Arial"
+    styled.font.underline = True
+    styled.font.size = Pt(8)
+    plain = p.add_run("plain")
+
+    patch = RunPropertiesPatch.from_font(size=12, bold=True, rgb=RGBColor(0, 0, 0xFF))
+    for run in (styled, plain):
+        patch.apply(run._r)
+
+    assert styled.font.name == "Arial" and styled.font.underline is True
+    assert styled.font.size == Pt(12) and styled.bold is True
+    assert plain.font.size == Pt(12) and str(plain.font.color.rgb) == "0000FF"
+    tags = [child.tag for child in styled._r.rPr]
+    assert tags == [qn("w:rFonts"), qn("w:b"), qn("w:color"), qn("w:sz"), qn("w:u")]
@@ -0,0 +1,129 @@
+"""Unit tests for the persistent directory search index."""
+
+import os
+
+import pytest
+from docx import Document
+
+from docx_mcp_server.core.corpus_index import DocxSearchIndex, search_directory, tokenize
+
+
+def _write_docx(path, paragraphs, table_cells=None):
+    doc = Document()
+    for text in paragraphs:
+        doc.add_paragraph(text)
+    if table_cells:
+        table = doc.add_table(rows=1, cols=len(table_cells))
+        for cell, text in zip(table.rows[0].cells, table_cells):
+            cell.text = text
+    doc.save(str(path))
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    _write_docx(tmp_path / "a.docx", ["Intro", "The limitation of liability applies."])
+    _write_docx(tmp_path / "b.docx", ["Nothing relevant here"], table_cells=["Limitation of Liability", "x"])
+    (tmp_path / "sub").mkdir()
+    _write_docx(tmp_path / "sub" / "c.docx", ["合同责任限制条款"])
+    (tmp_path / "notes.txt").write_text("limitation of liability")
+    return tmp_path
+
+
+def test_tokenize_splits_cjk_per_character():
+    assert tokenize("Hello, World") == ["hello", "world"]
+    assert tokenize("责任ABC") == ["责", "任", "abc"]
+
+
+def test_refresh_and_search(corpus):
+    index = DocxSearchIndex(str(corpus))
+    stats = index.refresh(workers=1)
+
+    assert stats["added"] == 3
+    assert stats["indexed_files"] == 3
+    results = index.search("limitation of liability")
+    assert [(r["path"], r["paragraph_index"]) for r in results] == [("a.docx", 1), ("b.docx", 1)]
+    assert [r["path"] for r in index.search("责任限制")] == ["sub/c.docx"]
+
+
+def test_phrase_must_match_not_just_terms(corpus):
+    index = DocxSearchIndex(str(corpus))
+    index.refresh(workers=1)
+
+    assert index.search("liability of limitation") == []
+
+
+def test_refresh_with_process_pool(corpus):
+    index = DocxSearchIndex(str(corpus))
+    stats = index.refresh(workers=2)
+
+    assert stats["added"] == 3
+    assert stats["failed"] == 0
+
+
+def test_incremental_refresh(corpus):
+    index = DocxSearchIndex(str(corpus))
+    index.refresh(workers=1)
+
+    _write_docx(corpus / "a.docx", ["Rewritten without the clause", "extra paragraph"])
+    os.utime(corpus / "a.docx", (1, 1))
+    os.remove(corpus / "b.docx")
+    _write_docx(corpus / "d.docx", ["limitation of liability again"])
+
+    stats = index.refresh(workers=1)
+
+    assert (stats["added"], stats["updated"], stats["removed"], stats["unchanged"]) == (1, 1, 1, 1)
+    assert [r["path"] for r in index.search("limitation of liability")] == ["d.docx"]
+    assert index.refresh(workers=1)["unchanged"] == 3
+
+
+def test_corrupt_file_is_reported_not_fatal(corpus):
+    (corpus / "broken.docx").write_bytes(b"not a zip")
+    index = DocxSearchIndex(str(corpus))
+
+    stats = index.refresh(workers=1)
+
+    assert stats["failed"] == 1
+    assert stats["errors"][0]["path"] == "broken.docx"
+    assert stats["indexed_files"] == 3
+
+
+def test_search_directory_builds_index_on_first_use(corpus, tmp_path_factory):
+    index_path = tmp_path_factory.mktemp("idx") / "index.sqlite3"
+
+    result = search_directory(str(corpus), "liability", index_path=str(index_path))
+
+    assert result["count"] == 2
+    assert result["refresh"]["added"] == 3
+    assert index_path.exists()
+
+
+def test_missing_directory_raises(tmp_path):
+    with pytest.raises(ValueError):
+        DocxSearchIndex(str(tmp_path / "missing"))
+
+
+def test_search_directory_tool(corpus):
+    from docx_mcp_server.server import docx_search_directory
+
+    result = docx_search_directory("limitation of liability", str(corpus))
+
+    assert "Found 2 match(es)" in result
+    assert "a.docx" in result
+
+
+def test_last_term_matches_as_prefix(corpus):
+    index = DocxSearchIndex(str(corpus))
+    index.refresh(workers=1)
+
+    assert [r["path"] for r in index.search("limitation of liab")] == ["a.docx", "b.docx"]
+    assert [r["path"] for r in index.search("liab")] == ["a.docx", "b.docx"]
+    assert index.search("limit of liability") == []
+
+
+def test_index_tools_report_storage_errors(corpus):
+    from docx_mcp_server.server import docx_index_directory, docx_search_directory
+
+    index_path = str(corpus / "notes.txt" / "index.sqlite3")
+
+    assert "SearchIndexError" in docx_index_directory(str(corpus), index_path=index_path)
+    assert "SearchIndexError" in docx_search_directory("liability", str(corpus), index_path=index_path)
@@ -0,0 +1,203 @@
+"""Unit tests for copying content between documents."""
+
+import io
+import struct
+import zlib
+
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+from docx_mcp_server.core.doc_import import DocumentImporter, body_elements
+
+
+def _png(color: bytes) -> bytes:
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    header = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(b"\x00" + color)) + chunk(b"IEND", b""))
+
+
+def _add_list(doc, num_fmt="decimal"):
+    """Add an abstractNum + num to ``doc`` and return the numId."""
+    numbering = doc.part.numbering_part.element
+    abstract_ids = [int(el.get(qn("w:abstractNumId"))) for el in numbering.findall(qn("w:abstractNum"))]
+    abstract_id = max(abstract_ids, default=-1) + 1
+    abstract = parse_xml(
+        f'<w:abstractNum {nsdecls("w")} w:abstractNumId="{abstract_id}">'
+        f'<w:nsid w:val="{abstract_id + 0x1000:08X}"/>'
+        f'<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="{num_fmt}"/>'
+        f'<w:lvlText w:val="%1."/></w:lvl></w:abstractNum>'
+    )
+    nums = numbering.findall(qn("w:num"))
+    if nums:
+        nums[0].addprevious(abstract)
+    else:
+        numbering.append(abstract)
+    return numbering.add_num(abstract_id).numId
+
+
+def _numbered(doc, text, num_id):
+    p = doc.add_paragraph(text)
+    p._p.get_or_add_pPr().append(parse_xml(
+        f'<w:numPr {nsdecls("w")}><w:ilvl w:val="0"/><w:numId w:val="{num_id}"/></w:numPr>'
+    ))
+    return p
+
+
+def _source():
+    doc = Document()
+    base = doc.styles.add_style("Proposal Base", WD_STYLE_TYPE.PARAGRAPH)
+    body = doc.styles.add_style("Proposal Body", WD_STYLE_TYPE.PARAGRAPH)
+    body.base_style = base
+    doc.add_paragraph("Styled", style="Proposal Body")
+    num_id = _add_list(doc)
+    _numbered(doc, "First", num_id)
+    _numbered(doc, "Second", num_id)
+    doc.add_picture(io.BytesIO(_png(b"\xff\x00\x00")))
+    return doc
+
+
+def _import(target, source, key=None):
+    importer = DocumentImporter(target)
+    result = importer.import_elements(source, body_elements(source), source_key=key)
+    for el in result["elements"]:
+        target.element.body.sectPr.addprevious(el)
+    return importer, result
+
+
+def test_styles_are_imported_with_their_base_chain():
+    source = _source()
+    target = Document()
+
+    _, result = _import(target, source)
+
+    styles = target.styles.element
+    body = styles.get_by_id("ProposalBody")
+    assert body is not None and styles.get_by_id("ProposalBase") is not None
+    assert body.basedOn_val == "ProposalBase"
+    assert result["styles"] == 2
+    assert target.paragraphs[0].style.name == "Proposal Body"
+
+
+def test_existing_styles_are_reused_by_name():
+    source = _source()
+    target = Document()
+    target.styles.add_style("Proposal Body", WD_STYLE_TYPE.PARAGRAPH).element.set(qn("w:styleId"), "Body1")
+
+    _, result = _import(target, source)
+
+    assert target.styles.element.get_by_id("ProposalBody") is None
+    assert target.paragraphs[0]._p.pPr.pStyle.val == "Body1"
+    # The matched style brings its own base chain; nothing is imported
+    assert result["styles"] == 0
+
+
+def test_numbering_is_recreated_in_the_target():
+    source = _source()
+    target = Document()
+    before = len(target.part.numbering_part.element.findall(qn("w:num")))
+
+    _, result = _import(target, source)
+
+    numbering = target.part.numbering_part.element
+    paragraphs = [p for p in target.paragraphs if p.text in ("First", "Second")]
+    num_ids = {p._p.pPr.numPr.numId.val for p in paragraphs}
+    assert len(num_ids) == 1
+    num = numbering.num_having_numId(num_ids.pop())
+    abstract = numbering.find(
+        f"{qn('w:abstractNum')}[@{qn('w:abstractNumId')}='{num.abstractNumId.val}']"
+    )
+    assert abstract.find(f"{qn('w:lvl')}/{qn('w:numFmt')}").get(qn("w:val")) == "decimal"
+    assert len(numbering.findall(qn("w:num"))) == before + 1
+    assert result["nums"] == 1 and result["abstract_nums"] == 1
+
+
+def test_identical_list_definitions_are_shared_across_sources():
+    target = Document()
+    importer = DocumentImporter(target)
+    numbering = target.part.numbering_part.element
+    abstracts_before = len(numbering.findall(qn("w:abstractNum")))
+
+    for key in ("a", "b"):
+        source = _source()
+        importer.import_elements(source, body_elements(source), source_key=key)
+
+    # Same look, one definition; each source keeps its own list instance
+    assert len(numbering.findall(qn("w:abstractNum"))) == abstracts_before + 1
+    assert importer.stats["nums"] == 2
+
+
+def test_repeated_imports_from_one_source_reuse_mappings():
+    source = _source()
+    target = Document()
+    importer = DocumentImporter(target)
+
+    first = importer.import_elements(source, body_elements(source), source_key="s")
+    second = importer.import_elements(source, body_elements(source), source_key="s")
+
+    assert first["styles"] == 2 and first["nums"] == 1
+    assert second["styles"] == second["nums"] == second["parts"] == 0
+    num_of = lambda el: el.find(f"{qn('w:pPr')}/{qn('w:numPr')}/{qn('w:numId')}").get(qn("w:val"))
+    assert num_of(first["elements"][1]) == num_of(second["elements"][1])
+
+
+def test_images_are_reattached_and_deduplicated():
+    source = _source()
+    target = Document()
+    target.add_picture(io.BytesIO(_png(b"\xff\x00\x00")))
+    images_before = len(list(target.part.package.image_parts))
+
+    _import(target, source)
+
+    blips = target.element.body.findall(".//" + qn("a:blip"))
+    assert len(blips) == 2
+    for blip in blips:
+        assert target.part.rels[blip.get(qn("r:embed"))].reltype == RT.IMAGE
+    # Same image bytes: the package keeps one image part
+    assert len(list(target.part.package.image_parts)) == images_before
+    target.save(io.BytesIO())
+
+
+def test_hyperlinks_are_recreated():
+    source = Document()
+    r_id = source.part.relate_to("https://example.com", RT.HYPERLINK, is_external=True)
+    p = source.add_paragraph()
+    p._p.append(parse_xml(
+        f'<w:hyperlink {nsdecls("w", "r")} r:id="{r_id}"><w:r><w:t>link</w:t></w:r></w:hyperlink>'
+    ))
+    target = Document()
+    for i in range(3):
+        target.part.relate_to(f"https://other/{i}", RT.HYPERLINK, is_external=True)
+
+    _import(target, source)
+
+    link = target.element.body.find(".//" + qn("w:hyperlink"))
+    assert target.part.rels[link.get(qn("r:id"))].target_ref == "https://example.com"
+
+
+def test_same_document_copies_are_plain():
+    doc = _source()
+    importer = DocumentImporter(doc)
+
+    result = importer.import_elements(doc, [doc.paragraphs[0]])
+
+    assert result["styles"] == result["nums"] == 0
+    assert result["elements"][0] is not doc.paragraphs[0]._p
+
+
+def test_saved_document_round_trips(tmp_path):
+    source = _source()
+    target = Document()
+    _import(target, source)
+    path = tmp_path / "assembled.docx"
+
+    target.save(str(path))
+    reopened = Document(str(path))
+
+    assert [p.text for p in reopened.paragraphs][:3] == ["Styled", "First", "Second"]
+    assert reopened.paragraphs[0].style.name == "Proposal Body"
+    assert len(reopened.inline_shapes) == 1
@@ -0,0 +1,83 @@
+"""Unit tests for bulk target selection."""
+
+import pytest
+from docx import Document
+
+from docx_mcp_server.core.element_selector import ElementSelector
+from docx_mcp_server.core.session import Session
+
+
+def _session():
+    session = Session(session_id="select", document=Document())
+    doc = session.document
+    doc.add_paragraph("Introduction", style="Heading 1")
+    doc.add_paragraph("Figure 1: Layout", style="Caption")
+    doc.add_paragraph("Body text")
+    table = doc.add_table(rows=1, cols=1)
+    table.cell(0, 0).paragraphs[0].text = "Figure 2: Inside a table"
+    doc.add_paragraph("Figure 3: Results", style="Caption")
+    return session
+
+
+def _texts(elements):
+    return [el.text for el in elements]
+
+
+def test_text_predicate_searches_the_whole_document():
+    session = _session()
+
+    selected = ElementSelector(session).select(text="figure")
+
+    assert _texts(selected) == ["Figure 1: Layout", "Figure 2: Inside a table", "Figure 3: Results"]
+
+
+def test_style_and_regex_predicates_combine():
+    session = _session()
+    selector = ElementSelector(session)
+
+    assert _texts(selector.select(style="Caption")) == ["Figure 1: Layout", "Figure 3: Results"]
+    assert _texts(selector.select(style="Caption", text=r"^Figure \d:\s+R", use_regex=True)) == [
+        "Figure 3: Results"
+    ]
+    # Paragraphs without a pStyle have the default style
+    assert "Body text" in _texts(selector.select(style="Normal"))
+
+
+def test_range_scope_filtered_by_predicate():
+    session = _session()
+    paragraphs = session.document.paragraphs
+    start = session.register_object(paragraphs[1], "para")
+    end = session.register_object(paragraphs[3], "para")
+    selector = ElementSelector(session)
+
+    blocks = selector.select(start_id=start, end_id=end)
+    filtered = selector.select(start_id=start, end_id=end, text="Figure")
+
+    assert len(blocks) == 4  # three paragraphs and the table between them
+    assert _texts(filtered) == ["Figure 1: Layout", "Figure 2: Inside a table", "Figure 3: Results"]
+
+
+def test_ids_are_deduplicated_and_kept_as_given():
+    session = _session()
+    table_id = session.register_object(session.document.tables[0], "table")
+    para_id = session.register_object(session.document.paragraphs[0], "para")
+
+    selected = ElementSelector(session).select(ids=[table_id, para_id, table_id])
+
+    assert [type(el).__name__ for el in selected] == ["Table", "Paragraph"]
+
+
+def test_invalid_selections():
+    session = _session()
+    selector = ElementSelector(session)
+
+    with pytest.raises(ValueError):
+        selector.select()
+    with pytest.raises(ValueError):
+        selector.select(start_id="para_1")
+    with pytest.raises(ValueError):
+        selector.select(text="(", use_regex=True)
+    with pytest.raises(ValueError):
+        selector.select(style="No Such Style")
+    with pytest.raises(LookupError):
+        selector.select(ids=["para_missing"])
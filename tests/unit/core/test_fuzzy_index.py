@@ -0,0 +1,108 @@
+"""Unit tests for the trigram fuzzy index and docx_find_paragraphs_fuzzy."""
+
+import pytest
+from docx import Document
+
+from docx_mcp_server.core.fuzzy_index import TrigramIndex, normalize_text, trigrams
+from docx_mcp_server.server import (
+    docx_find_paragraphs_fuzzy,
+    docx_insert_paragraph,
+    session_manager,
+)
+
+
+def test_normalize_text_folds_quotes_whitespace_and_case():
+    raw = "The “Vendor” shall   NOT — ever"
+    assert normalize_text(raw) == 'the "vendor" shall not - ever'
+
+
+def test_trigrams_short_text_has_grams():
+    assert trigrams("a") == {" a "}
+    assert trigrams("") == set()
+
+
+def test_search_tolerates_typo_and_ranks_best_first():
+    doc = Document()
+    doc.add_paragraph("Introduction to the agreement")
+    doc.add_paragraph("Either party may terminate for convenience with notice.")
+    doc.add_paragraph("Payment terms are net thirty days.")
+
+    index = TrigramIndex(doc)
+    matches = index.search("terminate for convenence", min_score=0.5)
+
+    assert matches
+    assert matches[0].text.startswith("Either party may terminate")
+    assert 0.5 <= matches[0].score < 1.0
+
+
+def test_search_exact_after_normalization_scores_one():
+    doc = Document()
+    doc.add_paragraph("The “Client” agrees.")
+
+    index = TrigramIndex(doc)
+    matches = index.search('the "client"   agrees')
+
+    assert matches[0].score == 1.0
+
+
+def test_search_respects_min_score_and_skips_empty_paragraphs():
+    doc = Document()
+    doc.add_paragraph("")
+    doc.add_paragraph("completely unrelated content")
+
+    index = TrigramIndex(doc)
+
+    assert len(index) == 1
+    assert index.search("quarterly revenue forecast", min_score=0.6) == []
+
+
+def test_is_current_detects_edits():
+    doc = Document()
+    p = doc.add_paragraph("original text")
+    index = TrigramIndex(doc)
+
+    assert index.is_current(0)
+    p.text = "changed text"
+    assert not index.is_current(0)
+
+
+def test_session_index_is_reused_until_revision_changes(active_session):
+    session = session_manager.get_session(active_session)
+    docx_insert_paragraph("First paragraph", position="end:document_body")
+
+    index = session.get_fuzzy_index()
+    assert session.get_fuzzy_index() is index
+
+    docx_insert_paragraph("Second paragraph", position="end:document_body")
+    rebuilt = session.get_fuzzy_index()
+    assert rebuilt is not index
+    assert len(rebuilt) == 2
+
+
+def test_fuzzy_tool_returns_ids_and_scores(active_session):
+    docx_insert_paragraph("Warranty disclaimer applies to all goods.", position="end:document_body")
+    docx_insert_paragraph("Governing law is the State of New York.", position="end:document_body")
+
+    result = docx_find_paragraphs_fuzzy("governing  law  of new york state")
+
+    assert "Found" in result
+    assert "**ID**: `para_" in result
+    assert "**Score**:" in result
+    assert "Governing law" in result.split("## Match 1")[1].split("## Match 2")[0]
+
+
+def test_fuzzy_tool_picks_up_unmarked_edits(active_session):
+    session = session_manager.get_session(active_session)
+    docx_insert_paragraph("alpha beta gamma", position="end:document_body")
+    session.get_fuzzy_index()
+
+    # Edit directly, bypassing the tools that bump the revision
+    session.document.paragraphs[0].text = "delta epsilon zeta"
+
+    result = docx_find_paragraphs_fuzzy("alpha beta gamma", min_score=0.9)
+    assert result == "No matching paragraphs found."
+
+
+def test_fuzzy_tool_rejects_invalid_min_score(active_session):
+    result = docx_find_paragraphs_fuzzy("anything", min_score=1.5)
+    assert "ValidationError" in result
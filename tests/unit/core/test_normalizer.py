@@ -0,0 +1,90 @@
+"""Unit tests for run normalization."""
+
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+from docx_mcp_server.core.normalizer import normalize_document
+
+
+def _fragmented_paragraph(doc):
+    p_xml = (
+        f'<w:p {nsdecls("w")} w:rsidR="00A1" w:rsidRDefault="00A1">'
+        '<w:r w:rsidR="00B2"><w:rPr><w:b/><w:i/></w:rPr><w:t xml:space="preserve">Hel</w:t></w:r>'
+        '<w:proofErr w:type="spellStart"/>'
+        '<w:r w:rsidR="00C3"><w:rPr><w:i/><w:b/></w:rPr><w:t>lo</w:t></w:r>'
+        '<w:proofErr w:type="spellEnd"/>'
+        '<w:r><w:rPr><w:b/><w:i/></w:rPr><w:tab/><w:t xml:space="preserve"> world</w:t></w:r>'
+        '<w:r><w:t>plain</w:t></w:r>'
+        '</w:p>'
+    )
+    p = parse_xml(p_xml)
+    doc.element.body.insert(0, p)
+    return doc.paragraphs[0]
+
+
+def test_merges_runs_with_equal_formatting():
+    doc = Document()
+    paragraph = _fragmented_paragraph(doc)
+    text_before = paragraph.text
+
+    result = normalize_document(doc)
+
+    assert paragraph.text == text_before
+    assert [run.text for run in paragraph.runs] == ["Hello\t world", "plain"]
+    assert paragraph.runs[0].bold and paragraph.runs[0].italic
+    assert result.runs_before == 4
+    assert result.runs_merged == 2
+    assert result.proof_marks_removed == 2
+    assert result.rsid_attributes_removed >= 4
+    assert result.bytes_removed > 0
+    assert not list(paragraph._p.iter(qn("w:proofErr")))
+
+
+def test_does_not_merge_different_formatting_or_special_content():
+    doc = Document()
+    p = doc.add_paragraph()
+    p.add_run("a").bold = True
+    p.add_run("b")
+    p.add_run("c")
+    fld = parse_xml(f'<w:r {nsdecls("w")}><w:fldChar w:fldCharType="begin"/></w:r>')
+    p._p.append(fld)
+    p._p.append(parse_xml(f'<w:r {nsdecls("w")}><w:t>d</w:t></w:r>'))
+
+    result = normalize_document(doc)
+
+    assert [run.text for run in p.runs] == ["a", "bc", "", "d"]
+    assert result.runs_merged == 1
+
+
+def test_normalize_tool_invalidates_merged_run_ids(active_session):
+    from docx_mcp_server.server import docx_normalize, session_manager
+
+    session = session_manager.get_session(active_session)
+    paragraph = _fragmented_paragraph(session.document)
+    first_id = session.register_object(paragraph.runs[0], "run")
+    second_id = session.register_object(paragraph.runs[1], "run")
+
+    result = docx_normalize()
+
+    assert "**Runs Merged**: 2" in result
+    assert first_id in session.object_registry
+    assert second_id not in session.object_registry
+    assert session.has_unsaved_changes()
+
+
+def test_normalize_on_load(tmp_path, monkeypatch):
+    from docx_mcp_server.server import session_manager
+
+    doc = Document()
+    _fragmented_paragraph(doc)
+    path = tmp_path / "fragmented.docx"
+    doc.save(str(path))
+
+    monkeypatch.setenv("DOCX_MCP_NORMALIZE_ON_LOAD", "1")
+    session_id = session_manager.create_session(file_path=str(path))
+    try:
+        session = session_manager.get_session(session_id)
+        assert len(session.document.paragraphs[0].runs) == 2
+    finally:
+        session_manager.close_session(session_id)
@@ -0,0 +1,112 @@
+"""Unit tests for the incremental heading outline."""
+
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+
+from docx_mcp_server.core.outline_index import OutlineIndex
+from docx_mcp_server.core.restyler import Restyler
+
+
+def _report():
+    doc = Document()
+    doc.add_paragraph("Title", style="Title")
+    doc.add_paragraph("Intro", style="Heading 1")         # 1
+    doc.add_paragraph("intro text")
+    doc.add_paragraph("Background", style="Heading 2")    # 1.1
+    doc.add_table(rows=1, cols=1)
+    doc.add_paragraph("Scope", style="Heading 2")         # 1.2
+    doc.add_paragraph("Deep", style="Heading 4")          # 1.2.1
+    doc.add_paragraph("Method", style="Heading 1")        # 2
+    doc.add_paragraph("method text")
+    return doc
+
+
+def _snapshot(index):
+    return [(h.number, h.level, h.position, h.parent, h.end, h.text) for h in index.headings]
+
+
+def test_levels_numbers_and_ranges():
+    doc = _report()
+    index = OutlineIndex(doc)
+
+    assert [(h.number, h.level, h.text) for h in index.headings] == [
+        ("1", 1, "Intro"), ("1.1", 2, "Background"), ("1.2", 2, "Scope"),
+        ("1.2.1", 4, "Deep"), ("2", 1, "Method"),
+    ]
+    intro = index.section(index.find_number("1"))
+    assert (intro.start, intro.end) == (1, 6)
+    scope = index.section(index.find_number("1.2"))
+    assert (scope.start, scope.end) == (5, 6)
+    method = index.section(index.find_number("2."))
+    assert (method.start, method.end) == (7, index.block_count - 1) == (7, 8)
+
+
+def test_subsections_and_containing():
+    doc = _report()
+    index = OutlineIndex(doc)
+    intro = index.find_number("1")
+
+    assert [index.headings[i].text for i in index.subsections(intro)] == ["Background", "Scope"]
+    assert [index.headings[i].text for i in index.subsections(None, level=2)] == ["Background", "Scope"]
+    assert [index.headings[i].text for i in index.subsections()] == ["Intro", "Method"]
+    table_cell_p = doc.tables[0].cell(0, 0).paragraphs[0]._p
+    assert index.headings[index.containing(table_cell_p)].text == "Background"
+    assert index.containing(doc.paragraphs[0]._p) is None
+
+
+def test_direct_outline_level_and_custom_styles():
+    doc = Document()
+    custom = doc.styles.add_style("Chapter", WD_STYLE_TYPE.PARAGRAPH)
+    custom.base_style = doc.styles["Heading 1"]
+    doc.add_paragraph("Chapter A", style="Chapter")
+    doc.add_paragraph("Contents", style="TOC Heading")
+    p = doc.add_paragraph("Manual level")
+    lvl = p._p.get_or_add_pPr()._add_outlineLvl()
+    lvl.set(qn("w:val"), "1")
+
+    index = OutlineIndex(doc)
+
+    assert [(h.text, h.level) for h in index.headings] == [("Chapter A", 1), ("Manual level", 2)]
+
+
+def test_incremental_updates_match_rebuild():
+    doc = _report()
+    index = OutlineIndex(doc)
+    body = doc.element.body
+
+    # Body text inserted before the first heading shifts every position
+    new = doc.add_paragraph("preface")._p
+    doc.paragraphs[0]._p.addnext(new)
+    index.block_inserted(new)
+    # A heading inserted in the middle of section 1.2
+    heading = doc.add_paragraph("Results", style="Heading 1")._p
+    doc.paragraphs[7]._p.addprevious(heading)
+    index.block_inserted(heading)
+    # Remove a heading and a table
+    background = doc.paragraphs[4]._p
+    index.block_removing(background)
+    body.remove(background)
+    tbl = doc.tables[0]._tbl
+    index.block_removing(tbl)
+    body.remove(tbl)
+    # Restyle body text into a heading and a heading into body text
+    Restyler(doc).restyle("Heading 3", text="method text", on_change=index.block_restyled)
+    Restyler(doc).restyle("Normal", current_style="Heading 4", on_change=index.block_restyled)
+
+    assert index.is_current()
+    assert _snapshot(index) == _snapshot(OutlineIndex(doc))
+
+
+def test_is_current_detects_unreported_edits():
+    doc = _report()
+    index = OutlineIndex(doc)
+
+    doc.add_paragraph("unreported")
+    assert not index.is_current()
+
+    index = OutlineIndex(doc)
+    body = doc.element.body
+    body.remove(doc.paragraphs[1]._p)
+    doc.add_paragraph("same length")
+    assert len(body) == index.body_length and not index.is_current()
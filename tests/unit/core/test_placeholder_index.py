@@ -0,0 +1,115 @@
+"""Unit tests for the template placeholder index."""
+
+import json
+
+from docx import Document
+
+from docx_mcp_server.core.placeholder_index import PlaceholderIndex
+
+
+def _split_paragraph(doc, *parts):
+    p = doc.add_paragraph()
+    for part in parts:
+        p.add_run(part)
+    return p
+
+
+def test_finds_placeholders_in_body_cells_and_split_runs():
+    doc = Document()
+    doc.add_paragraph("Dear {{NAME}},")
+    _split_paragraph(doc, "Date: {{", "DA", "TE}}")
+    table = doc.add_table(rows=1, cols=1)
+    table.cell(0, 0).text = "{{ NAME }}"
+
+    index = PlaceholderIndex(doc)
+
+    assert sorted(index.names()) == ["DATE", "NAME"]
+    assert len(index.slots["NAME"]) == 2
+    assert index.slots["DATE"][0].split_across_runs
+
+
+def test_fill_preserves_run_formatting_and_surrounding_text():
+    doc = Document()
+    p = doc.add_paragraph("Hello ")
+    bold = p.add_run("{{NA")
+    bold.bold = True
+    p.add_run("ME}}!")
+
+    index = PlaceholderIndex(doc)
+    counts = index.fill({"{{NAME}}": "World"})
+
+    assert counts == {"NAME": 1}
+    assert p.text == "Hello World!"
+    assert p.runs[1].text == "World"
+    assert p.runs[1].bold
+    assert index.names() == []
+
+
+def test_fill_multiple_slots_sharing_text_nodes():
+    doc = Document()
+    p = _split_paragraph(doc, "{{A}} and {{", "B}} then {{A}}")
+
+    index = PlaceholderIndex(doc)
+    index.fill({"A": "1", "B": "22"})
+
+    assert p.text == "1 and 22 then 1"
+
+
+def test_partial_fill_keeps_index_usable():
+    doc = Document()
+    p = doc.add_paragraph("{{FIRST}} {{SECOND}}")
+
+    index = PlaceholderIndex(doc)
+    index.fill({"FIRST": "a long value"})
+
+    assert index.names() == ["SECOND"]
+    assert index.is_current()
+    index.fill({"SECOND": "b"})
+    assert p.text == "a long value b"
+
+
+def test_is_current_detects_external_edits():
+    doc = Document()
+    p = doc.add_paragraph("{{NAME}}")
+    index = PlaceholderIndex(doc)
+
+    p.runs[0].text = "changed"
+
+    assert not index.is_current()
+
+
+def test_fill_placeholders_tool(active_session):
+    from docx_mcp_server.server import docx_fill_placeholders, docx_list_placeholders, session_manager
+
+    session = session_manager.get_session(active_session)
+    doc = session.document
+    doc.add_paragraph("Company: {{COMPANY}}")
+    _split_paragraph(doc, "Year: {{YE", "AR}}")
+
+    listing = docx_list_placeholders()
+    assert "{{COMPANY}}" in listing
+    assert "split across runs" in listing
+
+    result = docx_fill_placeholders(json.dumps({"COMPANY": "Acme", "MISSING": "x"}))
+
+    assert "**Filled**: 1" in result
+    assert "MISSING" in result
+    assert "YEAR" in result
+    assert doc.paragraphs[-2].text == "Company: Acme"
+    assert session.has_unsaved_changes()
+
+
+
+def test_fill_placeholders_tool_in_table_cell(active_session):
+    from docx_mcp_server.server import docx_fill_placeholders, session_manager
+
+    session = session_manager.get_session(active_session)
+    cell = session.document.add_table(rows=1, cols=1).cell(0, 0)
+    cell.text = "Total: {{TOTAL}}"
+
+    result = docx_fill_placeholders(json.dumps({"TOTAL": "42"}))
+
+    element_id = result.split("**Element ID**: ")[1].split()[0].strip("`")
+    paragraph = session.get_object(element_id)
+    assert paragraph.text == "Total: 42"
+    assert paragraph._parent is session.document._body
@@ -0,0 +1,102 @@
+"""Unit tests for predicate-based restyling."""
+
+import pytest
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+
+from docx_mcp_server.core.restyler import Restyler
+
+
+def _legacy_document():
+    doc = Document()
+    doc.styles.add_style("Legacy Caption", WD_STYLE_TYPE.PARAGRAPH)
+    doc.styles.add_style("Alert", WD_STYLE_TYPE.CHARACTER)
+    doc.add_paragraph("Overview", style="Heading 1")
+    doc.add_paragraph("Figure 1", style="Legacy Caption")
+    p = doc.add_paragraph()
+    p.add_run("WARNING: ")
+    p.add_run("keep dry")
+    doc.add_paragraph("Details", style="Heading 2")
+    table = doc.add_table(rows=1, cols=1)
+    table.cell(0, 0).paragraphs[0].text = "Figure 2"
+    table.cell(0, 0).paragraphs[0].style = doc.styles["Legacy Caption"]
+    inner = table.cell(0, 0).add_table(rows=1, cols=1)
+    inner.cell(0, 0).paragraphs[0].text = "nested"
+    return doc
+
+
+def test_paragraph_style_by_current_style():
+    doc = _legacy_document()
+
+    result = Restyler(doc).restyle("Caption", current_style="Legacy Caption")
+
+    assert result == {"style_id": "Caption", "style_type": "paragraph", "matched": 2, "changed": 2}
+    assert doc.paragraphs[1].style.name == "Caption"
+    assert doc.tables[0].cell(0, 0).paragraphs[0].style.name == "Caption"
+
+
+def test_in_table_and_heading_level_predicates():
+    doc = _legacy_document()
+    restyler = Restyler(doc)
+
+    outside = restyler.restyle("Caption", current_style="Legacy Caption", in_table=False)
+    headings = restyler.restyle("Heading 3", heading_level=2)
+
+    assert outside["matched"] == 1
+    assert doc.tables[0].cell(0, 0).paragraphs[0].style.name == "Legacy Caption"
+    assert headings["matched"] == 1 and doc.paragraphs[3].style.name == "Heading 3"
+    assert doc.paragraphs[0].style.name == "Heading 1"
+
+
+def test_character_style_on_matching_runs():
+    doc = _legacy_document()
+
+    result = Restyler(doc).restyle("Alert", text=r"^warning", use_regex=True)
+
+    runs = doc.paragraphs[2].runs
+    assert result["style_type"] == "character" and result["matched"] == 1
+    assert runs[0].style.name == "Alert" and runs[1].style.name == "Default Paragraph Font"
+
+
+def test_table_styles_and_nesting():
+    doc = _legacy_document()
+
+    result = Restyler(doc).restyle("Table Grid", in_table=False)
+
+    assert result["matched"] == 1
+    assert doc.tables[0].style.name == "Table Grid"
+    assert doc.tables[0].cell(0, 0).tables[0].style.name == "Normal Table"
+
+
+def test_default_style_removes_reference_and_repeats_are_no_ops():
+    doc = _legacy_document()
+    restyler = Restyler(doc)
+
+    first = restyler.restyle("Normal", current_style="Legacy Caption")
+    second = restyler.restyle("Normal", current_style="Normal")
+
+    assert first["changed"] == 2
+    assert doc.paragraphs[1]._p.pPr.pStyle is None
+    assert second["changed"] == 0 and second["matched"] > 0
+
+
+def test_scope_limits_the_walk():
+    doc = _legacy_document()
+
+    result = Restyler(doc).restyle("Caption", current_style="Legacy Caption", scope=doc.tables[0]._tbl)
+
+    assert result["matched"] == 1
+    assert doc.paragraphs[1].style.name == "Legacy Caption"
+
+
+def test_invalid_arguments():
+    restyler = Restyler(_legacy_document())
+
+    with pytest.raises(ValueError):
+        restyler.restyle("No Such Style")
+    with pytest.raises(ValueError):
+        restyler.restyle("Caption", current_style="Alert")
+    with pytest.raises(ValueError):
+        restyler.restyle("Table Grid", heading_level=1)
+    with pytest.raises(ValueError):
+        restyler.restyle("Caption", text="(", use_regex=True)
@@ -0,0 +1,97 @@
+"""Unit tests for repeating-row table templates."""
+
+import pytest
+from docx import Document
+from docx.oxml.ns import qn
+
+from docx_mcp_server.core.row_template import RowTemplate, find_template_row
+
+
+def _texts(table):
+    return [[cell.text for cell in row.cells] for row in table.rows]
+
+
+def _invoice():
+    doc = Document()
+    table = doc.add_table(rows=3, cols=3)
+    for c, text in enumerate(["#", "Item", "Amount"]):
+        table.cell(0, c).text = text
+    for c, text in enumerate(["{{_index}}", "{{sku}} x{{qty}}", "{{amount}}"]):
+        table.cell(1, c).text = text
+    table.cell(2, 0).text = "Total"
+    return table
+
+
+def test_render_clones_template_and_substitutes_values():
+    table = _invoice()
+    # Split a token across runs and make it bold, as Word often does
+    p = table.cell(1, 2).paragraphs[0]
+    p.runs[0].text = "{{amo"
+    p.add_run("unt}}")
+    p.runs[0].bold = True
+
+    template = RowTemplate(table, find_template_row(table))
+    result = template.render(
+        [{"sku": "A-1", "qty": "2", "amount": 10}, {"sku": "B-2", "qty": "1", "amount": 2.5}],
+        number_format=",.2f",
+    )
+
+    assert template.names() == ["_index", "sku", "qty", "amount"]
+    assert _texts(table) == [
+        ["#", "Item", "Amount"],
+        ["1", "A-1 x2.00", "10.00"],
+        ["2", "B-2 x1.00", "2.50"],
+        ["Total", "", ""],
+    ]
+    assert table.cell(2, 2).paragraphs[0].runs[0].bold is True
+    assert result["mapping"] == {1: None, 2: 3}
+
+
+def test_multi_row_records_and_alternating_variants():
+    doc = Document()
+    table = doc.add_table(rows=2, cols=1)
+    table.cell(0, 0).text = "{{name}}"
+    table.cell(1, 0).text = "{{name}}"
+    shading = table.cell(1, 0)._tc.get_or_add_tcPr()
+    shading.append(shading.makeelement(qn("w:shd"), {qn("w:fill"): "EEEEEE"}))
+
+    RowTemplate(table, 0, variants=2).render([{"name": n} for n in "abc"])
+
+    assert _texts(table) == [["a"], ["b"], ["c"]]
+    fills = [tc.xpath("string(w:tcPr/w:shd/@w:fill)") for tc in table._tbl.iter(qn("w:tc"))]
+    assert fills == ["", "EEEEEE", ""]
+
+    doc = Document()
+    table = doc.add_table(rows=2, cols=1)
+    table.cell(0, 0).text = "{{item.name}}"
+    table.cell(1, 0).text = "{{note}} {{missing}}"
+    RowTemplate(table, 0, row_count=2).render(
+        [{"item": {"name": "x"}, "note": "n1"}, {"item": {"name": "y"}, "note": "n2"}], keep_template=True
+    )
+    assert _texts(table)[:4] == [["x"], ["n1 {{missing}}"], ["y"], ["n2 {{missing}}"]]
+    assert len(table.rows) == 6
+
+
+def test_invalid_templates_raise():
+    table = _invoice()
+    with pytest.raises(IndexError):
+        RowTemplate(table, 2, row_count=2)
+    table.cell(1, 0).merge(table.cell(2, 0))
+    with pytest.raises(ValueError):
+        RowTemplate(table, 1)
+    doc = Document()
+    only = doc.add_table(rows=1, cols=1)
+    with pytest.raises(ValueError):
+        RowTemplate(only, 0).render([])
+
+
+def test_merge_across_variant_blocks_raises():
+    doc = Document()
+    table = doc.add_table(rows=5, cols=2)
+    table.cell(2, 0).merge(table.cell(3, 0))
+
+    # Rows 1-2 and 3-4 are the two variant blocks; the merge joins them
+    with pytest.raises(ValueError, match="row 3"):
+        RowTemplate(table, 1, row_count=2, variants=2)
+    # Inside one block the merge is fine
+    RowTemplate(table, 2, row_count=2, variants=1)
@@ -0,0 +1,75 @@
+"""Unit tests for the per-document style cache."""
+
+import pytest
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+
+from docx_mcp_server.core.style_cache import StyleCache, invalidate_style_cache
+
+
+def test_names_types_and_outline_levels():
+    doc = Document()
+    styles = StyleCache.of(doc)
+
+    heading = styles.resolve("Heading 2")
+    assert heading.style_id == "Heading2" and heading.type == "paragraph"
+    assert heading.name == "Heading 2" and heading.outline_level == 2 and heading.is_heading
+    assert styles.resolve("heading 2") is heading
+    assert styles.get("Normal").outline_level is None
+    assert styles.default("paragraph").style_id == "Normal"
+    assert styles.default("table").type == "table"
+
+
+def test_toc_heading_is_not_an_outline_level():
+    styles = StyleCache.of(Document())
+
+    toc = styles.resolve("TOC Heading")
+
+    assert toc.is_heading and toc.outline_level is None
+    assert "Heading1" in toc.based_on
+
+
+def test_custom_style_inherits_outline_level():
+    doc = Document()
+    custom = doc.styles.add_style("Chapter Title", WD_STYLE_TYPE.PARAGRAPH)
+    custom.base_style = doc.styles["Heading 2"]
+
+    info = StyleCache.of(doc).resolve("Chapter Title")
+
+    assert info.outline_level == 2
+    assert info.based_on[0] == "Heading2"
+
+
+def test_paragraph_style_matches_python_docx():
+    doc = Document()
+    doc.add_paragraph("plain")
+    doc.add_paragraph("title", style="Heading 1")
+    doc.add_paragraph("dangling")._p.style = "NoSuchStyle"
+    styles = StyleCache.of(doc)
+
+    for paragraph in doc.paragraphs:
+        assert styles.paragraph_style(paragraph._p).name == paragraph.style.name
+
+
+def test_cache_is_shared_and_rebuilt_on_change():
+    doc = Document()
+    paragraph = doc.add_paragraph("x")
+    first = StyleCache.of(doc)
+    assert StyleCache.of(paragraph) is first
+
+    doc.styles.add_style("Added", WD_STYLE_TYPE.PARAGRAPH)
+    second = StyleCache.of(doc)
+    assert second is not first and second.resolve("Added").type == "paragraph"
+
+    assert StyleCache.of(doc) is second
+
+    # In-place edits keep the shape; they are picked up after an invalidation
+    doc.styles["Added"].name = "Renamed"
+    assert StyleCache.of(doc) is second
+    invalidate_style_cache(doc)
+    assert StyleCache.of(doc).resolve("Renamed").style_id == second.resolve("Added").style_id
+
+
+def test_unknown_style():
+    with pytest.raises(ValueError, match="not found"):
+        StyleCache.of(Document()).resolve("Nope")
@@ -0,0 +1,103 @@
+"""Unit tests for the columnar table view and its transforms."""
+
+import math
+
+import pytest
+from docx import Document
+
+from docx_mcp_server.core.table_columns import (
+    ColumnarTable,
+    format_number,
+    parse_number,
+    transform_columns,
+)
+from docx_mcp_server.core.table_grid import TableGrid
+
+
+def _texts(table):
+    return [[cell.text for cell in row.cells] for row in table.rows]
+
+
+def _invoice(rows):
+    doc = Document()
+    table = doc.add_table(rows=len(rows), cols=len(rows[0]))
+    for r, values in enumerate(rows):
+        for c, text in enumerate(values):
+            table.cell(r, c).text = text
+    return table
+
+
+def test_parse_and_format_numbers():
+    assert parse_number("$1,234.50") == 1234.5
+    assert parse_number("(200)") == -200
+    assert parse_number("12.5%") == 0.125
+    assert math.isnan(parse_number("n/a"))
+    assert parse_number("-12,345,678.9") == -12345678.9
+    assert parse_number("(1,200)") == -1200
+    # Decimal commas and broken groups are not silently scaled
+    for text in ("1,5", "12,34", "1,2345", ",123", "1,234,56"):
+        assert math.isnan(parse_number(text)), text
+
+    assert format_number(1234.5) == "1,234.50"
+    assert format_number(-5, "currency", symbol="€") == "-€5.00"
+    assert format_number(0.125, "percent", decimals=1) == "12.5%"
+    assert format_number(float("nan")) == ""
+
+
+def test_columns_skip_header_and_merged_positions():
+    table = _invoice([["Item", "Qty"], ["A", "1"], ["B", "2"]])
+    table.cell(1, 0).merge(table.cell(1, 1))
+
+    view = ColumnarTable(table, TableGrid(table._tbl))
+
+    assert view.names == ["Item", "Qty"]
+    assert view.columns == [["A\n1", "B"], ["", "2"]]
+    assert list(view.numbers("Qty"))[1] == 2.0
+
+
+def test_transform_formats_computes_and_totals_in_one_pass():
+    table = _invoice([
+        ["Item", "Qty", "Price", "Amount"],
+        ["A", "2", "1000.5", ""],
+        ["B", "3", "(5)", ""],
+        ["C", "n/a", "2", ""],
+    ])
+
+    result = transform_columns(table, [
+        {"op": "format", "column": "Price", "style": "currency"},
+        {"op": "compute", "target": "Amount", "expression": "[Qty] * [Price]"},
+        {"op": "total", "column": 3, "label": "Total"},
+    ])
+
+    assert result["rows_added"] == 1 and result["totals"] == {"3": 1986.0}
+    assert _texts(table)[1:] == [
+        ["A", "2", "$1,000.50", "2,001.00"],
+        ["B", "3", "-$5.00", "-15.00"],
+        ["C", "n/a", "$2.00", ""],
+        ["Total", "", "", "1,986.00"],
+    ]
+
+
+def test_total_goes_to_footer_row_and_keeps_run_format():
+    table = _invoice([["Item", "Amount"], ["A", "1.5"], ["B", "2"], ["Sum", "0"]])
+    table.cell(3, 1).paragraphs[0].runs[0].bold = True
+
+    result = transform_columns(table, [{"op": "total", "column": "Amount", "style": "plain"}], footer_rows=1)
+
+    assert result["rows_added"] == 0 and result["cells_written"] == 1
+    assert table.cell(3, 1).text == "3.50"
+    assert table.cell(3, 1).paragraphs[0].runs[0].bold is True
+
+
+def test_invalid_operations_raise_value_error():
+    table = _invoice([["Qty"], ["1"]])
+
+    for ops in (
+        [{"op": "sort"}],
+        [{"op": "compute", "target": "Qty", "expression": "__import__('os')"}],
+        [{"op": "format", "column": "Missing"}],
+        [{"op": "format", "column": "Qty", "style": "roman"}],
+    ):
+        with pytest.raises(ValueError):
+            transform_columns(table, ops)
+    assert _texts(table) == [["Qty"], ["1"]]
@@ -0,0 +1,84 @@
+"""Unit tests for streaming table export."""
+
+import csv
+import json
+
+import pytest
+from docx import Document
+
+from docx_mcp_server.core import text_extractor
+from docx_mcp_server.core.table_export import body_tables, export_table, export_tables, read_rows
+
+
+def _merged_table(doc):
+    table = doc.add_table(rows=3, cols=3)
+    for r, row in enumerate(table.rows):
+        for c, cell in enumerate(row.cells):
+            cell.text = f"{r}{c}"
+    table.cell(0, 0).merge(table.cell(0, 1)).text = "Head"
+    table.cell(1, 2).merge(table.cell(2, 2)).text = "Tall"
+    return table
+
+
+def test_iter_table_rows_resolves_merges_in_both_modes():
+    table = _merged_table(Document())
+
+    repeated = list(text_extractor.iter_table_rows(table._tbl))
+    anchored = list(text_extractor.iter_table_rows(table._tbl, repeat_merged=False))
+
+    assert repeated == [[c.text for c in row.cells] for row in table.rows]
+    assert anchored == [["Head", "", "02"], ["10", "11", "Tall"], ["20", "21", ""]]
+
+
+def test_csv_and_tsv_export(tmp_path):
+    table = _merged_table(Document())
+
+    result = export_table(table._tbl, str(tmp_path / "out.csv"), header=True)
+    tsv = export_table(table._tbl, str(tmp_path / "out.tsv"), repeat_merged=False)
+
+    assert result == {"path": str(tmp_path / "out.csv"), "format": "csv", "rows": 2}
+    with open(tmp_path / "out.csv", newline="", encoding="utf-8") as f:
+        assert list(csv.reader(f))[2] == ["20", "21", "Tall"]
+    assert tsv["rows"] == 3
+    assert (tmp_path / "out.tsv").read_text(encoding="utf-8").splitlines()[0] == "Head\t\t02"
+
+
+def test_jsonl_header_keys_are_unique(tmp_path):
+    doc = Document()
+    table = doc.add_table(rows=2, cols=3)
+    for cell, text in zip(table.rows[0].cells, ["Item", "Item", ""]):
+        cell.text = text
+    for cell, text in zip(table.rows[1].cells, ["a", "b", "c"]):
+        cell.text = text
+
+    export_table(table._tbl, str(tmp_path / "out.jsonl"), header=True)
+
+    lines = (tmp_path / "out.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [{"Item": "a", "Item_2": "b", "column_3": "c"}]
+
+
+def test_export_all_tables_to_directory(tmp_path):
+    doc = Document()
+    doc.add_table(rows=1, cols=1).cell(0, 0).text = "first"
+    # Nested tables are not body-level tables
+    doc.add_table(rows=2, cols=1).cell(0, 0).add_table(rows=1, cols=1)
+
+    results = export_tables(body_tables(doc), str(tmp_path / "dump"), "jsonl")
+
+    assert len(body_tables(doc)) == len(doc.tables) == 2
+    assert [(r["index"], r["rows"]) for r in results] == [(0, 1), (1, 2)]
+    assert (tmp_path / "dump" / "table_0.jsonl").read_text(encoding="utf-8") == '["first"]\n'
+    with pytest.raises(ValueError):
+        export_tables(body_tables(doc), str(tmp_path / "dump"), "xlsx")
+
+
+def test_read_rows_window():
+    doc = Document()
+    table = doc.add_table(rows=5, cols=1)
+    for idx, row in enumerate(table.rows):
+        row.cells[0].text = str(idx)
+
+    window = read_rows(table._tbl, start_row=1, max_rows=2)
+
+    assert window == {"rows": [["1"], ["2"]], "start_row": 1, "total_rows": 5, "truncated": True}
+    assert not read_rows(table._tbl, start_row=3, max_rows=10)["truncated"]
@@ -0,0 +1,72 @@
+"""Unit tests for the bulk table fill engine."""
+
+from docx import Document
+from docx.shared import Pt
+
+from docx_mcp_server.core.table_fill import append_rows, fill_table
+
+
+def test_fill_preserves_run_formatting_per_cell():
+    doc = Document()
+    table = doc.add_table(rows=2, cols=2)
+    header = table.cell(0, 0).paragraphs[0].add_run("old")
+    header.bold = True
+    header.font.size = Pt(14)
+    table.cell(0, 1).paragraphs[0].add_run("plain")
+
+    fill_table(table, [["A", "B"], ["C", "D"]])
+
+    first = table.cell(0, 0).paragraphs[0].runs
+    assert [run.text for run in first] == ["A"]
+    assert first[0].bold and first[0].font.size == Pt(14)
+    assert not table.cell(0, 1).paragraphs[0].runs[0].bold
+    assert [[cell.text for cell in row.cells] for row in table.rows] == [["A", "B"], ["C", "D"]]
+
+
+def test_fill_appends_rows_and_converts_values():
+    doc = Document()
+    table = doc.add_table(rows=1, cols=3)
+
+    result = fill_table(table, [[1, None, "x"], ["a\tb", 2.5]], preserve_formatting=False)
+
+    assert [[cell.text for cell in row.cells] for row in table.rows] == [["1", "", "x"], ["a\tb", "2.5", ""]]
+    assert result["filled_range"] == {"start_row": 0, "start_col": 0, "end_row": 1, "end_col": 2}
+
+
+def test_fill_skips_spanned_cells_when_requested():
+    doc = Document()
+    table = doc.add_table(rows=2, cols=3)
+    table.cell(0, 0).merge(table.cell(0, 1))
+
+    result = fill_table(table, [["a", "b", "c"]], skip_spanned=True)
+
+    assert [cell.text for cell in table.rows[0].cells] == ["", "", "c"]
+    assert [(r["row"], r["col"]) for r in result["skipped_regions"]] == [(0, 0), (0, 1)]
+
+
+def test_append_rows_clones_last_row_formatting():
+    doc = Document()
+    table = doc.add_table(rows=1, cols=2)
+    run = table.cell(0, 0).paragraphs[0].add_run("template")
+    run.italic = True
+
+    new_rows = append_rows(table, 3)
+
+    assert len(new_rows) == 3
+    assert len(table.rows) == 4
+    assert [cell.text for cell in table.rows[3].cells] == ["", ""]
+    fill_table(table, [["x", "y"]], start_row=3)
+    assert table.cell(3, 0).paragraphs[0].runs[0].italic
+    assert table.cell(0, 0).text == "template"
+
+
+def test_append_rows_does_not_extend_vertical_merges():
+    doc = Document()
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 1).merge(table.cell(1, 1))
+
+    append_rows(table, 1)
+    table.cell(2, 1).text = "new"
+
+    assert table.cell(1, 1).text == ""
+    assert table.cell(2, 1).text == "new"
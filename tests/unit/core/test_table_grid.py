@@ -0,0 +1,196 @@
+"""Unit tests for the logical table grid model."""
+
+from docx import Document
+
+from docx_mcp_server.core.registry_cleaner import RegistryCleaner
+from docx_mcp_server.core.session import Session
+from docx_mcp_server.core.table_analyzer import TableStructureAnalyzer
+from docx_mcp_server.core.table_grid import TableGrid, parse_virtual_cell_id, virtual_cell_id
+
+
+def _merged_table(doc):
+    table = doc.add_table(rows=3, cols=3)
+    table.cell(0, 0).merge(table.cell(0, 1))
+    table.cell(1, 2).merge(table.cell(2, 2))
+    return table
+
+
+def test_anchors_mirror_row_cells():
+    doc = Document()
+    table = _merged_table(doc)
+
+    expected = [[cell._tc for cell in row.cells] for row in table.rows]
+    grid = TableGrid(table._tbl)
+
+    assert [[id(tc) for tc in row] for row in grid.anchors] == [[id(tc) for tc in row] for row in expected]
+
+
+def test_merge_map_origin_span_and_physical_cells():
+    doc = Document()
+    table = _merged_table(doc)
+    grid = TableGrid(table._tbl)
+
+    assert grid.origin(0, 1) == (0, 0)
+    assert grid.span(0, 1) == (1, 2)
+    assert grid.origin(2, 2) == (1, 2)
+    assert grid.span(2, 2) == (2, 1)
+    assert not grid.is_merged(2, 0)
+    # The continuation cell is a different w:tc in its own row
+    assert grid.physical_cell(2, 2) is not grid.anchor(2, 2)
+    assert grid.physical_cell(2, 2).getparent() is grid.rows[2]
+    assert grid.cell(2, 2, table)._tc is table.cell(1, 2)._tc
+
+
+def test_out_of_range_raises_index_error():
+    doc = Document()
+    grid = TableGrid(doc.add_table(rows=2, cols=2)._tbl)
+
+    for row, col in [(2, 0), (0, 2), (-1, 0)]:
+        try:
+            grid.anchor(row, col)
+        except IndexError:
+            continue
+        raise AssertionError(f"({row}, {col}) should be out of range")
+
+
+def test_structure_matches_analyzer_report():
+    doc = Document()
+    table = _merged_table(doc)
+    table.cell(2, 0).add_table(rows=1, cols=1)
+
+    report = TableStructureAnalyzer.detect_irregular_structure(table)
+
+    assert report["is_irregular"] and report["has_merged_cells"] and report["has_nested_tables"]
+    kinds = [(r["type"], r["row"], r["col"]) for r in report["irregular_regions"]]
+    assert ("merged", 0, 0) in kinds and ("merged", 0, 1) in kinds
+    assert ("merged_vertical", 1, 2) in kinds and ("merged_vertical", 2, 2) in kinds
+    assert kinds[-1] == ("nested", 2, 0)
+    assert TableStructureAnalyzer.get_fillable_cells(table) == [(0, 2), (1, 0), (1, 1), (2, 1)]
+
+
+def test_session_cache_reuses_and_rebuilds_grid():
+    doc = Document()
+    table = doc.add_table(rows=2, cols=2)
+    session = Session(session_id="grid", document=doc)
+
+    grid = session.get_table_grid(table)
+    table.cell(0, 0).text = "content only"
+    assert session.get_table_grid(table) is grid
+
+    # Within a revision the grid is trusted; the structure is checked once
+    # the revision moves on
+    table.cell(0, 0).merge(table.cell(0, 1))
+    assert session.get_table_grid(table) is grid
+    session.mark_dirty()
+    rebuilt = session.get_table_grid(table)
+    assert rebuilt is not grid
+    assert rebuilt.span(0, 0) == (1, 2)
+
+    session.mark_dirty()
+    assert session.get_table_grid(table) is rebuilt
+
+    session.invalidate_table_grid(table)
+    assert session.get_table_grid(table) is not rebuilt
+
+
+def test_session_drops_grids_of_removed_tables():
+    doc = Document()
+    kept, removed = doc.add_table(rows=1, cols=1), doc.add_table(rows=1, cols=1)
+    session = Session(session_id="prune", document=doc)
+    session.get_table_grid(kept)
+    session.get_table_grid(removed)
+
+    removed._tbl.getparent().remove(removed._tbl)
+    session.mark_dirty()
+    session.get_table_grid(doc.add_table(rows=1, cols=1))
+
+    assert id(removed._tbl) not in session._table_grids
+    assert id(kept._tbl) in session._table_grids
+
+
+def test_register_many_cells_checks_each_grid_once(monkeypatch):
+    doc = Document()
+    table = doc.add_table(rows=40, cols=25)
+    session = Session(session_id="bulk", document=doc)
+    session.get_table_grid(table)
+    session.mark_dirty()
+    checks = []
+    original = TableGrid.is_current
+    monkeypatch.setattr(TableGrid, "is_current", lambda grid: checks.append(1) or original(grid))
+
+    ids = session.register_objects([(cell, "cell", None) for row in table.rows for cell in row.cells])
+    ids.append(session.register_object(table.cell(0, 0), "cell"))
+
+    assert len(checks) == 1
+    assert session.cell_index.position(ids[-2]) == (39, 24)
+    assert session.cell_index.position(ids[-1]) == (0, 0)
+
+
+def test_registry_cleaner_uses_physical_rows_and_spanned_columns():
+    doc = Document()
+    table = _merged_table(doc)
+    session = Session(session_id="cleaner", document=doc)
+    ids = {
+        (row, col): session.register_object(table.cell(row, col), "cell")
+        for row, col in [(0, 0), (1, 0), (1, 2), (2, 0)]
+    }
+
+    row_ids = RegistryCleaner.find_invalidated_ids(session, table, row_index=2)
+    col_ids = RegistryCleaner.find_invalidated_ids(session, table, col_index=1)
+
+    # The vertical merge anchor lives in row 1 and survives deleting row 2
+    assert row_ids == [ids[(2, 0)]]
+    # The horizontally merged cell spans column 1 and goes with it
+    assert col_ids == [ids[(0, 0)]]
+
+
+def test_virtual_cell_ids_resolve_through_grid():
+    doc = Document()
+    table = _merged_table(doc)
+    session = Session(session_id="virtual", document=doc)
+    table_id = session.register_object(table, "table")
+
+    cell = session.get_object(virtual_cell_id(table_id, 2, 2))
+
+    assert cell._tc is table.cell(1, 2)._tc
+    assert parse_virtual_cell_id(f"{table_id}:r2:c2") == (table_id, 2, 2)
+    assert parse_virtual_cell_id(table_id) is None
+    assert session.get_object(virtual_cell_id(table_id, 3, 0)) is None
+    assert session.get_object("para_missing:r0:c0") is None
+
+
+def test_virtual_cell_lookups_check_the_grid_once_per_revision(monkeypatch):
+    doc = Document()
+    table = doc.add_table(rows=30, cols=10)
+    session = Session(session_id="virtual-bulk", document=doc)
+    table_id = session.register_object(table, "table")
+    session.get_table_grid(table)
+    session.mark_dirty()
+    checks = []
+    original = TableGrid.is_current
+    monkeypatch.setattr(TableGrid, "is_current", lambda grid: checks.append(1) or original(grid))
+
+    cells = [session.get_object(virtual_cell_id(table_id, r, c)) for r in range(30) for c in range(10)]
+
+    assert len(checks) == 1
+    assert cells[-1]._tc is table.cell(29, 9)._tc
+
+
+def test_structure_grid_is_windowed_and_unregistered():
+    doc = Document()
+    table = _merged_table(doc)
+    session = Session(session_id="window", document=doc)
+    table_id = session.register_object(table, "table")
+
+    report = TableStructureAnalyzer.detect_irregular_structure(
+        table, session=session, start_row=1, end_row=3, start_col=1
+    )
+
+    assert [[c["cell_id"] for c in row] for row in report["grid_structure"]] == [
+        [f"{table_id}:r1:c1", f"{table_id}:r1:c2"],
+        [f"{table_id}:r2:c1", f"{table_id}:r2:c2"],
+    ]
+    # Regions outside the window are dropped, flags stay table-wide
+    assert {(r["row"], r["col"]) for r in report["irregular_regions"]} == {(1, 2), (2, 2)}
+    assert report["has_merged_cells"]
+    assert list(session.object_registry) == [table_id]
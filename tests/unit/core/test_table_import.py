@@ -0,0 +1,96 @@
+"""Unit tests for streaming CSV/TSV/JSON-lines import into tables."""
+
+import json
+
+import pytest
+from docx import Document
+
+from docx_mcp_server.core.table_fill import stream_rows
+from docx_mcp_server.core.table_import import format_value, import_table_file
+
+
+def _texts(table):
+    return [[cell.text for cell in row.cells] for row in table.rows]
+
+
+def _header_table(cols=2):
+    doc = Document()
+    table = doc.add_table(rows=1, cols=cols)
+    for cell in table.rows[0].cells:
+        cell.paragraphs[0].add_run("H").bold = True
+    return table
+
+
+def test_csv_appends_rows_with_column_mapping(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("name,qty,price\nApple,3,1.5\nPear,10,0.25\n", encoding="utf-8")
+    table = _header_table()
+
+    result = import_table_file(table, str(path), columns=["price", "name"], number_format=".2f")
+
+    assert result["rows_written"] == 2 and result["rows_added"] == 2
+    assert result["header"] == ["price", "name"]
+    assert _texts(table)[1:] == [["1.50", "Apple"], ["0.25", "Pear"]]
+
+
+def test_appended_rows_clone_template_row_formatting(tmp_path):
+    path = tmp_path / "data.tsv"
+    path.write_text("a\tb\n1\t2\n", encoding="utf-8")
+    table = _header_table()
+
+    import_table_file(table, str(path), has_header=False)
+
+    assert _texts(table) == [["H", "H"], ["a", "b"], ["1", "2"]]
+    assert table.cell(2, 1).paragraphs[0].runs[0].bold
+
+
+def test_jsonl_objects_use_keys_and_write_header(tmp_path):
+    path = tmp_path / "data.jsonl"
+    lines = [{"id": "007", "total": 1234.5}, {"total": 2, "id": "8", "extra": True}]
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n\n", encoding="utf-8")
+    doc = Document()
+    table = doc.add_table(rows=1, cols=2)
+
+    result = import_table_file(table, str(path), write_header=True, start_row=0, number_format=",")
+
+    assert result["rows_added"] == 2
+    assert _texts(table) == [["id", "total"], ["007", "1,234.5"], ["8", "2"]]
+
+
+def test_invalid_inputs_raise(tmp_path):
+    table = _header_table()
+    bad = tmp_path / "bad.jsonl"
+    bad.write_text('{"a": 1}\nnot json\n', encoding="utf-8")
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("a,b\n1,2\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Line 2"):
+        import_table_file(table, str(bad))
+    with pytest.raises(ValueError, match="not found in header"):
+        import_table_file(table, str(csv_path), columns=["missing"])
+    txt_path = tmp_path / "data.txt"
+    txt_path.write_text("a,b\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Cannot detect format"):
+        import_table_file(table, str(txt_path))
+    with pytest.raises(FileNotFoundError):
+        import_table_file(table, str(tmp_path / "missing.csv"))
+
+
+def test_format_value_is_type_aware():
+    assert format_value(None) == ""
+    assert format_value("12", ".1f") == "12.0"
+    assert format_value("0042", ".1f") == "0042"
+    assert format_value("n/a", ".1f") == "n/a"
+    assert format_value(3.5, "d") == "3.5"
+
+
+def test_stream_rows_consumes_a_generator_and_overwrites_from_start_row():
+    doc = Document()
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 0).merge(table.cell(0, 1))
+
+    result = stream_rows(table, ((f"r{i}", i) for i in range(3)), start_row=0)
+
+    assert result == {"rows_written": 3, "rows_added": 1, "first_row": 0}
+    # The merged cell takes the first value of its row
+    assert _texts(table) == [["r0", "r0"], ["r1", "1"], ["r2", "2"]]
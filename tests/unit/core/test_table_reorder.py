@@ -0,0 +1,81 @@
+"""Unit tests for row-level table sort, filter and dedupe."""
+
+import pytest
+from docx import Document
+
+from docx_mcp_server.core.session import Session
+from docx_mcp_server.core.table_reorder import dedupe_rows, filter_rows, sort_rows
+
+
+def _texts(table):
+    return [[cell.text for cell in row.cells] for row in table.rows]
+
+
+def _table(rows):
+    doc = Document()
+    table = doc.add_table(rows=len(rows), cols=len(rows[0]))
+    for r, values in enumerate(rows):
+        for c, text in enumerate(values):
+            table.cell(r, c).text = text
+    return table
+
+
+def test_sort_moves_rows_and_keeps_formatting():
+    table = _table([["Name", "Amount"], ["b", "9"], ["a", "10"], ["c", ""], ["Total", "19"]])
+    trs = list(table._tbl.tr_lst)
+    table.cell(2, 1).paragraphs[0].runs[0].bold = True
+
+    result = sort_rows(table, [{"column": "Amount", "descending": True}], footer_rows=1)
+
+    # Numeric order (10 > 9), empty last, footer untouched
+    assert _texts(table) == [["Name", "Amount"], ["a", "10"], ["b", "9"], ["c", ""], ["Total", "19"]]
+    assert table._tbl.tr_lst[1] is trs[2]
+    assert table.cell(1, 1).paragraphs[0].runs[0].bold is True
+    assert result["mapping"] == {1: 2, 2: 1}
+
+
+def test_sort_multiple_keys_is_stable_and_case_insensitive():
+    table = _table([["K", "V"], ["b", "2"], ["A", "1"], ["a", "0"], ["B", "1"]])
+
+    sort_rows(table, ["K", {"column": "V"}])
+
+    assert [row[0] + row[1] for row in _texts(table)[1:]] == ["a0", "A1", "B1", "b2"]
+
+
+def test_vertically_merged_rows_move_as_one_block():
+    table = _table([["H", "K"], ["x", "3"], ["y", "1"], ["z", "2"]])
+    table.cell(1, 0).merge(table.cell(2, 0))
+
+    sort_rows(table, ["K"])
+
+    assert _texts(table)[1:] == [["z", "2"], ["x\ny", "3"], ["x\ny", "1"]]
+    with pytest.raises(ValueError):
+        sort_rows(table, ["K"], header_rows=3)
+
+
+def test_filter_and_dedupe_remove_rows():
+    table = _table([["Item", "Qty"], ["a", "5"], ["b", "20"], ["A ", "5"], ["c", "n/a"]])
+
+    dedupe = dedupe_rows(table, columns=["Item", 1])
+    assert dedupe["removed"] == 1 and [r[0] for r in _texts(table)[1:]] == ["a", "b", "c"]
+
+    result = filter_rows(table, [{"column": "Qty", "op": "gt", "value": 10}], keep_matching=False)
+    assert result == {"rows_before": 3, "rows_after": 2, "removed": 1, "moved": 1, "mapping": {2: None, 3: 2}}
+    assert _texts(table) == [["Item", "Qty"], ["a", "5"], ["c", "n/a"]]
+
+    with pytest.raises(ValueError):
+        filter_rows(table, [{"column": "Qty", "op": "like", "value": "x"}])
+    with pytest.raises(ValueError):
+        filter_rows(table, [{"column": "Qty", "op": "empty"}], header_rows=0)
+
+
+def test_session_cell_ids_follow_sorted_rows():
+    table = _table([["H"], ["b"], ["a"]])
+    session = Session(session_id="sort", document=table._parent.part.document)
+    cell_id = session.register_object(table.cell(1, 0), "cell")
+
+    mapping = sort_rows(table, [0], grid=session.get_table_grid(table))["mapping"]
+    session.cell_index.apply(session.cell_index.plan_row_mapping(table._tbl, mapping))
+
+    assert session.cell_index.position(cell_id) == (2, 0)
+    assert session.get_object(cell_id).text == "b"
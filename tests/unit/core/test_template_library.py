@@ -0,0 +1,97 @@
+"""Unit tests for the named format template library."""
+
+import json
+
+import pytest
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Pt
+
+from docx_mcp_server.core.template_library import TemplateLibrary
+from docx_mcp_server.utils.format_template import FormatTemplate, TemplateManager
+
+
+def _caption_template():
+    doc = Document()
+    run = doc.add_paragraph().add_run("Figure 1")
+    run.font.size = Pt(9)
+    run.italic = True
+    return TemplateManager().extract_template(run)
+
+
+def test_saved_templates_are_compiled_once():
+    library = TemplateLibrary()
+    library.save("house-caption", _caption_template())
+
+    template, compiled = library.get("house-caption")
+    target = Document().add_paragraph().add_run("x")
+    compiled.apply(target)
+
+    assert template.element_type == "run"
+    assert target.italic is True and target.font.size == Pt(9)
+    assert library.get(" house-caption ")[1] is compiled
+
+
+def test_templates_persist_to_json(tmp_path):
+    path = tmp_path / "library" / "templates.json"
+    library = TemplateLibrary(str(path))
+    library.save("house-caption", _caption_template())
+    library.save("legacy", FormatTemplate(element_type="paragraph", properties={"alignment": 1}))
+
+    reopened = TemplateLibrary(str(path))
+
+    assert [entry["name"] for entry in reopened.list()] == ["house-caption", "legacy"]
+    assert reopened.get("legacy")[1] is None
+    assert reopened.get("house-caption")[1].kind == "run"
+    assert json.loads(path.read_text(encoding="utf-8"))["version"] == 1
+
+    reopened.delete("legacy")
+    assert [entry["name"] for entry in TemplateLibrary(str(path)).list()] == ["house-caption"]
+
+
+def test_overwrite_and_missing_names():
+    library = TemplateLibrary()
+    library.save("a", _caption_template())
+
+    assert library.save("a", _caption_template()) is True
+    with pytest.raises(ValueError):
+        library.save("a", _caption_template(), overwrite=False)
+    with pytest.raises(ValueError):
+        library.save(" ", _caption_template())
+    with pytest.raises(KeyError):
+        library.get("missing")
+    with pytest.raises(KeyError):
+        library.delete("missing")
+
+
+def test_invalid_xml_is_rejected_on_save():
+    template = FormatTemplate(element_type="run", properties={}, xml={"rPr": "<w:rPr"})
+
+    with pytest.raises(ValueError):
+        TemplateLibrary().save("broken", template)
+
+
+def test_unreadable_library_file_is_left_alone(tmp_path):
+    path = tmp_path / "templates.json"
+    path.write_text("not json", encoding="utf-8")
+    library = TemplateLibrary(str(path))
+
+    with pytest.raises(ValueError):
+        library.list()
+    assert path.read_text(encoding="utf-8") == "not json"
+
+
+def test_cell_template_keeps_shading():
+    doc = Document()
+    cell = doc.add_table(rows=1, cols=2).cell(0, 0)
+    cell._tc.get_or_add_tcPr().append(
+        parse_xml(f'<w:shd {nsdecls("w")} w:val="clear" w:fill="FFEEDD"/>')
+    )
+    library = TemplateLibrary()
+    library.save("warning-cell", TemplateManager().extract_template(cell))
+
+    other = doc.tables[0].cell(0, 1)
+    library.get("warning-cell")[1].apply(other)
+
+    assert other._tc.tcPr.find(qn("w:shd")).get(qn("w:fill")) == "FFEEDD"
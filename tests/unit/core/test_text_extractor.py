@@ -0,0 +1,67 @@
+"""Unit tests for the lxml text extraction fast path."""
+
+from docx import Document
+from docx.enum.text import WD_BREAK
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+from docx_mcp_server.core import text_extractor
+
+
+def test_paragraph_text_matches_python_docx():
+    doc = Document()
+    p = doc.add_paragraph("Hello ")
+    p.add_run("bold").bold = True
+    p.add_run("\tTabbed")
+    run = p.add_run("line")
+    run.add_break()
+    run.add_text("next")
+    p.add_run("page").add_break(WD_BREAK.PAGE)
+
+    assert text_extractor.paragraph_text(p._element) == p.text
+
+
+def test_paragraph_text_includes_hyperlink_runs():
+    p_xml = (
+        f'<w:p {nsdecls("w", "r")}>'
+        '<w:r><w:t xml:space="preserve">See </w:t></w:r>'
+        '<w:hyperlink r:id="rId9"><w:r><w:t>docs</w:t></w:r></w:hyperlink>'
+        '<w:r><w:noBreakHyphen/><w:t>end</w:t></w:r>'
+        '</w:p>'
+    )
+    p = parse_xml(p_xml)
+
+    assert text_extractor.paragraph_text(p) == "See docs-end"
+
+
+def test_table_rows_match_row_cells_with_merges():
+    doc = Document()
+    table = doc.add_table(rows=3, cols=3)
+    for r, row in enumerate(table.rows):
+        for c, cell in enumerate(row.cells):
+            cell.text = f"{r}{c}"
+    table.cell(0, 0).merge(table.cell(0, 1))
+    table.cell(1, 2).merge(table.cell(2, 2))
+    table.cell(2, 0).add_paragraph("second line")
+
+    expected = [[cell.text for cell in row.cells] for row in table.rows]
+
+    assert text_extractor.table_rows(table._tbl) == expected
+
+
+def test_table_dimensions():
+    doc = Document()
+    table = doc.add_table(rows=4, cols=2)
+
+    assert text_extractor.table_dimensions(table._tbl) == (4, 2)
+
+
+def test_iter_blocks_yields_paragraphs_and_tables_in_order():
+    doc = Document()
+    doc.add_paragraph("A")
+    doc.add_table(rows=1, cols=1)
+    doc.add_paragraph("B")
+
+    kinds = [kind for kind, _ in text_extractor.iter_blocks(doc.element.body)]
+
+    assert kinds == ["paragraph", "table", "paragraph"]
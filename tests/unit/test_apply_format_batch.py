@@ -0,0 +1,100 @@
+"""Unit tests for applying one format to many elements"""
+import json
+import os
+import sys
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+# Add parent directory to path for helpers import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tests.helpers.session_helpers import setup_active_session, teardown_active_session
+from docx_mcp_server.server import session_manager
+from docx_mcp_server.core.global_state import global_state
+from docx_mcp_server.tools.format_tools import (
+    docx_apply_format_batch, docx_extract_format_template
+)
+from helpers import extract_metadata_field, is_success, is_error
+
+
+def _active():
+    return session_manager.get_session(global_state.active_session_id)
+
+
+def _table_session():
+    session = _active()
+    table = session.document.add_table(rows=3, cols=2)
+    source = table.cell(0, 0)
+    source._tc.get_or_add_tcPr().append(
+        parse_xml(f'<w:shd {nsdecls("w")} w:val="clear" w:fill="DDEEFF"/>')
+    )
+    source_id = session.register_object(source, "cell")
+    target_ids = [session.register_object(table.cell(r, 1), "cell") for r in range(3)]
+    return session, table, source_id, target_ids
+
+
+def test_batch_from_source_element():
+    setup_active_session()
+    try:
+        session, table, source_id, target_ids = _table_session()
+        para_id = session.register_object(session.document.add_paragraph("x"), "para")
+
+        result = docx_apply_format_batch(json.dumps(target_ids + [para_id]), source_id=source_id)
+
+        assert is_success(result)
+        assert extract_metadata_field(result, "applied_count") == 3
+        assert extract_metadata_field(result, "failed_count") == 1
+        assert para_id in result
+        for r in range(3):
+            assert table.cell(r, 1)._tc.tcPr.find(qn("w:shd")).get(qn("w:fill")) == "DDEEFF"
+        assert session.has_unsaved_changes()
+    finally:
+        teardown_active_session()
+
+
+def test_batch_from_template():
+    setup_active_session()
+    try:
+        session, table, source_id, target_ids = _table_session()
+        extracted = json.loads(docx_extract_format_template(source_id))
+        template_json = json.dumps(extracted["data"]["template"])
+
+        result = docx_apply_format_batch(json.dumps(target_ids), template_json=template_json)
+
+        assert extract_metadata_field(result, "applied_count") == 3
+        assert table.cell(2, 1)._tc.tcPr.find(qn("w:shd")) is not None
+    finally:
+        teardown_active_session()
+
+
+def test_batch_validation_errors():
+    setup_active_session()
+    try:
+        _, _, source_id, target_ids = _table_session()
+        assert is_error(docx_apply_format_batch(json.dumps(target_ids)))
+        assert is_error(docx_apply_format_batch(json.dumps(target_ids), source_id=source_id, template_json="{}"))
+        assert is_error(docx_apply_format_batch("cell_1", source_id=source_id))
+        missing = docx_apply_format_batch(json.dumps(["cell_missing"]), source_id=source_id)
+        assert is_error(missing) and "cell_missing" in missing
+    finally:
+        teardown_active_session()
+
+
+def test_batch_selects_by_style_predicate():
+    setup_active_session()
+    try:
+        doc = _active().document
+        sample = doc.add_paragraph("Figure 1", style="Caption")
+        sample.alignment = 1
+        others = [doc.add_paragraph(f"Figure {i}", style="Caption") for i in range(2, 6)]
+        plain = doc.add_paragraph("Body")
+        sample_id = _active().register_object(sample, "para")
+
+        result = docx_apply_format_batch(source_id=sample_id, style="Caption")
+
+        assert extract_metadata_field(result, "matched_count") == 5
+        assert all(p.alignment == 1 for p in others)
+        assert plain.alignment is None
+    finally:
+        teardown_active_session()
@@ -201,3 +201,45 @@ def test_smart_fill_table_with_table_id():
 
     finally:
         teardown_active_session()
+
+
+def test_format_range_formats_runs_directly():
+    """Formatting a range touches every run without registering them"""
+    from docx_mcp_server.server import session_manager
+    from docx_mcp_server.core.global_state import global_state
+
+    setup_active_session()
+    try:
+        session = session_manager.get_session(global_state.active_session_id)
+        doc = session.document
+        doc.add_paragraph("Start marker")
+        middle = doc.add_paragraph()
+        for text in ("a", "b", "c"):
+            middle.add_run(text)
+        doc.add_paragraph("End marker")
+        doc.add_paragraph("After")
+        registered = len(session.object_registry)
+
+        result_md = docx_format_range("Start marker", "End marker", italic=True, color_hex="00FF00")
+
+        assert extract_metadata_field(result_md, "run_count") == 5
+        assert all(r.italic for p in doc.paragraphs[:3] for r in p.runs)
+        assert doc.paragraphs[3].runs[0].italic is None
+        assert len(session.object_registry) == registered
+        assert session.has_unsaved_changes()
+    finally:
+        teardown_active_session()
+
+
+def test_quick_edit_respects_max_results():
+    """Quick edit stops after max_results matches"""
+    setup_active_session()
+    try:
+        for i in range(4):
+            docx_insert_paragraph(f"item {i}", position="end:document_body")
+
+        result = extract_json_from_markdown(docx_quick_edit("item", bold=True, max_results=3))
+
+        assert result["modified_count"] == 3
+    finally:
+        teardown_active_session()
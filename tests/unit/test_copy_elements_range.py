@@ -0,0 +1,113 @@
+"""Unit tests for docx_copy_elements_range source-to-copy ID mapping"""
+import json
+import os
+import re
+import sys
+
+# Add parent directory to path for helpers import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tests.helpers.session_helpers import setup_active_session, teardown_active_session
+from docx_mcp_server.server import session_manager
+from docx_mcp_server.core.global_state import global_state
+from docx_mcp_server.tools.copy_tools import docx_copy_elements_range
+from helpers import extract_metadata_field
+from helpers.markdown_extractors import extract_element_ids_list
+
+
+def _mapping(response):
+    return json.loads(re.search(r"```json\n(.*?)\n```", response, re.S).group(1))
+
+
+def test_range_copy_maps_nested_ids():
+    setup_active_session()
+    try:
+        session = session_manager.get_session(global_state.active_session_id)
+        doc = session.document
+        heading = doc.add_paragraph("Section")
+        table = doc.add_table(rows=2, cols=2)
+        outer_cell = table.cell(1, 1)
+        nested = outer_cell.add_table(rows=1, cols=1)
+        nested.cell(0, 0).text = "deep"
+        tail = doc.add_paragraph("End")
+        doc.add_paragraph("Outside")
+
+        ids = {
+            "heading": session.register_object(heading, "para"),
+            "table": session.register_object(table, "table"),
+            "cell": session.register_object(outer_cell, "cell"),
+            "nested": session.register_object(nested, "table"),
+            "deep_para": session.register_object(nested.cell(0, 0).paragraphs[0], "para"),
+            "run": session.register_object(heading.add_run("!"), "run"),
+            "tail": session.register_object(tail, "para"),
+        }
+
+        response = docx_copy_elements_range(ids["heading"], ids["tail"], "end:document_body")
+
+        assert extract_metadata_field(response, "copied_count") == 3
+        assert extract_metadata_field(response, "mapped_count") == len(ids)
+        assert len(extract_element_ids_list(response)) == 3
+        mapping = _mapping(response)
+        assert set(mapping) == set(ids.values())
+
+        copies = {name: session.get_object(mapping[source_id]) for name, source_id in ids.items()}
+        assert copies["deep_para"].text == "deep"
+        assert copies["deep_para"]._element is not nested.cell(0, 0).paragraphs[0]._element
+        assert copies["run"].text == "!"
+        assert copies["nested"]._element in copies["cell"]._element.iter()
+        assert copies["table"]._element.getparent() is doc.element.body
+        assert session.cell_index.position(mapping[ids["cell"]]) == (1, 1)
+        assert session.get_metadata(mapping[ids["deep_para"]])["source_id"] == ids["deep_para"]
+        # Copies land before the final section properties
+        assert doc.element.body[-1].tag.endswith("sectPr")
+        assert [p.text for p in doc.paragraphs][-2:] == ["Section!", "End"]
+    finally:
+        teardown_active_session()
+
+
+def test_range_copy_without_registered_children():
+    setup_active_session()
+    try:
+        session = session_manager.get_session(global_state.active_session_id)
+        first = session.document.add_paragraph("A")
+        second = session.document.add_paragraph("B")
+        first_id = session.register_object(first, "para")
+        second_id = session.register_object(second, "para")
+
+        response = docx_copy_elements_range(first_id, second_id, f"before:{first_id}")
+
+        mapping = _mapping(response)
+        assert list(mapping) == [first_id, second_id]
+        assert [p.text for p in session.document.paragraphs] == ["A", "B", "A", "B"]
+        assert session.document.paragraphs[0]._element is session.get_object(mapping[first_id])._element
+    finally:
+        teardown_active_session()
+
+
+def test_range_copy_of_large_registered_table_builds_one_grid(monkeypatch):
+    from docx_mcp_server.core.table_grid import TableGrid
+
+    setup_active_session()
+    try:
+        session = session_manager.get_session(global_state.active_session_id)
+        doc = session.document
+        table = doc.add_table(rows=150, cols=20)
+        cell_ids = session.register_objects([(cell, "cell", None) for row in table.rows for cell in row.cells])
+        table_id = session.register_object(table, "table")
+        session.mark_dirty()
+
+        builds, checks = [], []
+        original_init, original_check = TableGrid.__init__, TableGrid.is_current
+        monkeypatch.setattr(TableGrid, "__init__", lambda grid, tbl: builds.append(1) or original_init(grid, tbl))
+        monkeypatch.setattr(TableGrid, "is_current", lambda grid: checks.append(1) or original_check(grid))
+
+        response = docx_copy_elements_range(table_id, table_id, "end:document_body")
+
+        mapping = _mapping(response)
+        assert len(mapping) == len(cell_ids) + 1
+        # One grid for the copied table, no per-cell structure checks
+        assert len(builds) == 1 and len(checks) <= 1
+        assert session.cell_index.position(mapping[cell_ids[-1]]) == (149, 19)
+        assert len(session.cell_index) == 2 * len(cell_ids)
+    finally:
+        teardown_active_session()
@@ -0,0 +1,116 @@
+"""Unit tests for cross-document copy tools"""
+import os
+import sys
+
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+
+# Add parent directory to path for helpers import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tests.helpers.session_helpers import setup_active_session, teardown_active_session
+from docx_mcp_server.server import session_manager
+from docx_mcp_server.core.global_state import global_state
+from docx_mcp_server.tools.copy_tools import docx_copy_from_session, docx_insert_document
+from helpers import extract_metadata_field, is_success, is_error
+
+
+def _source_session():
+    source_id = session_manager.create_session()
+    source = session_manager.get_session(source_id)
+    style = source.document.styles.add_style("Clause", WD_STYLE_TYPE.PARAGRAPH)
+    style.font.bold = True
+    first = source.document.add_paragraph("Clause one", style="Clause")
+    source.document.add_table(rows=1, cols=2).cell(0, 0).text = "Price"
+    last = source.document.add_paragraph("Clause two", style="Clause")
+    return source_id, source.register_object(first, "para"), source.register_object(last, "para")
+
+
+def _active():
+    return session_manager.get_session(global_state.active_session_id)
+
+
+def test_copy_range_from_session_imports_styles():
+    setup_active_session()
+    source_id, first_id, last_id = _source_session()
+    try:
+        result = docx_copy_from_session(source_id, first_id, "end:document_body", end_id=last_id)
+
+        assert is_success(result)
+        new_ids = extract_metadata_field(result, "new_element_ids").split(", ")
+        assert len(new_ids) == 3
+        assert extract_metadata_field(result, "styles_added") == 1
+        doc = _active().document
+        assert [p.text for p in doc.paragraphs] == ["Clause one", "Clause two"]
+        assert doc.paragraphs[0].style.name == "Clause"
+        # Copied before the final section properties
+        assert doc.element.body[-1].tag.endswith("sectPr")
+
+        again = docx_copy_from_session(source_id, first_id, f"before:{new_ids[0]}")
+        assert extract_metadata_field(again, "styles_added") == 0
+        assert doc.paragraphs[0].text == "Clause one"
+        copied_id = extract_metadata_field(again, "new_element_ids")
+        assert _active().get_metadata(copied_id)["source_session_id"] == source_id
+        assert _active().get_metadata(copied_id)["source_id"] == first_id
+    finally:
+        session_manager.close_session(source_id)
+        teardown_active_session()
+
+
+def test_copy_from_unknown_session_fails():
+    setup_active_session()
+    try:
+        result = docx_copy_from_session("missing", "para_1", "end:document_body")
+        assert is_error(result)
+        assert "not found" in result
+    finally:
+        teardown_active_session()
+
+
+def test_insert_document_from_file(tmp_path):
+    path = tmp_path / "terms.docx"
+    doc = Document()
+    doc.styles.add_style("Terms", WD_STYLE_TYPE.PARAGRAPH)
+    for text in ("Terms", "Payment", "Liability"):
+        doc.add_paragraph(text, style="Terms")
+    doc.save(str(path))
+
+    setup_active_session()
+    try:
+        anchor = _active().document.add_paragraph("Intro")
+        anchor_id = _active().register_object(anchor, "para")
+
+        result = docx_insert_document(file_path=str(path), position=f"after:{anchor_id}")
+
+        assert is_success(result)
+        assert extract_metadata_field(result, "inserted_count") == 3
+        last_id = extract_metadata_field(result, "last_element_id")
+        assert _active().get_object(last_id).text == "Liability"
+        assert [p.text for p in _active().document.paragraphs] == ["Intro", "Terms", "Payment", "Liability"]
+        assert _active().has_unsaved_changes()
+
+        assert is_error(docx_insert_document())
+        assert is_error(docx_insert_document(file_path=str(tmp_path / "missing.docx")))
+    finally:
+        teardown_active_session()
+
+
+def test_import_failure_returns_copy_error(monkeypatch):
+    from docx_mcp_server.core.doc_import import DocumentImporter
+
+    def broken(self, *args, **kwargs):
+        raise KeyError("no relationship rId9")
+
+    setup_active_session()
+    source_id, first_id, last_id = _source_session()
+    monkeypatch.setattr(DocumentImporter, "import_elements", broken)
+    try:
+        result = docx_copy_from_session(source_id, first_id, "end:document_body", end_id=last_id)
+        assert is_error(result) and "CopyError" in result
+
+        result = docx_insert_document(source_session_id=source_id)
+        assert is_error(result) and "CopyError" in result
+        assert _active().document.paragraphs == []
+    finally:
+        session_manager.close_session(source_id)
+        teardown_active_session()
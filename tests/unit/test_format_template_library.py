@@ -0,0 +1,77 @@
+"""Unit tests for the named format template tools"""
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for helpers import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tests.helpers.session_helpers import setup_active_session, teardown_active_session
+from docx_mcp_server.server import session_manager
+from docx_mcp_server.core.global_state import global_state
+from docx_mcp_server.core.template_library import template_library
+from docx_mcp_server.tools.format_tools import (
+    docx_apply_format_batch, docx_apply_format_template, docx_delete_format_template,
+    docx_list_format_templates, docx_save_format_template
+)
+from helpers import extract_metadata_field, is_success, is_error
+
+
+@pytest.fixture
+def library(tmp_path):
+    template_library.configure(str(tmp_path / "templates.json"))
+    setup_active_session()
+    yield template_library
+    teardown_active_session()
+    template_library.configure(None)
+
+
+def _active():
+    return session_manager.get_session(global_state.active_session_id)
+
+
+def test_save_and_apply_by_name(library):
+    doc = _active().document
+    sample = doc.add_paragraph("Figure 1", style="Caption")
+    sample.alignment = 2
+    sample_id = _active().register_object(sample, "para")
+    target_id = _active().register_object(doc.add_paragraph("Figure 2"), "para")
+
+    saved = docx_save_format_template("house-caption", element_id=sample_id)
+    assert is_success(saved)
+    assert extract_metadata_field(saved, "element_type") == "paragraph"
+
+    assert is_success(docx_apply_format_template(target_id, template_name="house-caption"))
+    assert doc.paragraphs[1].style.name == "Caption"
+    assert doc.paragraphs[1].alignment == 2
+
+    doc.add_paragraph("Figure 3", style="Caption")
+    result = docx_apply_format_batch(template_name="house-caption", style="Caption")
+    assert extract_metadata_field(result, "applied_count") == 3
+    assert doc.paragraphs[2].alignment == 2
+
+
+def test_list_and_delete(library):
+    sample_id = _active().register_object(_active().document.add_paragraph("x"), "para")
+    docx_save_format_template("b-style", element_id=sample_id)
+    docx_save_format_template("a-style", element_id=sample_id)
+
+    listing = docx_list_format_templates()
+    assert extract_metadata_field(listing, "template_count") == 2
+    assert listing.index("a-style") < listing.index("b-style")
+
+    assert is_success(docx_delete_format_template("a-style"))
+    assert is_error(docx_delete_format_template("a-style"))
+    assert "a-style" not in docx_list_format_templates()
+
+
+def test_unknown_template_and_argument_errors(library):
+    para_id = _active().register_object(_active().document.add_paragraph("x"), "para")
+
+    assert is_error(docx_apply_format_template(para_id, template_name="missing"))
+    assert is_error(docx_apply_format_template(para_id))
+    assert is_error(docx_apply_format_batch(target_ids=f'["{para_id}"]', template_name="missing"))
+    assert is_error(docx_save_format_template("x"))
+    docx_save_format_template("x", element_id=para_id)
+    assert is_error(docx_save_format_template("x", element_id=para_id, overwrite=False))
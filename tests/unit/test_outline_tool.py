@@ -0,0 +1,126 @@
+"""Unit tests for docx_get_outline and incremental outline maintenance"""
+import os
+import sys
+
+# Add parent directory to path for helpers import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tests.helpers.session_helpers import setup_active_session, teardown_active_session
+from docx_mcp_server.server import session_manager
+from docx_mcp_server.core.global_state import global_state
+from docx_mcp_server.core.outline_index import OutlineIndex
+from docx_mcp_server.tools.content_tools import docx_get_outline
+from docx_mcp_server.tools.format_tools import docx_format_copy, docx_restyle
+from docx_mcp_server.tools.paragraph_tools import docx_insert_heading, docx_insert_paragraph, docx_delete
+from helpers import extract_metadata_field, is_error
+
+
+def _active():
+    return session_manager.get_session(global_state.active_session_id)
+
+
+def _build(doc):
+    for chapter in range(1, 4):
+        doc.add_paragraph(f"Chapter {chapter}", style="Heading 1")
+        for section in range(1, 3):
+            doc.add_paragraph(f"Section {chapter}.{section}", style="Heading 2")
+            doc.add_paragraph("text")
+
+
+def test_get_outline_sections():
+    setup_active_session()
+    try:
+        doc = _active().document
+        _build(doc)
+
+        overview = docx_get_outline()
+        assert extract_metadata_field(overview, "heading_count") == 9
+        assert "## Sections (3)" in overview
+
+        chapter = docx_get_outline(section="2", level=2)
+        assert extract_metadata_field(chapter, "start_index") == 5
+        assert extract_metadata_field(chapter, "end_index") == 9
+        assert "Section 2.1" in chapter and "Section 3.1" not in chapter
+
+        end_id = extract_metadata_field(chapter, "end_id").strip("`")
+        assert _active().get_object(end_id)._element is doc.paragraphs[9]._p
+
+        heading_id = extract_metadata_field(chapter, "heading_id").strip("`")
+        assert extract_metadata_field(docx_get_outline(section=heading_id), "level") == 1
+
+        containing = docx_get_outline(element_id=end_id)
+        assert "## Section 2.2: Section 2.2" in containing
+        assert extract_metadata_field(containing, "parent_section") == 2
+    finally:
+        teardown_active_session()
+
+
+def test_outline_follows_edits_incrementally():
+    setup_active_session()
+    try:
+        session = _active()
+        doc = session.document
+        _build(doc)
+        docx_get_outline()
+        index = session.get_outline_index()
+
+        anchor = session.register_object(doc.paragraphs[2], "para")
+        docx_insert_heading("Section 1.1b", position=f"after:{anchor}", level=2)
+        docx_insert_paragraph("more text", position=f"after:{anchor}")
+        delete_id = session.register_object(doc.paragraphs[0], "para")
+        docx_delete(delete_id)
+        docx_restyle("Heading 3", current_style="Heading 2", text="Section 3")
+
+        assert session.get_outline_index() is index
+        fresh = OutlineIndex(doc)
+        assert [(h.number, h.level, h.position) for h in index.headings] == \
+            [(h.number, h.level, h.position) for h in fresh.headings]
+        # Chapter 1 is gone: its sections move to the top level
+        assert [h.text for h in index.headings[:3]] == ["Section 1.1", "Section 1.1b", "Section 1.2"]
+        assert "Section 3.2" in docx_get_outline(section="5", level=3)
+    finally:
+        teardown_active_session()
+
+
+def test_outline_rebuilds_after_other_edits():
+    setup_active_session()
+    try:
+        session = _active()
+        doc = session.document
+        _build(doc)
+        index = session.get_outline_index()
+
+        doc.paragraphs[1].style = doc.styles["Heading 1"]
+        session.mark_dirty()
+
+        rebuilt = session.get_outline_index()
+        assert rebuilt is not index and len(rebuilt.subsections()) == 4
+    finally:
+        teardown_active_session()
+
+
+def test_outline_follows_format_copy():
+    setup_active_session()
+    try:
+        session = _active()
+        heading_id = extract_metadata_field(docx_insert_heading("Intro", position="end:document_body", level=1), "element_id")
+        para_id = extract_metadata_field(docx_insert_paragraph("Body", position="end:document_body"), "element_id")
+        assert extract_metadata_field(docx_get_outline(), "heading_count") == 1
+
+        assert not is_error(docx_format_copy(heading_id, para_id))
+
+        assert extract_metadata_field(docx_get_outline(), "heading_count") == 2
+        assert len(session.get_outline_index()) == len(session.get_outline_index(refresh=True)) == 2
+    finally:
+        teardown_active_session()
+
+
+def test_get_outline_errors():
+    setup_active_session()
+    try:
+        _build(_active().document)
+        assert is_error(docx_get_outline(section="9.9"))
+        assert is_error(docx_get_outline(level=12))
+        assert is_error(docx_get_outline(element_id="para_missing"))
+    finally:
+        teardown_active_session()
@@ -0,0 +1,49 @@
+"""Unit tests for docx_restyle"""
+import os
+import sys
+
+# Add parent directory to path for helpers import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tests.helpers.session_helpers import setup_active_session, teardown_active_session
+from docx_mcp_server.server import session_manager
+from docx_mcp_server.core.global_state import global_state
+from docx_mcp_server.tools.format_tools import docx_restyle
+from helpers import extract_metadata_field, is_success, is_error
+
+
+def _active():
+    return session_manager.get_session(global_state.active_session_id)
+
+
+def test_restyle_tool():
+    setup_active_session()
+    try:
+        doc = _active().document
+        for i in range(5):
+            doc.add_paragraph(f"Figure {i}")
+        doc.add_paragraph("Body")
+
+        result = docx_restyle("Caption", text=r"^Figure \d", use_regex=True)
+
+        assert is_success(result)
+        assert extract_metadata_field(result, "matched_count") == 5
+        assert extract_metadata_field(result, "style_type") == "paragraph"
+        assert [p.style.name for p in doc.paragraphs].count("Caption") == 5
+        assert _active().has_unsaved_changes()
+
+        table_id = _active().register_object(doc.add_table(rows=1, cols=1), "table")
+        scoped = docx_restyle("Caption", scope_id=table_id)
+        assert extract_metadata_field(scoped, "matched_count") == 1
+    finally:
+        teardown_active_session()
+
+
+def test_restyle_tool_errors():
+    setup_active_session()
+    try:
+        assert is_error(docx_restyle("No Such Style"))
+        assert is_error(docx_restyle("Caption", heading_level=12))
+        assert is_error(docx_restyle("Caption", scope_id="table_missing"))
+    finally:
+        teardown_active_session()
@@ -50,6 +50,35 @@ class TestSessionManager(unittest.TestCase):
         self.assertEqual(session.get_object(obj_id), dummy_obj)
         self.assertIsNone(session.get_object("non_existent"))
 
+    def test_register_objects_batch(self):
+        session = self.manager.sessions[self.manager.create_session()]
+        para = session.document.add_paragraph("a")
+        table = session.document.add_table(rows=1, cols=1)
+        cell = table.cell(0, 0)
+
+        ids = session.register_objects([
+            (para, "para", {"source_id": "para_x"}),
+            (table, "table", None),
+            (cell, "cell", None),
+        ])
+
+        self.assertEqual([i.split("_")[0] for i in ids], ["para", "table", "cell"])
+        self.assertIs(session.get_object(ids[0]), para)
+        self.assertEqual(session.get_metadata(ids[0]), {"source_id": "para_x"})
+        self.assertIsNone(session.get_metadata(ids[1]))
+        self.assertEqual(session.registered_id(para._element), ids[0])
+        self.assertEqual(session.registered_id(cell._tc), ids[2])
+        self.assertEqual(session.cell_index.position(ids[2]), (0, 0))
+
+    def test_registered_id_ignores_unregistered_and_stale(self):
+        session = self.manager.sessions[self.manager.create_session()]
+        para = session.document.add_paragraph("a")
+        self.assertIsNone(session.registered_id(para._element))
+
+        para_id = session.register_object(para, "para")
+        del session.object_registry[para_id]
+        self.assertIsNone(session.registered_id(para._element))
+
     def test_close_session(self):
         session_id = self.manager.create_session()
         result = self.manager.close_session(session_id)
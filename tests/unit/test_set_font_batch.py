@@ -0,0 +1,58 @@
+"""Unit tests for bulk font updates"""
+import json
+import os
+import sys
+
+from docx.shared import Pt
+
+# Add parent directory to path for helpers import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tests.helpers.session_helpers import setup_active_session, teardown_active_session
+from docx_mcp_server.server import session_manager
+from docx_mcp_server.core.global_state import global_state
+from docx_mcp_server.tools.run_tools import docx_set_font_batch
+from helpers import extract_metadata_field, is_success, is_error
+
+
+def _active():
+    return session_manager.get_session(global_state.active_session_id)
+
+
+def test_font_batch_by_text_and_ids():
+    setup_active_session()
+    try:
+        doc = _active().document
+        captions = []
+        for i in range(3):
+            p = doc.add_paragraph()
+            p.add_run(f"Figure {i}: ")
+            p.add_run("caption")
+            captions.append(p)
+        body = doc.add_paragraph("Body")
+
+        result = docx_set_font_batch(text="figure", italic=True, size=9)
+
+        assert is_success(result)
+        assert extract_metadata_field(result, "matched_count") == 3
+        assert extract_metadata_field(result, "run_count") == 6
+        assert all(r.italic and r.font.size == Pt(9) for p in captions for r in p.runs)
+        assert body.runs[0].italic is None
+        assert _active().has_unsaved_changes()
+
+        run_id = _active().register_object(body.runs[0], "run")
+        docx_set_font_batch(target_ids=json.dumps([run_id]), color_hex="112233")
+        assert str(body.runs[0].font.color.rgb) == "112233"
+    finally:
+        teardown_active_session()
+
+
+def test_font_batch_validation():
+    setup_active_session()
+    try:
+        assert is_error(docx_set_font_batch(text="x"))
+        assert is_error(docx_set_font_batch(text="x", color_hex="XYZ"))
+        assert is_error(docx_set_font_batch(bold=True))
+        assert is_error(docx_set_font_batch(target_ids='["run_missing"]', bold=True))
+    finally:
+        teardown_active_session()
@@ -8,12 +8,17 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from tests.helpers.session_helpers import setup_active_session, teardown_active_session
-from docx_mcp_server.tools.table_tools import docx_insert_table
+from docx_mcp_server.server import session_manager
+from docx_mcp_server.core.global_state import global_state
+from docx_mcp_server.tools.table_tools import docx_insert_table, docx_fill_table, docx_get_cell
 from docx_mcp_server.tools.table_rowcol_tools import (
     docx_insert_row_at,
     docx_insert_col_at,
     docx_delete_row,
-    docx_delete_col
+    docx_delete_col,
+    docx_table_sort,
+    docx_table_filter,
+    docx_table_dedupe
 )
 from helpers import (
     extract_session_id,
@@ -238,6 +243,74 @@ class TestInsertColAt:
             teardown_active_session()
 
 
+class TestMultiColumnOps:
+    """Test cases for inserting/deleting several columns in one call"""
+
+    def test_insert_count_and_indices(self):
+        setup_active_session()
+        try:
+            table_id = extract_element_id(docx_insert_table(3, 3, "end:document_body"))
+
+            result = docx_insert_col_at(table_id, "after:0", count=2, copy_format=True)
+            assert is_success(result)
+            assert extract_metadata_field(result, "new_col_count") == 5
+
+            result = docx_insert_col_at(table_id, "", col_indices="[0, 5]")
+            assert extract_metadata_field(result, "new_col_count") == 7
+
+            bad = docx_insert_col_at(table_id, "", col_indices="[9]")
+            assert extract_metadata_field(bad, "error_type") == "IndexError"
+        finally:
+            teardown_active_session()
+
+    def test_indices_copy_format_from_each_neighbour(self):
+        from docx.oxml import OxmlElement
+        from docx.oxml.ns import qn
+
+        setup_active_session()
+        try:
+            table_id = extract_element_id(docx_insert_table(1, 6, "end:document_body"))
+            table = session_manager.get_session(global_state.active_session_id).get_object(table_id)
+            for col, fill in ((0, "FF0000"), (4, "00FF00")):
+                shd = OxmlElement("w:shd")
+                shd.set(qn("w:fill"), fill)
+                table.cell(0, col)._tc.get_or_add_tcPr().append(shd)
+
+            result = docx_insert_col_at(table_id, "", col_indices="[0, 1, 5]", copy_format=True)
+            assert extract_metadata_field(result, "new_col_count") == 9
+
+            def fill(col):
+                shd = table.cell(0, col)._tc.find(f"{qn('w:tcPr')}/{qn('w:shd')}")
+                return shd.get(qn("w:fill")) if shd is not None else None
+
+            # New columns land at 0 and 2 (copies of column 0) and 7 (copy of column 4)
+            assert [fill(col) for col in range(9)] == [
+                "FF0000", "FF0000", "FF0000", None, None, None, "00FF00", "00FF00", None,
+            ]
+        finally:
+            teardown_active_session()
+
+    def test_delete_indices(self):
+        setup_active_session()
+        try:
+            table_id = extract_element_id(docx_insert_table(2, 6, "end:document_body"))
+            cell_id = extract_element_id(docx_get_cell(table_id, 0, 3))
+            removed_id = extract_element_id(docx_get_cell(table_id, 1, 4))
+
+            result = docx_delete_col(table_id, col_indices="[0, 4, 5]")
+
+            assert is_success(result)
+            assert extract_metadata_field(result, "new_col_count") == 3
+            assert removed_id in extract_metadata_field(result, "invalidated_ids")
+            assert "ValidationError" in docx_delete_col(table_id, col_indices="[0, 1, 2]")
+            from docx_mcp_server.server import session_manager
+            from docx_mcp_server.core.global_state import global_state
+            session = session_manager.get_session(global_state.active_session_id)
+            assert session.cell_index.position(cell_id) == (0, 2)
+        finally:
+            teardown_active_session()
+
+
 class TestDeleteRow:
     """Test cases for docx_delete_row"""
 
@@ -446,6 +519,31 @@ class TestElementIdCleanup:
             teardown_active_session()
 
 
+    def test_cell_ids_follow_rows_across_edits(self):
+        """Test that registered cells are remapped by inserts/deletes above them"""
+        from docx_mcp_server.server import session_manager
+        from docx_mcp_server.tools.table_tools import docx_get_cell
+        from docx_mcp_server.core.global_state import global_state
+
+        setup_active_session()
+        try:
+            table_id = extract_element_id(docx_insert_table(4, 2, "end:document_body"))
+            session = session_manager.get_session(global_state.active_session_id)
+            cell_id = extract_element_id(docx_get_cell(table_id, 2, 1))
+
+            docx_insert_row_at(table_id, "before:0")   # cell moves to row 3
+            docx_delete_row(table_id, row_index=1)     # back to row 2
+            assert session.cell_index.position(cell_id) == (2, 1)
+
+            result = docx_delete_row(table_id, row_index=2)
+
+            assert cell_id in result
+            assert cell_id not in session.object_registry
+            assert session.cell_index.position(cell_id) is None
+        finally:
+            teardown_active_session()
+
+
 class TestComplexOperations:
     """Test cases for complex row/column operations"""
 
@@ -492,3 +590,51 @@ class TestComplexOperations:
             assert extract_metadata_field(result, "new_col_count") == 3
         finally:
             teardown_active_session()
+
+
+class TestSortFilterDedupe:
+    """Test cases for docx_table_sort / docx_table_filter / docx_table_dedupe"""
+
+    def _table(self):
+        table_id = extract_element_id(docx_insert_table(5, 2, "end:document_body"))
+        docx_fill_table('[["Name", "Qty"], ["b", "3"], ["a", "12"], ["b", "3"], ["c", "1"]]', table_id=table_id)
+        return table_id
+
+    def test_sort_moves_registered_cells(self):
+        setup_active_session()
+        try:
+            table_id = self._table()
+            cell_id = extract_element_id(docx_get_cell(table_id, 2, 0))
+
+            result = docx_table_sort(table_id, '[{"column": "Qty", "descending": true}]')
+
+            assert is_success(result)
+            assert extract_metadata_field(result, "moved") == 2
+            assert "a" in docx_get_cell(table_id, 1, 0)
+            # The registered cell followed its row to the top
+            from docx_mcp_server.server import session_manager
+            from docx_mcp_server.core.global_state import global_state
+            session = session_manager.get_session(global_state.active_session_id)
+            assert session.cell_index.position(cell_id) == (1, 0)
+        finally:
+            teardown_active_session()
+
+    def test_dedupe_then_filter(self):
+        setup_active_session()
+        try:
+            table_id = self._table()
+
+            result = docx_table_dedupe(table_id, footer_rows=1)
+            assert extract_metadata_field(result, "removed") == 1
+            # The footer row only shifted up; it is not reported as moved
+            assert extract_metadata_field(result, "moved") == 0
+            assert extract_metadata_field(result, "new_row_count") == 4
+
+            result = docx_table_filter(table_id, '[{"column": "Qty", "op": "ge", "value": 3}]')
+            assert extract_metadata_field(result, "rows_after") == 2
+
+            bad = docx_table_filter(table_id, '[{"column": "Missing", "op": "eq", "value": 1}]')
+            assert is_error(bad)
+            assert extract_metadata_field(bad, "error_type") == "ValidationError"
+        finally:
+            teardown_active_session()
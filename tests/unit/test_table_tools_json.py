@@ -15,7 +15,13 @@ from docx_mcp_server.tools.table_tools import (
     docx_insert_table_row,
     docx_insert_table_col,
     docx_fill_table,
-    docx_copy_table
+    docx_copy_table,
+    docx_get_table_structure,
+    docx_fill_table_from_file,
+    docx_export_table,
+    docx_get_table_columns,
+    docx_transform_table_columns,
+    docx_render_table_rows
 )
 from tests.helpers.session_helpers import setup_active_session, teardown_active_session
 from helpers import (
@@ -107,6 +113,44 @@ def test_add_paragraph_to_cell_returns_json():
     teardown_active_session()
 
 
+def test_virtual_cell_id_usable_as_position():
+    """Test that a table_id:rN:cM virtual cell ID resolves without registration."""
+    setup_active_session()
+    table_id = extract_element_id(docx_insert_table(3, 2, position="end:document_body"))
+    from docx_mcp_server.server import session_manager
+    from docx_mcp_server.core.global_state import global_state
+    session = session_manager.get_session(global_state.active_session_id)
+
+    result = docx_insert_paragraph_to_cell("Virtual", position=f"inside:{table_id}:r2:c1")
+
+    assert is_success(result)
+    assert "Virtual" in session.get_object(table_id).cell(2, 1).text
+    assert session.get_object(f"{table_id}:r3:c0") is None
+
+    teardown_active_session()
+
+
+def test_get_table_structure_windows_rows():
+    """Test that docx_get_table_structure limits the grid to the requested window."""
+    setup_active_session()
+    table_id = extract_element_id(docx_insert_table(6, 3, position="end:document_body"))
+    from docx_mcp_server.server import session_manager
+    from docx_mcp_server.core.global_state import global_state
+    session = session_manager.get_session(global_state.active_session_id)
+    registry_size = len(session.object_registry)
+
+    result = docx_get_table_structure(table_id, start_row=2, max_rows=2, max_cols=2)
+
+    assert is_success(result)
+    assert len(session.object_registry) == registry_size
+    assert int(extract_metadata_field(result, "rows")) == 6
+    assert f"{table_id}:r3:c1" in result
+    assert f"{table_id}:r4:c0" not in result
+    assert f"{table_id}:r2:c2" not in result
+
+    teardown_active_session()
+
+
 def test_add_table_row_returns_json():
     """Test that docx_insert_table_row returns valid JSON."""
     setup_active_session()
@@ -178,6 +222,90 @@ def test_fill_table_preserves_run_formatting_when_enabled():
     teardown_active_session()
 
 
+def test_fill_table_from_file_returns_json(tmp_path):
+    """Test that docx_fill_table_from_file streams a CSV into the table."""
+    setup_active_session()
+    path = tmp_path / "rows.csv"
+    path.write_text("a,b\n1,2\n3,4\n", encoding="utf-8")
+    table_id = extract_element_id(docx_insert_table(1, 2, position="end:document_body"))
+
+    result = docx_fill_table_from_file(str(path), table_id=table_id, start_row=0)
+
+    assert is_success(result)
+    assert int(extract_metadata_field(result, "rows_written")) == 2
+    assert int(extract_metadata_field(result, "rows_added")) == 1
+    missing = docx_fill_table_from_file(str(tmp_path / "none.csv"), table_id=table_id)
+    assert extract_metadata_field(missing, "error_type") == "FileNotFound"
+
+    teardown_active_session()
+
+
+def test_export_table_returns_window_and_writes_files(tmp_path):
+    """Test that docx_export_table returns row windows and writes files."""
+    setup_active_session()
+    table_id = extract_element_id(docx_insert_table(3, 2, position="end:document_body"))
+    docx_fill_table('[["a", "b"], ["1", "2"], ["3", "4"]]', table_id=table_id)
+
+    window = docx_export_table(table_id=table_id, start_row=1, max_rows=1)
+    assert '["1", "2"]' in window
+    assert int(extract_metadata_field(window, "next_start_row")) == 2
+
+    result = docx_export_table(table_id=table_id, output_path=str(tmp_path / "t.csv"), header=True)
+    assert is_success(result)
+    assert int(extract_metadata_field(result, "rows")) == 2
+    assert (tmp_path / "t.csv").read_text(encoding="utf-8").splitlines() == ["a,b", "1,2", "3,4"]
+
+    out_of_range = docx_export_table(table_index=5)
+    assert extract_metadata_field(out_of_range, "error_type") == "IndexError"
+
+    teardown_active_session()
+
+
+def test_table_columns_read_and_transform():
+    """Test reading column arrays and transforming columns server-side."""
+    setup_active_session()
+    table_id = extract_element_id(docx_insert_table(3, 3, position="end:document_body"))
+    docx_fill_table('[["Qty", "Price", "Amount"], ["2", "$1.50", ""], ["4", "2", ""]]', table_id=table_id)
+
+    columns = docx_get_table_columns(table_id=table_id, columns='["Price"]', numeric=True)
+    assert '{"Price": [1.5, 2.0]}' in columns
+
+    result = docx_transform_table_columns(
+        '[{"op": "compute", "target": "Amount", "expression": "[Qty] * [Price]", "style": "currency"},'
+        ' {"op": "total", "column": "Amount", "style": "currency"}]',
+        table_id=table_id
+    )
+    assert is_success(result)
+    assert int(extract_metadata_field(result, "rows_added")) == 1
+    texts = docx_get_table_columns(table_id=table_id, columns='["Amount"]')
+    assert '{"Amount": ["$3.00", "$8.00", "$11.00"]}' in texts
+
+    bad = docx_transform_table_columns('[{"op": "total", "column": "Nope"}]', table_id=table_id)
+    assert extract_metadata_field(bad, "error_type") == "ValidationError"
+
+    teardown_active_session()
+
+
+def test_render_table_rows_from_template():
+    """Test that docx_render_table_rows expands a placeholder row per record."""
+    setup_active_session()
+    table_id = extract_element_id(docx_insert_table(3, 2, position="end:document_body"))
+    docx_fill_table('[["Item", "Qty"], ["{{item}}", "{{qty}}"], ["Total", "3"]]', table_id=table_id)
+
+    result = docx_render_table_rows('[{"item": "a", "qty": 1}, {"item": "b", "qty": 2}]', table_id=table_id)
+
+    assert is_success(result)
+    assert int(extract_metadata_field(result, "rows_added")) == 2
+    assert int(extract_metadata_field(result, "first_row")) == 1
+    columns = docx_get_table_columns(table_id=table_id)
+    assert '{"Item": ["a", "b", "Total"], "Qty": ["1", "2", "3"]}' in columns
+
+    missing = docx_render_table_rows('[{"item": "c"}]', table_id=table_id)
+    assert extract_metadata_field(missing, "error_type") == "ValidationError"
+
+    teardown_active_session()
+
+
 def test_copy_table_returns_json():
     """Test that docx_copy_table returns valid JSON."""
     setup_active_session()
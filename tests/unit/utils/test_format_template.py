@@ -61,3 +61,20 @@ def test_json_serialization():
 
     template_restored = manager.from_json(json_str)
     assert template_restored.font_properties['bold'] == True
+
+def test_table_template_carries_borders_through_json():
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls, qn
+
+    doc = Document()
+    src = doc.add_table(rows=1, cols=1)
+    src._tbl.tblPr.append(parse_xml(
+        f'<w:tblBorders {nsdecls("w")}><w:top w:val="single" w:sz="8"/></w:tblBorders>'
+    ))
+    tgt = doc.add_table(rows=1, cols=1)
+
+    manager = TemplateManager()
+    template = manager.from_json(manager.to_json(manager.extract_template(src)))
+    manager.apply_template(tgt, template)
+
+    assert tgt._tbl.tblPr.find(qn('w:tblBorders')) is not None